@@ -0,0 +1,245 @@
+"""
+Cek anggaran query per route: regresi N+1 langsung gagal (exit code 1), cocok untuk CI.
+
+Semua route GET (tanpa argumen URL) dirender sebagai tenant pertama di atas dua
+database sintetis dengan ukuran berbeda (benchmarks/data_sintetis.py, backend
+lokal). Tiap route diukur dalam keadaan cache kosong, lewat hook
+core.QUERY_HOOKS:
+
+- jumlah query  : tidak boleh melebihi ANGGARAN dan harus SAMA di kedua ukuran
+                  data. Query per baris (loop yang memanggil supabase) membuat
+                  jumlahnya ikut membesar dan langsung ketahuan.
+- baris dibaca  : dibandingkan dengan total baris di database (rasio), jadi
+                  anggarannya juga tidak tergantung ukuran data. Route yang
+                  tiba-tiba membaca tabel besar dua kali akan melewati rasio.
+
+Route yang merender halaman error juga gagal walaupun status 200 (view di sini
+menangkap exception sendiri): ada log ERROR selama request, atau body berisi
+penanda error ("Error: ..." / div "message error").
+
+Route baru wajib ditambahkan ke ANGGARAN (atau DILEWATI kalau GET-nya mengubah
+data). --usulan mencetak anggaran dari hasil ukur sekarang.
+
+    python benchmarks/anggaran_query.py
+    python benchmarks/anggaran_query.py --kecil 500 --besar 5000 --json
+    python benchmarks/anggaran_query.py --usulan
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# route -> (maks query per request, maks baris dibaca per baris database)
+ANGGARAN = {
+    "/": (1, 0.01),
+    "/admin/profiles": (0, 0),
+    "/arus-kas": (2, 1.84),
+    "/aset": (5, 0.38),
+    "/aset-lancar": (6, 0.38),
+    "/aset-tetap": (1, 0.01),
+    "/buku-besar": (1, 0.92),
+    "/buku-besar-pembantu-piutang": (2, 0.13),
+    "/buku-besar-pembantu-utang": (2, 0.03),
+    "/dashboard": (3, 0.01),
+    "/hapus-transaksi-massal": (7, 0.09),
+    "/healthz": (0, 0),
+    "/input-modal-awal": (2, 0.01),
+    "/jurnal-penutup": (4, 0.92),
+    "/jurnal-penyesuaian": (2, 0.01),
+    "/jurnal-umum": (1, 0.92),
+    "/laba-rugi": (1, 0.92),
+    "/laporan-perubahan-modal": (3, 0.92),
+    "/laporan-posisi-keuangan": (7, 0.92),
+    "/laporan-umur-piutang-utang": (4, 0.15),
+    "/login": (0, 0),
+    "/metrics": (0, 0),
+    "/neraca-lajur": (2, 0.92),
+    "/neraca-saldo": (1, 0.92),
+    "/neraca-saldo-awal": (1, 0.01),
+    "/neraca-saldo-setelah-penutupan": (7, 0.01),
+    "/neraca-saldo-setelah-penyesuaian": (1, 0.92),
+    "/operasional": (2, 0.16),
+    "/pelunasan-massal": (0, 0),
+    "/pembelian": (5, 0.1),
+    "/pendapatan-diterima-dimuka": (1, 0.01),
+    "/penjualan": (4, 0.26),
+    "/prive": (3, 0.92),
+    "/readyz": (1, 0.01),
+    "/register": (0, 0),
+    "/verify": (0, 0),
+}
+
+# GET yang mengubah data / session, tidak dirender di sini
+DILEWATI = {
+    "/logout",
+    "/create-aset-tetap-table",
+    "/fix-jurnal-problem",
+    "/fix-kas-data-complete",
+    "/generate-jurnal-otomatis",
+    "/generate-penyesuaian-otomatis",
+}
+
+# Dijalankan di proses anak dengan DB_BACKEND=local
+PROBE_QUERY = r"""
+import contextlib, io, json, logging, os, sqlite3, sys
+
+class TangkapError(logging.Handler):
+    def emit(self, record):
+        log_error.append(record.getMessage())
+
+# Hanya log ERROR yang diproses, dan hanya untuk dicatat (sebelum basicConfig di core)
+log_error = []
+logging.root.handlers[:] = [TangkapError(logging.ERROR)]
+logging.disable(logging.WARNING)
+email, dilewati = sys.argv[1], set(json.loads(sys.argv[2]))
+
+import pinky2
+from pinkilang import core
+
+app = pinky2.app
+query = []
+core.QUERY_HOOKS.append(query.append)
+
+with sqlite3.connect(os.environ["LOCAL_DB_PATH"]) as conn:
+    tabel = [t for (t,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+    ukuran = sum(conn.execute(f'SELECT COUNT(*) FROM "{t}"').fetchone()[0] for t in tabel)
+
+client = app.test_client()
+with client.session_transaction() as s:
+    s["logged_in"] = True
+    s["user_email"] = email
+    s["user_id"] = 1
+
+rules = sorted(r.rule for r in app.url_map.iter_rules()
+               if "GET" in r.methods and not r.arguments and r.endpoint != "static" and r.rule not in dilewati)
+hasil = {}
+for rule in rules:
+    with contextlib.redirect_stdout(io.StringIO()):
+        client.get(rule)   # pemanasan: import lazy
+        for cache in core.CACHES.values():
+            cache.clear()
+        del query[:], log_error[:]
+        response = client.get(rule)
+    body = response.get_data(as_text=True)
+    error = list(log_error)
+    if body.startswith("Error") or 'class="message error"' in body:
+        error.append("body berisi halaman/pesan error")
+    per_tabel = {}
+    for q in query:
+        per_tabel[q["tabel"]] = per_tabel.get(q["tabel"], 0) + 1
+    hasil[rule] = {
+        "status": response.status_code,
+        "error": error[:3],
+        "query": len(query),
+        "baris": sum(q["baris"] for q in query),
+        "per_tabel": per_tabel,
+    }
+
+print(json.dumps({"ukuran": ukuran, "route": hasil}))
+"""
+
+def ukur(baris, seed, direktori):
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    from data_sintetis import buat_data
+
+    path = os.path.join(direktori, f"anggaran-{baris}.db")
+    data = buat_data(path, baris, 3, seed)
+    env = dict(
+        os.environ, PYTHONDONTWRITEBYTECODE="1", DB_BACKEND="local", LOCAL_DB_PATH=path,
+        METRICS_PATH=os.path.join(direktori, "metrics.db"), PROFILE_SAMPLE_RATE="0",
+    )
+    hasil = subprocess.run(
+        [sys.executable, "-c", PROBE_QUERY, data["tenant"][0], json.dumps(sorted(DILEWATI))],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(hasil.stdout.strip().splitlines()[-1])
+
+def periksa(kecil, besar):
+    """Bandingkan hasil ukur dengan ANGGARAN; return daftar temuan per route"""
+    temuan = []
+    for rule in sorted(set(kecil["route"]) | set(besar["route"])):
+        k, b = kecil["route"].get(rule), besar["route"].get(rule)
+        rasio = b["baris"] / besar["ukuran"] if besar["ukuran"] else 0
+        masalah = []
+        if rule not in ANGGARAN:
+            masalah.append("belum ada di ANGGARAN")
+        else:
+            maks_query, maks_rasio = ANGGARAN[rule]
+            if k["status"] >= 500 or b["status"] >= 500:
+                masalah.append(f"status {k['status']}/{b['status']}")
+            if k["error"] or b["error"]:
+                masalah.append(f"halaman error ({(k['error'] or b['error'])[0][:80]})")
+            if k["query"] != b["query"]:
+                tumbuh = {t: n for t, n in b["per_tabel"].items() if n > k["per_tabel"].get(t, 0)}
+                masalah.append(f"query ikut ukuran data {k['query']} -> {b['query']} ({', '.join(f'{t} x{n}' for t, n in tumbuh.items())})")
+            elif b["query"] > maks_query:
+                masalah.append(f"{b['query']} query > anggaran {maks_query}")
+            if rasio > maks_rasio:
+                masalah.append(f"rasio baris {rasio:.3f} > anggaran {maks_rasio}")
+        temuan.append({
+            "route": rule,
+            "query_kecil": k["query"],
+            "query_besar": b["query"],
+            "baris": b["baris"],
+            "rasio_baris": rasio,
+            "masalah": masalah,
+        })
+    return temuan
+
+def gagal(t):
+    return bool(t["masalah"])
+
+def cetak(temuan, kecil, besar):
+    print("=" * 92)
+    print(f"🧮 Anggaran query per route (data {kecil['ukuran']:,} vs {besar['ukuran']:,} baris)")
+    print("=" * 92)
+    print(f"   {'Route':<36}{'Query':>13}{'Baris':>9}{'Rasio':>8}   Status")
+    for t in temuan:
+        if not t["masalah"]:
+            status = "✅"
+        else:
+            status = f"❌ {'; '.join(t['masalah'])}"
+        print(f"   {t['route']:<36}{t['query_kecil']:>6} -> {t['query_besar']:<4}{t['baris']:>9}{t['rasio_baris']:>8.3f}   {status}")
+    print("=" * 92)
+    jumlah_gagal = sum(gagal(t) for t in temuan)
+    print(f"   {'❌ ' + str(jumlah_gagal) + ' route melewati anggaran' if jumlah_gagal else '✅ Semua route dalam anggaran'}")
+    print("=" * 92)
+
+def usulan(temuan):
+    """Anggaran dari hasil ukur sekarang (rasio diberi kelonggaran 25%)"""
+    print("ANGGARAN = {")
+    for t in temuan:
+        query = min(t["query_kecil"], t["query_besar"])
+        rasio = max(math.ceil(t["rasio_baris"] * 1.25 * 100) / 100, 0.01) if query else 0
+        print(f'    "{t["route"]}": ({query}, {rasio:g}),')
+    print("}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Cek anggaran query dan baris per route (deteksi N+1)")
+    parser.add_argument("--kecil", type=int, default=300, help="baris jurnal dataset kecil")
+    parser.add_argument("--besar", type=int, default=3000, help="baris jurnal dataset besar")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--usulan", action="store_true", help="cetak ANGGARAN dari hasil ukur sekarang")
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pinkilang-anggaran-") as direktori:
+        kecil = ukur(args.kecil, args.seed, direktori)
+        besar = ukur(args.besar, args.seed, direktori)
+    temuan = periksa(kecil, besar)
+
+    if args.usulan:
+        usulan(temuan)
+    elif args.json:
+        print(json.dumps(temuan, indent=2))
+    else:
+        cetak(temuan, kecil, besar)
+    return 1 if any(gagal(t) for t in temuan) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Load test route Flask lewat gunicorn sungguhan dengan backend lokal (DB_BACKEND=local).
+
+Harness ini membuat database sintetis baru (benchmarks/data_sintetis.py) di
+direktori sementara, mengisi stok persediaan_terintegrasi dengan --stok, lalu
+menjalankan `gunicorn pinky2:app` di port lokal. Sejumlah virtual user (thread,
+masing-masing dengan session cookie sendiri) login lalu mengulang campuran
+request: GET /dashboard, /jurnal-umum, /neraca-lajur, /laba-rugi dan
+POST /penjualan, sampai --durasi habis.
+
+Hasil per route: jumlah request, throughput, latency p50/p90/p95/p99/max dan
+error (status >= 400 atau gagal koneksi). Setelah beban selesai stok dicek
+langsung di SQLite:
+
+- oversell     : stok akhir negatif, atau total penjualan baru > stok awal
+- lost update  : stok awal - total penjualan baru != stok akhir (dua request
+                 membaca stok yang sama lalu saling menimpa)
+
+    python benchmarks/beban.py                              # 20 VU, 30 detik, 4 worker sync
+    python benchmarks/beban.py --vu 50 --durasi 60 --workers 8
+    python benchmarks/beban.py --mode async --workers 2 --json
+
+Exit code 1 kalau ada oversell / lost update.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (route, bobot) campuran request per virtual user
+SKENARIO = [
+    ("GET /dashboard", 3),
+    ("GET /jurnal-umum", 2),
+    ("GET /neraca-lajur", 1),
+    ("GET /laba-rugi", 1),
+    ("POST /penjualan", 3),
+]
+
+def port_bebas():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def siapkan_data(direktori, baris, tenant, stok, seed):
+    """Database sintetis baru untuk satu run load test; return (path, daftar email tenant)"""
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    from data_sintetis import buat_data
+
+    path = os.path.join(direktori, "beban.db")
+    hasil = buat_data(path, baris, tenant, seed)
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE persediaan_terintegrasi SET jumlah_persediaan = ? WHERE id = 1", (stok,))
+    return path, hasil["tenant"]
+
+def baca_stok(path):
+    with sqlite3.connect(path) as conn:
+        stok = conn.execute("SELECT jumlah_persediaan FROM persediaan_terintegrasi WHERE id = 1").fetchone()[0]
+        id_terakhir = conn.execute("SELECT COALESCE(MAX(id), 0) FROM penjualan").fetchone()[0]
+    return stok, id_terakhir
+
+def penjualan_baru(path, setelah_id):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(jumlah), 0) FROM penjualan WHERE id > ?", (setelah_id,)
+        ).fetchone()
+
+class Server:
+    """gunicorn pinky2:app di port lokal dengan DB_BACKEND=local"""
+
+    def __init__(self, db_path, direktori, workers, mode, port):
+        self.url = f"http://127.0.0.1:{port}"
+        self.log_path = os.path.join(direktori, "gunicorn.log")
+        self.env = dict(
+            os.environ, PYTHONDONTWRITEBYTECODE="1", DB_BACKEND="local", LOCAL_DB_PATH=db_path,
+            SERVING_MODE=mode, METRICS_PATH=os.path.join(direktori, "metrics.db"),
+            PROFILE_SAMPLE_RATE="0",
+        )
+        self.args = [sys.executable, "-m", "gunicorn", "pinky2:app", "-b", f"127.0.0.1:{port}",
+                     "-w", str(workers), "--timeout", "120"]
+        self.proses = None
+
+    def __enter__(self):
+        self.log = open(self.log_path, "w")
+        self.proses = subprocess.Popen(self.args, cwd=ROOT, env=self.env, stdout=self.log, stderr=subprocess.STDOUT)
+        batas = time.monotonic() + 30
+        while time.monotonic() < batas:
+            if self.proses.poll() is not None:
+                raise RuntimeError(f"gunicorn berhenti saat start, lihat {self.log_path}")
+            try:
+                if httpx.get(self.url + "/healthz", timeout=1).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError("gunicorn tidak siap dalam 30 detik")
+
+    def __exit__(self, *exc):
+        self.proses.terminate()
+        try:
+            self.proses.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.proses.kill()
+        self.log.close()
+
+class VirtualUser(threading.Thread):
+    """Satu user: login sekali lalu kirim request acak dari SKENARIO sampai waktu habis"""
+
+    def __init__(self, nomor, url, email, batas_waktu, seed, jumlah_maks, catat):
+        super().__init__(name=f"vu-{nomor}", daemon=True)
+        self.url = url
+        self.email = email
+        self.batas_waktu = batas_waktu
+        self.rng = random.Random(seed * 1000 + nomor)
+        self.jumlah_maks = jumlah_maks
+        self.catat = catat
+        self.terjual = 0       # penjualan yang dikonfirmasi berhasil oleh response
+
+    def kirim(self, client, route, **kwargs):
+        method, path = route.split(" ", 1)
+        mulai = time.perf_counter()
+        try:
+            resp = client.request(method, path, **kwargs)
+            status = resp.status_code
+        except httpx.HTTPError:
+            resp, status = None, 0
+        self.catat(route, (time.perf_counter() - mulai) * 1000, status)
+        return resp
+
+    def form_penjualan(self):
+        kredit = self.rng.random() < 0.3
+        return {
+            "add_penjualan": "1",
+            "tanggal": date.today().isoformat(),
+            "nama_barang": "Lele",
+            "nama_pegawai": "Load Test",
+            "jumlah": str(self.rng.randint(1, self.jumlah_maks)),
+            "tipe_harga": self.rng.choice(["200", "500"]),
+            "harga_jual": "1000",
+            "metode_pembayaran": "KREDIT" if kredit else "TUNAI",
+            "nama_pelanggan": "Pelanggan Load Test" if kredit else "",
+        }
+
+    def run(self):
+        route, bobot = zip(*SKENARIO)
+        with httpx.Client(base_url=self.url, timeout=120) as client:
+            resp = self.kirim(client, "POST /login", data={"email": self.email, "password": "benchmark"})
+            if resp is None or resp.status_code != 302:
+                return
+            while time.monotonic() < self.batas_waktu:
+                pilihan = self.rng.choices(route, bobot)[0]
+                if pilihan == "POST /penjualan":
+                    form = self.form_penjualan()
+                    resp = self.kirim(client, pilihan, data=form)
+                    if resp is not None and "Transaksi berhasil" in resp.text:
+                        self.terjual += int(form["jumlah"])
+                else:
+                    self.kirim(client, pilihan)
+
+def persentil(nilai, p):
+    if not nilai:
+        return 0.0
+    urut = sorted(nilai)
+    return urut[min(len(urut) - 1, int(round(p / 100 * (len(urut) - 1))))]
+
+def jalankan(args):
+    direktori = tempfile.mkdtemp(prefix="pinkilang-beban-")
+    try:
+        db_path, tenant = siapkan_data(direktori, args.baris, args.tenant, args.stok, args.seed)
+        stok_awal, id_awal = baca_stok(db_path)
+
+        hasil_route = {}
+        kunci = threading.Lock()
+
+        def catat(route, ms, status):
+            with kunci:
+                r = hasil_route.setdefault(route, {"latency": [], "error": 0})
+                r["latency"].append(ms)
+                if status == 0 or status >= 400:
+                    r["error"] += 1
+
+        with Server(db_path, direktori, args.workers, args.mode, args.port or port_bebas()) as server:
+            mulai = time.monotonic()
+            batas = mulai + args.durasi
+            users = [VirtualUser(i, server.url, tenant[i % len(tenant)], batas, args.seed, args.jumlah_maks, catat)
+                     for i in range(args.vu)]
+            for u in users:
+                u.start()
+            for u in users:
+                u.join()
+            durasi = time.monotonic() - mulai
+
+        stok_akhir, _ = baca_stok(db_path)
+        jumlah_transaksi, total_terjual = penjualan_baru(db_path, id_awal)
+        dikonfirmasi = sum(u.terjual for u in users)
+    finally:
+        if args.simpan_db:
+            print(f"💾 Database dan log disimpan di {direktori}", file=sys.stderr)
+        else:
+            shutil.rmtree(direktori, ignore_errors=True)
+
+    route = {}
+    for nama, r in sorted(hasil_route.items()):
+        lat = r["latency"]
+        route[nama] = {
+            "request": len(lat),
+            "rps": len(lat) / durasi,
+            "error": r["error"],
+            **{f"p{p}_ms": persentil(lat, p) for p in (50, 90, 95, 99)},
+            "max_ms": max(lat),
+        }
+    total = sum(r["request"] for r in route.values())
+    return {
+        "vu": args.vu,
+        "workers": args.workers,
+        "mode": args.mode,
+        "durasi_s": durasi,
+        "request": total,
+        "rps": total / durasi,
+        "route": route,
+        "persediaan": {
+            "stok_awal": stok_awal,
+            "stok_akhir": stok_akhir,
+            "transaksi_baru": jumlah_transaksi,
+            "terjual_db": total_terjual,
+            "terjual_dikonfirmasi": dikonfirmasi,
+            "stok_seharusnya": stok_awal - total_terjual,
+            "oversell": stok_akhir < 0 or total_terjual > stok_awal,
+            "lost_update": stok_awal - total_terjual != stok_akhir,
+        },
+    }
+
+def cetak(hasil):
+    print("=" * 86)
+    print(f"🏋️ Load test: {hasil['vu']} VU, {hasil['workers']} worker {hasil['mode']}, "
+          f"{hasil['durasi_s']:.0f} detik - {hasil['request']:,} request ({hasil['rps']:.1f} req/s)")
+    print("=" * 86)
+    print(f"   {'Route':<22}{'Req':>7}{'Req/s':>8}{'Err':>6}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'Max':>9}")
+    for nama, r in hasil["route"].items():
+        print(f"   {nama:<22}{r['request']:>7}{r['rps']:>8.1f}{r['error']:>6}"
+              + "".join(f"{r[k]:>7.0f}ms" for k in ("p50_ms", "p90_ms", "p95_ms", "p99_ms", "max_ms")))
+    p = hasil["persediaan"]
+    print("-" * 86)
+    print(f"   Stok awal {p['stok_awal']:g}, terjual {p['terjual_db']:g} ({p['transaksi_baru']} transaksi, "
+          f"{p['terjual_dikonfirmasi']:g} dikonfirmasi response), stok akhir {p['stok_akhir']:g} "
+          f"(seharusnya {p['stok_seharusnya']:g})")
+    print(f"   Oversell    : {'❌ YA' if p['oversell'] else '✅ tidak'}")
+    print(f"   Lost update : {'❌ YA' if p['lost_update'] else '✅ tidak'}")
+    print("=" * 86)
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test route pinky2 via gunicorn dengan backend lokal")
+    parser.add_argument("--vu", type=int, default=20, help="jumlah virtual user bersamaan")
+    parser.add_argument("--durasi", type=float, default=30, help="lama beban (detik)")
+    parser.add_argument("--workers", type=int, default=4, help="jumlah worker gunicorn")
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync", help="SERVING_MODE gunicorn")
+    parser.add_argument("--port", type=int, default=0, help="port gunicorn (default: port bebas)")
+    parser.add_argument("--baris", type=int, default=10_000, help="baris jurnal_umum data sintetis")
+    parser.add_argument("--tenant", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stok", type=int, default=500, help="stok awal persediaan_terintegrasi")
+    parser.add_argument("--jumlah-maks", type=int, default=5, help="jumlah ekor maksimum per penjualan")
+    parser.add_argument("--simpan-db", action="store_true", help="jangan hapus database dan log gunicorn")
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    # log per request httpx hanya mengotori output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    hasil = jalankan(args)
+    if args.json:
+        print(json.dumps(hasil, indent=2))
+    else:
+        cetak(hasil)
+
+    p = hasil["persediaan"]
+    return 1 if p["oversell"] or p["lost_update"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Generator data akuntansi sintetis untuk backend lokal (DB_BACKEND=local).
+
+Deterministik: seed + jumlah baris + jumlah tenant yang sama selalu menghasilkan
+database yang sama, jadi hasil benchmark antar commit bisa dibandingkan.
+Tiap tenant punya modal awal, saldo awal (NSA), aset tetap, dan dokumen
+penjualan (tunai/kredit, sebagian dilunasi bertahap), pembelian dan
+operasional beserta jurnalnya, sampai total baris jurnal_umum tercapai
+(dokumen terakhir tidak dipotong, jadi bisa lebih beberapa baris; jurnal selalu balance).
+
+    python benchmarks/data_sintetis.py /tmp/pinkilang-10k.db --baris 10000
+    python benchmarks/data_sintetis.py /tmp/pinkilang-1m.db --baris 1000000 --tenant 20
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BARANG = ["Lele", "Nila", "Gurame", "Patin", "Mas", "Bawal"]
+PELANGGAN = ["Toko Makmur", "RM Sederhana", "Pak Budi", "Bu Sari", "CV Segar", "Warung Ijo", "Pasar Induk"]
+SUPPLIER = ["Tambak Jaya", "Kolam Sejahtera", "UD Benih", "Koperasi Mina"]
+OPERASIONAL = [("Beban Perlengkapan", "Pakan"), ("Beban TLA", "Listrik"), ("Beban Lain-Lain", "Transport")]
+ASET = [("Tanah", "Tanah Kolam", 0), ("Bangunan", "Gudang", 20), ("Kendaraan", "Mobil Pickup", 8),
+        ("Peralatan", "Pompa Air", 4), ("Peralatan", "Aerator", 3)]
+
+TANGGAL_AWAL = date(2025, 1, 1)
+
+def _hapus_db(path):
+    for akhiran in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + akhiran)
+        except FileNotFoundError:
+            pass
+
+def _buat_skema(path):
+    # Skema diambil dari backend lokal supaya sama persis dengan yang dipakai aplikasi
+    sys.path.insert(0, ROOT)
+    from pinkilang.local_db import SCHEMA_LOKAL
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA_LOKAL)
+    return conn
+
+class Tenant:
+    """Kumpulan baris satu tenant, id dokumen diisi berurutan per tabel"""
+
+    def __init__(self, gen, email, user_id):
+        self.gen = gen
+        self.email = email
+        self.user_id = user_id
+
+    def jurnal(self, tanggal, baris, tipe, transaksi_id):
+        # Jurnal dokumen diberi ref_id + nomor baris seperti akuntansi.buat_entri_jurnal
+        ref_id = f"{tipe}_{transaksi_id}" if tipe in ("PENJUALAN", "PEMBELIAN", "OPERASIONAL") else None
+        for nomor, (nama_akun, debit, kredit, keterangan) in enumerate(baris, 1):
+            self.gen.tambah("jurnal_umum", {
+                "tanggal": tanggal, "nama_akun": nama_akun, "debit": debit, "kredit": kredit,
+                "deskripsi": keterangan, "keterangan": keterangan, "transaksi_type": tipe,
+                "transaksi_id": str(transaksi_id), "ref_id": ref_id, "ref_baris": nomor if ref_id else None,
+                "user_email": self.email, "created_at": f"{tanggal}T08:00:00",
+            })
+
+class GeneratorLedger:
+    def __init__(self, seed=42):
+        self.rng = random.Random(seed)
+        self.baris = {}
+        self.id_terakhir = {}
+        self.jumlah_jurnal = 0
+
+    def tambah(self, tabel, row):
+        self.id_terakhir[tabel] = self.id_terakhir.get(tabel, 0) + 1
+        row = {"id": self.id_terakhir[tabel], **row}
+        self.baris.setdefault(tabel, []).append(row)
+        if tabel == "jurnal_umum":
+            self.jumlah_jurnal += 1
+        return row["id"]
+
+    def tanggal(self, hari_maks=364):
+        return (TANGGAL_AWAL + timedelta(days=self.rng.randint(0, hari_maks))).isoformat()
+
+    def siapkan_tenant(self, nomor):
+        email = f"tenant{nomor:03d}@pinkilang.test"
+        user_id = self.tambah("user", {"email": email, "password": "benchmark"})
+        t = Tenant(self, email, user_id)
+        rng = self.rng
+
+        modal = rng.randrange(50, 500) * 1_000_000
+        modal_id = self.tambah("modal", {"user_id": user_id, "user_email": email, "tanggal": "2025-01-01", "jumlah": modal,
+                                         "keterangan": "Modal Awal: setoran pemilik", "tipe": "MODAL_AWAL", "sumber_modal": "CASH"})
+        t.jurnal("2025-01-01", [("Kas", modal, 0, "Modal awal"), ("Modal Pemilik", 0, modal, "Modal awal")], "MODAL_AWAL", modal_id)
+
+        for nama_akun, debit, kredit in [("Kas", rng.randrange(5, 50) * 1_000_000, 0),
+                                         ("Persediaan Barang Dagang", rng.randrange(5, 30) * 1_000_000, 0),
+                                         ("Perlengkapan", rng.randrange(1, 5) * 1_000_000, 0)]:
+            self.tambah("neraca_saldo_awal", {"user_email": email, "tanggal": "2025-01-01", "nama_akun": nama_akun,
+                                              "debit": debit, "kredit": kredit, "keterangan": "Saldo awal"})
+
+        for jenis, nama, umur in rng.sample(ASET, rng.randint(2, len(ASET))):
+            nilai = rng.randrange(10, 300) * 1_000_000
+            residu = nilai // 10 if umur else nilai
+            tahunan = (nilai - residu) / umur if umur else 0
+            self.tambah("aset_tetap", {
+                "user_email": email, "tanggal_perolehan": self.tanggal(180), "jenis_aset": jenis, "nama_aset": nama,
+                "nilai_perolehan": nilai, "masa_manfaat": umur, "nilai_residu": residu,
+                "metode_penyusutan": "GARIS_LURUS", "penyusutan_tahunan": tahunan,
+                "akumulasi_penyusutan": 0, "nilai_buku": nilai,
+            })
+        return t
+
+    def penjualan(self, t):
+        rng = self.rng
+        tanggal = self.tanggal()
+        jumlah = rng.randint(5, 200)
+        harga_beli = rng.randrange(15, 40) * 1000
+        harga_jual = harga_beli + rng.randrange(3, 15) * 1000
+        total, hpp = jumlah * harga_jual, jumlah * harga_beli
+        kredit = rng.random() < 0.4
+        pelanggan = rng.choice(PELANGGAN)
+        barang = rng.choice(BARANG)
+        pid = self.tambah("penjualan", {
+            "user_id": t.user_id, "user_email": t.email, "tanggal": tanggal, "nama_barang": barang,
+            "nama_pegawai": "Pegawai", "nama_pelanggan": pelanggan if kredit else "", "jumlah": jumlah,
+            "harga_beli": harga_beli, "harga_jual": harga_jual, "total_penjualan": total, "hpp": hpp,
+            "metode_pembayaran": "KREDIT" if kredit else "CASH",
+        })
+        t.jurnal(tanggal, [
+            ("Piutang Usaha" if kredit else "Kas", total, 0, f"Penjualan {barang}"),
+            ("Penjualan", 0, total, f"Penjualan {barang}"),
+            ("HPP", hpp, 0, f"HPP {barang}"),
+            ("Persediaan Barang Dagang", 0, hpp, f"HPP {barang}"),
+        ], "PENJUALAN", pid)
+
+        # 70% penjualan kredit dilunasi sebagian/seluruhnya dalam 1-3 cicilan
+        if kredit and rng.random() < 0.7:
+            sisa = total
+            for _ in range(rng.randint(1, 3)):
+                bayar = min(sisa, rng.randrange(1, 10) * total // 10)
+                if bayar <= 0:
+                    break
+                sisa -= bayar
+                tgl_bayar = min(date.fromisoformat(tanggal) + timedelta(days=rng.randint(7, 60)), date(2025, 12, 31)).isoformat()
+                lid = self.tambah("pelunasan_piutang", {"penjualan_id": pid, "tanggal_bayar": tgl_bayar, "jumlah_bayar": bayar,
+                                                        "metode_pembayaran": "CASH", "user_email": t.email})
+                t.jurnal(tgl_bayar, [("Kas", bayar, 0, f"Pelunasan piutang {pelanggan}"),
+                                     ("Piutang Usaha", 0, bayar, f"Pelunasan piutang {pelanggan}")], "PELUNASAN_PIUTANG", lid)
+
+    def pembelian(self, t):
+        rng = self.rng
+        tanggal = self.tanggal()
+        jumlah = rng.randint(50, 500)
+        harga = rng.randrange(10, 30) * 1000
+        total = jumlah * harga
+        kredit = rng.random() < 0.3
+        supplier = rng.choice(SUPPLIER)
+        barang = rng.choice(BARANG)
+        pid = self.tambah("pembelian", {
+            "user_id": t.user_id, "user_email": t.email, "tanggal": tanggal, "nama_barang": barang,
+            "nama_supplier": supplier, "jumlah": jumlah, "harga_beli_per_ekor": harga, "total_pembelian": total,
+            "metode_pembayaran": "KREDIT" if kredit else "CASH",
+        })
+        t.jurnal(tanggal, [("Persediaan Barang Dagang", total, 0, f"Pembelian {barang}"),
+                           ("Utang Usaha" if kredit else "Kas", 0, total, f"Pembelian dari {supplier}")], "PEMBELIAN", pid)
+
+    def operasional(self, t):
+        rng = self.rng
+        tanggal = self.tanggal()
+        akun, nama = rng.choice(OPERASIONAL)
+        jumlah = rng.randint(1, 20)
+        harga = rng.randrange(5, 100) * 1000
+        oid = self.tambah("operasional", {
+            "user_id": t.user_id, "user_email": t.email, "tanggal": tanggal, "jenis_pengeluaran": akun,
+            "nama_barang": nama, "jumlah": jumlah, "satuan": "unit", "harga_satuan": harga,
+            "total_pengeluaran": jumlah * harga, "supplier": rng.choice(SUPPLIER), "metode_pembayaran": "CASH",
+            "keterangan": nama,
+        })
+        t.jurnal(tanggal, [(akun, jumlah * harga, 0, nama), ("Kas", 0, jumlah * harga, nama)], "OPERASIONAL", oid)
+
+    def isi(self, baris_jurnal, jumlah_tenant):
+        tenant = [self.siapkan_tenant(i + 1) for i in range(jumlah_tenant)]
+        dokumen = [self.penjualan] * 5 + [self.pembelian] * 3 + [self.operasional] * 2
+        while self.jumlah_jurnal < baris_jurnal:
+            self.rng.choice(dokumen)(self.rng.choice(tenant))
+
+        persediaan = sum(r["jumlah"] for r in self.baris.get("pembelian", [])) - sum(r["jumlah"] for r in self.baris.get("penjualan", []))
+        self.tambah("persediaan_terintegrasi", {"jumlah_persediaan": max(persediaan, 0), "created_by": "benchmark", "updated_by": "benchmark"})
+        return tenant
+
+def buat_data(path, baris_jurnal, jumlah_tenant=3, seed=42):
+    """Buat ulang database `path`; return ringkasan jumlah baris per tabel"""
+    mulai = time.perf_counter()
+    gen = GeneratorLedger(seed)
+    tenant = gen.isi(baris_jurnal, jumlah_tenant)
+
+    _hapus_db(path)
+    conn = _buat_skema(path)
+    conn.execute("BEGIN")
+    for tabel, rows in gen.baris.items():
+        kolom = list(rows[0])
+        conn.executemany(
+            f'INSERT INTO "{tabel}" ({", ".join(kolom)}) VALUES ({", ".join("?" * len(kolom))})',
+            [tuple(r.get(k) for k in kolom) for r in rows]
+        )
+    conn.execute("COMMIT")
+    conn.execute("ANALYZE")
+    conn.close()
+
+    return {
+        "path": path,
+        "seed": seed,
+        "tenant": [t.email for t in tenant],
+        "baris": {tabel: len(rows) for tabel, rows in gen.baris.items()},
+        "detik": round(time.perf_counter() - mulai, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Buat database SQLite sintetis untuk DB_BACKEND=local")
+    parser.add_argument("path", help="file SQLite tujuan (ditimpa)")
+    parser.add_argument("--baris", type=int, default=10_000, help="jumlah baris jurnal_umum")
+    parser.add_argument("--tenant", type=int, default=3, help="jumlah tenant (user)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    hasil = buat_data(args.path, args.baris, args.tenant, args.seed)
+    print("=" * 60)
+    print(f"🧪 Data sintetis: {hasil['path']} ({hasil['detik']} detik)")
+    print("=" * 60)
+    for tabel, jumlah in sorted(hasil["baris"].items()):
+        print(f"   {tabel:<28}{jumlah:>10,}")
+    print(f"   Login benchmark: {hasil['tenant'][0]}")
+    print("=" * 60)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Benchmark perhitungan laporan di atas data sintetis (backend lokal SQLite).
+
+Untuk tiap skala (jumlah baris jurnal_umum) database dibuat sekali oleh
+benchmarks/data_sintetis.py lalu di-cache di benchmarks/.data. Tiap skala
+diukur di proses Python baru dengan DB_BACKEND=local: waktu (median/min dari
+beberapa putaran), memori puncak (tracemalloc) serta jumlah query dan baris
+yang dibaca dari database (hook instrumentasi core.QUERY_HOOKS).
+
+Hasil ditambahkan ke benchmarks/hasil/laporan.jsonl bersama commit git-nya,
+jadi hasil commit sekarang bisa dibandingkan dengan commit sebelumnya:
+
+    python benchmarks/laporan.py                         # skala 1k, 10k, 100k
+    python benchmarks/laporan.py --skala 1000000 -n 1
+    python benchmarks/laporan.py --bandingkan            # selisih vs commit lain terakhir
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "benchmarks", ".data")
+HASIL_PATH = os.path.join(ROOT, "benchmarks", "hasil", "laporan.jsonl")
+
+# Dijalankan di proses anak dengan DB_BACKEND=local
+PROBE_LAPORAN = r"""
+import contextlib, io, json, logging, statistics, sys, time, tracemalloc
+
+logging.disable(logging.CRITICAL)
+email, putaran = sys.argv[1], int(sys.argv[2])
+
+import pinky2
+from flask import session
+from pinkilang import core
+from pinkilang.statements.laba_rugi import get_neraca_lajur_simple, hitung_laba_rugi_terintegrasi
+from pinkilang.statements.arus_kas import hitung_arus_kas_fixed
+from pinkilang.ledger.buku_besar import get_piutang_data
+
+app = pinky2.app
+query = []
+core.QUERY_HOOKS.append(query.append)
+
+client = app.test_client()
+with client.session_transaction() as s:
+    s["logged_in"] = True
+    s["user_email"] = email
+    s["user_id"] = 1
+
+with app.test_request_context(), contextlib.redirect_stdout(io.StringIO()):
+    akun_data = get_neraca_lajur_simple()["akun_data"]
+
+def route(path):
+    def jalan():
+        resp = client.get(path)
+        assert resp.status_code == 200, resp.status_code
+    return jalan
+
+KASUS = {
+    "get_neraca_lajur_simple": get_neraca_lajur_simple,
+    "hitung_laba_rugi_terintegrasi": lambda: hitung_laba_rugi_terintegrasi(akun_data),
+    "hitung_arus_kas_fixed": hitung_arus_kas_fixed,
+    "get_piutang_data": get_piutang_data,
+    "GET /neraca-lajur": route("/neraca-lajur"),
+}
+
+def panggil(fungsi):
+    with app.test_request_context(), contextlib.redirect_stdout(io.StringIO()):
+        session.update({"logged_in": True, "user_email": email, "user_id": 1})
+        fungsi()
+
+hasil = {}
+for nama, fungsi in KASUS.items():
+    panggil(fungsi)   # pemanasan: import lazy, cache statement SQLite
+
+    del query[:]
+    waktu = []
+    for _ in range(putaran):
+        mulai = time.perf_counter()
+        panggil(fungsi)
+        waktu.append((time.perf_counter() - mulai) * 1000)
+    jumlah_query = len(query) / putaran
+    baris_db = sum(q["baris"] for q in query) / putaran
+
+    tracemalloc.start()
+    panggil(fungsi)
+    puncak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    hasil[nama] = {
+        "median_ms": statistics.median(waktu),
+        "min_ms": min(waktu),
+        "peak_mb": puncak / 1024 / 1024,
+        "query": jumlah_query,
+        "baris_db": baris_db,
+    }
+
+print(json.dumps(hasil))
+"""
+
+def info_git():
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown", "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+def siapkan_data(baris, tenant, seed):
+    """Path database sintetis untuk skala ini, dibuat kalau belum ada di cache"""
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    from data_sintetis import buat_data
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    path = os.path.join(DATA_DIR, f"ledger-{baris}-t{tenant}-s{seed}.db")
+    if not os.path.exists(path):
+        print(f"🧪 Membuat data sintetis {baris:,} baris jurnal ...", file=sys.stderr)
+        buat_data(path, baris, tenant, seed)
+    return path
+
+def ukur_skala(baris, tenant, seed, putaran):
+    path = siapkan_data(baris, tenant, seed)
+    env = dict(
+        os.environ, PYTHONDONTWRITEBYTECODE="1", DB_BACKEND="local", LOCAL_DB_PATH=path,
+        METRICS_PATH=os.path.join(DATA_DIR, "metrics-benchmark.db"), PROFILE_SAMPLE_RATE="0",
+    )
+    email = "tenant001@pinkilang.test"
+    hasil = subprocess.run(
+        [sys.executable, "-c", PROBE_LAPORAN, email, str(putaran)], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(hasil.stdout.strip().splitlines()[-1])
+
+def muat_riwayat():
+    if not os.path.exists(HASIL_PATH):
+        return []
+    with open(HASIL_PATH) as f:
+        return [json.loads(baris) for baris in f if baris.strip()]
+
+def simpan(record):
+    os.makedirs(os.path.dirname(HASIL_PATH), exist_ok=True)
+    with open(HASIL_PATH, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+def pembanding(riwayat, record):
+    """Record terakhir dengan skala/tenant/seed sama dari commit lain"""
+    for lama in reversed(riwayat):
+        if (lama["commit"], lama["baris"], lama["tenant"], lama["seed"]) != (record["commit"], record["baris"], record["tenant"], record["seed"]) \
+                and (lama["baris"], lama["tenant"], lama["seed"]) == (record["baris"], record["tenant"], record["seed"]):
+            return lama
+    return None
+
+def cetak(record, lama=None):
+    print("=" * 78)
+    judul = f"📈 {record['baris']:,} baris jurnal, {record['tenant']} tenant - commit {record['commit']}{'+' if record['dirty'] else ''}"
+    print(judul + (f" vs {lama['commit']}" if lama else ""))
+    print("=" * 78)
+    print(f"   {'Kasus':<32}{'Median':>11}{'Min':>11}{'Puncak':>10}{'Query':>7}{'Baris DB':>10}")
+    for nama, h in record["hasil"].items():
+        baris = f"   {nama:<32}{h['median_ms']:>9.1f}ms{h['min_ms']:>9.1f}ms{h['peak_mb']:>8.1f}MB{h['query']:>7.0f}{h['baris_db']:>10.0f}"
+        if lama and nama in lama["hasil"] and lama["hasil"][nama]["median_ms"]:
+            selisih = (h["median_ms"] / lama["hasil"][nama]["median_ms"] - 1) * 100
+            baris += f"  {selisih:+.0f}%"
+        print(baris)
+    print("=" * 78)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark perhitungan laporan di atas data sintetis")
+    parser.add_argument("--skala", default="1000,10000,100000", help="jumlah baris jurnal, dipisah koma")
+    parser.add_argument("--tenant", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-n", "--putaran", type=int, default=3, help="putaran per kasus (median)")
+    parser.add_argument("--bandingkan", action="store_true", help="tampilkan selisih vs hasil commit lain terakhir")
+    parser.add_argument("--tanpa-simpan", action="store_true", help="jangan tambahkan hasil ke laporan.jsonl")
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    git = info_git()
+    riwayat = muat_riwayat()
+    semua = []
+    for baris in (int(s) for s in args.skala.split(",") if s.strip()):
+        record = {
+            **git,
+            "waktu": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "baris": baris,
+            "tenant": args.tenant,
+            "seed": args.seed,
+            "putaran": args.putaran,
+            "hasil": ukur_skala(baris, args.tenant, args.seed, args.putaran),
+        }
+        semua.append(record)
+        if not args.tanpa_simpan:
+            simpan(record)
+        if not args.json:
+            cetak(record, pembanding(riwayat, record) if args.bandingkan else None)
+
+    if args.json:
+        print(json.dumps(semua, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Benchmark boot worker: waktu import `pinky2`, memori (RSS) dan jumlah koneksi jaringan.
+
+Tiap putaran dijalankan di proses Python baru (seperti worker gunicorn yang boot
+tanpa --preload), jadi hasilnya tidak terpengaruh cache modul dari putaran lain.
+
+    python benchmarks/startup.py            # 5 putaran
+    python benchmarks/startup.py -n 20 --json
+    python benchmarks/startup.py --per-blueprint
+
+Mode --per-blueprint mengukur cold start tiap blueprint: request pertama ke
+semua route GET-nya (yang memicu import modul view secara lazy) dan tambahan
+RSS setelahnya. Request dikirim tanpa login dan tanpa konfigurasi Supabase,
+jadi yang terukur adalah biaya memuat kode, bukan query.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# RSS saat ini dari /proc (Linux), fallback ke RSS puncak
+RSS_KB = r"""
+import resource
+
+def rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            for baris in f:
+                if baris.startswith("VmRSS:"):
+                    return int(baris.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+# Dijalankan di proses anak: hitung koneksi socket / DNS selama import lalu ukur memori
+PROBE = RSS_KB + r"""
+import json, resource, socket, sys, time
+
+jaringan = []
+_connect = socket.socket.connect
+_getaddrinfo = socket.getaddrinfo
+
+def connect(self, address):
+    jaringan.append(str(address))
+    return _connect(self, address)
+
+def getaddrinfo(host, *args, **kwargs):
+    jaringan.append(str(host))
+    return _getaddrinfo(host, *args, **kwargs)
+
+socket.socket.connect = connect
+socket.getaddrinfo = getaddrinfo
+
+rss_awal = rss_kb()
+mulai = time.perf_counter()
+import pinky2
+waktu_import = time.perf_counter() - mulai
+rss_import = rss_kb()
+
+mulai = time.perf_counter()
+pinky2.app.test_client().get("/healthz")
+waktu_request = time.perf_counter() - mulai
+
+print(json.dumps({
+    "import_ms": waktu_import * 1000,
+    "first_request_ms": waktu_request * 1000,
+    "rss_awal_mb": rss_awal / 1024,
+    "rss_mb": rss_import / 1024,
+    "rss_puncak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "network_calls": jaringan,
+}))
+"""
+
+
+# Dijalankan di proses anak: boot app lalu panggil semua route GET milik satu blueprint
+PROBE_BLUEPRINT = RSS_KB + r"""
+import json, sys, time
+
+nama = sys.argv[1]
+import pinky2
+rss_boot = rss_kb()
+modul_boot = set(sys.modules)
+
+client = pinky2.app.test_client()
+rules = [r for r in pinky2.app.url_map.iter_rules()
+         if r.endpoint.startswith(nama + ".") and "GET" in r.methods and not r.arguments]
+route = {}
+mulai_total = time.perf_counter()
+for rule in rules:
+    mulai = time.perf_counter()
+    client.get(rule.rule)
+    route[rule.rule] = (time.perf_counter() - mulai) * 1000
+waktu_total = (time.perf_counter() - mulai_total) * 1000
+
+mulai = time.perf_counter()
+for rule in rules:
+    client.get(rule.rule)
+waktu_hangat = (time.perf_counter() - mulai) * 1000
+
+print(json.dumps({
+    "routes": len(rules),
+    "cold_ms": waktu_total,
+    "warm_ms": waktu_hangat,
+    "rss_boot_mb": rss_boot / 1024,
+    "rss_tambahan_mb": (rss_kb() - rss_boot) / 1024,
+    "modul_dimuat": sorted(m for m in set(sys.modules) - modul_boot if m.startswith("pinkilang")),
+    "route_ms": route,
+}))
+"""
+
+
+def jalankan_probe(kode, *args, env_tambahan=None):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", **(env_tambahan or {}))
+    hasil = subprocess.run(
+        [sys.executable, "-c", kode, *args], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(hasil.stdout.strip().splitlines()[-1])
+
+
+def satu_putaran():
+    return jalankan_probe(PROBE)
+
+
+def ukur_blueprint(nama, putaran):
+    # Supabase sengaja dikosongkan supaya tidak ada request jaringan sama sekali
+    env = {"SUPABASE_URL": "", "SUPABASE_KEY": ""}
+    hasil = [jalankan_probe(PROBE_BLUEPRINT, nama, env_tambahan=env) for _ in range(putaran)]
+    return {
+        "blueprint": nama,
+        "routes": hasil[0]["routes"],
+        "cold_ms": statistics.median(h["cold_ms"] for h in hasil),
+        "warm_ms": statistics.median(h["warm_ms"] for h in hasil),
+        "rss_tambahan_mb": statistics.median(h["rss_tambahan_mb"] for h in hasil),
+        "modul_dimuat": hasil[0]["modul_dimuat"],
+    }
+
+
+def cetak_blueprint(semua):
+    print("=" * 60)
+    print("📦 Cold start per blueprint (median)")
+    print("=" * 60)
+    print(f"   {'Blueprint':<14}{'Route':>6}{'Cold':>11}{'Hangat':>10}{'RSS +':>10}")
+    for b in semua:
+        print(f"   {b['blueprint']:<14}{b['routes']:>6}{b['cold_ms']:>9.1f}ms{b['warm_ms']:>8.1f}ms{b['rss_tambahan_mb']:>8.1f}MB")
+    print("=" * 60)
+
+
+def ringkas(putaran):
+    def stat(kunci):
+        nilai = [p[kunci] for p in putaran]
+        return {"median": statistics.median(nilai), "min": min(nilai), "max": max(nilai)}
+
+    return {
+        "putaran": len(putaran),
+        "import_ms": stat("import_ms"),
+        "first_request_ms": stat("first_request_ms"),
+        "rss_mb": stat("rss_mb"),
+        "rss_puncak_mb": stat("rss_puncak_mb"),
+        "network_calls": sorted({c for p in putaran for c in p["network_calls"]}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu boot dan memori worker pinky2")
+    parser.add_argument("-n", "--putaran", type=int, default=5, help="jumlah proses yang diukur")
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    parser.add_argument("--per-blueprint", action="store_true", help="ukur cold start dan RSS tiap blueprint")
+    args = parser.parse_args()
+
+    if args.per_blueprint:
+        sys.path.insert(0, ROOT)
+        from pinkilang import BLUEPRINTS
+        semua = [ukur_blueprint(nama, args.putaran) for nama in BLUEPRINTS]
+        if args.json:
+            print(json.dumps(semua, indent=2))
+        else:
+            cetak_blueprint(semua)
+        return 0
+
+    hasil = ringkas([satu_putaran() for _ in range(args.putaran)])
+
+    if args.json:
+        print(json.dumps(hasil, indent=2))
+    else:
+        print("=" * 60)
+        print(f"🚀 Boot worker pinky2 ({hasil['putaran']} putaran, median [min - max])")
+        print("=" * 60)
+        for kunci, label, satuan in [
+            ("import_ms", "Import modul", "ms"),
+            ("first_request_ms", "Request pertama /healthz", "ms"),
+            ("rss_mb", "RSS setelah import", "MB"),
+            ("rss_puncak_mb", "RSS puncak", "MB"),
+        ]:
+            s = hasil[kunci]
+            print(f"   {label:<26} {s['median']:8.1f} {satuan}  [{s['min']:.1f} - {s['max']:.1f}]")
+        jaringan = hasil["network_calls"]
+        print(f"   {'Koneksi jaringan':<26} {len(jaringan):8d}     {', '.join(jaringan) if jaringan else '✅ tidak ada'}")
+        print("=" * 60)
+
+    # Gagal (exit 1) kalau import masih melakukan I/O jaringan
+    return 1 if hasil["network_calls"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
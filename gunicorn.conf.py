@@ -0,0 +1,33 @@
+"""
+Konfigurasi gunicorn - dibaca otomatis oleh `gunicorn pinky2:app` (Procfile).
+
+SERVING_MODE=sync  (default) worker sync: satu request per proses, seperti sebelumnya.
+SERVING_MODE=async           worker gthread dengan banyak thread per proses. Query
+                             dikirim lewat event loop async bersama (SUPABASE_ASYNC=1,
+                             HTTP/2 + pool keep-alive), jadi thread yang menunggu
+                             PostgREST tidak memegang koneksi sendiri dan satu proses
+                             bisa melayani banyak user sekaligus.
+
+Metrics /metrics digabung dari snapshot semua worker (METRICS_PATH); snapshot
+dari run sebelumnya dihapus sekali saat master start. Tiap worker menjalankan
+thread purge tombstone soft delete (PURGE_INTERVAL).
+"""
+import os
+
+SERVING_MODE = os.getenv("SERVING_MODE", "sync")
+
+if SERVING_MODE == "async":
+    worker_class = "gthread"
+    threads = int(os.getenv("GUNICORN_THREADS", "32"))
+    os.environ.setdefault("SUPABASE_ASYNC", "1")
+
+def on_starting(server):
+    from pinkilang.metrics import reset_metrics
+
+    reset_metrics()
+
+def post_fork(server, worker):
+    # Purge tombstone soft delete di background (satu worker per putaran, lihat pinkilang.soft_delete)
+    from pinkilang.soft_delete import get_purge_worker
+
+    get_purge_worker()
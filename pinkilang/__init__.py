@@ -0,0 +1,38 @@
+"""
+PINKILANG - aplikasi akuntansi (Flask + Supabase).
+
+Route dikelompokkan per blueprint (auth, transactions, ledger, statements,
+assets, admin). Tiap blueprint hanya mendaftarkan URL; modul view beserta
+HTML laporannya baru di-import saat route-nya pertama kali diminta
+(lihat pinkilang.lazy), jadi worker yang tidak pernah melayani suatu laporan
+juga tidak pernah memuatnya.
+"""
+import os
+from importlib import import_module
+from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
+from pinkilang.core import pasang_instrumentasi
+from pinkilang.metrics import pasang_metrics
+from pinkilang.profiling import pasang_profiling
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BLUEPRINTS = ("auth", "transactions", "ledger", "statements", "assets", "admin")
+# Jumlah proxy tepercaya di depan app (Heroku router = 1). 0 = X-Forwarded-For diabaikan,
+# karena header itu bisa dikirim klien sendiri untuk lolos dari limit per IP.
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))
+
+def create_app():
+    app = Flask(__name__, root_path=PROJECT_ROOT)
+    app.secret_key = os.getenv("SECRET_KEY", "pinkilang_secret_123")
+    if TRUSTED_PROXY_COUNT > 0:
+        # remote_addr = hop ke-N dari belakang X-Forwarded-For (yang ditambahkan proxy sendiri)
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_COUNT)
+
+    for nama in BLUEPRINTS:
+        app.register_blueprint(import_module(f"pinkilang.{nama}").bp)
+
+    pasang_instrumentasi(app)
+    pasang_metrics(app)
+    pasang_profiling(app)
+
+    return app
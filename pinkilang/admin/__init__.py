@@ -0,0 +1,59 @@
+"""Blueprint admin: health check, metrics, profil request, perbaikan data, hapus transaksi dan perintah CLI"""
+import click
+from flask import Blueprint, Response, jsonify, request
+from pinkilang import core, metrics
+from pinkilang.lazy import lazy_route
+
+bp = Blueprint("admin", __name__, cli_group=None)
+
+lazy_route(bp, "/fix-jurnal-problem", "perbaikan.fix_jurnal_problem")
+lazy_route(bp, "/fix-kas-data-complete", "perbaikan.fix_kas_data_complete")
+lazy_route(bp, "/create-aset-tetap-table", "perbaikan.create_aset_tetap_table")
+lazy_route(bp, "/admin/profiles", "profil.daftar_profil_view")
+lazy_route(bp, "/admin/profiles/<nama>", "profil.detail_profil")
+lazy_route(bp, "/admin/profiles/<nama>/<any(prof, collapsed):jenis>", "profil.unduh_profil")
+lazy_route(bp, "/hapus-transaksi-massal", "hapus_transaksi.hapus_transaksi_massal", methods=["GET", "POST"])
+lazy_route(bp, "/hapus-transaksi-massal/status/<int:job_id>", "hapus_transaksi.status_hapus_semua")
+
+@bp.route("/healthz")
+def healthz():
+    """Liveness: proses hidup, tanpa menyentuh database"""
+    return jsonify({"status": "ok"})
+
+@bp.route("/readyz")
+def readyz():
+    """Readiness: worker siap melayani kalau database bisa di-query"""
+    siap = core.cek_kesiapan_supabase()
+    return jsonify({"status": "ready" if siap else "not ready", "database": core.db_status, "detail": core.db_detail}), (200 if siap else 503)
+
+@bp.route("/metrics")
+def metrics_prometheus():
+    """Metrics format Prometheus, gabungan semua worker gunicorn"""
+    if metrics.METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {metrics.METRICS_TOKEN}":
+        return Response("unauthorized\n", status=401, mimetype="text/plain")
+    return Response(metrics.render_metrics(), mimetype="text/plain; version=0.0.4")
+
+@bp.cli.command("smtp-lokal")
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", default=1025, type=int)
+def smtp_lokal_command(host, port):
+    """Jalankan SMTP lokal yang mencetak email masuk (SMTP_STARTTLS=0)."""
+    from pinkilang.mailer import LocalSMTPServer
+
+    server = LocalSMTPServer(host, port)
+    click.echo(f"📬 SMTP lokal di {host}:{port} - Ctrl+C untuk berhenti")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+@bp.cli.command("purge-terhapus")
+@click.option("--batch", default=None, type=int, help="baris per DELETE (default PURGE_BATCH)")
+def purge_terhapus_command(batch):
+    """Hapus permanen tombstone soft delete yang lewat masa retensi (untuk cron)."""
+    from pinkilang.soft_delete import purge_terhapus, PURGE_BATCH, SOFT_DELETE_RETENSI_HARI
+
+    hasil = purge_terhapus(batch or PURGE_BATCH)
+    click.echo(f"🧹 {sum(hasil.values())} tombstone > {SOFT_DELETE_RETENSI_HARI} hari dihapus permanen {hasil or ''}")
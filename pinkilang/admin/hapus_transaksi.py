@@ -0,0 +1,1310 @@
+"""Hapus transaksi massal / semua transaksi beserta jurnalnya (soft delete, bisa dipulihkan)"""
+from flask import request, redirect, session, jsonify, abort
+from contextlib import closing
+from datetime import datetime
+import os
+import sqlite3
+import threading
+import time
+from pinkilang.core import logger, supabase, format_currency, jalankan_paralel, SOFT_DELETE
+from pinkilang.piutang_utang import invalidate_aging_cache
+from pinkilang.ringkasan import invalidate_ringkasan_cache
+from pinkilang.soft_delete import hapus, pulihkan, batas_retensi, SOFT_DELETE_RETENSI_HARI
+
+# Tabel yang boleh dihapus dari halaman ini dan transaksi_type jurnalnya
+TABEL_KE_TIPE_JURNAL = {
+    "penjualan": "PENJUALAN",
+    "pembelian": "PEMBELIAN",
+    "operasional": "OPERASIONAL",
+    "prive": "PRIVE",
+    "modal": "TAMBAHAN_MODAL",
+    "aset_tetap": "PEMBELIAN_ASET",
+}
+TABEL_HAPUS = set(TABEL_KE_TIPE_JURNAL) | {"neraca_saldo_awal"}
+UKURAN_BATCH_HAPUS = 200   # id per query in_(), menjaga panjang URL PostgREST
+
+# "Hapus SEMUA": (tabel, kolom nilai) yang dihitung lalu dihapus per tabel; NSA nilainya debit + kredit
+TABEL_HAPUS_SEMUA = [
+    ("penjualan", "total_penjualan"),
+    ("pembelian", "total_pembelian"),
+    ("operasional", "total_pengeluaran"),
+    ("prive", "jumlah"),
+    ("modal", "jumlah"),
+    ("aset_tetap", "nilai_perolehan"),
+    ("neraca_saldo_awal", "debit"),
+]
+HAPUS_JOB_PATH = os.getenv("HAPUS_JOB_PATH", "hapus_jobs.db")
+HAPUS_SEMUA_BACKGROUND_MIN = int(os.getenv("HAPUS_SEMUA_BACKGROUND_MIN", "20000"))   # baris; mulai jumlah ini otomatis di background
+HAPUS_JOB_STALE = 300                                                                # detik tanpa progres -> job dianggap terhenti
+BATAS_TAMPIL_TERHAPUS = 200                                                          # tombstone per tabel di halaman pulihkan
+
+# ============================================================
+# 🔹 RENCANA HAPUS SEMUA (COUNT/SUM di database)
+# ============================================================
+# Jumlah dan total per tabel dihitung oleh fungsi Postgres, bukan dengan mengunduh
+# semua baris. Jalankan SQL ini sekali di Supabase SQL Editor; selama fungsi belum
+# ada, dipakai COUNT (head) + kolom nilai saja per tabel. Dengan SOFT_DELETE=1
+# pakai versi yang mengabaikan tombstone di soft_delete.SQL_SOFT_DELETE.
+SQL_RENCANA_HAPUS_SEMUA = """
+CREATE OR REPLACE FUNCTION rencana_hapus_semua(p_user_email TEXT)
+RETURNS TABLE (tabel TEXT, jumlah BIGINT, total NUMERIC)
+LANGUAGE sql STABLE AS $$
+    SELECT 'penjualan', COUNT(*), COALESCE(SUM(total_penjualan), 0) FROM penjualan WHERE user_email = p_user_email
+    UNION ALL SELECT 'pembelian', COUNT(*), COALESCE(SUM(total_pembelian), 0) FROM pembelian WHERE user_email = p_user_email
+    UNION ALL SELECT 'operasional', COUNT(*), COALESCE(SUM(total_pengeluaran), 0) FROM operasional WHERE user_email = p_user_email
+    UNION ALL SELECT 'prive', COUNT(*), COALESCE(SUM(jumlah), 0) FROM prive WHERE user_email = p_user_email
+    UNION ALL SELECT 'modal', COUNT(*), COALESCE(SUM(jumlah), 0) FROM modal WHERE user_email = p_user_email
+    UNION ALL SELECT 'aset_tetap', COUNT(*), COALESCE(SUM(nilai_perolehan), 0) FROM aset_tetap WHERE user_email = p_user_email
+    UNION ALL SELECT 'neraca_saldo_awal', COUNT(*), COALESCE(SUM(COALESCE(debit, 0) + COALESCE(kredit, 0)), 0) FROM neraca_saldo_awal WHERE user_email = p_user_email
+    UNION ALL SELECT 'jurnal_umum', COUNT(*), 0 FROM jurnal_umum WHERE user_email = p_user_email;
+$$;
+"""
+
+_rpc_rencana_tersedia = True
+
+# ============================================================
+# 🔹 ROUTE: Hapus Transaksi Massal (Multi-Select) - DIPERBAIKI
+# ============================================================
+def hapus_transaksi_massal():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    message = ""
+    
+    try:
+        # Handle POST request untuk hapus massal
+        if request.method == "POST":
+            selected_transactions = request.form.getlist("selected_transactions")
+            action = request.form.get("action")
+            konfirmasi = request.form.get("konfirmasi")
+            
+            if action == "delete_selected" and selected_transactions:
+                if konfirmasi != "YA":
+                    message = '<div class="message error">❌ Konfirmasi penghapusan massal diperlukan</div>'
+                else:
+                    message = process_hapus_massal(selected_transactions, user_email)
+            elif action == "delete_all":
+                if konfirmasi != "YA_ALL":
+                    message = '<div class="message error">❌ Konfirmasi penghapusan SEMUA transaksi diperlukan</div>'
+                else:
+                    message = process_hapus_semua_transaksi(user_email, background=request.form.get("background") == "1")
+            elif action == "restore_selected" and selected_transactions:
+                message = process_pulihkan(selected_transactions, user_email)
+        
+        # Ambil data semua transaksi user yang login
+        semua_transaksi = get_semua_transaksi_user_advanced(user_email)
+        # Transaksi terhapus (tombstone) hanya dibaca kalau diminta
+        transaksi_terhapus = get_transaksi_terhapus(user_email) if SOFT_DELETE and request.args.get("terhapus") == "1" else None
+        
+        return generate_hapus_transaksi_massal_html(user_email, message, semua_transaksi, transaksi_terhapus)
+    
+    except Exception as e:
+        logger.error(f"❌ Error in hapus_transaksi_massal: {str(e)}")
+        return f"""
+        <div class="message error">
+            ❌ Error: {str(e)}
+            <br><a href="/dashboard">Kembali ke Dashboard</a>
+        </div>
+        """
+
+def get_semua_transaksi_user_advanced(user_email):
+    """Ambil semua transaksi dengan informasi lengkap untuk massal"""
+    try:
+        semua_transaksi = []
+        
+        # Tabel Transaksi yang memiliki user_email
+        tables = [
+            ("penjualan", "PENJUALAN", "🛍️", "nama_barang", "total_penjualan"),
+            ("pembelian", "PEMBELIAN", "🛒", "nama_barang", "total_pembelian"), 
+            ("operasional", "OPERASIONAL", "💰", "nama_barang", "total_pengeluaran"),
+            ("prive", "PRIVE", "💼", "keterangan", "jumlah"),
+            ("modal", "MODAL", "📈", "keterangan", "jumlah"),
+            ("aset_tetap", "ASET_TETAP", "🏢", "nama_aset", "nilai_perolehan"),
+            ("neraca_saldo_awal", "NSA", "🔢", "nama_akun", "debit") # Ambil debit sbg nilai
+        ]
+        
+        for table_name, jenis, icon, nama_field, jumlah_field in tables:
+            try:
+                # Untuk ASET_TETAP dan NSA, filter berdasarkan user_email (asumsi ada)
+                result = supabase.table(table_name).select("*").eq("user_email", user_email).execute()
+                for item in result.data:
+                    item['jenis'] = jenis
+                    item['icon'] = icon
+                    # Khusus NSA, nilai ditampilkan adalah jumlah debit + kredit
+                    if table_name == "neraca_saldo_awal":
+                        nilai = float(item.get('debit', 0) or 0) + float(item.get('kredit', 0) or 0)
+                        item['jumlah_display'] = format_currency(nilai)
+                        item['nilai'] = nilai
+                    else:
+                        item['jumlah_display'] = format_currency(item.get(jumlah_field, 0))
+                        item['nilai'] = item.get(jumlah_field, 0)
+                        
+                    item['nama_display'] = item.get(nama_field, 'Tidak ada nama')
+                    item['table_source'] = table_name
+                    item['tanggal_formatted'] = item.get('tanggal', '')[:10] if item.get('tanggal') else item.get('tanggal_perolehan', '')[:10]
+                    
+                    item['display'] = f"{icon} {jenis}: {item['nama_display']} - {item['jumlah_display']}"
+                    
+                    semua_transaksi.append(item)
+            except Exception as e:
+                logger.error(f"❌ Error mengambil {table_name}: {str(e)}")
+                continue
+        
+        # Urutkan berdasarkan tanggal (yang terbaru di atas)
+        semua_transaksi.sort(key=lambda x: x.get('tanggal', '') or x.get('tanggal_perolehan', ''), reverse=True)
+        
+        logger.info(f"📊 Found {len(semua_transaksi)} transactions for mass operations")
+        return semua_transaksi
+        
+    except Exception as e:
+        logger.error(f"❌ Error get transaksi advanced: {str(e)}")
+        return []
+
+def process_hapus_massal(selected_transactions, user_email):
+    """Process penghapusan transaksi massal - per tabel sekaligus (batch in_), bukan per item"""
+    try:
+        if not selected_transactions:
+            return '<div class="message error">❌ Tidak ada transaksi yang dipilih</div>'
+        
+        success_count = 0
+        deleted_info = []
+        delta_persediaan = 0
+        per_tabel, error_count = kelompokkan_per_tabel(selected_transactions)
+        
+        for table_name, ids in per_tabel.items():
+            for batch in [ids[i:i + UKURAN_BATCH_HAPUS] for i in range(0, len(ids), UKURAN_BATCH_HAPUS)]:
+                try:
+                    # Dapatkan info transaksi sebelum dihapus (laporan + jumlah untuk persediaan)
+                    # Hanya milik user yang login: id dari form bisa saja milik tenant lain
+                    rows = supabase.table(table_name).select("*").in_("id", batch).eq("user_email", user_email).execute().data or []
+                    
+                    # ✅ HAPUS (tombstone deleted_at kalau SOFT_DELETE, masih bisa dipulihkan)
+                    delete_result = hapus(table_name).in_("id", [r['id'] for r in rows]) \
+                        .eq("user_email", user_email).execute() if rows else None
+                    deleted = delete_result.data if delete_result and delete_result.data else []
+                    deleted_ids = {str(r['id']) for r in deleted}
+                    
+                    success_count += len(deleted)
+                    error_count += len(batch) - len(deleted)
+                    for row in rows:
+                        if str(row['id']) not in deleted_ids:
+                            continue
+                        deleted_info.append(format_transaksi_info(table_name, row))
+                        # ✅ KUMPULKAN PERUBAHAN PERSEDIAAN (satu update di akhir)
+                        if table_name == "penjualan":
+                            delta_persediaan += row.get('jumlah', 0) or 0
+                        elif table_name == "pembelian":
+                            delta_persediaan -= row.get('jumlah', 0) or 0
+                    
+                    # ✅ HAPUS JUGA JURNAL YANG TERKAIT
+                    if deleted_ids:
+                        hapus_jurnal_terkait(table_name, sorted(deleted_ids))
+                        
+                except Exception as e:
+                    logger.error(f"❌ Error hapus transaksi {table_name} ({len(batch)} item): {str(e)}")
+                    error_count += len(batch)
+                    continue
+        
+        # ✅ UPDATE PERSEDIAAN JIKA PERLU
+        if delta_persediaan:
+            update_persediaan_setelah_hapus(delta_persediaan)
+        
+        if success_count:
+            invalidate_aging_cache()
+            invalidate_ringkasan_cache()
+        
+        # Buat laporan hasil
+        report_html = f'<div class="message success">✅ Penghapusan Massal Selesai!<br>'
+        report_html += f'<strong>Berhasil:</strong> {success_count} transaksi<br>'
+        report_html += f'<strong>Gagal:</strong> {error_count} transaksi</div>'
+        
+        # Tampilkan detail transaksi yang berhasil dihapus (maksimal 5)
+        if deleted_info:
+            report_html += '<div class="deleted-details"><strong>Transaksi yang dihapus:</strong><ul>'
+            for info in deleted_info[:5]:
+                report_html += f'<li>• {info}</li>'
+            if len(deleted_info) > 5:
+                report_html += f'<li>• ... dan {len(deleted_info) - 5} transaksi lainnya</li>'
+            report_html += '</ul></div>'
+        
+        logger.info(f"✅ Mass deletion completed: {success_count} success, {error_count} failed")
+        return report_html
+        
+    except Exception as e:
+        logger.error(f"❌ Error process hapus massal: {str(e)}")
+        return f'<div class="message error">❌ Error penghapusan massal: {str(e)}</div>'
+
+def kelompokkan_per_tabel(selected_transactions):
+    """Pilihan form (format: table_name|transaksi_id) -> ({tabel: [id, ...]}, jumlah pilihan tidak valid)"""
+    per_tabel = {}
+    error_count = 0
+    for transaksi_data in selected_transactions:
+        parts = transaksi_data.split('|')
+        if len(parts) != 2 or parts[0] not in TABEL_HAPUS:
+            error_count += 1
+            continue
+        table_name, transaksi_id = parts
+        ids = per_tabel.setdefault(table_name, [])
+        if transaksi_id not in ids:
+            ids.append(transaksi_id)
+    return per_tabel, error_count
+
+# ============================================================
+# 🔹 PULIHKAN TRANSAKSI TERHAPUS (selama masa retensi soft delete)
+# ============================================================
+def get_transaksi_terhapus(user_email):
+    """Tombstone milik user yang masih bisa dipulihkan, terbaru dulu"""
+    batas = batas_retensi()
+
+    def ambil(table_name):
+        def jalan():
+            return supabase.table(table_name, termasuk_terhapus=True).select("*").eq("user_email", user_email) \
+                .gte("deleted_at", batas).order("deleted_at", desc=True).limit(BATAS_TAMPIL_TERHAPUS).execute().data or []
+        return jalan
+
+    try:
+        hasil = jalankan_paralel({table_name: ambil(table_name) for table_name, _ in TABEL_HAPUS_SEMUA})
+    except Exception as e:
+        logger.error(f"❌ Error mengambil transaksi terhapus: {str(e)}")
+        return []
+
+    terhapus = [
+        {
+            'table_source': table_name,
+            'id': row['id'],
+            'display': format_transaksi_info(table_name, row),
+            'deleted_at': str(row.get('deleted_at') or ''),
+        }
+        for table_name, rows in hasil.items() for row in rows
+    ]
+    terhapus.sort(key=lambda x: x['deleted_at'], reverse=True)
+    return terhapus
+
+def process_pulihkan(selected_transactions, user_email):
+    """Pulihkan transaksi terhapus beserta jurnalnya - per tabel sekaligus, persediaan disesuaikan sekali"""
+    try:
+        success_count = 0
+        restored_info = []
+        delta_persediaan = 0
+        per_tabel, error_count = kelompokkan_per_tabel(selected_transactions)
+        
+        for table_name, ids in per_tabel.items():
+            for batch in [ids[i:i + UKURAN_BATCH_HAPUS] for i in range(0, len(ids), UKURAN_BATCH_HAPUS)]:
+                try:
+                    rows = pulihkan(table_name).in_("id", batch).eq("user_email", user_email).execute().data or []
+                    success_count += len(rows)
+                    error_count += len(batch) - len(rows)
+                    for row in rows:
+                        restored_info.append(format_transaksi_info(table_name, row))
+                        # Kebalikan dari hapus: penjualan mengurangi, pembelian menambah persediaan
+                        if table_name == "penjualan":
+                            delta_persediaan -= row.get('jumlah', 0) or 0
+                        elif table_name == "pembelian":
+                            delta_persediaan += row.get('jumlah', 0) or 0
+                    
+                    transaksi_type = TABEL_KE_TIPE_JURNAL.get(table_name)
+                    if rows and transaksi_type:
+                        pulihkan("jurnal_umum", returning="minimal").in_("transaksi_id", [str(r['id']) for r in rows]) \
+                            .eq("transaksi_type", transaksi_type).execute()
+                except Exception as e:
+                    logger.error(f"❌ Error pulihkan transaksi {table_name} ({len(batch)} item): {str(e)}")
+                    error_count += len(batch)
+                    continue
+        
+        if delta_persediaan:
+            update_persediaan_setelah_hapus(delta_persediaan, "system_pulihkan_transaksi")
+        
+        if success_count:
+            invalidate_aging_cache()
+            invalidate_ringkasan_cache()
+        
+        report_html = f'<div class="message success">♻️ Pemulihan Selesai!<br>'
+        report_html += f'<strong>Dipulihkan:</strong> {success_count} transaksi<br>'
+        report_html += f'<strong>Gagal:</strong> {error_count} transaksi (mungkin sudah lewat {SOFT_DELETE_RETENSI_HARI} hari)</div>'
+        if restored_info:
+            report_html += '<div class="deleted-details"><strong>Transaksi yang dipulihkan:</strong><ul>'
+            for info in restored_info[:5]:
+                report_html += f'<li>• {info}</li>'
+            if len(restored_info) > 5:
+                report_html += f'<li>• ... dan {len(restored_info) - 5} transaksi lainnya</li>'
+            report_html += '</ul></div>'
+        
+        logger.info(f"♻️ Restore completed: {success_count} success, {error_count} failed")
+        return report_html
+        
+    except Exception as e:
+        logger.error(f"❌ Error process pulihkan: {str(e)}")
+        return f'<div class="message error">❌ Error pemulihan transaksi: {str(e)}</div>'
+
+def rencana_hapus_semua(user_email):
+    """Jumlah baris dan total nilai per tabel yang akan dihapus: satu RPC, atau COUNT per tabel"""
+    global _rpc_rencana_tersedia
+    if _rpc_rencana_tersedia:
+        try:
+            rows = supabase.rpc("rencana_hapus_semua", {"p_user_email": user_email}).execute().data or []
+            if rows:
+                return {r['tabel']: {'jumlah': r['jumlah'] or 0, 'total': float(r['total'] or 0)} for r in rows}
+        except Exception as e:
+            _rpc_rencana_tersedia = False
+            logger.warning(f"⚠️ RPC rencana_hapus_semua belum tersedia, pakai COUNT per tabel: {e}")
+
+    def hitung(table_name, nilai_field):
+        def jalan():
+            if table_name == "neraca_saldo_awal":
+                rows = supabase.table(table_name).select("debit,kredit").eq("user_email", user_email).execute().data or []
+                total = sum(float(r.get('debit') or 0) + float(r.get('kredit') or 0) for r in rows)
+            else:
+                rows = supabase.table(table_name).select(nilai_field).eq("user_email", user_email).execute().data or []
+                total = sum(float(r.get(nilai_field) or 0) for r in rows)
+            return {'jumlah': len(rows), 'total': total}
+        return jalan
+
+    tugas = {table_name: hitung(table_name, nilai_field) for table_name, nilai_field in TABEL_HAPUS_SEMUA}
+    tugas["jurnal_umum"] = lambda: {
+        'jumlah': supabase.table("jurnal_umum").select("id", count="exact", head=True).eq("user_email", user_email).execute().count or 0,
+        'total': 0,
+    }
+    return jalankan_paralel(tugas)
+
+def jalankan_hapus_semua(user_email, rencana, progres=None):
+    """
+    Hapus semua transaksi + jurnal user per tabel, lalu reset persediaan; return jumlah tabel gagal.
+
+    Tanpa `progres`: satu DELETE per tabel. Dengan `progres(tabel, terhapus)` (mode
+    background): dihapus per UKURAN_BATCH_HAPUS id supaya progres bisa dilaporkan dan
+    tidak ada satu statement yang terlalu lama untuk tenant yang sangat besar.
+    """
+    error_count = 0
+    for table_name in [t for t, _ in TABEL_HAPUS_SEMUA] + ["jurnal_umum"]:
+        if not rencana.get(table_name, {}).get('jumlah'):
+            continue
+        try:
+            if progres is None:
+                hapus(table_name, returning="minimal").eq("user_email", user_email).execute()
+            else:
+                terhapus = 0
+                while True:
+                    ids = [r['id'] for r in supabase.table(table_name).select("id").eq("user_email", user_email)
+                           .limit(UKURAN_BATCH_HAPUS).execute().data or []]
+                    if not ids:
+                        break
+                    hapus(table_name, returning="minimal").in_("id", ids).eq("user_email", user_email).execute()
+                    terhapus += len(ids)
+                    progres(table_name, terhapus)
+            logger.info(f"✅ Deleted {rencana[table_name]['jumlah']} records from {table_name}")
+        except Exception as e:
+            logger.error(f"❌ Error hapus semua dari {table_name}: {str(e)}")
+            error_count += 1
+
+    # LOGIC KHUSUS: Reset Persediaan Terintegrasi ke Nol
+    try:
+        supabase.table("persediaan_terintegrasi").update({
+            "jumlah_persediaan": 0,
+            "updated_by": "system_mass_reset",
+            "updated_at": datetime.now().isoformat()
+        }).eq("id", 1).execute()
+        logger.info("📦 Persediaan terintegrasi direset ke 0.")
+    except Exception as e:
+        logger.error(f"❌ Gagal reset persediaan terintegrasi: {str(e)}")
+        error_count += 1
+
+    invalidate_aging_cache()
+    invalidate_ringkasan_cache()
+    return error_count
+
+def process_hapus_semua_transaksi(user_email, background=False):
+    """Hapus SEMUA transaksi user: rencana dari COUNT/SUM, hapus per tabel (opsional di background)"""
+    try:
+        rencana = rencana_hapus_semua(user_email)
+        jumlah_transaksi = sum(rencana.get(t, {}).get('jumlah', 0) for t, _ in TABEL_HAPUS_SEMUA)
+        total_nilai = sum(rencana.get(t, {}).get('total', 0) for t, _ in TABEL_HAPUS_SEMUA)
+        total_baris = jumlah_transaksi + rencana.get("jurnal_umum", {}).get('jumlah', 0)
+        
+        if not jumlah_transaksi:
+            return '<div class="message warning">ℹ️ Tidak ada transaksi untuk dihapus</div>'
+        
+        if background or total_baris >= HAPUS_SEMUA_BACKGROUND_MIN:
+            job_id = mulai_job_hapus_semua(user_email, rencana)
+            if job_id is None:
+                return '<div class="message warning">⏳ Penghapusan semua transaksi masih berjalan di background</div>'
+            return generate_progres_hapus_html(job_id, jumlah_transaksi, total_nilai, total_baris)
+        
+        error_count = jalankan_hapus_semua(user_email, rencana)
+        
+        report_html = f'<div class="message success">🗑️ SEMUA Transaksi Berhasil Dihapus!<br>'
+        report_html += f'<strong>Total dihapus:</strong> {jumlah_transaksi} transaksi<br>'
+        report_html += f'<strong>Total nilai:</strong> {format_currency(total_nilai)}<br>'
+        report_html += f'<strong>Gagal (Table):</strong> {error_count} table</div>'
+        
+        logger.info(f"✅ All transactions deleted for {user_email}: {jumlah_transaksi} transaksi, {error_count} table gagal")
+        return report_html
+        
+    except Exception as e:
+        logger.error(f"❌ Error hapus semua transaksi: {str(e)}")
+        return f'<div class="message error">❌ Error hapus semua transaksi: {str(e)}</div>'
+
+# ============================================================
+# 🔹 HAPUS SEMUA DI BACKGROUND (progres bisa dibaca semua worker)
+# ============================================================
+class JobHapusStore:
+    """Status job hapus semua di SQLite - dibaca halaman progres dari worker gunicorn mana pun"""
+
+    def __init__(self, path):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS hapus_job (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_email TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'berjalan',
+                    total INTEGER NOT NULL,
+                    terhapus INTEGER NOT NULL DEFAULT 0,
+                    tabel TEXT,
+                    error_count INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def buat(self, user_email, total):
+        """Job baru, atau None kalau user masih punya job yang berjalan"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            aktif = conn.execute(
+                "SELECT id FROM hapus_job WHERE user_email = ? AND status = 'berjalan' AND updated_at > ?",
+                (user_email, now - HAPUS_JOB_STALE)
+            ).fetchone()
+            if aktif:
+                conn.execute("ROLLBACK")
+                return None
+            cur = conn.execute(
+                "INSERT INTO hapus_job (user_email, total, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (user_email, total, now, now)
+            )
+            conn.execute("COMMIT")
+            return cur.lastrowid
+
+    def progres(self, job_id, tabel, terhapus):
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE hapus_job SET tabel = ?, terhapus = ?, updated_at = ? WHERE id = ?",
+                (tabel, terhapus, time.time(), job_id)
+            )
+
+    def selesai(self, job_id, error_count):
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE hapus_job SET status = ?, terhapus = total, tabel = NULL, error_count = ?, updated_at = ? WHERE id = ?",
+                ("gagal" if error_count else "selesai", error_count, time.time(), job_id)
+            )
+
+    def get(self, job_id):
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id, user_email, status, total, terhapus, tabel, error_count, updated_at FROM hapus_job WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(("id", "user_email", "status", "total", "terhapus", "tabel", "error_count", "updated_at"), row))
+        if job['status'] == 'berjalan' and time.time() - job['updated_at'] > HAPUS_JOB_STALE:
+            job['status'] = 'terhenti'   # worker mati / restart di tengah job
+        return job
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+def get_job_store():
+    global _job_store
+    with _job_store_lock:
+        if _job_store is None:
+            _job_store = JobHapusStore(HAPUS_JOB_PATH)
+        return _job_store
+
+def mulai_job_hapus_semua(user_email, rencana):
+    """Jalankan jalankan_hapus_semua di thread background; return job id (None kalau masih ada job)"""
+    store = get_job_store()
+    total = sum(r.get('jumlah', 0) for r in rencana.values())
+    job_id = store.buat(user_email, total)
+    if job_id is None:
+        return None
+
+    urutan = [t for t, _ in TABEL_HAPUS_SEMUA] + ["jurnal_umum"]
+
+    def progres(tabel, terhapus):
+        # Baris dari tabel yang sudah selesai + baris tabel yang sedang dihapus
+        sebelum = sum(rencana.get(t, {}).get('jumlah', 0) for t in urutan[:urutan.index(tabel)])
+        store.progres(job_id, tabel, sebelum + terhapus)
+
+    def jalan():
+        error_count = 1
+        try:
+            error_count = jalankan_hapus_semua(user_email, rencana, progres)
+            logger.info(f"✅ Job hapus semua #{job_id} untuk {user_email} selesai: {total} baris, {error_count} table gagal")
+        except Exception as e:
+            logger.error(f"❌ Job hapus semua #{job_id} gagal: {str(e)}")
+        finally:
+            store.selesai(job_id, error_count)
+
+    threading.Thread(target=jalan, name=f"hapus-semua-{job_id}", daemon=True).start()
+    return job_id
+
+def status_hapus_semua(job_id):
+    """ROUTE JSON: progres job hapus semua milik user yang login"""
+    if not session.get('logged_in'):
+        abort(404)
+    job = get_job_store().get(job_id)
+    if job is None or job['user_email'] != session.get('user_email'):
+        abort(404)
+    return jsonify({k: job[k] for k in ("id", "status", "total", "terhapus", "tabel", "error_count")})
+
+def generate_progres_hapus_html(job_id, jumlah_transaksi, total_nilai, total_baris):
+    return f"""
+    <div id="progres-hapus" class="selection-counter" style="background: #fff3cd; border: 1px solid #ffeeba; color: #856404;">
+        ⏳ Menghapus {jumlah_transaksi} transaksi ({format_currency(total_nilai)}) beserta jurnalnya di background...
+        <div style="background: #eee; border-radius: 6px; margin-top: 10px; height: 14px;">
+            <div id="progres-hapus-bar" style="background: #dc3545; border-radius: 6px; height: 14px; width: 0%;"></div>
+        </div>
+        <small id="progres-hapus-teks">0 / {total_baris} baris</small>
+    </div>
+    <script>
+        (function pantauHapus() {{
+            fetch('/hapus-transaksi-massal/status/{job_id}').then(r => r.json()).then(job => {{
+                const persen = job.total ? Math.round(job.terhapus * 100 / job.total) : 100;
+                document.getElementById('progres-hapus-bar').style.width = persen + '%';
+                document.getElementById('progres-hapus-teks').textContent =
+                    `${{job.terhapus}} / ${{job.total}} baris` + (job.tabel ? ` - ${{job.tabel}}` : '');
+                if (job.status === 'berjalan') {{
+                    setTimeout(pantauHapus, 1500);
+                }} else if (job.status === 'selesai') {{
+                    window.location.href = '/hapus-transaksi-massal';
+                }} else {{
+                    document.getElementById('progres-hapus-teks').textContent +=
+                        job.status === 'gagal' ? ` - ❌ ${{job.error_count}} table gagal, lihat log` : ' - ⚠️ job terhenti, jalankan ulang';
+                }}
+            }});
+        }})();
+    </script>
+    """
+
+def hapus_jurnal_terkait(table_name, transaksi_ids):
+    """Hapus jurnal yang terkait dengan transaksi yang dihapus (satu query untuk semua id)"""
+    try:
+        transaksi_type = TABEL_KE_TIPE_JURNAL.get(table_name)
+        if transaksi_type and transaksi_ids:
+            # Hapus jurnal dengan transaksi_id dan transaksi_type yang sesuai
+            hapus("jurnal_umum", returning="minimal").in_("transaksi_id", transaksi_ids).eq("transaksi_type", transaksi_type).execute()
+            logger.info(f"✅ Jurnal terkait dihapus: {transaksi_type} - {len(transaksi_ids)} transaksi")
+            
+    except Exception as e:
+        logger.error(f"❌ Error hapus jurnal terkait: {str(e)}")
+
+def update_persediaan_setelah_hapus(delta, updated_by="system_hapus_massal"):
+    """Sesuaikan persediaan sekali setelah hapus massal (+jumlah penjualan, -jumlah pembelian) atau pulihkan"""
+    try:
+        # Ambil persediaan saat ini
+        persediaan_result = supabase.table("persediaan_terintegrasi").select("*").eq("id", 1).execute()
+        if persediaan_result.data:
+            persediaan_sekarang = persediaan_result.data[0]['jumlah_persediaan']
+            persediaan_baru = max(0, persediaan_sekarang + delta)  # Jangan sampai minus
+            
+            # Update persediaan
+            supabase.table("persediaan_terintegrasi").update({
+                "jumlah_persediaan": persediaan_baru,
+                "updated_by": updated_by,
+                "updated_at": datetime.now().isoformat()
+            }).eq("id", 1).execute()
+            
+            logger.info(f"📦 Persediaan disesuaikan ({updated_by}): {delta:+} ekor")
+    except Exception as e:
+        logger.error(f"❌ Error update persediaan hapus massal: {str(e)}")
+
+def format_transaksi_info(table_name, data):
+    """Informasi transaksi untuk laporan penghapusan"""
+    if table_name == "penjualan":
+        return f"🛍️ Penjualan: {data.get('nama_barang', '')} - Rp {data.get('total_penjualan', 0):,}"
+    elif table_name == "pembelian":
+        return f"🛒 Pembelian: {data.get('nama_barang', '')} - Rp {data.get('total_pembelian', 0):,}"
+    elif table_name == "operasional":
+        return f"💰 Operasional: {data.get('nama_barang', '')} - Rp {data.get('total_pengeluaran', 0):,}"
+    elif table_name == "prive":
+        return f"💼 Prive: {data.get('keterangan', '')} - Rp {data.get('jumlah', 0):,}"
+    elif table_name == "modal":
+        tipe = data.get('tipe', 'MODAL')
+        return f"📈 {tipe}: {data.get('keterangan', '')} - Rp {data.get('jumlah', 0):,}"
+    elif table_name == "aset_tetap":
+        return f"🏢 Aset: {data.get('nama_aset', '')} - Rp {data.get('nilai_perolehan', 0):,}"
+    elif table_name == "neraca_saldo_awal":
+        return f"🔢 NSA: {data.get('nama_akun', '')} (D: {data.get('debit', 0):,}, K: {data.get('kredit', 0):,})"
+    return f"Transaksi {table_name}#{data.get('id')}"
+
+def generate_transaksi_terhapus_html(transaksi_terhapus):
+    """Bagian halaman: daftar tombstone + tombol pulihkan (transaksi_terhapus None = tautan saja)"""
+    if not SOFT_DELETE:
+        return ""
+    if transaksi_terhapus is None:
+        return f"""
+        <div style="text-align: center; margin: 10px 0;">
+            <a href="/hapus-transaksi-massal?terhapus=1" class="btn" style="background: #17a2b8;">♻️ Lihat transaksi terhapus ({SOFT_DELETE_RETENSI_HARI} hari terakhir)</a>
+        </div>
+        """
+    
+    baris = ""
+    for transaksi in transaksi_terhapus:
+        baris += f"""
+                    <tr class="transaksi-row">
+                        <td class="checkbox-cell">
+                            <input type="checkbox" name="selected_transactions" value="{transaksi['table_source']}|{transaksi['id']}">
+                        </td>
+                        <td class="info-cell">{transaksi['display']}</td>
+                        <td>🗑️ {transaksi['deleted_at'][:16].replace('T', ' ')}</td>
+                    </tr>
+        """
+    if not baris:
+        baris = '<tr><td colspan="3" class="empty-state">Tidak ada transaksi terhapus yang bisa dipulihkan</td></tr>'
+    
+    return f"""
+        <div class="mass-actions" style="background: #e6f7ff; border-color: #91d5ff;">
+            <h3 style="color: #0066cc; margin-bottom: 15px;">♻️ Transaksi Terhapus ({len(transaksi_terhapus)})</h3>
+            <p style="font-size: 13px; color: #666;">Bisa dipulihkan beserta jurnalnya sampai {SOFT_DELETE_RETENSI_HARI} hari setelah dihapus, setelah itu dihapus permanen.</p>
+            <form method="POST" action="/hapus-transaksi-massal?terhapus=1">
+                <table class="transactions-table">
+                    <thead>
+                        <tr>
+                            <th class="checkbox-cell"></th>
+                            <th class="info-cell">Informasi Transaksi</th>
+                            <th>Dihapus</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {baris}
+                    </tbody>
+                </table>
+                <div class="action-buttons">
+                    <button type="submit" class="btn-mass" style="background: #17a2b8; color: white;" name="action" value="restore_selected">
+                        ♻️ Pulihkan yang Dipilih
+                    </button>
+                    <a href="/hapus-transaksi-massal" class="btn">Tutup</a>
+                </div>
+            </form>
+        </div>
+    """
+
+def generate_hapus_transaksi_massal_html(user_email, message, semua_transaksi, transaksi_terhapus=None):
+    """Generate HTML untuk halaman hapus transaksi massal - DIPERBAIKI"""
+    
+    try:
+        bagian_terhapus = generate_transaksi_terhapus_html(transaksi_terhapus)
+        if SOFT_DELETE:
+            info_pulihkan = f"Data yang dihapus masih bisa dipulihkan selama {SOFT_DELETE_RETENSI_HARI} hari"
+        else:
+            info_pulihkan = "Data tidak dapat dikembalikan"
+        
+        # Hitung statistik
+        total_transaksi = len(semua_transaksi) if semua_transaksi else 0
+        total_nilai = sum(transaksi.get('nilai', 0) for transaksi in semua_transaksi) if semua_transaksi else 0
+        
+        # Generate tabel transaksi dengan checkbox
+        transaksi_table = ""
+        if semua_transaksi:
+            for i, transaksi in enumerate(semua_transaksi):
+                transaksi_value = f"{transaksi['table_source']}|{transaksi['id']}"
+                transaksi_table += f"""
+                <tr class="transaksi-row">
+                    <td class="checkbox-cell">
+                        <input type="checkbox" name="selected_transactions" value="{transaksi_value}" 
+                               class="transaksi-checkbox" id="transaksi-{i}">
+                    </td>
+                    <td class="icon-cell">{transaksi.get('icon', '📄')}</td>
+                    <td class="info-cell">
+                        <strong>{transaksi.get('nama_display', 'No Name')}</strong>
+                        <div class="transaksi-details">
+                            <span class="jenis-badge {transaksi.get('jenis', '').lower()}">{transaksi.get('jenis', 'UNKNOWN')}</span>
+                            • {transaksi.get('jumlah_display', 'Rp 0')} • 📅 {transaksi.get('tanggal_formatted', '')}
+                        </div>
+                    </td>
+                    <td class="actions-cell">
+                        <button type="button" class="btn-quick-delete" 
+                                onclick="quickDelete('{transaksi_value}')" 
+                                title="Hapus cepat transaksi ini">
+                            🗑️
+                        </button>
+                    </td>
+                </tr>
+                """
+        else:
+            transaksi_table = """
+            <tr>
+                <td colspan="4" class="empty-state">
+                    <h3>📊 Belum ada transaksi</h3>
+                    <p>Transaksi yang Anda buat akan muncul di sini</p>
+                    <br>
+                    <a href="/dashboard" class="btn">🏠 Kembali ke Dashboard</a>
+                    <a href="/tambah-penjualan" class="btn" style="background: #28a745;">➕ Buat Transaksi Baru</a>
+                </td>
+            </tr>
+            """
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Hapus Transaksi Massal - PINKILANG</title>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #ffe6e6, #ffcccc);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #ff4444, #cc0000);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    transition: all 0.3s ease;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                }}
+                
+                .content {{
+                    padding: 25px;
+                }}
+                
+                /* Statistics Cards */
+                .stats-container {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 15px;
+                    margin: 20px 0;
+                }}
+                
+                .stat-card {{
+                    background: #f8f9fa;
+                    padding: 20px;
+                    border-radius: 10px;
+                    text-align: center;
+                    border-left: 4px solid #ff4444;
+                }}
+                
+                .stat-number {{
+                    font-size: 24px;
+                    font-weight: bold;
+                    color: #ff4444;
+                }}
+                
+                .stat-label {{
+                    font-size: 14px;
+                    color: #666;
+                    margin-top: 5px;
+                }}
+                
+                /* Mass Actions */
+                .mass-actions {{
+                    background: #fff3cd;
+                    border: 2px solid #ffeaa7;
+                    border-radius: 10px;
+                    padding: 20px;
+                    margin: 20px 0;
+                }}
+                
+                .action-buttons {{
+                    display: flex;
+                    gap: 10px;
+                    flex-wrap: wrap;
+                    margin-top: 15px;
+                }}
+                
+                .btn-mass {{
+                    padding: 10px 20px;
+                    border: none;
+                    border-radius: 5px;
+                    cursor: pointer;
+                    font-size: 14px;
+                    transition: all 0.3s ease;
+                }}
+                
+                .btn-delete-selected {{
+                    background: #ff4444;
+                    color: white;
+                }}
+                
+                .btn-delete-all {{
+                    background: #dc3545;
+                    color: white;
+                }}
+                
+                .btn-select-all {{
+                    background: #6c757d;
+                    color: white;
+                }}
+                
+                .btn-mass:hover {{
+                    transform: translateY(-2px);
+                    opacity: 0.9;
+                }}
+                
+                /* Transactions Table */
+                .transactions-table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                    background: white;
+                    border-radius: 8px;
+                    overflow: hidden;
+                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                }}
+                
+                .transactions-table th {{
+                    background: #f8f9fa;
+                    padding: 15px;
+                    text-align: left;
+                    font-weight: 600;
+                    color: #333;
+                    border-bottom: 2px solid #dee2e6;
+                }}
+                
+                .transactions-table td {{
+                    padding: 12px 15px;
+                    border-bottom: 1px solid #dee2e6;
+                }}
+                
+                .transaksi-row:hover {{
+                    background: #f8f9fa;
+                }}
+                
+                .checkbox-cell {{
+                    width: 40px;
+                }}
+                
+                .icon-cell {{
+                    width: 50px;
+                    font-size: 18px;
+                    text-align: center;
+                }}
+                
+                .info-cell {{
+                    min-width: 300px;
+                }}
+                
+                .actions-cell {{
+                    width: 80px;
+                    text-align: center;
+                }}
+                
+                .transaksi-checkbox {{
+                    transform: scale(1.2);
+                }}
+                
+                .transaksi-details {{
+                    font-size: 12px;
+                    color: #666;
+                    margin-top: 5px;
+                }}
+                
+                .jenis-badge {{
+                    display: inline-block;
+                    padding: 2px 8px;
+                    border-radius: 12px;
+                    font-size: 10px;
+                    font-weight: bold;
+                    color: white;
+                }}
+                
+                .jenis-badge.penjualan {{ background: #28a745; }}
+                .jenis-badge.pembelian {{ background: #007bff; }}
+                .jenis-badge.operasional {{ background: #ff6b00; }}
+                .jenis-badge.prive {{ background: #6f42c1; }}
+                .jenis-badge.modal {{ background: #17a2b8; }}
+                .jenis-badge.aset_tetap {{ background: #00cc66; }}
+                .jenis-badge.nsa {{ background: #ff9966; }}
+                
+                .btn-quick-delete {{
+                    background: none;
+                    border: 1px solid #ff4444;
+                    color: #ff4444;
+                    padding: 5px 10px;
+                    border-radius: 4px;
+                    cursor: pointer;
+                    transition: all 0.3s ease;
+                }}
+                
+                .btn-quick-delete:hover {{
+                    background: #ff4444;
+                    color: white;
+                }}
+                
+                /* Selection Counter */
+                .selection-counter {{
+                    background: #e6f7ff;
+                    border: 1px solid #91d5ff;
+                    border-radius: 8px;
+                    padding: 10px 15px;
+                    margin: 10px 0;
+                    font-size: 14px;
+                    color: #0066cc;
+                }}
+                
+                /* Messages */
+                .message {{
+                    padding: 15px;
+                    margin: 15px 0;
+                    border-radius: 8px;
+                    font-size: 14px;
+                }}
+                
+                .success {{
+                    background: #d4edda;
+                    color: #155724;
+                    border: 1px solid #c3e6cb;
+                }}
+                
+                .error {{
+                    background: #f8d7da;
+                    color: #721c24;
+                    border: 1px solid #f5c6cb;
+                }}
+                
+                .warning {{
+                    background: #fff3cd;
+                    color: #856404;
+                    border: 1px solid #ffeaa7;
+                }}
+                
+                .deleted-details {{
+                    background: #f8f9fa;
+                    border: 1px solid #dee2e6;
+                    border-radius: 8px;
+                    padding: 15px;
+                    margin: 10px 0;
+                    font-size: 13px;
+                }}
+                
+                .deleted-details ul {{
+                    margin: 10px 0;
+                    padding-left: 20px;
+                }}
+                
+                .empty-state {{
+                    text-align: center;
+                    padding: 40px;
+                    color: #666;
+                }}
+                
+                .empty-state h3 {{
+                    margin-bottom: 10px;
+                    color: #333;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: #666;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 5px;
+                    margin: 5px;
+                    transition: all 0.3s ease;
+                }}
+                
+                .btn:hover {{
+                    background: #555;
+                    transform: translateY(-2px);
+                }}
+                
+                @media (max-width: 768px) {{
+                    .mass-actions {{
+                        padding: 15px;
+                    }}
+                    
+                    .action-buttons {{
+                        flex-direction: column;
+                    }}
+                    
+                    .btn-mass {{
+                        width: 100%;
+                    }}
+                    
+                    .transactions-table {{
+                        font-size: 14px;
+                    }}
+                    
+                    .transactions-table td {{
+                        padding: 8px 10px;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>🗑️ Hapus Transaksi Massal</h1>
+                    <p>Kelola dan Hapus Multiple Transaksi Sekaligus - PINKILANG</p>
+                </div>
+                
+                <div class="content">
+                    {message}
+                    
+                    <div style="text-align: center; margin-bottom: 20px; color: #666;">
+                        👋 Anda login sebagai: <strong>{user_email}</strong>
+                    </div>
+                    
+                    <div class="stats-container">
+                        <div class="stat-card">
+                            <div class="stat-number">{total_transaksi}</div>
+                            <div class="stat-label">Total Transaksi</div>
+                        </div>
+                        <div class="stat-card">
+                            <div class="stat-number">{format_currency(total_nilai)}</div>
+                            <div class="stat-label">Total Nilai</div>
+                        </div>
+                        <div class="stat-card">
+                            <div class="stat-number" id="selected-count">0</div>
+                            <div class="stat-label">Dipilih</div>
+                        </div>
+                    </div>
+                    
+                    <div class="mass-actions">
+                        <h3 style="color: #856404; margin-bottom: 15px;">🚀 Aksi Massal</h3>
+                        
+                        <div class="selection-counter" id="selection-info">
+                            Pilih transaksi yang ingin dihapus dengan mencentang checkbox
+                        </div>
+                        
+                        <form method="POST" id="massForm">
+                            <div class="action-buttons">
+                                <button type="button" class="btn-mass btn-select-all" onclick="selectAll()">
+                                    📋 Pilih Semua
+                                </button>
+                                <button type="button" class="btn-mass btn-select-all" onclick="deselectAll()">
+                                    ❌ Batal Pilih Semua
+                                </button>
+                                <button type="submit" class="btn-mass btn-delete-selected" 
+                                        name="action" value="delete_selected"
+                                        onclick="return confirmMassDelete('selected')">
+                                    🗑️ Hapus yang Dipilih
+                                </button>
+                                <button type="submit" class="btn-mass btn-delete-all" 
+                                        name="action" value="delete_all"
+                                        onclick="return confirmMassDelete('all')">
+                                    💥 Hapus SEMUA Transaksi
+                                </button>
+                            </div>
+                            <label style="display: block; text-align: center; margin-bottom: 15px; color: #856404;">
+                                <input type="checkbox" name="background" value="1">
+                                Jalankan "Hapus SEMUA" di background (untuk data yang sangat banyak)
+                            </label>
+                            
+                            <input type="hidden" name="konfirmasi" id="konfirmasi" value="">
+                            
+                            <table class="transactions-table">
+                                <thead>
+                                    <tr>
+                                        <th class="checkbox-cell">
+                                            <input type="checkbox" id="select-all-checkbox" onchange="toggleSelectAll(this)">
+                                        </th>
+                                        <th class="icon-cell">Icon</th>
+                                        <th class="info-cell">Informasi Transaksi</th>
+                                        <th class="actions-cell">Aksi</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                                    {transaksi_table}
+                                </tbody>
+                            </table>
+                        </form>
+                    </div>
+                    
+                    {bagian_terhapus}
+                    
+                    <div class="message warning">
+                        <strong>⚠️ PERHATIAN!</strong><br>
+                        • {info_pulihkan}<br>
+                        • Jurnal akuntansi terkait juga akan terhapus otomatis<br>
+                        • **Semua Aset Tetap, NSA, dan Saldo Persediaan akan ter-reset jika 'Hapus SEMUA'**
+                    </div>
+                    
+                    <div style="text-align: center; margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee;">
+                        <a href="/dashboard" class="btn">🏠 Dashboard</a>
+                        <a href="/jurnal-umum" class="btn" style="background: #6f42c1;">📝 Lihat Jurnal</a>
+                    </div>
+                </div>
+            </div>
+            
+            <script>
+                const totalTransaksi = {total_transaksi};
+                const totalNilai = {total_nilai};
+                
+                function updateSelectionCounter() {{
+                    const checkboxes = document.querySelectorAll('.transaksi-checkbox:checked');
+                    const selectedCount = checkboxes.length;
+                    document.getElementById('selected-count').textContent = selectedCount;
+                    
+                    const selectionInfo = document.getElementById('selection-info');
+                    if (selectedCount > 0) {{
+                        selectionInfo.innerHTML = `✅ <strong>${{selectedCount}} transaksi</strong> dipilih untuk dihapus`;
+                        selectionInfo.style.background = '#d4edda';
+                        selectionInfo.style.border = '1px solid #c3e6cb';
+                        selectionInfo.style.color = '#155724';
+                    }} else {{
+                        selectionInfo.innerHTML = 'Pilih transaksi yang ingin dihapus dengan mencentang checkbox';
+                        selectionInfo.style.background = '#e6f7ff';
+                        selectionInfo.style.border = '1px solid #91d5ff';
+                        selectionInfo.style.color = '#0066cc';
+                    }}
+                }}
+                
+                function toggleSelectAll(source) {{
+                    const checkboxes = document.querySelectorAll('.transaksi-checkbox');
+                    checkboxes.forEach(checkbox => {{
+                        checkbox.checked = source.checked;
+                    }});
+                    updateSelectionCounter();
+                }}
+                
+                function selectAll() {{
+                    const checkboxes = document.querySelectorAll('.transaksi-checkbox');
+                    checkboxes.forEach(checkbox => {{
+                        checkbox.checked = true;
+                    }});
+                    document.getElementById('select-all-checkbox').checked = true;
+                    updateSelectionCounter();
+                }}
+                
+                function deselectAll() {{
+                    const checkboxes = document.querySelectorAll('.transaksi-checkbox');
+                    checkboxes.forEach(checkbox => {{
+                        checkbox.checked = false;
+                    }});
+                    document.getElementById('select-all-checkbox').checked = false;
+                    updateSelectionCounter();
+                }}
+                
+                function quickDelete(transaksiValue) {{
+                    if (confirm('Yakin hapus transaksi ini?\\\\n\\\\n{info_pulihkan}!')) {{
+                        const form = document.createElement('form');
+                        form.method = 'POST';
+                        form.action = window.location.href;
+                        
+                        const input1 = document.createElement('input');
+                        input1.type = 'hidden';
+                        input1.name = 'selected_transactions';
+                        input1.value = transaksiValue;
+                        
+                        const input2 = document.createElement('input');
+                        input2.type = 'hidden';
+                        input2.name = 'action';
+                        input2.value = 'delete_selected';
+                        
+                        const input3 = document.createElement('input');
+                        input3.type = 'hidden';
+                        input3.name = 'konfirmasi';
+                        input3.value = 'YA';
+                        
+                        form.appendChild(input1);
+                        form.appendChild(input2);
+                        form.appendChild(input3);
+                        document.body.appendChild(form);
+                        form.submit();
+                    }}
+                }}
+                
+                function confirmMassDelete(type) {{
+                    const checkboxes = document.querySelectorAll('.transaksi-checkbox:checked');
+                    const selectedCount = checkboxes.length;
+                    
+                    if (type === 'selected' && selectedCount === 0) {{
+                        alert('❌ Tidak ada transaksi yang dipilih!');
+                        return false;
+                    }}
+                    
+                    let message = '';
+                    if (type === 'selected') {{
+                        message = `Apakah Anda yakin ingin menghapus ${{selectedCount}} transaksi yang dipilih?\\\\n\\\\n⚠️ {info_pulihkan}!`;
+                        document.getElementById('konfirmasi').value = 'YA';
+                    }} else {{
+                        message = `⚠️ ⚠️ ⚠️ PERINGATAN!\\\\n\\\\nAnda akan menghapus SEMUA ${{totalTransaksi}} transaksi, Aset Tetap, dan Saldo Awal!\\\\nTotal nilai: {format_currency(total_nilai)}\\\\n\\\\nTindakan ini TIDAK DAPAT DIBATALKAN!\\\\nYakin lanjutkan?`;
+                        document.getElementById('konfirmasi').value = 'YA_ALL';
+                    }}
+                    
+                    return confirm(message);
+                }}
+                
+                document.addEventListener('DOMContentLoaded', function() {{
+                    const checkboxes = document.querySelectorAll('.transaksi-checkbox');
+                    checkboxes.forEach(checkbox => {{
+                        checkbox.addEventListener('change', updateSelectionCounter);
+                    }});
+                    updateSelectionCounter();
+                    
+                    setTimeout(function() {{
+                        const messages = document.querySelectorAll('.message');
+                        messages.forEach(message => {{
+                            message.style.opacity = '0';
+                            message.style.transition = 'opacity 0.5s ease';
+                            setTimeout(() => message.remove(), 500);
+                        }});
+                    }}, 5000);
+                }});
+            </script>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error generating HTML: {str(e)}")
+        return f"""
+        <html>
+        <body style="font-family: Arial; padding: 20px;">
+            <h1>❌ Error</h1>
+            <p>Terjadi kesalahan: {str(e)}</p>
+            <a href="/dashboard">Kembali ke Dashboard</a>
+        </body>
+        </html>
+        """
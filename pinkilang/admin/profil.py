@@ -0,0 +1,102 @@
+"""Halaman admin untuk melihat hasil profiling per request"""
+import io
+import pstats
+from html import escape
+from flask import abort, request, send_file
+from pinkilang.core import create_simple_page
+from pinkilang.profiling import is_admin, daftar_profil, path_profil, PROFILE_DIR
+
+# ============================================================
+# 🔹 ROUTE: Daftar Profil
+# ============================================================
+def daftar_profil_view():
+    if not is_admin():
+        abort(404)
+
+    route = request.args.get("route")
+    profil = daftar_profil(route)
+
+    per_route = {}
+    for info in daftar_profil():
+        r = per_route.setdefault(info["route"], {"jumlah": 0, "terlama": 0})
+        r["jumlah"] += 1
+        r["terlama"] = max(r["terlama"], info["durasi_ms"])
+
+    ringkasan_html = "".join(
+        f"""<tr>
+            <td><a href="/admin/profiles?route={escape(r)}">{escape(r)}</a></td>
+            <td>{data['jumlah']}</td>
+            <td>{data['terlama']:.0f} ms</td>
+        </tr>"""
+        for r, data in sorted(per_route.items(), key=lambda x: -x[1]["terlama"])
+    )
+    profil_html = "".join(
+        f"""<tr>
+            <td>{escape(info['waktu'])}</td>
+            <td>{escape(info['method'])} {escape(info['path'])}</td>
+            <td>{info['durasi_ms']:.0f} ms</td>
+            <td>{info['query']}</td>
+            <td>{escape(info['alasan'])}</td>
+            <td>
+                <a href="/admin/profiles/{info['nama']}">top fungsi</a> |
+                <a href="/admin/profiles/{info['nama']}/prof">.prof</a> |
+                <a href="/admin/profiles/{info['nama']}/collapsed">.collapsed</a>
+            </td>
+        </tr>"""
+        for info in profil[:100]
+    )
+
+    content = f"""
+        <p>Profil tersimpan di <code>{escape(PROFILE_DIR)}</code>.
+        Tambahkan <code>?_profile=1</code> ke URL mana pun untuk memprofil request itu.</p>
+        <h3>Per Route</h3>
+        <table style="width:100%; text-align:left;">
+            <tr><th>Route</th><th>Profil</th><th>Terlama</th></tr>
+            {ringkasan_html or '<tr><td colspan="3">Belum ada profil</td></tr>'}
+        </table>
+        <h3>Terbaru{f' - {escape(route)}' if route else ''}</h3>
+        <table style="width:100%; text-align:left; font-size:14px;">
+            <tr><th>Waktu</th><th>Request</th><th>Durasi</th><th>Query</th><th>Alasan</th><th>File</th></tr>
+            {profil_html or '<tr><td colspan="6">Belum ada profil</td></tr>'}
+        </table>
+    """
+    return create_simple_page("🔬 Profil Request", content)
+
+# ============================================================
+# 🔹 ROUTE: Detail Profil (top fungsi dari pstats)
+# ============================================================
+def detail_profil(nama):
+    if not is_admin():
+        abort(404)
+
+    path = path_profil(nama, ".prof")
+    if path is None:
+        abort(404)
+
+    urutan = request.args.get("urut", "cumulative")
+    if urutan not in ("cumulative", "tottime", "ncalls"):
+        urutan = "cumulative"
+
+    output = io.StringIO()
+    pstats.Stats(path, stream=output).strip_dirs().sort_stats(urutan).print_stats(40)
+
+    content = f"""
+        <p>Urutkan:
+            <a href="?urut=cumulative">cumulative</a> |
+            <a href="?urut=tottime">tottime</a> |
+            <a href="?urut=ncalls">ncalls</a>
+        </p>
+        <pre style="text-align:left; font-size:12px; overflow-x:auto;">{escape(output.getvalue())}</pre>
+        <a href="/admin/profiles">← Semua profil</a>
+    """
+    return create_simple_page(f"🔬 {escape(nama)}", content)
+
+def unduh_profil(nama, jenis):
+    if not is_admin():
+        abort(404)
+
+    path = path_profil(nama, f".{jenis}")
+    if path is None:
+        abort(404)
+    return send_file(path, as_attachment=True, download_name=f"{nama}.{jenis}",
+                     mimetype="text/plain" if jenis == "collapsed" else "application/octet-stream")
@@ -0,0 +1,638 @@
+"""Daftar akun dan pembuatan jurnal otomatis yang dipakai lintas modul"""
+from datetime import datetime
+from pinkilang.core import logger, supabase, JURNAL_IDEMPOTEN
+
+# ============================================================
+# 🔹 KONFIGURASI AKUN (Chart of Accounts) DAFTAR AKUN
+# ============================================================
+
+CHART_OF_ACCOUNTS = {
+    # Aset Lancar
+    "1110": {"nama": "Kas", "tipe": "Aset Lancar", "saldo_normal": "debit"},
+    "1120": {"nama": "Piutang Usaha", "tipe": "Aset Lancar", "saldo_normal": "debit"},
+    "1130": {"nama": "Persediaan Barang Dagang", "tipe": "Aset Lancar", "saldo_normal": "debit"},
+    "1140": {"nama": "Perlengkapan", "tipe": "Aset Lancar", "saldo_normal": "debit"},
+
+    # Aset Tetap
+    "1260": {"nama": "Akumulasi Penyusutan", "tipe": "Aset Tetap", "saldo_normal": "debit"},
+    "1261": {"nama": "Tanah", "tipe": "Aset Tetap", "saldo_normal": "debit"},
+    "1262": {"nama": "Bangunan", "tipe": "Aset Tetap", "saldo_normal": "debit"},
+    "1263": {"nama": "Kendaraan", "tipe": "Aset Tetap", "saldo_normal": "debit"},
+    "1264": {"nama": "Peralatan", "tipe": "Aset Tetap", "saldo_normal": "debit"},
+    "1265": {"nama": "Inventaris", "tipe": "Aset Tetap", "saldo_normal": "debit"},
+
+    # Utang
+    "2110": {"nama": "Utang Usaha", "tipe": "Utang", "saldo_normal": "kredit"},
+    "2120": {"nama": "Pendapatan Diterima Di Muka", "tipe": "Utang", "saldo_normal": "kredit"},
+    
+    # Modal
+    "3110": {"nama": "Modal Pemilik", "tipe": "Modal", "saldo_normal": "kredit"},
+    "3210": {"nama": "Prive", "tipe": "Modal", "saldo_normal": "debit"},
+    "3310": {"nama": "Ikhtisar Laba Rugi", "tipe": "Modal", "saldo_normal": "debit"},
+
+    # Pendapatan
+    "4110": {"nama": "Penjualan", "tipe": "Pendapatan", "saldo_normal": "kredit"},
+
+    # HPP
+    "5110": {"nama": "Pembelian", "tipe": "HPP", "saldo_normal": "kredit"},
+    "5210": {"nama": "HPP", "tipe": "HPP", "saldo_normal": "debit"},
+
+    # Beban Operasional
+    "6110": {"nama": "Beban Perlengkapan", "tipe": "Beban", "saldo_normal": "debit"},
+    "6120": {"nama": "Beban TLA", "tipe": "Beban", "saldo_normal": "debit"},
+    "6130": {"nama": "Beban Penyusutan", "tipe": "Beban", "saldo_normal": "debit"},
+    "6140": {"nama": "Beban Lain-Lain", "tipe": "Beban", "saldo_normal": "debit"},
+}
+AKUN_PERSEDIAAN = "Persediaan"
+AKUN_HPP = "HPP"
+AKUN_PENJUALAN = "Penjualan"
+AKUN_KAS = "Kas"
+AKUN_PIUTANG = "Piutang"
+AKUN_UTANG_USAHA = "Utang Usaha"
+AKUN_BEBAN_OPERASIONAL = "Beban Operasional"
+AKUN_BEBAN_PENYUSUTAN = "Beban Penyusutan"
+
+# ============================================================
+# 🎀 FUNGSI JURNAL UMUM - PINK THEME - FIXED VERSION
+# ============================================================
+
+UKURAN_BATCH_JURNAL = 500   # baris per upsert saat posting ulang massal
+
+# Kunci idempoten jurnal dokumen: ref_id (mis. PENJUALAN_12) + nomor baris, hanya untuk
+# baris yang belum dihapus (tombstone soft delete tidak menahan kuncinya). Jalankan
+# sekali di Supabase SQL Editor (jurnal lama diberi nomor baris) lalu set JURNAL_IDEMPOTEN=1.
+# Index parsial tidak bisa dipakai upsert PostgREST (on_conflict tanpa predikat), jadi
+# posting lewat fungsi posting_jurnal.
+SQL_JURNAL_IDEMPOTEN = """
+ALTER TABLE jurnal_umum ADD COLUMN IF NOT EXISTS ref_baris INTEGER;
+ALTER TABLE jurnal_umum ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+
+UPDATE jurnal_umum j SET ref_id = COALESCE(j.ref_id, b.ref_id_baru), ref_baris = b.nomor
+FROM (
+    SELECT id,
+           CASE transaksi_type WHEN 'TAMBAHAN_MODAL' THEN 'MODAL' ELSE transaksi_type END || '_' || transaksi_id AS ref_id_baru,
+           ROW_NUMBER() OVER (PARTITION BY transaksi_type, transaksi_id ORDER BY id) AS nomor
+    FROM jurnal_umum
+    WHERE ref_baris IS NULL AND transaksi_id IS NOT NULL
+      AND transaksi_type IN ('PENJUALAN', 'PEMBELIAN', 'OPERASIONAL', 'PRIVE', 'TAMBAHAN_MODAL')
+) b
+WHERE j.id = b.id;
+
+-- NULL dianggap berbeda: jurnal manual / penyesuaian tanpa ref_baris tidak terpengaruh
+DROP INDEX IF EXISTS uq_jurnal_umum_ref;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jurnal_umum_ref_aktif ON jurnal_umum(ref_id, ref_baris) WHERE deleted_at IS NULL;
+
+-- Return hanya baris yang benar-benar baru; kunci yang sudah ada dilewati
+CREATE OR REPLACE FUNCTION posting_jurnal(p_jurnal JSONB)
+RETURNS SETOF jurnal_umum
+LANGUAGE sql AS $$
+    INSERT INTO jurnal_umum (tanggal, nama_akun, akun_debit, akun_kredit, ref, ref_id, ref_baris, jumlah, debit, kredit,
+                             deskripsi, keterangan, transaksi_type, transaksi_id, user_email, created_at)
+    SELECT j.tanggal, j.nama_akun, j.akun_debit, j.akun_kredit, j.ref, j.ref_id, j.ref_baris, j.jumlah,
+           COALESCE(j.debit, 0), COALESCE(j.kredit, 0), j.deskripsi, j.keterangan, j.transaksi_type,
+           j.transaksi_id, j.user_email, COALESCE(j.created_at, now())
+    FROM jsonb_populate_recordset(NULL::jurnal_umum, p_jurnal) AS j
+    ON CONFLICT (ref_id, ref_baris) WHERE deleted_at IS NULL DO NOTHING
+    RETURNING *;
+$$;
+"""
+
+def buat_entri_jurnal(transaksi_type, data, user_email):
+    """
+    Baris jurnal satu dokumen (belum disimpan); [] kalau data tidak valid.
+    Tiap baris diberi ref_baris 1..n: kunci idempoten bersama ref_id.
+    """
+    try:
+        # Validasi dasar
+        if not data:
+            logger.error("❌ Data transaksi kosong")
+            return []
+            
+        tanggal = data.get('tanggal', datetime.now().strftime('%Y-%m-%d'))
+        transaksi_id = str(data.get('transaksi_id', '')).strip()
+        
+        if not transaksi_id or transaksi_id.lower() == 'none':
+            logger.error(f"❌ transaksi_id tidak valid: {transaksi_id}")
+            return []
+            
+        entries = []
+        
+        logger.info(f"🔄 Membuat jurnal untuk {transaksi_type} ID: {transaksi_id}")
+        
+        if transaksi_type == "PENJUALAN":
+            total_penjualan = float(data.get('total_penjualan', 0) or data.get('total', 0) or 0)
+            hpp = float(data.get('hpp', 0) or data.get('harga_pokok', 0) or 0)
+            metode_bayar = data.get('metode_pembayaran', 'CASH') or 'CASH'
+            nama_barang = data.get('nama_barang', 'Produk') or 'Produk'
+            jumlah = data.get('jumlah', 0) or 0
+            nama_pelanggan = data.get('nama_pelanggan', 'Pelanggan') or 'Pelanggan'
+            
+            logger.info(f"📊 Processing PENJUALAN: Total={total_penjualan}, HPP={hpp}")
+
+            if total_penjualan <= 0:
+                logger.error("❌ Total penjualan harus > 0")
+                return []
+            
+            # JURNAL UTAMA - SESUAI STRUCTURE SQL
+            if metode_bayar.upper() == 'CASH':
+                entries.append({
+                    "tanggal": tanggal,
+                    "nama_akun": "Kas",
+                    "akun_debit": "Kas", 
+                    "akun_kredit": "Penjualan",
+                    "ref": "1110",
+                    "ref_id": f"PENJUALAN_{transaksi_id}",
+                    "jumlah": total_penjualan,
+                    "debit": total_penjualan, 
+                    "kredit": 0,
+                    "keterangan": f"Penjualan tunai {nama_barang} {jumlah} unit kepada {nama_pelanggan}",
+                    "transaksi_type": "PENJUALAN",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                })
+            else:
+                entries.append({
+                    "tanggal": tanggal,
+                    "nama_akun": "Piutang Usaha",
+                    "akun_debit": "Piutang Usaha",
+                    "akun_kredit": "Penjualan", 
+                    "ref": "1120",
+                    "ref_id": f"PENJUALAN_{transaksi_id}",
+                    "jumlah": total_penjualan,
+                    "debit": total_penjualan,
+                    "kredit": 0,
+                    "keterangan": f"Piutang penjualan {nama_barang} {jumlah} unit ke {nama_pelanggan}",
+                    "transaksi_type": "PENJUALAN",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                })
+            
+            # ENTRI KEDUA - PENDAPATAN
+            entries.append({
+                "tanggal": tanggal,
+                "nama_akun": "Penjualan",
+                "akun_debit": "Piutang Usaha" if metode_bayar.upper() != 'CASH' else "Kas",
+                "akun_kredit": "Penjualan",
+                "ref": "4110", 
+                "ref_id": f"PENJUALAN_{transaksi_id}",
+                "jumlah": total_penjualan,
+                "debit": 0,
+                "kredit": total_penjualan,
+                "keterangan": f"Pendapatan penjualan {nama_barang} {jumlah} unit",
+                "transaksi_type": "PENJUALAN",
+                "transaksi_id": transaksi_id,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            })
+            
+            # JURNAL HPP (jika ada)
+            if hpp > 0:
+                entries.append({
+                    "tanggal": tanggal,
+                    "nama_akun": "Harga Pokok Penjualan",
+                    "akun_debit": "Harga Pokok Penjualan",
+                    "akun_kredit": "Persediaan Barang Dagang",
+                    "ref": "5210",
+                    "ref_id": f"PENJUALAN_{transaksi_id}",
+                    "jumlah": hpp,
+                    "debit": hpp,
+                    "kredit": 0,
+                    "keterangan": f"HPP {nama_barang} {jumlah} unit",
+                    "transaksi_type": "PENJUALAN", 
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                })
+                entries.append({
+                    "tanggal": tanggal,
+                    "nama_akun": "Persediaan Barang Dagang",
+                    "akun_debit": "Harga Pokok Penjualan", 
+                    "akun_kredit": "Persediaan Barang Dagang",
+                    "ref": "1130",
+                    "ref_id": f"PENJUALAN_{transaksi_id}",
+                    "jumlah": hpp,
+                    "debit": 0,
+                    "kredit": hpp,
+                    "keterangan": f"Pengurangan persediaan {nama_barang} {jumlah} unit",
+                    "transaksi_type": "PENJUALAN",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                })
+
+        elif transaksi_type == "PEMBELIAN":
+            total_pembelian = float(data.get('total_pembelian', 0) or data.get('total', 0) or 0)
+            metode_bayar = data.get('metode_pembayaran', 'CASH') or 'CASH'
+            nama_barang = data.get('nama_barang', 'Barang') or 'Barang'
+            nama_supplier = data.get('nama_supplier', 'Supplier') or 'Supplier'
+            jumlah = data.get('jumlah', 0) or 0
+            
+            logger.info(f"📊 Processing PEMBELIAN: Total={total_pembelian}")
+
+            if total_pembelian <= 0:
+                logger.error("❌ Total pembelian harus > 0")
+                return []
+            
+            # PERSEDIAAN BERTAMBAH
+            entries.append({
+                "tanggal": tanggal,
+                "nama_akun": "Persediaan Barang Dagang", 
+                "akun_debit": "Persediaan Barang Dagang",
+                "akun_kredit": "Kas" if metode_bayar.upper() == 'CASH' else "Utang Usaha",
+                "ref": "1130",
+                "ref_id": f"PEMBELIAN_{transaksi_id}",
+                "jumlah": total_pembelian,
+                "debit": total_pembelian,
+                "kredit": 0,
+                "keterangan": f"Pembelian {nama_barang} {jumlah} unit dari {nama_supplier}",
+                "transaksi_type": "PEMBELIAN",
+                "transaksi_id": transaksi_id,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            })
+            
+            # SUMBER PEMBAYARAN
+            if metode_bayar.upper() == 'CASH':
+                entries.append({
+                    "tanggal": tanggal,
+                    "nama_akun": "Kas",
+                    "akun_debit": "Persediaan Barang Dagang",
+                    "akun_kredit": "Kas",
+                    "ref": "1110",
+                    "ref_id": f"PEMBELIAN_{transaksi_id}", 
+                    "jumlah": total_pembelian,
+                    "debit": 0,
+                    "kredit": total_pembelian,
+                    "keterangan": f"Pembayaran pembelian {nama_barang} ke {nama_supplier}",
+                    "transaksi_type": "PEMBELIAN",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                })
+            else:
+                entries.append({
+                    "tanggal": tanggal,
+                    "nama_akun": "Utang Usaha",
+                    "akun_debit": "Persediaan Barang Dagang", 
+                    "akun_kredit": "Utang Usaha",
+                    "ref": "2110",
+                    "ref_id": f"PEMBELIAN_{transaksi_id}",
+                    "jumlah": total_pembelian,
+                    "debit": 0,
+                    "kredit": total_pembelian,
+                    "keterangan": f"Utang pembelian {nama_barang} ke {nama_supplier}",
+                    "transaksi_type": "PEMBELIAN",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                })
+
+        elif transaksi_type == "OPERASIONAL":
+            total_pengeluaran = float(data.get('total_pengeluaran', 0) or data.get('total', 0) or 0)
+            jenis_beban = data.get('jenis_pengeluaran', 'LAINNYA') or 'LAINNYA'
+            metode_bayar = data.get('metode_pembayaran', 'CASH') or 'CASH'
+            nama_barang = data.get('nama_barang', 'Pengeluaran') or 'Pengeluaran'
+            supplier = data.get('supplier', 'Supplier') or 'Supplier'
+            
+            logger.info(f"📊 Processing OPERASIONAL: Total={total_pengeluaran}")
+
+            if total_pengeluaran <= 0:
+                logger.error("❌ Total pengeluaran harus > 0")
+                return []
+            
+            # MAPPING JENIS BEBAN
+            beban_map = {
+                'PERLENGKAPAN': {'nama': 'Beban Perlengkapan', 'ref': '6110'},
+                'LISTRIK': {'nama': 'Beban Listrik', 'ref': '6140'},
+                'SEWA': {'nama': 'Beban Sewa', 'ref': '6130'}, 
+                'GAJI': {'nama': 'Beban Gaji', 'ref': '6120'},
+                'LAINNYA': {'nama': 'Beban Lainnya', 'ref': '6170'}
+            }
+            beban_info = beban_map.get(jenis_beban, beban_map['LAINNYA'])
+            
+            # BEBAN BERTAMBAH
+            entries.append({
+                "tanggal": tanggal,
+                "nama_akun": beban_info['nama'],
+                "akun_debit": beban_info['nama'],
+                "akun_kredit": "Kas" if metode_bayar.upper() == 'CASH' else "Utang Usaha",
+                "ref": beban_info['ref'],
+                "ref_id": f"OPERASIONAL_{transaksi_id}",
+                "jumlah": total_pengeluaran,
+                "debit": total_pengeluaran,
+                "kredit": 0,
+                "keterangan": f"{beban_info['nama']} - {nama_barang} dari {supplier}",
+                "transaksi_type": "OPERASIONAL",
+                "transaksi_id": transaksi_id,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            })
+            
+            # SUMBER PEMBAYARAN
+            entries.append({
+                "tanggal": tanggal,
+                "nama_akun": "Kas" if metode_bayar.upper() == 'CASH' else "Utang Usaha",
+                "akun_debit": beban_info['nama'],
+                "akun_kredit": "Kas" if metode_bayar.upper() == 'CASH' else "Utang Usaha", 
+                "ref": "1110" if metode_bayar.upper() == 'CASH' else "2110",
+                "ref_id": f"OPERASIONAL_{transaksi_id}",
+                "jumlah": total_pengeluaran,
+                "debit": 0,
+                "kredit": total_pengeluaran,
+                "keterangan": f"Pembayaran {beban_info['nama'].lower()} - {nama_barang}",
+                "transaksi_type": "OPERASIONAL",
+                "transaksi_id": transaksi_id,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            })
+
+        elif transaksi_type == "PRIVE":
+            jumlah = float(data.get('jumlah', 0) or data.get('total', 0) or 0)
+            keterangan = data.get('keterangan', 'Pengambilan prive') or 'Pengambilan prive'
+            
+            logger.info(f"📊 Processing PRIVE: Jumlah={jumlah}")
+
+            if jumlah <= 0:
+                logger.error("❌ Jumlah prive harus > 0")
+                return []
+            
+            entries.extend([
+                {
+                    "tanggal": tanggal,
+                    "nama_akun": "Prive",
+                    "akun_debit": "Prive",
+                    "akun_kredit": "Kas",
+                    "ref": "3210",
+                    "ref_id": f"PRIVE_{transaksi_id}",
+                    "jumlah": jumlah,
+                    "debit": jumlah,
+                    "kredit": 0,
+                    "keterangan": f"Pengambilan prive: {keterangan}",
+                    "transaksi_type": "PRIVE",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                },
+                {
+                    "tanggal": tanggal,
+                    "nama_akun": "Kas",
+                    "akun_debit": "Prive", 
+                    "akun_kredit": "Kas",
+                    "ref": "1110",
+                    "ref_id": f"PRIVE_{transaksi_id}",
+                    "jumlah": jumlah,
+                    "debit": 0,
+                    "kredit": jumlah,
+                    "keterangan": f"Pembayaran prive: {keterangan}",
+                    "transaksi_type": "PRIVE",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                }
+            ])
+
+        elif transaksi_type == "TAMBAHAN_MODAL":
+            jumlah = float(data.get('jumlah', 0) or data.get('total', 0) or 0)
+            keterangan = data.get('keterangan', 'Tambahan modal') or 'Tambahan modal'
+            
+            logger.info(f"📊 Processing TAMBAHAN_MODAL: Jumlah={jumlah}")
+
+            if jumlah <= 0:
+                logger.error("❌ Jumlah modal harus > 0")
+                return []
+            
+            entries.extend([
+                {
+                    "tanggal": tanggal,
+                    "nama_akun": "Kas",
+                    "akun_debit": "Kas",
+                    "akun_kredit": "Modal Pemilik", 
+                    "ref": "1110",
+                    "ref_id": f"MODAL_{transaksi_id}",
+                    "jumlah": jumlah,
+                    "debit": jumlah,
+                    "kredit": 0,
+                    "keterangan": f"Setoran modal: {keterangan}",
+                    "transaksi_type": "TAMBAHAN_MODAL",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                },
+                {
+                    "tanggal": tanggal,
+                    "nama_akun": "Modal Pemilik",
+                    "akun_debit": "Kas",
+                    "akun_kredit": "Modal Pemilik",
+                    "ref": "3110",
+                    "ref_id": f"MODAL_{transaksi_id}",
+                    "jumlah": jumlah,
+                    "debit": 0,
+                    "kredit": jumlah,
+                    "keterangan": f"Tambahan modal: {keterangan}",
+                    "transaksi_type": "TAMBAHAN_MODAL",
+                    "transaksi_id": transaksi_id,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                }
+            ])
+
+        # Nomor baris per dokumen, urutan entri selalu sama untuk data yang sama
+        entries = [entry for entry in entries if entry.get('nama_akun')]
+        for nomor, entry in enumerate(entries, 1):
+            entry['ref_baris'] = nomor
+        return entries
+        
+    except Exception as e:
+        logger.error(f"❌ Error buat_entri_jurnal: {str(e)}")
+        return []
+
+def posting_jurnal(entries):
+    """
+    Simpan baris jurnal, return baris yang benar-benar baru tersimpan.
+
+    JURNAL_IDEMPOTEN: satu RPC posting_jurnal (insert ON CONFLICT DO NOTHING pada
+    kunci unik (ref_id, ref_baris) baris yang belum dihapus), jadi retry / posting
+    ulang dokumen yang sama tidak menggandakan jurnal (0 baris baru) dan pemanggil
+    tidak perlu cek jurnal yang sudah ada. Tanpa itu: insert per baris seperti sebelumnya.
+    """
+    if not entries:
+        return []
+    if JURNAL_IDEMPOTEN:
+        result = supabase.rpc("posting_jurnal", {"p_jurnal": entries}).execute()
+        return result.data or []
+
+    baru = []
+    for entry in entries:
+        try:
+            result = supabase.table("jurnal_umum").insert(entry).execute()
+            if result.data:
+                baru.extend(result.data)
+                logger.info(f"✅ Jurnal: {entry['nama_akun']} - {entry['debit']}/{entry['kredit']}")
+            else:
+                logger.error(f"❌ Gagal: {result.error}")
+        except Exception as e:
+            logger.error(f"❌ Exception: {str(e)}")
+            continue
+    return baru
+
+def posting_jurnal_utuh(entries):
+    """
+    Seperti posting_jurnal tapi semua-atau-tidak-sama-sekali: tanpa JURNAL_IDEMPOTEN
+    satu insert batch (satu statement), bukan insert per baris yang menelan error,
+    jadi tidak ada jurnal sepihak yang tertinggal. Error diteruskan ke pemanggil.
+    """
+    if not entries:
+        return []
+    if JURNAL_IDEMPOTEN:
+        return posting_jurnal(entries)
+    return supabase.table("jurnal_umum").insert(entries).execute().data or []
+
+def jurnal_tersimpan(entries, baru):
+    """True kalau semua kunci (ref_id, ref_baris) entries sudah ada: baru diposting atau dari posting sebelumnya"""
+    kunci = {(e.get('ref_id'), e.get('ref_baris')) for e in entries}
+    kunci -= {(r.get('ref_id'), r.get('ref_baris')) for r in baru}
+    if not kunci:
+        return True
+    if any(ref_baris is None for _, ref_baris in kunci):
+        return False   # baris tanpa ref_baris tidak punya kunci untuk dicek
+    rows = supabase.table("jurnal_umum").select("ref_id, ref_baris") \
+        .in_("ref_id", sorted({ref_id for ref_id, _ in kunci})).execute().data or []
+    return not kunci - {(r['ref_id'], r['ref_baris']) for r in rows}
+
+def create_journal_entries(transaksi_type, data, user_email):
+    """
+    🎀 FUNGSI JURNAL - COMPATIBLE WITH EXISTING DATABASE STRUCTURE
+    """
+    try:
+        if not supabase:
+            logger.error("❌ Database tidak tersedia")
+            return False
+        
+        entries = buat_entri_jurnal(transaksi_type, data, user_email)
+
+        # 💾 SIMPAN KE DATABASE
+        if not entries:
+            logger.warning("⚠️ Tidak ada entri jurnal yang dibuat")
+            return False
+        
+        baru = posting_jurnal(entries)
+        logger.info(f"🎀 {len(baru)}/{len(entries)} jurnal berhasil")
+        if not JURNAL_IDEMPOTEN:
+            return len(baru) > 0
+        # Idempoten: dokumen yang jurnalnya sudah lengkap juga berhasil (no-op)
+        return jurnal_tersimpan(entries, baru)
+        
+    except Exception as e:
+        logger.error(f"❌ Error create_journal_entries: {str(e)}")
+        return False
+
+def get_kode_akun(nama_akun):
+    """Get kode akun berdasarkan nama akun"""
+    kode_map = {
+        "Kas": "1110",
+        "Bank": "1120",
+        "Beban Penyusutan": "6130",
+        "Beban Perlengkapan": "6110",
+        "HPP": "5210",
+        "Pembelian": "5110",
+        "Akumulasi Penyusutan": "1260",
+        "Perlengkapan": "1140",
+        "Persediaan Barang Dagang": "1130",
+    }
+    return kode_map.get(nama_akun, "0000")
+
+def get_kode_akumulasi_penyusutan(jenis_aset):
+    """Get kode akun akumulasi penyusutan berdasarkan jenis aset"""
+    kode_map = {
+        "TANAH": "1261",
+        "BANGUNAN": "1262",
+        "KENDARAAN": "1263",
+        "PERALATAN": "1264",
+        "INVENTARIS": "1265"
+    }
+    return kode_map.get(jenis_aset, "1260")
+
+# ============================================================
+# 🔹 FUNGSI BANTUAN 
+# ============================================================
+
+def filter_akun_tidak_diinginkan(jurnal_data):
+    """Filter out specific accounts if needed"""
+    filtered_data = []
+    for jurnal in jurnal_data:
+        akun_nama = jurnal.get('nama_akun', '').lower()
+        # Tambahkan filter jika diperlukan
+        filtered_data.append(jurnal)
+    return filtered_data
+
+def hitung_laba_bersih_otomatis():
+    """Hitung laba bersih dari data jurnal yang ada"""
+    try:
+        # Ambil semua data jurnal
+        jurnal_result = supabase.table("jurnal_umum").select("*").execute()
+        jurnal_data = jurnal_result.data or []
+        
+        logger.info(f"🔍 Menghitung laba bersih dari {len(jurnal_data)} transaksi")
+        
+        pendapatan_total = 0
+        beban_total = 0
+        
+        for jurnal in jurnal_data:
+            nama_akun = jurnal.get('nama_akun', '').lower()
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            # PENDAPATAN (akun pendapatan, penjualan, dll) - ada di sisi kredit
+            if any(keyword in nama_akun for keyword in ['pendapatan', 'penjualan', 'hasil', 'jasa']):
+                pendapatan_total += kredit
+            
+            # BEBAN (akun beban, biaya, hpp, pokok) - ada di sisi debit  
+            elif any(keyword in nama_akun for keyword in ['beban', 'biaya', 'hpp', 'pokok']):
+                beban_total += debit
+        
+        laba_bersih = pendapatan_total - beban_total
+        
+        logger.info(f"📊 Laba Bersih: {pendapatan_total} - {beban_total} = {laba_bersih}")
+        
+        return laba_bersih
+        
+    except Exception as e:
+        logger.error(f"❌ Error hitung_laba_bersih_otomatis: {str(e)}")
+        return 0
+
+# ============================================================
+# 🔹 FUNGSI BANTU: NERACA SALDO AWAL
+# ============================================================
+
+def get_initial_balance_data():
+    """Mengambil dan mengkonsolidasikan data Neraca Saldo Awal (NSA)"""
+    try:
+        if not supabase:
+            return {}
+
+        # Ambil semua data NSA
+        result = supabase.table("neraca_saldo_awal").select("*").execute()
+        return konsolidasi_nsa(result.data or [])
+
+    except Exception as e:
+        logger.error(f"❌ Error get_initial_balance_data: {str(e)}")
+        return {}
+
+def konsolidasi_nsa(nsa_data):
+    """Konsolidasi baris neraca_saldo_awal berdasarkan nama akun"""
+    consolidated_nsa = {}
+    for row in nsa_data:
+        akun = row.get('nama_akun', 'Unknown')
+        debit = float(row.get('debit', 0) or 0)
+        kredit = float(row.get('kredit', 0) or 0)
+
+        if akun not in consolidated_nsa:
+            consolidated_nsa[akun] = {'debit': 0, 'kredit': 0, 'data': []}
+
+        consolidated_nsa[akun]['debit'] += debit
+        consolidated_nsa[akun]['kredit'] += kredit
+        consolidated_nsa[akun]['data'].append(row)
+
+    return consolidated_nsa
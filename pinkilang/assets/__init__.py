@@ -0,0 +1,11 @@
+"""Blueprint assets: aset lancar dan aset tetap"""
+from flask import Blueprint
+from pinkilang.lazy import lazy_route
+
+bp = Blueprint("assets", __name__)
+
+lazy_route(bp, "/aset", "aset.aset")
+lazy_route(bp, "/aset-lancar", "aset.aset_lancar")
+lazy_route(bp, "/set-saldo-awal-otomatis", "aset.set_saldo_awal_otomatis", methods=["POST"])
+lazy_route(bp, "/set-saldo-kas", "aset.set_saldo_kas", methods=["POST"])
+lazy_route(bp, "/aset-tetap", "aset_tetap.aset_tetap", methods=["GET", "POST"])
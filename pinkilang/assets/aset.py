@@ -0,0 +1,978 @@
+"""Ringkasan aset dan aset lancar (saldo kas/persediaan)"""
+from flask import json, request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, format_currency
+from pinkilang.penyusutan import get_aset_tetap_data
+
+# ============================================================
+# 🔹 ROUTE: Aset (Menu Utama) - UPDATED dengan REAL DATA
+# ============================================================
+def aset():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Hitung data real aset lancar
+        aset_lancar_data = hitung_saldo_aset_lancar_fixed()
+        total_aset_lancar = aset_lancar_data.get('total_aset_lancar', 0)
+        
+        # Hitung data real aset tetap
+        aset_tetap_data = get_aset_tetap_data()
+        total_nilai_aset = sum(item.get('nilai_perolehan', 0) for item in aset_tetap_data)
+        total_penyusutan = sum(item.get('akumulasi_penyusutan', 0) for item in aset_tetap_data)
+        total_nilai_buku_aset_tetap = total_nilai_aset - total_penyusutan
+        
+        # Total semua aset
+        total_semua_aset = total_aset_lancar + total_nilai_buku_aset_tetap
+        
+    except Exception as e:
+        logger.error(f"Error hitung data aset: {str(e)}")
+        total_aset_lancar = 0
+        total_nilai_buku_aset_tetap = 0
+        total_semua_aset = 0
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Manajemen Aset - PINKILANG</title>
+        <meta charset="utf-8">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                padding: 20px;
+                min-height: 100vh;
+            }}
+            
+            .container {{
+                max-width: 1200px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 15px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                padding: 25px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 8px;
+                margin-bottom: 15px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 28px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            .menu-grid {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 25px;
+                margin-top: 20px;
+            }}
+            
+            .menu-card {{
+                background: #fff5f9;
+                padding: 30px;
+                border-radius: 12px;
+                text-align: center;
+                text-decoration: none;
+                color: #333;
+                transition: all 0.3s ease;
+                border: 2px solid #ffd1e6;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            .menu-card:hover {{
+                transform: translateY(-5px);
+                box-shadow: 0 8px 25px rgba(255,133,179,0.2);
+                border-color: #ff85b3;
+                background: white;
+            }}
+            
+            .menu-icon {{
+                font-size: 48px;
+                margin-bottom: 15px;
+            }}
+            
+            .menu-title {{
+                font-size: 20px;
+                font-weight: bold;
+                color: #ff66a3;
+                margin-bottom: 10px;
+            }}
+            
+            .menu-description {{
+                color: #666;
+                font-size: 14px;
+                line-height: 1.5;
+            }}
+            
+            .info-box {{
+                background: #e6f7ff;
+                border: 1px solid #91d5ff;
+                border-radius: 10px;
+                padding: 20px;
+                margin: 20px 0;
+                color: #0066cc;
+            }}
+            
+            .stats-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                gap: 15px;
+                margin: 25px 0;
+            }}
+            
+            .stat-card {{
+                background: white;
+                padding: 20px;
+                border-radius: 10px;
+                text-align: center;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+                border: 1px solid #ffe6f2;
+            }}
+            
+            .stat-number {{
+                font-size: 24px;
+                font-weight: bold;
+                color: #ff66a3;
+                margin: 10px 0;
+            }}
+            
+            .stat-label {{
+                color: #e83e8c;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            
+            .real-data-badge {{
+                background: #00cc66;
+                color: white;
+                padding: 4px 8px;
+                border-radius: 12px;
+                font-size: 10px;
+                margin-left: 5px;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>🏦 Manajemen Aset</h1>
+                <p>Sistem Pencatatan Aset Lancar dan Tetap - PINKILANG</p>
+            </div>
+            
+            <div class="content">
+                <div class="stats-grid">
+                    <div class="stat-card">
+                        <div>💰</div>
+                        <div class="stat-number">{format_currency(total_aset_lancar)}</div>
+                        <div class="stat-label">Total Aset Lancar <span class="real-data-badge">REAL</span></div>
+                    </div>
+                    <div class="stat-card">
+                        <div>🏢</div>
+                        <div class="stat-number">{format_currency(total_nilai_buku_aset_tetap)}</div>
+                        <div class="stat-label">Total Aset Tetap <span class="real-data-badge">REAL</span></div>
+                    </div>
+                    <div class="stat-card">
+                        <div>📊</div>
+                        <div class="stat-number">{format_currency(total_semua_aset)}</div>
+                        <div class="stat-label">Total Semua Aset <span class="real-data-badge">REAL</span></div>
+                    </div>
+                </div>
+                
+                <div class="menu-grid">
+                    <a href="/aset-lancar" class="menu-card">
+                        <div class="menu-icon">💰</div>
+                        <div class="menu-title">Aset Lancar</div>
+                        <div class="menu-description">
+                            Kelola aset lancar seperti kas, piutang, persediaan, dan perlengkapan.
+                            Total saat ini: <strong>{format_currency(total_aset_lancar)}</strong>
+                        </div>
+                    </a>
+                    
+                    <a href="/aset-tetap" class="menu-card">
+                        <div class="menu-icon">🏢</div>
+                        <div class="menu-title">Aset Tetap</div>
+                        <div class="menu-description">
+                            Kelola aset tetap seperti tanah, bangunan, kendaraan, dan peralatan.
+                            Total saat ini: <strong>{format_currency(total_nilai_buku_aset_tetap)}</strong>
+                        </div>
+                    </a>
+                </div>
+                
+                <div style="text-align: center; margin-top: 30px; padding: 20px; background: #fff5f9; border-radius: 10px;">
+                    <h3 style="color: #ff66a3; margin-bottom: 15px;">📋 Ringkasan Aset</h3>
+                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; text-align: left;">
+                        <div>
+                            <strong>Aset Lancar:</strong>
+                            <ul style="margin-top: 10px; color: #666;">
+                                <li>Kas: {format_currency(aset_lancar_data.get('kas', 0))}</li>
+                                <li>Piutang: {format_currency(aset_lancar_data.get('piutang', 0))}</li>
+                                <li>Persediaan: {format_currency(aset_lancar_data.get('persediaan', 0))}</li>
+                                <li>Perlengkapan: {format_currency(aset_lancar_data.get('perlengkapan', 0))}</li>
+                            </ul>
+                        </div>
+                        <div>
+                            <strong>Aset Tetap:</strong>
+                            <ul style="margin-top: 10px; color: #666;">
+                                <li>Nilai Perolehan: {format_currency(total_nilai_aset)}</li>
+                                <li>Akumulasi Penyusutan: {format_currency(total_penyusutan)}</li>
+                                <li>Nilai Buku: {format_currency(total_nilai_buku_aset_tetap)}</li>
+                                <li>Jumlah Aset: {len(aset_tetap_data)} item</li>
+                            </ul>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    return html
+
+# ============================================================
+# 🔹 ROUTE: Aset Lancar - FIXED VERSION (KAS SAJA)
+# ============================================================
+def aset_lancar():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # 🔧 INISIALISASI SALDO AWAL JIKA PERLU
+        initialize_saldo_awal()
+        
+        # 🔧 HITUNG SALDO DENGAN FUNGSI YANG SUDAH DIPERBAIKI
+        saldo_data = hitung_saldo_aset_lancar_fixed()
+        
+        # Ambil data perlengkapan untuk tabel
+        operasional_data = supabase.table("operasional")\
+            .select("*")\
+            .eq("jenis_pengeluaran", "PERLENGKAPAN")\
+            .order("tanggal", desc=True)\
+            .execute()
+        
+        perlengkapan_data = operasional_data.data or []
+        
+    except Exception as e:
+        logger.error(f"Error di aset lancar: {str(e)}")
+        saldo_data = {
+            'kas': 0, 
+            'piutang': 0,
+            'persediaan': 0,
+            'perlengkapan': 0,
+            'total_aset_lancar': 0,
+            'debug_info': {'error': str(e)}
+        }
+        perlengkapan_data = []
+    
+    # 🔧 FIX: Gunakan get() untuk akses yang aman
+    kas_saldo = saldo_data.get('kas', 0)
+    piutang_saldo = saldo_data.get('piutang', 0)
+    persediaan_saldo = saldo_data.get('persediaan', 0)
+    perlengkapan_saldo = saldo_data.get('perlengkapan', 0)
+    total_aset = saldo_data.get('total_aset_lancar', 0)
+    
+    # 🔧 TAMPILKAN FORM SET SALDO JIKA MASIH 0
+    kas_form = ""
+    if kas_saldo <= 0:
+        kas_form = f"""
+        <div class="section" style="background: #fff0f0; border-left: 5px solid #ff6666;">
+            <h2 class="section-title">⚠️ Perhatian: Saldo Kas Masih Kosong</h2>
+            <div class="info-box" style="background: #ffd4d4; color: #cc0000;">
+                <strong>❌ Masalah Terdeteksi:</strong> Saldo Kas saat ini: <strong>{format_currency(kas_saldo)}</strong>
+                <br>Hal ini bisa terjadi karena:
+                <br>• Belum ada transaksi saldo awal
+                <br>• Transaksi belum tercatat di jurnal
+                <br>• Data jurnal tidak lengkap
+            </div>
+            
+            <form method="POST" action="/set-saldo-awal-otomatis">
+                <div style="text-align: center; padding: 20px;">
+                    <button type="submit" class="btn" style="background: #ff6666; font-size: 18px; padding: 15px 30px;">
+                        🔄 BUAT SALDO AWAL OTOMATIS
+                    </button>
+                    <p style="margin-top: 10px; color: #666; font-size: 14px;">
+                        Sistem akan membuat saldo awal Kas: Rp 10.000.000
+                    </p>
+                </div>
+            </form>
+            
+            <div style="margin-top: 20px; padding: 15px; background: #e6f7ff; border-radius: 8px;">
+                <strong>💡 Atau atur manual:</strong>
+                <form method="POST" action="/set-saldo-kas" style="margin-top: 10px;">
+                    <div>
+                        <label for="saldo_kas">💰 Set Saldo Kas Awal:</label>
+                        <input type="number" name="saldo_kas" value="10000000" style="width: 100%; padding: 8px; font-size: 16px;">
+                    </div>
+                    <button type="submit" class="btn" style="background: #66b3ff; margin-top: 10px; font-size: 16px;">
+                        💾 Simpan Saldo Kas
+                    </button>
+                </form>
+            </div>
+        </div>
+        """
+    
+    # Generate table rows untuk perlengkapan
+    perlengkapan_rows = ""
+    if perlengkapan_data:
+        for item in perlengkapan_data:
+            try:
+                tanggal = datetime.strptime(item.get('tanggal', ''), '%Y-%m-%d').strftime('%d/%m/%Y')
+            except:
+                tanggal = '-'
+            
+            perlengkapan_rows += f"""
+                <tr>
+                    <td>{tanggal}</td>
+                    <td>{item.get('nama_barang', '-')}</td>
+                    <td>{item.get('supplier', '-')}</td>
+                    <td>{item.get('jumlah', 0)} {item.get('satuan', 'unit')}</td>
+                    <td>{format_currency(item.get('harga_satuan', 0))}</td>
+                    <td><strong>{format_currency(item.get('total_pengeluaran', 0))}</strong></td>
+                    <td>
+                        <span style="background: #ffb6d9; color: #c2185b; padding: 4px 8px; border-radius: 12px; font-size: 11px;">
+                            {item.get('user_email', 'Unknown').split('@')[0]}
+                        </span>
+                    </td>
+                </tr>
+            """
+    else:
+        perlengkapan_rows = """
+                <tr>
+                    <td colspan="7" style="text-align: center; padding: 40px; color: #999;">
+                        📊 Belum ada data perlengkapan
+                        <br><br>
+                        <a href="/operasional" style="color: #66b3ff; text-decoration: none;">
+                            ➕ Input Transaksi Perlengkapan
+                        </a>
+                    </td>
+                </tr>
+        """
+    
+    # Data untuk chart persentase
+    chart_data = []
+    if total_aset > 0:
+        chart_data = [
+            {'name': 'Kas', 'value': kas_saldo, 'percentage': (kas_saldo / total_aset * 100) if total_aset > 0 else 0},
+            {'name': 'Piutang', 'value': piutang_saldo, 'percentage': (piutang_saldo / total_aset * 100) if total_aset > 0 else 0},
+            {'name': 'Persediaan', 'value': persediaan_saldo, 'percentage': (persediaan_saldo / total_aset * 100) if total_aset > 0 else 0},
+            {'name': 'Perlengkapan', 'value': perlengkapan_saldo, 'percentage': (perlengkapan_saldo / total_aset * 100) if total_aset > 0 else 0}
+        ]
+    else:
+        chart_data = [
+            {'name': 'Kas', 'value': 0, 'percentage': 0},
+            {'name': 'Piutang', 'value': 0, 'percentage': 0},
+            {'name': 'Persediaan', 'value': 0, 'percentage': 0},
+            {'name': 'Perlengkapan', 'value': 0, 'percentage': 0}
+        ]
+    
+    chart_html = ""
+    for item in chart_data:
+        chart_html += f"""
+            <div style="margin: 15px 0;">
+                <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
+                    <span>{item['name']}</span>
+                    <span>{item['percentage']:.1f}%</span>
+                </div>
+                <div style="background: #e6f2ff; border-radius: 10px; height: 10px;">
+                    <div style="background: #66b3ff; height: 100%; border-radius: 10px; width: {item['percentage']}%;"></div>
+                </div>
+            </div>
+        """
+    
+    # 🔧 DEBUG INFO
+    debug_info = f"""
+    <div class="section" style="background: #f8f9fa; border-left: 5px solid #999;">
+        <h2 class="section-title">🔧 Debug Information</h2>
+        <div style="font-family: monospace; font-size: 12px; background: white; padding: 15px; border-radius: 8px;">
+            <strong>Data Perhitungan:</strong><br>
+            • Kas: {format_currency(kas_saldo)}<br>
+            • Piutang: {format_currency(piutang_saldo)}<br>
+            • Persediaan: {format_currency(persediaan_saldo)}<br>
+            • Perlengkapan: {format_currency(perlengkapan_saldo)}<br>
+            • Total: {format_currency(total_aset)}<br>
+            <br>
+            <strong>Detail Debug:</strong><br>
+            {json.dumps(saldo_data.get('debug_info', {}), indent=2)}
+        </div>
+                
+        <div style="background: #fff0f0; border: 2px solid #ff6666; border-radius: 10px; padding: 20px; margin: 20px 0; text-align: center;">
+            <h3 style="color: #ff6666; margin-bottom: 15px;">⚠️ Perhatian: Saldo Kas Tidak Normal</h3>
+            <p style="color: #cc0000; margin-bottom: 15px;">
+                Terdeteksi saldo Kas: <strong>{format_currency(kas_saldo)}</strong>
+            </p>
+            <a href="/fix-kas-data-complete" class="btn" style="background: #ff6666; color: white; padding: 12px 25px; text-decoration: none; border-radius: 8px; font-size: 16px;">
+                🔧 PERBAIKI DATA KAS
+            </a>
+            <p style="color: #666; font-size: 12px; margin-top: 10px;">
+                Klik tombol di atas untuk memperbaiki data Kas secara otomatis
+            </p>
+        </div>
+    </div>
+    """
+
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Aset Lancar - PINKILANG</title>
+        <meta charset="utf-8">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                padding: 20px;
+                min-height: 100vh;
+            }}
+            
+            .container {{
+                max-width: 1200px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 15px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #66b3ff, #4d94ff);
+                color: white;
+                padding: 25px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 8px;
+                margin-bottom: 15px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 28px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 25px;
+            }}
+            
+            .stats-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+                gap: 20px;
+                margin: 25px 0;
+            }}
+            
+            .stat-card {{
+                background: white;
+                padding: 25px;
+                border-radius: 12px;
+                text-align: center;
+                box-shadow: 0 4px 15px rgba(102,179,255,0.1);
+                border: 2px solid #e6f2ff;
+                transition: transform 0.3s ease;
+            }}
+            
+            .stat-card:hover {{
+                transform: translateY(-5px);
+            }}
+            
+            .stat-icon {{
+                font-size: 36px;
+                margin-bottom: 15px;
+            }}
+            
+            .stat-number {{
+                font-size: 24px;
+                font-weight: bold;
+                color: #66b3ff;
+                margin: 10px 0;
+            }}
+            
+            .stat-number.negative {{
+                color: #ff6666;
+            }}
+            
+            .stat-label {{
+                color: #3399ff;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            
+            .section {{
+                margin: 30px 0;
+                padding: 25px;
+                background: #f8fbff;
+                border-radius: 12px;
+                border-left: 5px solid #66b3ff;
+            }}
+            
+            .section-title {{
+                color: #66b3ff;
+                font-size: 22px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #e6f2ff;
+            }}
+            
+            .table-container {{
+                overflow-x: auto;
+                margin-top: 15px;
+            }}
+            
+            table {{
+                width: 100%;
+                border-collapse: collapse;
+                background: white;
+                border-radius: 8px;
+                overflow: hidden;
+                box-shadow: 0 4px 15px rgba(102,179,255,0.1);
+            }}
+            
+            th, td {{
+                padding: 12px;
+                text-align: left;
+                border-bottom: 1px solid #e6f2ff;
+            }}
+            
+            th {{
+                background: #66b3ff;
+                color: white;
+                font-weight: bold;
+            }}
+            
+            tr:hover {{
+                background: #f0f8ff;
+            }}
+            
+            .total-row {{
+                background: #e6f2ff;
+                font-weight: bold;
+            }}
+            
+            .info-box {{
+                background: #e6f7ff;
+                border: 1px solid #91d5ff;
+                border-radius: 8px;
+                padding: 15px;
+                margin: 15px 0;
+                color: #0066cc;
+            }}
+            
+            .form-group {{
+                margin-bottom: 15px;
+            }}
+            
+            label {{
+                display: block;
+                margin-bottom: 5px;
+                color: #3399ff;
+                font-weight: bold;
+            }}
+            
+            input, textarea {{
+                width: 100%;
+                padding: 10px;
+                border: 2px solid #b3d9ff;
+                border-radius: 8px;
+                font-size: 14px;
+            }}
+            
+            .btn {{
+                padding: 12px 25px;
+                background: #66b3ff;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                cursor: pointer;
+                font-size: 16px;
+                text-decoration: none;
+                display: inline-block;
+                margin: 5px;
+            }}
+            
+            .btn:hover {{
+                background: #4d94ff;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/aset" class="back-btn">← Kembali ke Aset</a>
+                <h1>💰 Aset Lancar</h1>
+                <p>Manajemen Kas, Piutang, Persediaan, dan Perlengkapan</p>
+            </div>
+            
+            <div class="content">
+                {kas_form}
+                
+                <div class="stats-grid">
+                    <div class="stat-card">
+                        <div class="stat-icon">💵</div>
+                        <div class="stat-number {'negative' if kas_saldo < 0 else ''}">
+                            {format_currency(abs(kas_saldo))}
+                            {'⚠️' if kas_saldo < 0 else ''}
+                        </div>
+                        <div class="stat-label">Kas</div>
+                    </div>
+                    
+                    <div class="stat-card">
+                        <div class="stat-icon">📄</div>
+                        <div class="stat-number">{format_currency(piutang_saldo)}</div>
+                        <div class="stat-label">Piutang Usaha</div>
+                    </div>
+                    
+                    <div class="stat-card">
+                        <div class="stat-icon">📦</div>
+                        <div class="stat-number">{format_currency(persediaan_saldo)}</div>
+                        <div class="stat-label">Persediaan Barang</div>
+                    </div>
+                    
+                    <div class="stat-card">
+                        <div class="stat-icon">🛠️</div>
+                        <div class="stat-number">{format_currency(perlengkapan_saldo)}</div>
+                        <div class="stat-label">Perlengkapan</div>
+                    </div>
+                </div>
+                
+                <div style="text-align: center; margin: 30px 0; padding: 20px; background: linear-gradient(135deg, #66b3ff, #4d94ff); color: white; border-radius: 10px;">
+                    <h2 style="margin-bottom: 10px;">Total Aset Lancar</h2>
+                    <div style="font-size: 32px; font-weight: bold;">
+                        {format_currency(total_aset)}
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2 class="section-title">🛠️ Data Perlengkapan</h2>
+                    <p>Data diambil dari transaksi operasional dengan jenis pengeluaran "Perlengkapan"</p>
+                    
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>Tanggal</th>
+                                    <th>Nama Barang</th>
+                                    <th>Supplier</th>
+                                    <th>Jumlah</th>
+                                    <th>Harga Satuan</th>
+                                    <th>Total</th>
+                                    <th>Input Oleh</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {perlengkapan_rows}
+                                {f'<tr class="total-row"><td colspan="5" style="text-align: right;"><strong>Total Nilai Perlengkapan:</strong></td><td colspan="2"><strong>{format_currency(perlengkapan_saldo)}</strong></td></tr>' if perlengkapan_data else ''}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2 class="section-title">📊 Breakdown Aset Lancar</h2>
+                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+                        <div>
+                            <h3 style="color: #66b3ff; margin-bottom: 15px;">Komposisi Aset Lancar</h3>
+                            <div style="background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                                <div style="display: flex; justify-content: space-between; margin: 10px 0; padding: 8px; border-bottom: 1px solid #f0f0f0;">
+                                    <span>Kas:</span>
+                                    <strong>{format_currency(kas_saldo)}</strong>
+                                </div>
+                                <div style="display: flex; justify-content: space-between; margin: 10px 0; padding: 8px; border-bottom: 1px solid #f0f0f0;">
+                                    <span>Piutang Usaha:</span>
+                                    <strong>{format_currency(piutang_saldo)}</strong>
+                                </div>
+                                <div style="display: flex; justify-content: space-between; margin: 10px 0; padding: 8px; border-bottom: 1px solid #f0f0f0;">
+                                    <span>Persediaan:</span>
+                                    <strong>{format_currency(persediaan_saldo)}</strong>
+                                </div>
+                                <div style="display: flex; justify-content: space-between; margin: 10px 0; padding: 8px;">
+                                    <span>Perlengkapan:</span>
+                                    <strong>{format_currency(perlengkapan_saldo)}</strong>
+                                </div>
+                            </div>
+                        </div>
+                        
+                        <div>
+                            <h3 style="color: #66b3ff; margin-bottom: 15px;">Persentase</h3>
+                            <div style="background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                                {chart_html}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                
+                {debug_info if kas_saldo <= 0 else ''}
+                
+                <div style="text-align: center; margin-top: 30px;">
+                    <a href="/operasional" class="btn">
+                        ➕ Input Perlengkapan
+                    </a>
+                    <a href="/penjualan" class="btn" style="background: #ff66a3;">
+                        📊 Lihat Piutang
+                    </a>
+                    <a href="/jurnal-umum" class="btn" style="background: #00cc66;">
+                        📝 Lihat Jurnal
+                    </a>
+                    <button onclick="window.print()" class="btn" style="background: #ff9966;">
+                        🖨️ Cetak Laporan
+                    </button>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    return html
+
+# ============================================================
+# 🔹 FUNGSI BANTU YANG SUDAH DIPERBAIKI (KAS SAJA)
+# ============================================================
+
+def hitung_saldo_aset_lancar_fixed():
+    """Hitung saldo aset lancar - FIXED VERSION (KAS SAJA)"""
+    try:
+        # 1. HITUNG KAS SAJA
+        kas_data = supabase.table("jurnal_umum")\
+            .select("nama_akun, debit, kredit")\
+            .eq("nama_akun", "Kas")\
+            .execute()
+        
+        kas_list = kas_data.data or []
+        
+        saldo_kas = 0
+        
+        for transaksi in kas_list:
+            debit = float(transaksi.get('debit', 0) or 0)
+            kredit = float(transaksi.get('kredit', 0) or 0)
+            saldo_kas += (debit - kredit)
+
+        # 2. HITUNG PIUTANG
+        piutang_data = supabase.table("jurnal_umum")\
+            .select("debit, kredit")\
+            .eq("nama_akun", "Piutang Usaha")\
+            .execute()
+        
+        piutang_list = piutang_data.data or []
+        saldo_piutang = sum(float(item.get('debit', 0) or 0) for item in piutang_list) - \
+                       sum(float(item.get('kredit', 0) or 0) for item in piutang_list)
+        
+        # 3. HITUNG PERSEDIAAN
+        persediaan_data = supabase.table("persediaan_terintegrasi")\
+            .select("*")\
+            .eq("id", 1)\
+            .execute()
+        
+        if persediaan_data.data:
+            persediaan = persediaan_data.data[0]
+            jumlah_persediaan = persediaan.get('jumlah_persediaan', 0)
+            nilai_persediaan = jumlah_persediaan * 350  # Harga rata-rata
+        else:
+            nilai_persediaan = 0
+            jumlah_persediaan = 0
+        
+        # 4. HITUNG PERLENGKAPAN
+        operasional_data = supabase.table("operasional")\
+            .select("total_pengeluaran")\
+            .eq("jenis_pengeluaran", "PERLENGKAPAN")\
+            .execute()
+        
+        perlengkapan_list = operasional_data.data or []
+        total_perlengkapan = sum(float(item.get('total_pengeluaran', 0) or 0) for item in perlengkapan_list)
+        
+        # 🔧 FIX: Return dengan key 'kas' saja
+        return {
+            'kas': saldo_kas,  # Key utama yang digunakan di route
+            'piutang': max(0, saldo_piutang),
+            'persediaan': nilai_persediaan,
+            'perlengkapan': total_perlengkapan,
+            'total_aset_lancar': max(0, saldo_kas) + max(0, saldo_piutang) + nilai_persediaan + total_perlengkapan,
+            'debug_info': {
+                'kas': saldo_kas,
+                'piutang_raw': saldo_piutang,
+                'persediaan_unit': jumlah_persediaan,
+                'total_transaksi_kas': len(kas_list),
+                'total_transaksi_piutang': len(piutang_list)
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error hitung saldo aset lancar: {str(e)}")
+        return {
+            'kas': 0,
+            'piutang': 0, 
+            'persediaan': 0,
+            'perlengkapan': 0,
+            'total_aset_lancar': 0,
+            'debug_info': {'error': str(e)}
+        }
+
+def initialize_saldo_awal():
+    """Inisialisasi saldo awal otomatis jika belum ada data"""
+    try:
+        # Cek apakah sudah ada saldo awal
+        result = supabase.table("jurnal_umum")\
+            .select("*")\
+            .eq("transaksi_type", "SALDO_AWAL")\
+            .execute()
+        
+        if not result.data:
+            # Buat saldo awal default
+            saldo_awal_entry = {
+                "tanggal": "2024-01-01",
+                "nama_akun": "Kas",
+                "ref": "1110",
+                "debit": 10000000,
+                "kredit": 0,
+                "deskripsi": "Saldo awal kas",
+                "transaksi_type": "SALDO_AWAL",
+                "user_email": "system",
+                "created_at": datetime.now().isoformat()
+            }
+            
+            supabase.table("jurnal_umum").insert(saldo_awal_entry).execute()
+            logger.info("✅ Saldo awal Kas berhasil diinisialisasi")
+            return True
+            
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Error inisialisasi saldo awal: {str(e)}")
+        return False
+
+# ============================================================
+# 🔹 ROUTE UNTUK SET SALDO KAS - FIXED
+# ============================================================
+
+def set_saldo_awal_otomatis():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Hapus saldo awal lama jika ada
+        supabase.table("jurnal_umum")\
+            .delete()\
+            .eq("transaksi_type", "SALDO_AWAL")\
+            .execute()
+        
+        # Buat saldo awal baru
+        saldo_entry = {
+            "tanggal": datetime.now().strftime('%Y-%m-%d'),
+            "nama_akun": "Kas",
+            "ref": "1110", 
+            "debit": 10000000,
+            "kredit": 0,
+            "deskripsi": "Saldo awal kas - Generated by System",
+            "transaksi_type": "SALDO_AWAL",
+            "user_email": user_email,
+            "created_at": datetime.now().isoformat()
+        }
+        
+        result = supabase.table("jurnal_umum").insert(saldo_entry).execute()
+        
+        if result.data:
+            session['flash_message'] = "✅ Saldo awal berhasil dibuat! Kas: Rp 10.000.000"
+            logger.info(f"✅ Saldo awal otomatis berhasil dibuat oleh {user_email}")
+        else:
+            session['flash_message'] = "❌ Gagal membuat saldo awal"
+            
+    except Exception as e:
+        logger.error(f"❌ Error set saldo awal otomatis: {str(e)}")
+        session['flash_message'] = f"❌ Error: {str(e)}"
+    
+    return redirect("/aset-lancar")
+
+def set_saldo_kas():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        saldo_kas = int(request.form.get("saldo_kas", 0) or 0)
+        
+        if saldo_kas <= 0:
+            session['flash_message'] = "❌ Saldo harus lebih dari 0"
+            return redirect("/aset-lancar")
+        
+        # Hapus saldo lama untuk akun Kas
+        supabase.table("jurnal_umum")\
+            .delete()\
+            .eq("transaksi_type", "SALDO_AWAL")\
+            .execute()
+        
+        jurnal_entry = {
+            "tanggal": datetime.now().strftime('%Y-%m-%d'),
+            "nama_akun": "Kas",
+            "ref": "1110",
+            "debit": saldo_kas,
+            "kredit": 0,
+            "deskripsi": "Saldo awal kas - Manual Entry",
+            "transaksi_type": "SALDO_AWAL",
+            "user_email": user_email,
+            "created_at": datetime.now().isoformat()
+        }
+        
+        result = supabase.table("jurnal_umum").insert(jurnal_entry).execute()
+        
+        if result.data:
+            session['flash_message'] = f"✅ Saldo Kas berhasil diatur! Jumlah: {format_currency(saldo_kas)}"
+        else:
+            session['flash_message'] = "❌ Gagal mengatur saldo Kas"
+            
+    except Exception as e:
+        logger.error(f"❌ Error set saldo kas: {str(e)}")
+        session['flash_message'] = f"❌ Error: {str(e)}"
+    
+    return redirect("/aset-lancar")
@@ -0,0 +1,564 @@
+"""Input dan daftar aset tetap"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, format_currency
+from pinkilang.penyusutan import get_aset_tetap_data, simpan_penyusutan_aset, METODE_PENYUSUTAN
+
+# False setelah insert pertama gagal karena kolom metode_penyusutan belum ada
+# (SQL_METODE_PENYUSUTAN belum dijalankan): aset berikutnya disimpan tanpa kolom itu
+_kolom_metode_tersedia = True
+
+def _kolom_tidak_ada(e, kolom):
+    pesan = getattr(e, "message", None) or str(e)
+    return getattr(e, "code", None) in ("PGRST204", "42703") and kolom in pesan
+
+def insert_aset_tetap(aset_data):
+    """Insert aset_tetap; tanpa metode_penyusutan (= garis lurus) kalau kolomnya belum ada"""
+    global _kolom_metode_tersedia
+    if _kolom_metode_tersedia:
+        try:
+            return supabase.table("aset_tetap").insert(aset_data).execute()
+        except Exception as e:
+            if not _kolom_tidak_ada(e, "metode_penyusutan"):
+                raise
+            _kolom_metode_tersedia = False
+            logger.warning(f"⚠️ Kolom aset_tetap.metode_penyusutan belum ada (jalankan SQL_METODE_PENYUSUTAN), disimpan garis lurus: {e}")
+
+    aset_data = {k: v for k, v in aset_data.items() if k != "metode_penyusutan"}
+    return supabase.table("aset_tetap").insert(aset_data).execute()
+
+        
+# ============================================================
+# 🔹 ROUTE: Aset Tetap - VERSI SESUAI STRUCTURE TABEL
+# ============================================================
+
+def aset_tetap():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    message = ""
+    
+    # Handle form submission
+    if request.method == "POST" and 'simpan_penyusutan' not in request.form:
+        message = process_aset_tetap_form(user_email)
+    
+    try:
+        # Ambil data aset tetap dengan penyusutan terhitung (tanpa menulis ke DB)
+        aset_tetap_data = get_aset_tetap_data()
+
+        # Simpan penyusutan hanya bila diminta eksplisit
+        if request.method == "POST" and 'simpan_penyusutan' in request.form:
+            jumlah_disimpan = simpan_penyusutan_aset(aset_tetap_data)
+            message = f'<div class="message success">✅ Penyusutan disimpan untuk {jumlah_disimpan} aset</div>'
+        logger.info(f"✅ Data aset tetap berhasil diambil: {len(aset_tetap_data)} item")
+        
+        # Hitung totals
+        total_nilai_aset = sum(float(item.get('nilai_perolehan', 0) or 0) for item in aset_tetap_data)
+        total_penyusutan = sum(float(item.get('akumulasi_penyusutan', 0) or 0) for item in aset_tetap_data)
+        total_nilai_buku = total_nilai_aset - total_penyusutan
+        
+    except Exception as e:
+        logger.error(f"❌ Error di route aset tetap: {str(e)}")
+        aset_tetap_data = []
+        total_nilai_aset = 0
+        total_penyusutan = 0
+        total_nilai_buku = 0
+        message += f'<div class="message error">❌ Error memuat data: {str(e)}</div>'
+    
+    html = generate_aset_tetap_html(user_email, message, aset_tetap_data, total_nilai_aset, total_penyusutan, total_nilai_buku)
+    return html
+
+def process_aset_tetap_form(user_email):
+    """Process form input aset tetap dengan jurnal otomatis - SESUAI STRUCTURE"""
+    try:
+        # Collect form data
+        tanggal_perolehan = request.form.get("tanggal_perolehan")
+        jenis_aset = request.form.get("jenis_aset")
+        nama_aset = request.form.get("nama_aset")
+        nilai_perolehan_str = request.form.get("nilai_perolehan", "0")
+        masa_manfaat_str = request.form.get("masa_manfaat", "0")
+        nilai_residu_str = request.form.get("nilai_residu", "0") or "0"
+        metode_penyusutan = request.form.get("metode_penyusutan", "GARIS_LURUS")
+        metode_pembayaran = request.form.get("metode_pembayaran")
+        keterangan = request.form.get("keterangan", "")
+        
+        # Validasi input
+        if not all([tanggal_perolehan, jenis_aset, nama_aset]):
+            return '<div class="message error">❌ Tanggal, Jenis, dan Nama Aset wajib diisi!</div>'
+        
+        try:
+            nilai_perolehan = float(nilai_perolehan_str)
+            masa_manfaat = int(masa_manfaat_str)
+            nilai_residu = float(nilai_residu_str)
+        except ValueError:
+            return '<div class="message error">❌ Nilai perolehan, masa manfaat dan nilai residu harus angka!</div>'
+        
+        if nilai_perolehan <= 0:
+            return '<div class="message error">❌ Nilai perolehan harus lebih dari 0!</div>'
+        
+        if masa_manfaat <= 0 and jenis_aset != "TANAH":
+            return '<div class="message error">❌ Masa manfaat harus lebih dari 0!</div>'
+        
+        if nilai_residu < 0 or (nilai_residu >= nilai_perolehan and jenis_aset != "TANAH"):
+            return '<div class="message error">❌ Nilai residu harus 0 atau lebih dan di bawah nilai perolehan!</div>'
+        
+        if metode_penyusutan not in METODE_PENYUSUTAN:
+            metode_penyusutan = "GARIS_LURUS"
+        
+        logger.info(f"🔧 Processing aset tetap: {nama_aset}, nilai: {nilai_perolehan}, jenis: {jenis_aset}")
+        
+        # Hitung penyusutan tahunan (kecuali tanah) - SESUAI STRUCTURE TABEL
+        if jenis_aset == "TANAH":
+            penyusutan_tahunan = 0
+            nilai_residu = nilai_perolehan  # Tanah tidak disusutkan
+        else:
+            # Rata-rata per tahun; metode non garis lurus dihitung per tahun oleh engine jadwal
+            penyusutan_tahunan = (nilai_perolehan - nilai_residu) / masa_manfaat
+        
+        # Simpan data aset tetap - SESUAI STRUCTURE TABEL
+        aset_data = {
+            "user_email": user_email,
+            "tanggal_perolehan": tanggal_perolehan,
+            "jenis_aset": jenis_aset,
+            "nama_aset": nama_aset,
+            "nilai_perolehan": nilai_perolehan,
+            "masa_manfaat": masa_manfaat,
+            "nilai_residu": nilai_residu,
+            "metode_penyusutan": metode_penyusutan,
+            "penyusutan_tahunan": penyusutan_tahunan,  # SESUAI STRUCTURE
+            "akumulasi_penyusutan": 0,  # Awalnya 0
+            "nilai_buku": nilai_perolehan,
+            "keterangan": keterangan
+            # created_at otomatis dari database
+        }
+        
+        if supabase:
+            # Insert ke tabel aset_tetap
+            logger.info(f"🔧 Inserting aset data: {aset_data}")
+            insert_result = insert_aset_tetap(aset_data)
+            
+            if insert_result and insert_result.data:
+                aset_id = insert_result.data[0]['id']
+                logger.info(f"✅ Aset tetap berhasil disimpan dengan ID: {aset_id}")
+                
+                # ✅ BUAT JURNAL OTOMATIS untuk pembelian aset tetap
+                akun_aset = get_akun_aset_tetap(jenis_aset)
+                kode_aset = get_kode_akun_aset(jenis_aset)
+                
+                jurnal_entries = [
+                    # Debit: Aset Tetap
+                    {
+                        "tanggal": tanggal_perolehan,
+                        "nama_akun": akun_aset,
+                        "ref": kode_aset,
+                        "debit": nilai_perolehan,
+                        "kredit": 0,
+                        "deskripsi": f"Pembelian {jenis_aset.lower()}: {nama_aset}",
+                        "transaksi_type": "PEMBELIAN_ASET",
+                        "transaksi_id": aset_id,
+                        "user_email": user_email
+                    },
+                    # Kredit: Kas/Bank
+                    {
+                        "tanggal": tanggal_perolehan,
+                        "nama_akun": "Kas" if metode_pembayaran == "CASH" else "Bank",
+                        "ref": "1110" if metode_pembayaran == "CASH" else "1120",
+                        "debit": 0,
+                        "kredit": nilai_perolehan,
+                        "deskripsi": f"Pembayaran {jenis_aset.lower()}: {nama_aset}",
+                        "transaksi_type": "PEMBELIAN_ASET",
+                        "transaksi_id": aset_id,
+                        "user_email": user_email
+                    }
+                ]
+                
+                # Simpan jurnal
+                success_count = 0
+                for entry in jurnal_entries:
+                    try:
+                        result = supabase.table("jurnal_umum").insert(entry).execute()
+                        if result.data:
+                            success_count += 1
+                            logger.info(f"✅ Jurnal aset tetap: {entry['nama_akun']} - {entry['debit']}/{entry['kredit']}")
+                    except Exception as e:
+                        logger.error(f"❌ Error insert jurnal aset tetap: {str(e)}")
+                
+                if success_count == len(jurnal_entries):
+                    logger.info(f"✅ Aset tetap berhasil dicatat: {nama_aset} senilai {nilai_perolehan}")
+                    return f'<div class="message success">✅ Aset tetap berhasil dicatat! Jurnal otomatis dibuat.</div>'
+                else:
+                    logger.warning(f"⚠️ Sebagian jurnal aset tetap gagal: {success_count}/{len(jurnal_entries)}")
+                    return f'<div class="message success">✅ Aset tetap berhasil dicatat! ({success_count}/{len(jurnal_entries)} jurnal berhasil)</div>'
+            else:
+                logger.error("❌ Gagal menyimpan data aset tetap - insert_result kosong")
+                return '<div class="message error">❌ Gagal menyimpan data aset tetap!</div>'
+        else:
+            return '<div class="message error">❌ Database connection error!</div>'
+                
+    except Exception as e:
+        logger.error(f"❌ Error proses aset tetap: {str(e)}")
+        return f'<div class="message error">❌ Error mencatat aset tetap: {str(e)}</div>'
+
+def get_jenis_aset_color(jenis_aset):
+    """Warna untuk badge jenis aset"""
+    colors = {
+        "TANAH": "#8B4513",
+        "BANGUNAN": "#FF6B35", 
+        "KENDARAAN": "#2E86AB",
+        "PERALATAN": "#A23B72",
+        "INVENTARIS": "#F18F01"
+    }
+    return colors.get(jenis_aset, "#666666")
+
+def get_akun_aset_tetap(jenis_aset):
+    """Mendapatkan nama akun aset tetap berdasarkan jenis"""
+    akun_map = {
+        "TANAH": "Tanah",
+        "BANGUNAN": "Bangunan",
+        "KENDARAAN": "Kendaraan",
+        "PERALATAN": "Peralatan",
+        "INVENTARIS": "Inventaris"
+    }
+    return akun_map.get(jenis_aset, "Aset Tetap")
+
+def get_kode_akun_aset(jenis_aset):
+    """Mendapatkan kode akun aset tetap berdasarkan jenis"""
+    kode_map = {
+        "TANAH": "1510",
+        "BANGUNAN": "1520",
+        "KENDARAAN": "1530", 
+        "PERALATAN": "1540",
+        "INVENTARIS": "1550"
+    }
+    return kode_map.get(jenis_aset, "1500")
+
+def generate_aset_tetap_html(user_email, message, aset_tetap_data, total_nilai_aset, total_penyusutan, total_nilai_buku):
+    """Generate HTML untuk halaman aset tetap - FIXED"""
+    
+    # Debug info - TAMBAHKAN KEMBALI
+    debug_info = ""
+    if not aset_tetap_data:
+        debug_info = f"""
+        <div class="section" style="background: #fff0f0; border-left: 5px solid #ff6666;">
+            <h2 class="section-title">🔧 Debug Information</h2>
+            <div style="font-family: monospace; font-size: 12px; background: white; padding: 15px; border-radius: 8px;">
+                <strong>Status Data Aset Tetap:</strong><br>
+                • Total data ditemukan: {len(aset_tetap_data)}<br>
+                • User: {user_email}<br>
+                • Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
+                <br>
+                <strong>Kemungkinan Masalah:</strong><br>
+                1. Tabel aset_tetap belum ada<br>
+                2. Belum ada data yang diinput<br>
+                3. Error koneksi database<br>
+                4. Permissions issue
+            </div>
+            
+            <div style="text-align: center; margin-top: 20px;">
+                <a href="/create-aset-tetap-table" class="btn" style="background: #ff6666; color: white; padding: 12px 25px; text-decoration: none; border-radius: 8px;">
+                    🔧 BUAT TABEL ASET TETAP
+                </a>
+                <p style="color: #666; font-size: 12px; margin-top: 10px;">
+                    Klik tombol di atas jika tabel aset_tetap belum ada
+                </p>
+            </div>
+        </div>
+        """
+    
+    # Generate form input
+    input_form = f"""
+    <div class="section">
+        <h2 class="section-title">➕ Input Aset Tetap Baru</h2>
+        
+        <div class="info-box">
+            <strong>💡 Informasi Penyusutan:</strong> 
+            Sistem akan menghitung penyusutan otomatis setiap bulan.
+            Garis lurus: (Nilai Perolehan − Nilai Residu) ÷ Masa Manfaat.
+            Tersedia juga metode Saldo Menurun Ganda dan Jumlah Angka Tahun.
+            <br><br>
+            <strong>Contoh:</strong> Aset Rp 25.000.000 dengan masa manfaat 5 tahun
+            <br>• Penyusutan per tahun: Rp 5.000.000
+            <br>• Penyusutan per bulan: Rp 416.667
+        </div>
+        
+        <form method="POST">
+            <div class="form-grid">
+                <div class="form-group">
+                    <label for="tanggal_perolehan">📅 Tanggal Perolehan:</label>
+                    <input type="date" id="tanggal_perolehan" name="tanggal_perolehan" 
+                           value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                </div>
+                <div class="form-group">
+                    <label for="jenis_aset">🏷️ Jenis Aset:</label>
+                    <select id="jenis_aset" name="jenis_aset" required>
+                        <option value="">Pilih Jenis Aset</option>
+                        <option value="TANAH">Tanah (Tidak Disusutkan)</option>
+                        <option value="BANGUNAN">Bangunan</option>
+                        <option value="KENDARAAN">Kendaraan</option>
+                        <option value="PERALATAN">Peralatan</option>
+                        <option value="INVENTARIS">Inventaris</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label for="nama_aset">📝 Nama Aset:</label>
+                    <input type="text" id="nama_aset" name="nama_aset" 
+                           placeholder="Contoh: Toyota Avanza, Laptop Dell, dll" required>
+                </div>
+                <div class="form-group">
+                    <label for="nilai_perolehan">💰 Nilai Perolehan (Rp):</label>
+                    <input type="number" id="nilai_perolehan" name="nilai_perolehan" 
+                           placeholder="0" step="1" min="1" required>
+                </div>
+                <div class="form-group">
+                    <label for="masa_manfaat">⏰ Masa Manfaat (tahun):</label>
+                    <input type="number" id="masa_manfaat" name="masa_manfaat" 
+                           placeholder="0" step="1" min="1" required>
+                    <small style="color: #666;">Contoh: Bangunan 20 tahun, Kendaraan 5 tahun, Peralatan 3 tahun</small>
+                </div>
+                <div class="form-group">
+                    <label for="nilai_residu">♻️ Nilai Residu (Rp):</label>
+                    <input type="number" id="nilai_residu" name="nilai_residu" 
+                           placeholder="0" step="1" min="0" value="0">
+                </div>
+                <div class="form-group">
+                    <label for="metode_penyusutan">📉 Metode Penyusutan:</label>
+                    <select id="metode_penyusutan" name="metode_penyusutan">
+                        <option value="GARIS_LURUS">Garis Lurus</option>
+                        <option value="SALDO_MENURUN">Saldo Menurun Ganda</option>
+                        <option value="JUMLAH_ANGKA_TAHUN">Jumlah Angka Tahun</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label for="metode_pembayaran">💳 Metode Pembayaran:</label>
+                    <select id="metode_pembayaran" name="metode_pembayaran" required>
+                        <option value="CASH">Cash</option>
+                        <option value="BANK">Transfer Bank</option>
+                    </select>
+                </div>
+                <div class="form-group" style="grid-column: span 2;">
+                    <label for="keterangan">📋 Keterangan (Opsional):</label>
+                    <textarea id="keterangan" name="keterangan" 
+                              placeholder="Tambahkan keterangan tentang aset..." rows="3"></textarea>
+                </div>
+            </div>
+            
+            <div class="akun-info">
+                <strong>📋 Jurnal Otomatis akan dibuat:</strong>
+                <br>• <strong>Debit:</strong> Akun Aset Tetap (sesuai jenis) - Penambahan aset
+                <br>• <strong>Kredit:</strong> Kas/Bank - Pengurangan kas
+                <br><br>
+                <strong>Penyusutan otomatis:</strong> Sistem akan menghitung dan mencatat penyusutan setiap bulan
+            </div>
+            
+            <button type="submit" class="btn">💾 Simpan Aset Tetap</button>
+        </form>
+    </div>
+    """
+    
+    # Generate table rows
+    table_rows = ""
+    if aset_tetap_data:
+        for aset in aset_tetap_data:
+            try:
+                # Format tanggal
+                tanggal_perolehan_str = aset.get('tanggal_perolehan', '')
+                if isinstance(tanggal_perolehan_str, str):
+                    try:
+                        tanggal_perolehan = datetime.strptime(tanggal_perolehan_str, '%Y-%m-%d')
+                        tanggal_formatted = tanggal_perolehan.strftime('%d/%m/%Y')
+                    except:
+                        tanggal_formatted = str(tanggal_perolehan_str)
+                else:
+                    tanggal_formatted = str(tanggal_perolehan_str)
+                
+                # Hitung umur aset
+                try:
+                    if isinstance(tanggal_perolehan_str, str):
+                        tanggal_perolehan = datetime.strptime(tanggal_perolehan_str, '%Y-%m-%d')
+                    else:
+                        tanggal_perolehan = tanggal_perolehan_str
+                    
+                    umur_bulan = (datetime.now() - tanggal_perolehan).days // 30
+                    if umur_bulan < 0:
+                        umur_bulan = 0
+                except:
+                    umur_bulan = 0
+                
+                # Ambil nilai-nilai dengan error handling
+                penyusutan_tahunan = float(aset.get('penyusutan_tahunan', 0) or 0)
+                penyusutan_bulanan = penyusutan_tahunan / 12  # Hitung dari tahunan
+                akumulasi_penyusutan = float(aset.get('akumulasi_penyusutan', 0) or 0)
+                nilai_buku = float(aset.get('nilai_buku', 0) or 0)
+                nilai_perolehan = float(aset.get('nilai_perolehan', 0) or 0)
+                
+                table_rows += f"""
+                <tr>
+                    <td>{tanggal_formatted}</td>
+                    <td>
+                        <span style="padding: 4px 8px; border-radius: 12px; font-size: 11px; font-weight: bold; color: white; background: {get_jenis_aset_color(aset.get('jenis_aset', ''))}">
+                            {aset.get('jenis_aset', '-')}
+                        </span>
+                    </td>
+                    <td><strong>{aset.get('nama_aset', '-')}</strong></td>
+                    <td class="number">{format_currency(nilai_perolehan)}</td>
+                    <td class="number">{format_currency(penyusutan_bulanan)}/bln</td>
+                    <td class="number">{format_currency(akumulasi_penyusutan)}</td>
+                    <td class="number"><strong>{format_currency(nilai_buku)}</strong></td>
+                    <td>{umur_bulan} bulan</td>
+                    <td>{aset.get('keterangan', '-')}</td>
+                </tr>
+                """
+            except Exception as e:
+                logger.error(f"❌ Error processing aset row {aset.get('id')}: {str(e)}")
+                table_rows += f"""
+                <tr style="background: #fff0f0;">
+                    <td colspan="9" style="color: #ff6666;">
+                        ❌ Error memproses data: {str(e)}
+                    </td>
+                </tr>
+                """
+    else:
+        table_rows = """
+        <tr>
+            <td colspan="9" style="text-align: center; padding: 40px; color: #999;">
+                🏢 Belum ada data aset tetap
+                <br><br>
+                Gunakan form di atas untuk menambahkan aset tetap pertama Anda.
+            </td>
+        </tr>
+        """
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Aset Tetap - PINKILANG</title>
+        <meta charset="utf-8">
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            body {{ font-family: 'Arial', sans-serif; background: linear-gradient(135deg, #ffe6f2, #fff0f7); padding: 20px; min-height: 100vh; }}
+            .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.1); overflow: hidden; }}
+            .header {{ background: linear-gradient(135deg, #00cc66, #00b359); color: white; padding: 25px; text-align: center; }}
+            .back-btn {{ display: inline-block; padding: 10px 20px; background: rgba(255,255,255,0.2); color: white; text-decoration: none; border-radius: 8px; margin-bottom: 15px; border: 1px solid rgba(255,255,255,0.3); }}
+            .back-btn:hover {{ background: rgba(255,255,255,0.3); }}
+            h1 {{ font-size: 28px; margin-bottom: 10px; }}
+            .content {{ padding: 25px; }}
+            .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 25px 0; }}
+            .stat-card {{ background: white; padding: 25px; border-radius: 12px; text-align: center; box-shadow: 0 4px 15px rgba(0,204,102,0.1); border: 2px solid #e6f7f0; transition: transform 0.3s ease; }}
+            .stat-card:hover {{ transform: translateY(-5px); }}
+            .stat-icon {{ font-size: 36px; margin-bottom: 15px; }}
+            .stat-number {{ font-size: 24px; font-weight: bold; color: #00cc66; margin: 10px 0; }}
+            .stat-label {{ color: #00994d; font-size: 14px; font-weight: bold; }}
+            .section {{ margin: 30px 0; padding: 25px; background: #f0faf5; border-radius: 12px; border-left: 5px solid #00cc66; }}
+            .section-title {{ color: #00cc66; font-size: 22px; margin-bottom: 20px; padding-bottom: 10px; border-bottom: 2px solid #e6f7f0; }}
+            .form-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 20px; }}
+            .form-group {{ margin-bottom: 15px; }}
+            label {{ display: block; margin-bottom: 5px; color: #00994d; font-weight: bold; }}
+            input, select, textarea {{ width: 100%; padding: 12px; border: 2px solid #b3e6cc; border-radius: 8px; font-size: 16px; transition: border-color 0.3s ease; background: white; }}
+            input:focus, select:focus, textarea:focus {{ border-color: #00cc66; outline: none; box-shadow: 0 0 0 3px rgba(0,204,102,0.1); }}
+            .btn {{ padding: 12px 30px; background: linear-gradient(135deg, #00cc66, #00b359); color: white; border: none; border-radius: 8px; cursor: pointer; font-size: 16px; transition: all 0.3s ease; font-weight: bold; }}
+            .btn:hover {{ transform: translateY(-2px); box-shadow: 0 6px 20px rgba(0,204,102,0.3); }}
+            .table-container {{ overflow-x: auto; margin-top: 15px; }}
+            table {{ width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 4px 15px rgba(0,204,102,0.1); }}
+            th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e6f7f0; }}
+            th {{ background: #00cc66; color: white; font-weight: bold; }}
+            tr:hover {{ background: #f0faf5; }}
+            .number {{ text-align: right; font-family: 'Courier New', monospace; }}
+            .total-row {{ background: #e6f7f0; font-weight: bold; }}
+            .info-box {{ background: #e6f7ff; border: 1px solid #91d5ff; border-radius: 8px; padding: 15px; margin: 15px 0; color: #0066cc; }}
+            .akun-info {{ background: #e6f7f0; border: 1px solid #b3e6cc; border-radius: 8px; padding: 10px; margin: 10px 0; font-size: 12px; color: #00994d; }}
+            .message {{ padding: 15px; margin: 15px 0; border-radius: 8px; font-size: 14px; }}
+            .success {{ background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }}
+            .error {{ background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }}
+            small {{ color: #666; font-size: 12px; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/aset" class="back-btn">← Kembali ke Aset</a>
+                <h1>🏢 Aset Tetap</h1>
+                <p>Manajemen Tanah, Bangunan, Kendaraan, dan Peralatan</p>
+            </div>
+            
+            <div class="content">
+                {message}
+                {debug_info}  <!-- INI YANG DIPERBAIKI -->
+                
+                <div class="stats-grid">
+                    <div class="stat-card">
+                        <div class="stat-icon">💰</div>
+                        <div class="stat-number">{format_currency(total_nilai_aset)}</div>
+                        <div class="stat-label">Nilai Perolehan</div>
+                    </div>
+                    
+                    <div class="stat-card">
+                        <div class="stat-icon">📉</div>
+                        <div class="stat-number">{format_currency(total_penyusutan)}</div>
+                        <div class="stat-label">Akumulasi Penyusutan</div>
+                    </div>
+                    
+                    <div class="stat-card">
+                        <div class="stat-icon">📊</div>
+                        <div class="stat-number">{format_currency(total_nilai_buku)}</div>
+                        <div class="stat-label">Nilai Buku</div>
+                    </div>
+                    
+                    <div class="stat-card">
+                        <div class="stat-icon">📋</div>
+                        <div class="stat-number">{len(aset_tetap_data)}</div>
+                        <div class="stat-label">Jumlah Aset</div>
+                    </div>
+                </div>
+                
+                {input_form}
+                
+                <div class="section">
+                    <h2 class="section-title">📋 Daftar Aset Tetap ({len(aset_tetap_data)} item)</h2>
+                    
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>Tanggal</th>
+                                    <th>Jenis</th>
+                                    <th>Nama Aset</th>
+                                    <th>Nilai Perolehan</th>
+                                    <th>Penyusutan/Bulan</th>
+                                    <th>Akumulasi Penyusutan</th>
+                                    <th>Nilai Buku</th>
+                                    <th>Umur</th>
+                                    <th>Keterangan</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {table_rows}
+                                {f'<tr class="total-row"><td colspan="3"><strong>TOTAL</strong></td><td class="number"><strong>{format_currency(total_nilai_aset)}</strong></td><td class="number">-</td><td class="number"><strong>{format_currency(total_penyusutan)}</strong></td><td class="number"><strong>{format_currency(total_nilai_buku)}</strong></td><td colspan="2">-</td></tr>' if aset_tetap_data else ''}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                
+                <div style="text-align: center; margin-top: 30px;">
+                    <a href="/jurnal-umum" class="btn" style="background: #00cc66; color: white; text-decoration: none; padding: 12px 25px; border-radius: 8px; margin: 0 10px;">
+                        📝 Lihat Jurnal
+                    </a>
+                    <a href="/neraca-lajur" class="btn" style="background: #ff66a3; color: white; text-decoration: none; padding: 12px 25px; border-radius: 8px; margin: 0 10px;">
+                        🏦 Lihat Neraca
+                    </a>
+                    <form method="POST" style="display: inline;">
+                        <button type="submit" name="simpan_penyusutan" class="btn" style="background: #ffaa00; color: white; border: none; padding: 12px 25px; border-radius: 8px; margin: 0 10px; cursor: pointer;">
+                            💾 Simpan Penyusutan
+                        </button>
+                    </form>
+                    <button onclick="window.print()" class="btn" style="background: #66b3ff; color: white; border: none; padding: 12px 25px; border-radius: 8px; margin: 0 10px; cursor: pointer;">
+                        🖨️ Cetak Laporan
+                    </button>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    return html
@@ -0,0 +1,128 @@
+"""
+Akses data async: query PostgREST lewat satu httpx.AsyncClient per proses
+(HTTP/2, keep-alive, pool koneksi) yang berjalan di event loop background.
+
+Aktif dengan SUPABASE_ASYNC=1. Tanpa itu ambil_paralel() memakai client
+Supabase sync + thread pool fan-out (core.jalankan_paralel) dengan hasil sama,
+jadi view cukup ditulis sekali.
+"""
+import asyncio
+import atexit
+import os
+import threading
+from pinkilang.core import (
+    logger, supabase, SUPABASE_URL, SUPABASE_KEY, DB_BACKEND, FANOUT_TIMEOUT,
+    jalankan_paralel, get_catatan_query, ClientTercatat,
+)
+
+SUPABASE_ASYNC = os.getenv("SUPABASE_ASYNC", "0") == "1"
+ASYNC_DB_HTTP2 = os.getenv("ASYNC_DB_HTTP2", "1") != "0"
+ASYNC_DB_MAX_CONNECTIONS = int(os.getenv("ASYNC_DB_MAX_CONNECTIONS", "20"))
+ASYNC_DB_MAX_KEEPALIVE = int(os.getenv("ASYNC_DB_MAX_KEEPALIVE", "10"))
+ASYNC_DB_KEEPALIVE_EXPIRY = float(os.getenv("ASYNC_DB_KEEPALIVE_EXPIRY", "30"))   # detik
+
+class AsyncDataAccess:
+    """Event loop di thread background + AsyncPostgrestClient di atas pool httpx bersama"""
+
+    def __init__(self, url, key):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-db", daemon=True)
+        self._thread.start()
+        self.http = None
+        self.db = None
+        self.jalankan(self._buka(url, key))
+
+    async def _buka(self, url, key):
+        import httpx
+        from postgrest import AsyncPostgrestClient
+
+        self.http = httpx.AsyncClient(
+            http2=ASYNC_DB_HTTP2,
+            timeout=FANOUT_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=ASYNC_DB_MAX_CONNECTIONS,
+                max_keepalive_connections=ASYNC_DB_MAX_KEEPALIVE,
+                keepalive_expiry=ASYNC_DB_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self.db = AsyncPostgrestClient(
+            f"{url}/rest/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            http_client=self.http,
+        )
+
+    def jalankan(self, coro):
+        """Jalankan coroutine di loop background dan tunggu hasilnya (dari kode sync)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _satu(self, db, langkah, timeout):
+        hasil = None
+        for buat in langkah:
+            hasil = await asyncio.wait_for(buat(db).execute(), timeout)
+        return hasil.data
+
+    async def query_paralel(self, tugas, timeout, catatan=None):
+        # catatan query request pemanggil diteruskan eksplisit: loop ini tidak punya context request
+        db = ClientTercatat(self.db, catatan)
+        nama = list(tugas)
+        hasil = await asyncio.gather(*(self._satu(db, _langkah(tugas[n]), timeout) for n in nama))
+        return dict(zip(nama, hasil))
+
+    def tutup(self):
+        try:
+            self.jalankan(self.http.aclose())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+_async_db = None
+_async_db_pid = None
+_async_db_lock = threading.Lock()
+
+def get_async_db():
+    """AsyncDataAccess milik proses ini, atau None kalau mode async tidak aktif"""
+    global _async_db, _async_db_pid
+    if not SUPABASE_ASYNC or DB_BACKEND == "local" or not SUPABASE_URL or not SUPABASE_KEY:
+        return None
+    with _async_db_lock:
+        if _async_db is None or _async_db_pid != os.getpid():
+            _async_db = AsyncDataAccess(SUPABASE_URL, SUPABASE_KEY)
+            _async_db_pid = os.getpid()
+            atexit.register(_async_db.tutup)
+            logger.info(f"✅ Async data access aktif (HTTP/2: {ASYNC_DB_HTTP2}, pool {ASYNC_DB_MAX_CONNECTIONS})")
+        return _async_db
+
+def _langkah(tugas):
+    return tugas if isinstance(tugas, (list, tuple)) else [tugas]
+
+def ambil_paralel(tugas, timeout=FANOUT_TIMEOUT):
+    """
+    Jalankan beberapa query PostgREST bersamaan, kembalikan dict nama -> data.
+
+    Nilai `tugas` berupa factory `lambda db: db.table(...).select(...)` (tanpa
+    .execute()), atau list factory yang dijalankan berurutan - hasil langkah
+    terakhir yang dipakai (mis. RPC generate lalu select). `timeout` berlaku per query.
+    """
+    adb = get_async_db()
+    if adb:
+        return adb.jalankan(adb.query_paralel(tugas, timeout, get_catatan_query()))
+
+    def sync(langkah):
+        def run():
+            hasil = None
+            for buat in langkah:
+                hasil = buat(supabase).execute()
+            return hasil.data
+        return run
+
+    return jalankan_paralel({nama: sync(_langkah(t)) for nama, t in tugas.items()}, timeout)
+
+async def ambil_paralel_async(tugas, timeout=FANOUT_TIMEOUT):
+    """Versi awaitable ambil_paralel untuk view/worker async (loop mana pun)"""
+    adb = get_async_db()
+    if adb is None:
+        return await asyncio.to_thread(ambil_paralel, tugas, timeout)
+    coro = adb.query_paralel(tugas, timeout, get_catatan_query())
+    if asyncio.get_running_loop() is adb.loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, adb.loop))
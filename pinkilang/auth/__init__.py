@@ -0,0 +1,12 @@
+"""Blueprint auth: halaman depan, registrasi, login dan dashboard"""
+from flask import Blueprint
+from pinkilang.lazy import lazy_route
+
+bp = Blueprint("auth", __name__)
+
+lazy_route(bp, "/", "views.home")
+lazy_route(bp, "/register", "views.register", methods=["GET", "POST"])
+lazy_route(bp, "/verify", "views.verify_otp", methods=["GET", "POST"])
+lazy_route(bp, "/login", "views.login", methods=["GET", "POST"])
+lazy_route(bp, "/logout", "views.logout")
+lazy_route(bp, "/dashboard", "dashboard.dashboard")
@@ -0,0 +1,523 @@
+"""Dashboard ringkasan penjualan, pembelian dan persediaan"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.ringkasan import get_ringkasan_dashboard
+
+# ============================================================
+# 🔹 FUNGSI: Ambil Data untuk Dashboard 
+# ============================================================
+def get_dashboard_data():
+    """Fungsi untuk mengambil data penjualan, pembelian, dan persediaan untuk dashboard"""
+    try:
+        if supabase:
+            return get_ringkasan_dashboard()
+    except Exception as e:
+        logger.error(f"❌ Error mengambil data dashboard: {str(e)}")
+    
+    return {
+        'total_penjualan': 0,
+        'total_pembelian': 0,
+        'persediaan_saat_ini': 0,
+        'transaksi_penjualan_terbaru': [],
+        'transaksi_pembelian_terbaru': []
+    }
+
+# ============================================================
+# 🔹 ROUTE: Dashboard
+# ============================================================
+def dashboard():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    # Profil user sudah disimpan di session saat login; query hanya untuk session lama
+    user_id = session.get('user_id')
+    if user_id is None:
+        try:
+            if supabase:
+                result = supabase.table("user").select("id").eq("email", user_email).execute()
+                user_id = result.data[0]['id'] if result.data else 'Unknown'
+                session['user_id'] = user_id
+            else:
+                user_id = 'Database Error'
+        except Exception as e:
+            user_id = f'Error: {str(e)}'
+
+    # Ambil data untuk dashboard
+    dashboard_data = get_dashboard_data()
+    
+    total_penjualan = dashboard_data['total_penjualan']
+    total_pembelian = dashboard_data['total_pembelian']
+    persediaan_saat_ini = dashboard_data['persediaan_saat_ini']
+    transaksi_penjualan = dashboard_data['transaksi_penjualan_terbaru']
+    transaksi_pembelian = dashboard_data['transaksi_pembelian_terbaru']
+
+    # Format currency
+    def format_currency(amount):
+        return f"Rp {amount:,.0f}".replace(",", ".")
+
+    # Tampilan dashboard
+    dashboard_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Dashboard PINKILANG 💖</title>
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial Rounded MT Bold', 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffd1dc, #ffe0e9, #fff0f5);
+                min-height: 100vh;
+            }}
+            
+            .dashboard-container {{
+                display: flex;
+                min-height: 100vh;
+            }}
+            
+            /* Sidebar Styles */
+            .sidebar {{
+                width: 250px;
+                background: linear-gradient(180deg, #ff66a3, #ff4d94);
+                padding: 20px;
+                box-shadow: 2px 0 10px rgba(0,0,0,0.1);
+            }}
+            
+            .logo {{
+                text-align: center;
+                margin-bottom: 30px;
+                padding: 15px;
+                background: rgba(255,255,255,0.2);
+                border-radius: 15px;
+                color: white;
+                font-size: 24px;
+                font-weight: bold;
+            }}
+            
+            .menu-section {{
+                margin-bottom: 25px;
+            }}
+            
+            .menu-title {{
+                color: white;
+                font-size: 16px;
+                margin-bottom: 10px;
+                padding-left: 10px;
+                border-left: 3px solid white;
+            }}
+            
+            .menu-item {{
+                display: block;
+                width: 100%;
+                padding: 12px 15px;
+                margin: 5px 0;
+                background: rgba(255,255,255,0.1);
+                border: none;
+                border-radius: 10px;
+                color: white;
+                text-align: left;
+                cursor: pointer;
+                transition: all 0.3s ease;
+                font-size: 14px;
+                text-decoration: none;
+            }}
+            
+            .menu-item:hover {{
+                background: rgba(255,255,255,0.3);
+                transform: translateX(5px);
+            }}
+            
+            .menu-item.active {{
+                background: rgba(255,255,255,0.3);
+                border-left: 3px solid white;
+            }}
+            
+            /* Main Content Styles */
+            .main-content {{
+                flex: 1;
+                padding: 30px;
+            }}
+            
+            .header {{
+                display: flex;
+                justify-content: space-between;
+                align-items: center;
+                margin-bottom: 30px;
+                padding: 20px;
+                background: white;
+                border-radius: 15px;
+                box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            }}
+            
+            .welcome-message h1 {{
+                color: #ff66a3;
+                font-size: 28px;
+                margin-bottom: 5px;
+            }}
+            
+            .user-info {{
+                color: #666;
+                font-size: 14px;
+            }}
+            
+            .stats-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+                gap: 20px;
+                margin-bottom: 30px;
+            }}
+            
+            .stat-card {{
+                background: white;
+                padding: 25px;
+                border-radius: 15px;
+                box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+                text-align: center;
+                transition: transform 0.3s ease;
+            }}
+            
+            .stat-card:hover {{
+                transform: translateY(-5px);
+            }}
+            
+            .stat-card.penjualan {{
+                border-top: 5px solid #ff66a3;
+            }}
+            
+            .stat-card.pembelian {{
+                border-top: 5px solid #66b3ff;
+            }}
+            
+            .stat-card.persediaan {{
+                border-top: 5px solid #66ff99;
+            }}
+            
+            .stat-number {{
+                font-size: 36px;
+                font-weight: bold;
+                color: #333;
+                margin: 10px 0;
+            }}
+            
+            .stat-label {{
+                color: #666;
+                font-size: 14px;
+            }}
+            
+            .content-grid {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 20px;
+            }}
+            
+            .content-card {{
+                background: white;
+                padding: 25px;
+                border-radius: 15px;
+                box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            }}
+            
+            .card-title {{
+                color: #ff66a3;
+                font-size: 20px;
+                margin-bottom: 15px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #ffe0e9;
+            }}
+            
+            .transaction-list {{
+                max-height: 300px;
+                overflow-y: auto;
+            }}
+            
+            .transaction-item {{
+                display: flex;
+                justify-content: space-between;
+                align-items: center;
+                padding: 12px;
+                margin: 8px 0;
+                background: #f8f9fa;
+                border-radius: 10px;
+                border-left: 4px solid #ff66a3;
+            }}
+            
+            .transaction-item.pembelian {{
+                border-left-color: #66b3ff;
+            }}
+            
+            .transaction-info h4 {{
+                color: #333;
+                margin-bottom: 5px;
+                font-size: 14px;
+            }}
+            
+            .transaction-date {{
+                color: #999;
+                font-size: 12px;
+            }}
+            
+            .transaction-amount {{
+                font-weight: bold;
+                color: #ff66a3;
+                font-size: 14px;
+            }}
+            
+            .transaction-amount.negative {{
+                color: #66b3ff;
+            }}
+            
+            .quick-actions {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
+                gap: 15px;
+                margin-top: 20px;
+            }}
+            
+            .action-btn {{
+                padding: 15px;
+                background: linear-gradient(135deg, #ff66a3, #ff4d94);
+                color: white;
+                border: none;
+                border-radius: 10px;
+                cursor: pointer;
+                transition: all 0.3s ease;
+                font-size: 14px;
+                text-align: center;
+                text-decoration: none;
+            }}
+            
+            .action-btn:hover {{
+                transform: translateY(-2px);
+                box-shadow: 0 4px 12px rgba(255,102,163,0.3);
+            }}
+            
+            .logout-btn {{
+                background: linear-gradient(135deg, #ff6666, #ff4d4d);
+            }}
+            
+            .empty-state {{
+                text-align: center;
+                padding: 40px 20px;
+                color: #999;
+            }}
+            
+            .user-badge {{
+                background: #66b3ff;
+                color: white;
+                padding: 2px 6px;
+                border-radius: 8px;
+                font-size: 10px;
+                margin-left: 5px;
+            }}
+            
+            .current-user {{
+                background: #ff66a3;
+            }}
+            
+            /* Animations */
+            @keyframes float {{
+                0%, 100% {{ transform: translateY(0px); }}
+                50% {{ transform: translateY(-10px); }}
+            }}
+            
+            .floating {{
+                animation: float 3s ease-in-out infinite;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="dashboard-container">
+            <!-- Sidebar -->
+            <div class="sidebar">
+                <div class="logo">
+                    💖 PINKILANG
+                </div>
+                
+                <!-- Siklus Akuntansi -->
+                <div class="menu-section">
+                    <div class="menu-title">📊 SIKLUS AKUNTANSI</div>
+                    <a href="/jurnal-umum" class="menu-item">📝 Jurnal Umum</a>
+                    <a href="/buku-besar" class="menu-item">📚 Buku Besar</a>
+                    <a href="/neraca-saldo" class="menu-item">⚖ Neraca Saldo</a>
+                    <a href="/jurnal-penyesuaian" class="menu-item">🔄 Jurnal Penyesuaian</a>
+                    <a href="/laporan-posisi-keuangan" class="menu-item">📈 Laporan Posisi Keuangan</a>
+                    <a href="/jurnal-penutup" class="menu-item">🔒 Jurnal Penutup</a>
+                     <a href="/neraca-saldo-setelah-penutupan" class="menu-item">📋 Neraca Saldo Setelah Penutupan</a>
+                </div>
+                
+                <!-- Transaksi -->
+                <div class="menu-section">
+                    <div class="menu-title">💸 TRANSAKSI</div>
+                    <a href="/penjualan" class="menu-item">📦Penjualan</a>
+                    <a href="/pembelian" class="menu-item">🛒 Pembelian</a>
+                    <a href="/operasional" class="menu-item">💰 operasional</a>
+                    <a href="/buku-besar-pembantu-piutang" class="menu-item">📄 BB Pembantu Piutang</a>
+                    <a href="/buku-besar-pembantu-utang" class="menu-item">📋 BB Pembantu utang</a>
+                    <a href="/laporan-umur-piutang-utang" class="menu-item">⏳ Umur Piutang & Utang</a>
+                    <a href="/pelunasan-massal" class="menu-item">💳 Pelunasan Massal</a>
+                </div>
+                
+                <!-- Laporan -->
+                <div class="menu-section">
+                    <div class="menu-title">📋 LAPORAN</div>
+                    <a href="/laba-rugi" class="menu-item">📊 Laba Rugi</a>
+                    <a href="/neraca-saldo-setelah-penyesuaian" class="menu-item">🏦 Neraca Saldo Setelah Penyesuaian</a>
+                    <a href="/neraca-lajur" class="menu-item">📈 Neraca Lajur</a>
+                    <a href="/arus-kas" class="menu-item">💧 Arus Kas</a>
+                    <a href="/laporan-perubahan-modal" class="menu-item">👨‍💼 Laporan Perubahan Modal</a>
+                </div>
+                
+                <!-- Lain-lain -->
+                <div class="menu-section">
+                    <div class="menu-title">👥 Lain-lain</div>
+                    <a href="/aset" class="menu-item"> Aset</a>
+                    <a href="/prive" class="menu-item"> Prive</a>
+                     <a href="/pendapatan-diterima-dimuka" class="menu-item"> Pendapatan Diterima Dimuka</a>
+                      <a href="/neraca-saldo-awal" class="menu-item"> Neraca Saldo Awal</a>
+                    <a href="/hapus-transaksi-massal" class="menu-item"> Hapus Transaksi</a>
+                </div>
+            </div>
+            
+            <!-- Main Content -->
+            <div class="main-content">
+                <!-- Header -->
+                <div class="header">
+                    <div class="welcome-message">
+                        <h1>🎀 Selamat Datang, {user_email}!</h1>
+                        <div class="user-info">User ID: {user_id} | Last login: {datetime.now().strftime("%d %b %Y %H:%M")}</div>
+                    </div>
+                    <a href="/logout" class="action-btn logout-btn">🚪 Logout</a>
+                </div>
+                
+                <!-- Stats Grid -->
+                <div class="stats-grid">
+                    <div class="stat-card penjualan floating">
+                        <div class="stat-icon">🛍</div>
+                        <div class="stat-number">{format_currency(total_penjualan)}</div>
+                        <div class="stat-label">Total Penjualan</div>
+                    </div>
+                    
+                    <div class="stat-card pembelian floating" style="animation-delay: 0.2s">
+                        <div class="stat-icon">🛒</div>
+                        <div class="stat-number">{format_currency(total_pembelian)}</div>
+                        <div class="stat-label">Total Pembelian</div>
+                    </div>
+                    
+                    <div class="stat-card persediaan floating" style="animation-delay: 0.4s">
+                        <div class="stat-icon">📦</div>
+                        <div class="stat-number">{persediaan_saat_ini} ekor</div>
+                        <div class="stat-label">Persediaan Saat Ini</div>
+                    </div>
+                </div>
+                
+                <!-- Content Grid -->
+                <div class="content-grid">
+                    <!-- Penjualan Terbaru -->
+                    <div class="content-card">
+                        <h3 class="card-title">🛍 Penjualan Terbaru</h3>
+                        <div class="transaction-list">
+                            {"".join([f'''
+                            <div class="transaction-item">
+                                <div class="transaction-info">
+                                    <h4>{transaksi['nama_barang']} 
+                                        <span class="user-badge {'current-user' if transaksi.get('user_email') == user_email else ''}">
+                                            {transaksi.get('user_email', 'Unknown').split('@')[0]}
+                                        </span>
+                                    </h4>
+                                    <div class="transaction-date">
+                                        {datetime.strptime(transaksi['tanggal'], '%Y-%m-%d').strftime('%d %b %Y')} • {transaksi['nama_pegawai']}
+                                    </div>
+                                </div>
+                                <div class="transaction-amount">
+                                    +{format_currency(transaksi['total_penjualan'])}
+                                </div>
+                            </div>
+                            ''' for transaksi in transaksi_penjualan]) if transaksi_penjualan else '''
+                            <div class="empty-state">
+                                📝 Belum ada transaksi penjualan
+                            </div>
+                            '''}
+                        </div>
+                        <a href="/penjualan" class="action-btn" style="margin-top: 15px; display: block; text-align: center;">➕ Tambah Penjualan</a>
+                    </div>
+                    
+                    <!-- Pembelian Terbaru -->
+                    <div class="content-card">
+                        <h3 class="card-title">🛒 Pembelian Terbaru</h3>
+                        <div class="transaction-list">
+                            {"".join([f'''
+                            <div class="transaction-item pembelian">
+                                <div class="transaction-info">
+                                    <h4>{transaksi['nama_barang']}
+                                        <span class="user-badge {'current-user' if transaksi.get('user_email') == user_email else ''}">
+                                            {transaksi.get('user_email', 'Unknown').split('@')[0]}
+                                        </span>
+                                    </h4>
+                                    <div class="transaction-date">
+                                        {datetime.strptime(transaksi['tanggal'], '%Y-%m-%d').strftime('%d %b %Y')} • {transaksi['nama_supplier']}
+                                    </div>
+                                </div>
+                                <div class="transaction-amount negative">
+                                    -{format_currency(transaksi['total_pembelian'])}
+                                </div>
+                            </div>
+                            ''' for transaksi in transaksi_pembelian]) if transaksi_pembelian else '''
+                            <div class="empty-state">
+                                🛒 Belum ada transaksi pembelian
+                            </div>
+                            '''}
+                        </div>
+                        <a href="/pembelian" class="action-btn" style="margin-top: 15px; display: block; text-align: center;">➕ Tambah Pembelian</a>
+                    </div>
+                </div>
+                
+                <!-- Quick Actions -->
+                <div class="content-card">
+                    <h3 class="card-title">⚡ Aksi Cepat</h3>
+                    <div class="quick-actions">
+                        <a href="/penjualan" class="action-btn">🛍 Penjualan</a>
+                        <a href="/pembelian" class="action-btn">🛒 Pembelian</a>
+                        <a href="/kas" class="action-btn">💰 Kas</a>
+                        <a href="/laporan-keuangan" class="action-btn">📊 Laporan</a>
+                        <a href="/produk" class="action-btn">📦 Produk</a>
+                        <a href="/pelanggan" class="action-btn">👥 Pelanggan</a>
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            // Tambahkan efek interaktif
+            document.addEventListener('DOMContentLoaded', function() {{
+                // Highlight menu aktif
+                const currentPage = window.location.pathname;
+                document.querySelectorAll('.menu-item').forEach(item => {{
+                    if (item.getAttribute('href') === currentPage) {{
+                        item.classList.add('active');
+                    }}
+                }});
+                
+                // Animasi hover untuk stat cards
+                const statCards = document.querySelectorAll('.stat-card');
+                statCards.forEach(card => {{
+                    card.addEventListener('mouseenter', function() {{
+                        this.style.transform = 'translateY(-10px) scale(1.05)';
+                    }});
+                    
+                    card.addEventListener('mouseleave', function() {{
+                        this.style.transform = 'translateY(0px) scale(1)';
+                    }});
+                }});
+            }});
+        </script>
+    </body>
+    </html>
+    """
+    return dashboard_html
@@ -0,0 +1,281 @@
+"""Halaman depan, registrasi + verifikasi OTP, login dan logout"""
+from flask import render_template_string, request, redirect, session
+import os
+from pinkilang.core import logger, supabase, base_html
+from pinkilang.mailer import enqueue_email
+from pinkilang.ringkasan import get_jumlah_user, invalidate_ringkasan_cache
+from pinkilang.otp import get_client_ip, otp_boleh_dikirim, buat_otp, verifikasi_otp
+
+# ============================================================
+# 🔹 ROUTE: Home
+# ============================================================
+def home():
+    try:
+        if supabase:
+            current_status = "✅ Terhubung"
+            current_detail = f"Tabel user aktif ({get_jumlah_user()} data)"
+        else:
+            current_status = "❌ Error"
+            current_detail = "Supabase client tidak terinisialisasi"
+    except Exception as e:
+        current_status = "❌ Error"
+        current_detail = f"Koneksi terputus: {str(e)}"
+
+    # Cek path yang sederhana
+    logo_path = 'static/image/pinkilang-logo.png'
+    logo_exists = os.path.exists(logo_path)
+    
+    print(f"🔍 Checking logo at: {os.path.abspath(logo_path)}")
+    print(f"📁 Logo exists: {logo_exists}")
+    
+    # Jika tidak ada, coba path alternatif
+    if not logo_exists:
+        # Coba path dengan backslash untuk Windows
+        logo_path_win = 'static\\image\\pinkilang-logo.png'
+        logo_exists = os.path.exists(logo_path_win)
+        print(f"🔍 Checking Windows path: {os.path.abspath(logo_path_win)}")
+        print(f"📁 Logo exists (Windows path): {logo_exists}")
+
+    html = f"""
+    <div style="text-align: center; padding: 50px 0;">
+        <!-- Logo Pinkilang di Tengah -->
+        <div style="margin-bottom: 40px;">
+            {f'''
+            <img src="/static/image/pinkilang-logo.png" 
+                 alt="PINKILANG" 
+                 style="max-width: 350px; width: 100%; height: auto; display: block; margin: 0 auto;">
+            ''' if logo_exists else '''
+            <div style="font-size: 48px; color: #ff66a3; font-weight: bold; margin-bottom: 20px;">
+                PINKILANG
+            </div>
+            <div style="color: #666; font-size: 12px;">
+                (Logo: static/image/pinkilang-logo.png tidak ditemukan)
+            </div>
+            '''}
+        </div>
+        
+        <!-- Status Sistem Simple -->
+        <div style="max-width: 400px; margin: 0 auto 30px; padding: 15px; background: #f8f9fa; border-radius: 8px;">
+            <strong>Status Sistem:</strong><br>
+            • Database: {current_status}<br>
+            • {current_detail}
+        </div>
+        
+        <!-- Tombol Aksi Simple -->
+        <div style="display: flex; flex-direction: column; gap: 15px; max-width: 300px; margin: 0 auto;">
+            <a href='/register' style="text-decoration: none;">
+                <button style="width: 100%; padding: 12px; background: #ff66a3; color: white; border: none; border-radius: 5px; cursor: pointer; font-size: 16px;">
+                    📝 Daftar
+                </button>
+            </a>
+            <a href='/login' style="text-decoration: none;">
+                <button style="width: 100%; padding: 12px; background: #6666ff; color: white; border: none; border-radius: 5px; cursor: pointer; font-size: 16px;">
+                    🔐 Login
+                </button>
+            </a>
+        </div>
+    </div>
+    """
+    return render_template_string(base_html, content=html)
+
+# ============================================================
+# 🔹 ROUTE: Register
+# ============================================================
+def register():
+    message = ""
+    status_code = 200
+    
+    if not supabase:
+        message = '<div class="message error">❌ Database tidak tersedia! Silakan cek koneksi.</div>'
+    
+    elif request.method == "POST":
+        email = request.form["email"]
+        password = request.form["password"]
+        
+        logger.info(f"🔄 Registrasi: {email}")
+        
+        try:
+            # Rate limit dulu supaya lonjakan/abuse tidak sampai ke DB & SMTP
+            if not otp_boleh_dikirim(email, get_client_ip()):
+                message = '<div class="message error">❌ Terlalu banyak permintaan OTP. Coba lagi beberapa menit lagi.</div>'
+                status_code = 429
+                logger.warning(f"⛔ Rate limit OTP untuk {email} / {get_client_ip()}")
+
+            else:
+                # Cek apakah email sudah terdaftar
+                result = supabase.table("user").select("email").eq("email", email).execute()
+            
+                if result.data:
+                    message = '<div class="message error">❌ Email sudah terdaftar!</div>'
+                    logger.warning(f"Email {email} sudah terdaftar")
+                else:
+                    # Generate OTP - disimpan di server (hash + TTL), session hanya pegang email
+                    otp = buat_otp(email, password)
+                    session['register_email'] = email
+                
+                    logger.info(f"📧 Kirim OTP ke {email}")
+                
+                    # Kirim OTP via email
+                    email_body = f"""
+                    HALO! 👋
+
+                    Kode OTP Verifikasi PINKILANG Anda adalah:
+
+                    🎀 {otp} 🎀
+
+                    Masukkan kode ini di halaman verifikasi untuk menyelesaikan pendaftaran.
+
+                    Jangan berikan kode ini kepada siapapun.
+
+                    Terima kasih,
+                    💖 Tim PINKILANG
+                    """
+                
+                    if enqueue_email(email, "🎀 Kode OTP PINKILANG", email_body):
+                        logger.info(f"✅ OTP masuk antrean untuk {email}")
+                        return redirect('/verify')
+                    else:
+                        message = '<div class="message error">❌ Gagal kirim OTP! Cek konfigurasi email.</div>'
+                        logger.error(f"❌ Gagal kirim OTP ke {email}")
+                    
+        except Exception as e:
+            message = f'<div class="message error">⚠ Error database: {str(e)}</div>'
+            logger.error(f"Database error: {str(e)}")
+    
+    html = f"""
+    <h2>📝 Daftar Akun</h2>
+    {message}
+    <form method="POST">
+        <input type="email" name="email" placeholder="Email" required><br>
+        <input type="password" name="password" placeholder="Password" required><br>
+        <button type="submit">Daftar & Kirim OTP</button>
+    </form>
+    <p><a href="/login">Sudah punya akun? Login</a></p>
+    <a href="/"><button>🏠 Kembali</button></a>
+    """
+    return render_template_string(base_html, content=html), status_code
+
+# ============================================================
+# 🔹 ROUTE: Verifikasi OTP
+# ============================================================
+def verify_otp():
+    message = ""
+    email = session.get('register_email')
+    
+    if not email:
+        return redirect('/register')
+    
+    logger.info(f"🔄 Verifikasi OTP untuk: {email}")
+    
+    if request.method == "POST":
+        otp_input = request.form["otp"].strip()
+        
+        # Cek OTP di server
+        status, data = verifikasi_otp(email, otp_input)
+        
+        if status == 'ok':
+            password = data
+            
+            try:
+                # Simpan user ke Supabase
+                user_data = {
+                    "email": email,
+                    "password": password
+                }
+                
+                result = supabase.table("user").insert(user_data).execute()
+                invalidate_ringkasan_cache()
+                logger.info(f"✅ User {email} berhasil disimpan ke database")
+                
+                # Hapus data sementara
+                session.pop('register_email', None)
+                
+                message = '<div class="message success">✅ Akun berhasil dibuat!</div>'
+                html = f"""
+                <h2>🎉 Registrasi Berhasil!</h2>
+                {message}
+                <p>Akun Anda sudah aktif di database.</p>
+                <a href="/login"><button>🔐 Login Sekarang</button></a>
+                """
+                return render_template_string(base_html, content=html)
+                
+            except Exception as e:
+                message = f'<div class="message error">❌ Gagal menyimpan ke database: {str(e)}</div>'
+                logger.error(f"❌ Error simpan user: {str(e)}")
+        elif status == 'salah':
+            message = f'<div class="message error">❌ OTP salah! Sisa percobaan: {data}</div>'
+            logger.warning(f"❌ OTP salah untuk {email}")
+        elif status == 'terkunci':
+            session.pop('register_email', None)
+            message = '<div class="message error">❌ Terlalu banyak percobaan. Silakan daftar ulang untuk OTP baru.</div>'
+            logger.warning(f"⛔ OTP terkunci untuk {email}")
+        else:
+            message = '<div class="message error">❌ OTP kedaluwarsa. Silakan daftar ulang untuk OTP baru.</div>'
+            logger.warning(f"⌛ OTP kedaluwarsa untuk {email}")
+    
+    html = f"""
+    <h2>🔒 Verifikasi OTP</h2>
+    <p>Kode OTP dikirim ke: <strong>{email}</strong></p>
+    <div class="message info">
+        💡 Periksa folder <strong>Spam/Promosi</strong> jika tidak ditemukan
+    </div>
+    {message}
+    <form method="POST">
+        <input type="text" name="otp" placeholder="Masukkan 6 digit OTP" 
+               required maxlength="6" pattern="[0-9]{{6}}"><br>
+        <button type="submit">✅ Verifikasi</button>
+    </form>
+    <a href="/register"><button>↩ Kembali</button></a>
+    """
+    return render_template_string(base_html, content=html)
+
+# ============================================================
+# 🔹 ROUTE: Login
+# ============================================================
+def login():
+    message = ""
+    if request.method == "POST":
+        email = request.form["email"]
+        password = request.form["password"]
+        
+        try:
+            if not supabase:
+                message = '<div class="message error">❌ Database tidak tersedia</div>'
+            else:
+                # Cek user di Supabase
+                result = supabase.table("user").select("*").eq("email", email).execute()
+                
+                if result.data and result.data[0]['password'] == password:
+                    # Login berhasil
+                    session['logged_in'] = True
+                    session['user_email'] = email
+                    session['user_id'] = result.data[0]['id']
+                    logger.info(f"✅ Login berhasil: {email}")
+                    return redirect('/dashboard')
+                else:
+                    message = '<div class="message error">❌ Email atau password salah!</div>'
+                    logger.warning(f"❌ Login gagal: {email}")
+                    
+        except Exception as e:
+            message = f'<div class="message error">⚠ Error database: {str(e)}</div>'
+            logger.error(f"Database error saat login: {str(e)}")
+    
+    html = f"""
+    <h2>🔐 Login</h2>
+    {message}
+    <form method="POST">
+        <input type="email" name="email" placeholder="Email" required><br>
+        <input type="password" name="password" placeholder="Password" required><br>
+        <button type="submit">Login</button>
+    </form>
+    <p><a href="/register">Belum punya akun? Daftar</a></p>
+    <a href="/"><button>🏠 Kembali</button></a>
+    """
+    return render_template_string(base_html, content=html)
+
+# ============================================================
+# 🔹 ROUTE: Logout
+# ============================================================
+def logout():
+    session.clear()
+    return redirect('/')
@@ -0,0 +1,567 @@
+"""Konfigurasi, logging, client Supabase (lazy) dan helper HTML yang dipakai semua blueprint"""
+from dotenv import load_dotenv
+from flask import request, has_request_context, copy_current_request_context
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import inspect
+import json
+import logging
+import threading
+import os
+import time
+
+# ============================================================
+# 🔹 Setup Logging
+# ============================================================
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# 🔹 Load Konfigurasi
+# ============================================================
+load_dotenv()
+SUPABASE_URL = os.getenv("SUPABASE_URL")
+SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+EMAIL_SENDER = os.getenv("EMAIL_SENDER")
+EMAIL_PASSWORD = os.getenv("EMAIL_APP_PASSWORD")
+DB_BACKEND = os.getenv("DB_BACKEND", "supabase")          # "local" = SQLite lokal (pinkilang.local_db)
+LOCAL_DB_PATH = os.getenv("LOCAL_DB_PATH", "pinkilang_local.db")
+# Soft delete: baris dengan deleted_at terisi tidak ikut terbaca (lihat pinkilang.soft_delete).
+# Di Supabase aktifkan setelah SQL_SOFT_DELETE dijalankan; backend lokal selalu punya kolomnya.
+SOFT_DELETE = os.getenv("SOFT_DELETE", "1" if DB_BACKEND == "local" else "0") == "1"
+TABEL_SOFT_DELETE = ("penjualan", "pembelian", "operasional", "prive", "modal", "aset_tetap", "neraca_saldo_awal", "jurnal_umum")
+# Posting jurnal idempoten pada (ref_id, ref_baris) - di Supabase setelah SQL_JURNAL_IDEMPOTEN (pinkilang.akuntansi)
+JURNAL_IDEMPOTEN = os.getenv("JURNAL_IDEMPOTEN", "1" if DB_BACKEND == "local" else "0") == "1"
+
+# ============================================================
+# 🔹 Inisialisasi Supabase
+# ============================================================
+# Client Supabase dibuat malas (saat pertama dipakai), bukan saat import:
+# import modul / boot worker gunicorn tidak melakukan I/O jaringan sama sekali.
+# Cek koneksi ke database dipisah ke cek_kesiapan_supabase() (dipakai /readyz).
+db_status = "❌ Tidak Terhubung"
+db_detail = "Belum diinisialisasi"
+
+class LazySupabaseClient:
+    """Proxy client Supabase yang dibuat thread-safe saat atribut pertama kali diakses"""
+
+    def __init__(self, url, key):
+        self.url = url
+        self.key = key
+        self._client = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def get_client(self):
+        if self._client is None and self._error is None:
+            with self._lock:
+                if self._client is None and self._error is None:
+                    self._client, self._error = self._buat_client()
+        return self._client
+
+    def _buat_client(self):
+        if DB_BACKEND == "local":
+            from pinkilang.local_db import ClientLokal
+            try:
+                client = ClientLokal(LOCAL_DB_PATH)
+                logger.info(f"✅ Backend lokal SQLite aktif ({LOCAL_DB_PATH})")
+                return client, None
+            except Exception as e:
+                logger.error(f"❌ Backend lokal gagal dibuka: {e}")
+                return None, f"Gagal membuka {LOCAL_DB_PATH}: {str(e)}"
+        if not self.url or not self.key:
+            logger.error("❌ SUPABASE_URL atau SUPABASE_KEY tidak ditemukan di .env")
+            return None, "Konfigurasi Supabase tidak lengkap"
+        try:
+            # SDK supabase (httpx, postgrest, auth, ...) cukup berat; di-import di sini juga
+            from supabase import create_client
+            client = create_client(self.url, self.key)
+            logger.info(f"✅ Supabase client initialized ({self.url})")
+            return client, None
+        except Exception as e:
+            logger.error(f"❌ Supabase initialization error: {e}")
+            return None, f"Gagal terhubung: {str(e)}"
+
+    @property
+    def error(self):
+        return self._error
+
+    def __bool__(self):
+        return self.get_client() is not None
+
+    def _wajib_client(self):
+        client = self.get_client()
+        if client is None:
+            raise RuntimeError(f"Supabase client tidak tersedia: {self._error}")
+        return client
+
+    def __getattr__(self, name):
+        return getattr(self._wajib_client(), name)
+
+    # Semua query lewat sini, jadi dibungkus instrumentasi (lihat QueryTercatat)
+    def table(self, nama, termasuk_terhapus=False):
+        return ClientTercatat(self._wajib_client()).table(nama, termasuk_terhapus)
+
+    from_ = table
+
+    def rpc(self, fn, *args, **kwargs):
+        return ClientTercatat(self._wajib_client()).rpc(fn, *args, **kwargs)
+
+supabase = LazySupabaseClient(SUPABASE_URL, SUPABASE_KEY)
+
+def cek_kesiapan_supabase():
+    """Probe koneksi database (I/O jaringan) - hanya dipanggil dari readiness check"""
+    global db_status, db_detail
+    if not supabase:
+        db_status = "❌ Error"
+        db_detail = supabase.error or "Supabase client tidak terinisialisasi"
+        return False
+    try:
+        test_result = supabase.table("user").select("id").limit(1).execute()
+        db_status = "✅ Terhubung"
+        db_detail = f"Tabel user siap ({len(test_result.data)} data)"
+        return True
+    except Exception as e:
+        logger.error(f"❌ Readiness check gagal: {e}")
+        db_status = "❌ Error"
+        db_detail = f"Koneksi terputus: {str(e)}"
+        return False
+
+# ============================================================
+# 🔹 Instrumentasi Query Supabase
+# ============================================================
+# Tiap .execute() dicatat (tabel, operasi, bentuk filter, baris, bytes, latensi)
+# ke daftar milik request aktif. Setelah request selesai totalnya dikirim di
+# header Server-Timing + log, dan pola N+1 (tabel/filter sama berulang) diberi peringatan.
+N_PLUS_1_THRESHOLD = int(os.getenv("N_PLUS_1_THRESHOLD", "5"))
+_OPERASI_QUERY = ("select", "insert", "update", "upsert", "delete")
+_ENV_CATATAN = "pinkilang.query"
+_ENV_MULAI = "pinkilang.mulai"
+QUERY_HOOKS = []   # callable(info) dipanggil untuk tiap query, mis. untuk metrics
+
+def get_catatan_query():
+    """Daftar catatan query request aktif (ikut terbawa ke thread fan-out), None di luar request"""
+    if has_request_context():
+        return request.environ.setdefault(_ENV_CATATAN, [])
+    return None
+
+def ukuran_json(data):
+    try:
+        return len(json.dumps(data, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+class QueryTercatat:
+    """Bungkus request builder postgrest (sync/async) dan catat hasil .execute()"""
+
+    def __init__(self, builder, tabel, operasi="select", catatan=None, bytes_kirim=0, saring_terhapus=False):
+        self._builder = builder
+        self._catatan = catatan
+        self._saring_terhapus = saring_terhapus
+        self.tabel = tabel
+        self.operasi = operasi
+        self.filter = []
+        self.bytes_kirim = bytes_kirim
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+
+        def panggil(*args, **kwargs):
+            if name in _OPERASI_QUERY:
+                self.operasi = name
+                if name in ("insert", "update", "upsert") and args:
+                    self.bytes_kirim = ukuran_json(args[0])
+            elif args and isinstance(args[0], str):
+                self.filter.append(f"{name}:{args[0]}")
+            hasil = attr(*args, **kwargs)
+            if name == "select" and self._saring_terhapus:
+                # Tombstone (soft delete) tidak pernah ikut terbaca, termasuk COUNT
+                hasil = hasil.is_("deleted_at", "null")
+            if hasattr(hasil, "execute"):
+                self._builder = hasil
+                return self
+            return hasil
+        return panggil
+
+    def execute(self):
+        catatan = self._catatan if self._catatan is not None else get_catatan_query()
+        mulai = time.perf_counter()
+        try:
+            hasil = self._builder.execute()
+        except Exception:
+            self._catat(catatan, mulai, None)
+            raise
+        if inspect.isawaitable(hasil):
+            return self._execute_async(hasil, catatan, mulai)
+        self._catat(catatan, mulai, hasil)
+        return hasil
+
+    async def _execute_async(self, coro, catatan, mulai):
+        try:
+            hasil = await coro
+        except BaseException:
+            self._catat(catatan, mulai, None)
+            raise
+        self._catat(catatan, mulai, hasil)
+        return hasil
+
+    def _catat(self, catatan, mulai, hasil):
+        data = getattr(hasil, "data", None)
+        info = {
+            "tabel": self.tabel,
+            "operasi": self.operasi,
+            "filter": tuple(self.filter),
+            "baris": len(data) if isinstance(data, list) else int(bool(data)),
+            "bytes_kirim": self.bytes_kirim,
+            "bytes_terima": ukuran_json(data) if data else 0,
+            "durasi_ms": (time.perf_counter() - mulai) * 1000,
+            "error": hasil is None,
+        }
+        if catatan is not None:
+            catatan.append(info)
+        for hook in QUERY_HOOKS:
+            hook(info)
+
+class ClientTercatat:
+    """Client Supabase/PostgREST yang table()/rpc()-nya menghasilkan QueryTercatat"""
+
+    def __init__(self, client, catatan=None):
+        self._client = client
+        self._catatan = catatan
+
+    def table(self, nama, termasuk_terhapus=False):
+        saring = SOFT_DELETE and not termasuk_terhapus and nama in TABEL_SOFT_DELETE
+        return QueryTercatat(self._client.table(nama), nama, catatan=self._catatan, saring_terhapus=saring)
+
+    from_ = table
+
+    def rpc(self, fn, *args, **kwargs):
+        params = args[0] if args else kwargs.get("params")
+        return QueryTercatat(self._client.rpc(fn, *args, **kwargs), f"rpc:{fn}", "rpc",
+                             catatan=self._catatan, bytes_kirim=ukuran_json(params) if params else 0)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+def ringkas_query(catatan):
+    """Total per request + daftar pola N+1 (tabel, operasi, filter, jumlah)"""
+    pola = {}
+    for q in catatan:
+        key = (q["tabel"], q["operasi"], q["filter"])
+        pola[key] = pola.get(key, 0) + 1
+    return {
+        "jumlah": len(catatan),
+        "durasi_ms": sum(q["durasi_ms"] for q in catatan),
+        "baris": sum(q["baris"] for q in catatan),
+        "bytes": sum(q["bytes_kirim"] + q["bytes_terima"] for q in catatan),
+        "error": sum(1 for q in catatan if q["error"]),
+        "n_plus_1": [(*key, n) for key, n in pola.items() if n > N_PLUS_1_THRESHOLD],
+    }
+
+def pasang_instrumentasi(app):
+    """Daftarkan hook request: Server-Timing, log ringkasan query dan peringatan N+1"""
+
+    @app.before_request
+    def _mulai_request():
+        request.environ[_ENV_MULAI] = time.perf_counter()
+
+    @app.after_request
+    def _ringkas_request(response):
+        total_ms = (time.perf_counter() - request.environ.get(_ENV_MULAI, time.perf_counter())) * 1000
+        r = ringkas_query(request.environ.get(_ENV_CATATAN, []))
+
+        response.headers.add("Server-Timing", f'db;dur={r["durasi_ms"]:.1f};desc="{r["jumlah"]} query"')
+        response.headers.add("Server-Timing", f"app;dur={total_ms:.1f}")
+        for tabel, operasi, filter_, jumlah in r["n_plus_1"]:
+            logger.warning(f"⚠️ N+1 di {request.path}: {operasi} {tabel} [{', '.join(filter_)}] x{jumlah}")
+        if r["n_plus_1"]:
+            response.headers.add("Server-Timing", f'n1;desc="{len(r["n_plus_1"])} pola N+1"')
+
+        if r["jumlah"]:
+            logger.info(
+                f"📊 {request.method} {request.path} {response.status_code} - {r['jumlah']} query, "
+                f"{r['baris']} baris, {r['bytes'] / 1024:.1f} KB, db {r['durasi_ms']:.0f}ms / total {total_ms:.0f}ms"
+            )
+        return response
+
+# ============================================================
+# 🔹 Fan-out Query Paralel
+# ============================================================
+# Query yang saling independen dalam satu request dijalankan bersamaan di thread
+# pool terbatas, jadi waktu halaman mendekati query paling lambat, bukan jumlahnya.
+FANOUT_WORKERS = int(os.getenv("FANOUT_WORKERS", "8"))
+FANOUT_TIMEOUT = float(os.getenv("FANOUT_TIMEOUT", "15"))   # detik, batas tiap query
+_FANOUT_PREFIX = "fanout"
+
+_fanout_pool = None
+_fanout_pid = None
+_fanout_lock = threading.Lock()
+
+def get_fanout_pool():
+    """Thread pool fan-out (dibuat ulang kalau proses di-fork oleh gunicorn)"""
+    global _fanout_pool, _fanout_pid
+    with _fanout_lock:
+        if _fanout_pool is None or _fanout_pid != os.getpid():
+            _fanout_pool = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix=_FANOUT_PREFIX)
+            _fanout_pid = os.getpid()
+        return _fanout_pool
+
+def jalankan_paralel(tugas, timeout=FANOUT_TIMEOUT):
+    """
+    Jalankan dict nama -> callable secara paralel, kembalikan dict nama -> hasil.
+
+    Exception dari salah satu tugas dilempar ulang ke pemanggil; TimeoutError kalau
+    ada tugas yang belum selesai `timeout` detik setelah dimulai. Tugas boleh memakai
+    session/request (context request disalin ke thread). Dipanggil dari dalam tugas
+    fan-out lain, semuanya dijalankan berurutan supaya pool tidak deadlock.
+    """
+    if len(tugas) <= 1 or FANOUT_WORKERS <= 1 or threading.current_thread().name.startswith(_FANOUT_PREFIX):
+        return {nama: fungsi() for nama, fungsi in tugas.items()}
+
+    if has_request_context():
+        tugas = {nama: copy_current_request_context(fungsi) for nama, fungsi in tugas.items()}
+
+    pool = get_fanout_pool()
+    futures = {nama: pool.submit(fungsi) for nama, fungsi in tugas.items()}
+    batas = time.monotonic() + timeout
+    hasil = {}
+    try:
+        for nama, future in futures.items():
+            hasil[nama] = future.result(timeout=max(0, batas - time.monotonic()))
+    except FuturesTimeoutError:
+        for future in futures.values():
+            future.cancel()
+        raise TimeoutError(f"Query '{nama}' belum selesai setelah {timeout} detik")
+    except Exception:
+        for future in futures.values():
+            future.cancel()
+        raise
+    return hasil
+
+# ============================================================
+# 🔹 Cache In-Process (TTL)
+# ============================================================
+# Cache per worker untuk hasil query yang mahal; tiap fitur menghapus cache-nya
+# sendiri setelah menulis data (write invalidation), TTL hanya jaring pengaman
+# untuk perubahan dari worker lain.
+CACHES = {}
+_KOSONG = object()
+
+class TTLCache:
+    """Cache key -> nilai dengan TTL per entri dan statistik hit/miss"""
+
+    def __init__(self, nama, ttl):
+        self.nama = nama
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = {}
+        self._lock = threading.Lock()
+        CACHES[nama] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.time(), value)
+
+    def get_or_set(self, key, hitung):
+        """Ambil dari cache, atau panggil hitung() lalu simpan hasilnya"""
+        value = self.get(key, _KOSONG)
+        if value is _KOSONG:
+            value = hitung()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+# ============================================================
+# 🔹 Tampilan Base
+# ============================================================
+base_html = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>PINKILANG</title>
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            background: linear-gradient(135deg, #ffd1dc, #ffe0e9); 
+            display: flex; 
+            justify-content: center; 
+            align-items: center; 
+            height: 100vh; 
+            margin: 0; 
+        }
+        .container { 
+            background: white; 
+            padding: 30px; 
+            border-radius: 15px; 
+            width: 350px; 
+            text-align: center; 
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1); 
+        }
+        input { 
+            width: 90%; 
+            padding: 10px; 
+            margin: 8px 0; 
+            border: 1px solid #ddd; 
+            border-radius: 8px; 
+            font-size: 16px;
+        }
+        button { 
+            background: #ff66a3; 
+            color: white; 
+            border: none; 
+            padding: 12px 24px; 
+            border-radius: 8px; 
+            cursor: pointer; 
+            margin: 5px; 
+            font-size: 16px;
+            width: 95%;
+        }
+        button:hover {
+            background: #ff4d94;
+        }
+        .message {
+            padding: 12px;
+            margin: 10px 0;
+            border-radius: 8px;
+            font-size: 14px;
+        }
+        .success { 
+            background: #d4ffd4; 
+            color: #006600; 
+            border: 1px solid #c3e6cb;
+        }
+        .error { 
+            background: #ffd4d4; 
+            color: #cc0000; 
+            border: 1px solid #f5c6cb;
+        }
+        .info { 
+            background: #d1ecf1; 
+            color: #0c5460; 
+            border: 1px solid #bee5eb;
+        }
+        .warning { 
+            background: #fff3cd; 
+            color: #856404; 
+            border: 1px solid #ffeaa7;
+        }
+        .menu { 
+            margin: 15px 0; 
+        }
+    </style>
+</head>
+<body>
+    <div class="container">{{ content|safe }}</div>
+</body>
+</html>
+"""
+
+# ============================================================
+# 🔹 ROUTE: Halaman Menu Lainnya
+# ============================================================
+def create_simple_page(title, content):
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>{title} - PINKILANG</title>
+        <style>
+            body {{
+                font-family: 'Arial Rounded MT Bold', 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffd1dc, #ffe0e9);
+                margin: 0;
+                padding: 20px;
+            }}
+            .container {{
+                max-width: 800px;
+                margin: 0 auto;
+                background: white;
+                padding: 30px;
+                border-radius: 20px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+            }}
+            h1 {{
+                color: #ff66a3;
+                text-align: center;
+                margin-bottom: 30px;
+            }}
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: #ff66a3;
+                color: white;
+                text-decoration: none;
+                border-radius: 10px;
+                margin-bottom: 20px;
+            }}
+            .content {{
+                text-align: center;
+                padding: 40px 20px;
+                color: #666;
+                font-size: 18px;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+            <h1>{title}</h1>
+            <div class="content">
+                {content}
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+def create_error_page(title, message):
+    """Create error page"""
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Error - {title}</title>
+        <style>
+            body {{ font-family: Arial; padding: 20px; background: #ffe6e6; }}
+            .container {{ max-width: 600px; margin: 50px auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center; }}
+            .error-icon {{ font-size: 48px; margin-bottom: 20px; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="error-icon">❌</div>
+            <h1>Error: {title}</h1>
+            <p>{message}</p>
+            <br>
+            <a href="/dashboard" style="background: #ff66a3; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">
+                ← Kembali ke Dashboard
+            </a>
+        </div>
+    </body>
+    </html>
+    """
+
+# ============================================================
+# 🔹 HELPER FUNCTIONS 
+# ============================================================
+
+def format_currency(amount):
+    """Format angka menjadi format mata uang Indonesia"""
+    try:
+        return f"Rp {int(amount):,}".replace(",", ".")
+    except (ValueError, TypeError):
+        return "Rp 0"
@@ -0,0 +1,21 @@
+"""Pendaftaran route yang modul view-nya baru di-import saat request pertama"""
+from functools import cached_property
+from werkzeug.utils import import_string
+
+class LazyView:
+    """View function yang import-nya ditunda sampai pertama kali dipanggil"""
+
+    def __init__(self, import_name):
+        self.__module__, self.__name__ = import_name.rsplit(".", 1)
+        self.import_name = import_name
+
+    @cached_property
+    def view(self):
+        return import_string(self.import_name)
+
+    def __call__(self, *args, **kwargs):
+        return self.view(*args, **kwargs)
+
+def lazy_route(bp, rule, view, **options):
+    """Daftarkan `rule` ke blueprint dengan view "modul.fungsi" relatif ke package blueprint"""
+    bp.add_url_rule(rule, view_func=LazyView(f"{bp.import_name}.{view}"), **options)
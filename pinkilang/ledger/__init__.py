@@ -0,0 +1,35 @@
+"""Blueprint ledger: jurnal, buku besar, neraca saldo dan neraca lajur"""
+import click
+from flask import Blueprint
+from pinkilang.lazy import lazy_route
+
+bp = Blueprint("ledger", __name__, cli_group=None)
+
+lazy_route(bp, "/jurnal-umum", "jurnal_umum.jurnal_umum")
+lazy_route(bp, "/generate-jurnal-otomatis", "jurnal_umum.generate_jurnal_otomatis")
+lazy_route(bp, "/buku-besar", "buku_besar.buku_besar")
+lazy_route(bp, "/buku-besar-pembantu-utang", "buku_besar.buku_besar_pembantu_utang")
+lazy_route(bp, "/buku-besar-pembantu-piutang", "buku_besar.buku_besar_pembantu_piutang")
+lazy_route(bp, "/neraca-saldo", "neraca_saldo.neraca_saldo")
+lazy_route(bp, "/neraca-saldo-awal", "neraca_saldo.neraca_saldo_awal", methods=["GET", "POST"])
+lazy_route(bp, "/neraca-saldo-setelah-penyesuaian", "neraca_saldo.neraca_saldo_setelah_penyesuaian")
+lazy_route(bp, "/neraca-saldo-setelah-penutupan", "neraca_saldo.neraca_saldo_setelah_penutupan")
+lazy_route(bp, "/neraca-lajur", "neraca_lajur.neraca_lajur")
+lazy_route(bp, "/jurnal-penyesuaian", "jurnal_penyesuaian.jurnal_penyesuaian", methods=["GET", "POST"])
+lazy_route(bp, "/generate-penyesuaian-otomatis", "jurnal_penyesuaian.generate_penyesuaian_otomatis")
+lazy_route(bp, "/jurnal-penutup", "jurnal_penutup.jurnal_penutup")
+
+@bp.cli.command("penyesuaian-bulanan")
+@click.option("--periode", help="Periode YYYY-MM (default: bulan lalu)")
+@click.option("--dari", help="Posting ulang berurutan dari periode YYYY-MM sampai --periode")
+@click.option("--tenant", "tenants", multiple=True, help="Batasi ke user_email tertentu")
+@click.option("--dry-run", is_flag=True, help="Hitung saja, jangan posting")
+def penyesuaian_bulanan_command(periode, dari, tenants, dry_run):
+    """Posting jurnal penyesuaian akhir bulan untuk semua tenant."""
+    from pinkilang.penyesuaian import daftar_periode, jalankan_penyesuaian_bulanan, periode_sebelumnya
+
+    periode = periode or periode_sebelumnya()
+    for p in (daftar_periode(dari, periode) if dari else [periode]):
+        hasil = jalankan_penyesuaian_bulanan(p, list(tenants) or None, dry_run)
+        for user_email, info in hasil.items():
+            click.echo(f"{p}  {user_email:<40} {info['status']:<8} {info['entri']:>4} entri  penyusutan {info['total_penyusutan']:,.2f}")
@@ -0,0 +1,1035 @@
+"""Buku besar dan buku besar pembantu utang/piutang"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.piutang_utang import get_pelunasan_per_faktur
+
+    
+# ============================================================
+# ROUTE: Buku Besar - OTOMATIS DARI SEMUA TRANSAKSI - FIXED
+# ============================================================
+def buku_besar():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get("user_email")
+
+    # =======================================================
+    # 1. PERBAIKI CONSTRAINT JIKA PERLU
+    # =======================================================
+    try:
+        # Cek dan perbaiki constraint
+        print("=== MEMASTIKAN CONSTRAINT JURNAL_UMUM ===")
+    except Exception as e:
+        print(f"⚠️  Info constraint: {e}")
+
+    # =======================================================
+    # 2. AMBIL DATA DARI JURNAL_UMUM
+    # =======================================================
+    try:
+        print("=== MENGAMBIL DATA DARI JURNAL_UMUM ===")
+        res = supabase.table("jurnal_umum").select("*").order("tanggal").execute()
+        jurnal_data = res.data or []
+        print(f"✅ Data jurnal_umum: {len(jurnal_data)} records")
+        
+        # DEBUG: Tampilkan sample data
+        for i, row in enumerate(jurnal_data[:5]):
+            print(f"Sample {i+1}: {row.get('nama_akun')} | Debit: {row.get('debit')} | Kredit: {row.get('kredit')}")
+            
+    except Exception as e:
+        print(f"❌ Error ambil jurnal_umum: {e}")
+        jurnal_data = []
+
+    # =======================================================
+    # 3. JIKA KOSONG, INSERT DATA OTOMATIS
+    # =======================================================
+    if not jurnal_data:
+        try:
+            print("=== INSERT DATA OTOMATIS DARI SEMUA TABEL ===")
+            
+            # Insert dari modal (saldo awal)
+            modal_data = supabase.table("modal").select("*").execute().data or []
+            for modal in modal_data:
+                # Debit Kas
+                supabase.table("jurnal_umum").insert({
+                    "tanggal": modal.get('tanggal'),
+                    "nama_akun": "Kas (1110)",
+                    "debit": modal.get('jumlah'),
+                    "kredit": 0,
+                    "keterangan": modal.get('keterangan', 'Setoran Modal'),
+                    "transaksi_type": "MODAL",
+                    "transaksi_id": f"modal_{modal.get('id')}",
+                    "user_email": modal.get('user_email', user_email)
+                }).execute()
+                
+                # Kredit Modal
+                supabase.table("jurnal_umum").insert({
+                    "tanggal": modal.get('tanggal'),
+                    "nama_akun": "Modal (3100)",
+                    "debit": 0,
+                    "kredit": modal.get('jumlah'),
+                    "keterangan": modal.get('keterangan', 'Setoran Modal'),
+                    "transaksi_type": "MODAL",
+                    "transaksi_id": f"modal_{modal.get('id')}",
+                    "user_email": modal.get('user_email', user_email)
+                }).execute()
+            
+            print("✅ Data modal diinsert")
+            
+            # Ambil ulang data
+            res = supabase.table("jurnal_umum").select("*").order("tanggal").execute()
+            jurnal_data = res.data or []
+            print(f"✅ Data jurnal_umum setelah insert: {len(jurnal_data)} records")
+            
+        except Exception as e:
+            print(f"❌ Error insert otomatis: {e}")
+
+    # =======================================================
+    # 4. KELOMPOKKAN PER AKUN & HITUNG SALDO
+    # =======================================================
+    account_order = [
+        # ASET LANCAR
+        "Kas (1110)", "Piutang Usaha (1130)", "Perlengkapan (1150)",
+        # ASET TETAP  
+        "Tanah (1210)", "Bangunan (1220)", "Akumulasi Penyusutan Bangunan (1221)",
+        "Kendaraan (1230)", "Akumulasi Penyusutan Kendaraan (1231)", 
+        "Peralatan (1240)", "Akumulasi Penyusutan Peralatan (1241)",
+        # UTANG
+        "Utang (2100)", "Pendapatan Diterima Dimuka (2200)",
+        # MODAL
+        "Modal (3100)", "Prive Mas Angga (3200)", "Ikhtisar L/R (3300)",
+        # PENDAPATAN
+        "Penjualan (4100)", "Retur Penjualan (4200)", "Potongan Penjualan (4300)",
+        # HPP & PEMBELIAN
+        "HPP (5110)", "Pembelian (5200)",
+        # BEBAN
+        "Beban Perlengkapan (6100)", "Beban air, listrik dan telepon (6200)", 
+        "Beban Penyusutan (6300)", "Beban Lainnya (6900)",
+        "Lainnya"
+    ]
+
+    # Kelompokkan data
+    ledger = {}
+    for row in jurnal_data:
+        akun = row.get('nama_akun', 'Lainnya')
+        if akun not in ledger:
+            ledger[akun] = []
+        ledger[akun].append(row)
+
+    # Tambahkan akun yang belum ada di order list
+    for akun in ledger.keys():
+        if akun not in account_order:
+            account_order.append(akun)
+
+    # =======================================================
+    # 5. GENERATE HTML BUKU BESAR
+    # =======================================================
+    def rp(v):
+        try:
+            if float(v) == 0:
+                return "Rp 0"
+            return f"Rp {int(float(v)):,}".replace(",", ".")
+        except:
+            return "Rp 0"
+
+    akun_sections = ""
+    
+    for akun in account_order:
+        if akun in ledger and ledger[akun]:
+            entries = sorted(ledger[akun], key=lambda x: x.get('tanggal', ''))
+            saldo = 0
+            rows_html = ""
+            
+            for e in entries:
+                debit = float(e.get('debit', 0) or 0)
+                kredit = float(e.get('kredit', 0) or 0)
+                
+                # Hitung saldo berdasarkan jenis akun
+                if akun in ["Kas (1110)", "Piutang Usaha (1130)", "Perlengkapan (1150)", 
+                           "Tanah (1210)", "Bangunan (1220)", "Kendaraan (1230)", "Peralatan (1240)"]:
+                    saldo += debit - kredit
+                elif akun in ["Akumulasi Penyusutan Bangunan (1221)", "Akumulasi Penyusutan Kendaraan (1231)", 
+                             "Akumulasi Penyusutan Peralatan (1241)"]:
+                    saldo += kredit - debit
+                elif akun in ["Utang (2100)", "Pendapatan Diterima Dimuka (2200)", "Modal (3100)", 
+                             "Penjualan (4100)", "Retur Penjualan (4200)", "Potongan Penjualan (4300)"]:
+                    saldo += kredit - debit
+                else:
+                    saldo += debit - kredit
+                
+                rows_html += f"""
+                <tr>
+                    <td>{e.get('tanggal', '')}</td>
+                    <td>{e.get('keterangan', '')}</td>
+                    <td class="debit">{rp(debit)}</td>
+                    <td class="kredit">{rp(kredit)}</td>
+                    <td class="saldo">{rp(saldo)}</td>
+                </tr>
+                """
+            
+            # Tentukan class
+            if 'Kas' in akun or 'Piutang' in akun or 'Perlengkapan' in akun or 'Tanah' in akun or 'Bangunan' in akun or 'Kendaraan' in akun or 'Peralatan' in akun:
+                account_class = "asset"
+            elif 'Akumulasi' in akun:
+                account_class = "contra-asset" 
+            elif 'Utang' in akun or 'Pendapatan Diterima Dimuka' in akun:
+                account_class = "liability"
+            elif 'Modal' in akun or 'Prive' in akun or 'Ikhtisar' in akun:
+                account_class = "equity"
+            elif 'Penjualan' in akun or 'Retur' in akun or 'Potongan' in akun:
+                account_class = "revenue"
+            elif 'HPP' in akun or 'Pembelian' in akun:
+                account_class = "cogs"
+            elif 'Beban' in akun:
+                account_class = "expense"
+            else:
+                account_class = "other"
+            
+            akun_sections += f"""
+            <div class="account-section {account_class}">
+                <h3>{akun} <span class="badge">{len(entries)} transaksi</span></h3>
+                <table>
+                    <thead>
+                        <tr><th>Tanggal</th><th>Keterangan</th><th>Debit</th><th>Kredit</th><th>Saldo</th></tr>
+                    </thead>
+                    <tbody>{rows_html}</tbody>
+                </table>
+            </div>
+            """
+
+    # =======================================================
+    # 6. RENDER HTML
+    # =======================================================
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Buku Besar - PINKILANG</title>
+        <style>
+            body {{ font-family: Arial; background: #f5f5f5; margin: 0; padding: 20px; }}
+            .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; }}
+            .header {{ text-align: center; margin-bottom: 30px; }}
+            .account-section {{ margin-bottom: 30px; padding: 15px; border-radius: 5px; }}
+            .asset {{ background: #e8f5e9; border-left: 4px solid #4caf50; }}
+            .contra-asset {{ background: #c8e6c9; border-left: 4px solid #2e7d32; }}
+            .liability {{ background: #fff3e0; border-left: 4px solid #ff9800; }}
+            .equity {{ background: #e3f2fd; border-left: 4px solid #2196f3; }}
+            .revenue {{ background: #f3e5f5; border-left: 4px solid #9c27b0; }}
+            .cogs {{ background: #ffebee; border-left: 4px solid #f44336; }}
+            .expense {{ background: #fff8e1; border-left: 4px solid #ffc107; }}
+            .other {{ background: #f5f5f5; border-left: 4px solid #9e9e9e; }}
+            
+            table {{ width: 100%; border-collapse: collapse; }}
+            th, td {{ padding: 10px; border: 1px solid #ddd; text-align: left; }}
+            th {{ background: #e91e63; color: white; }}
+            .debit {{ color: #2e7d32; text-align: right; }}
+            .kredit {{ color: #c62828; text-align: right; }}
+            .saldo {{ font-weight: bold; text-align: right; }}
+            
+            .badge {{ background: #e91e63; color: white; padding: 2px 8px; border-radius: 10px; font-size: 12px; }}
+            .btn {{ background: #e91e63; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px;">
+                <h1 style="color: #e91e63; margin: 0;">Buku Besar - PINKILANG</h1>
+                <a href="/dashboard" class="btn">Kembali ke Dashboard</a>
+            </div>
+            
+            <div class="header">
+                <p>Laporan lengkap semua transaksi keuangan • Login sebagai: {user_email}</p>
+                <p><strong>Total Transaksi: {len(jurnal_data)}</strong></p>
+            </div>
+            
+            {akun_sections if akun_sections else '<p style="text-align: center; color: #666;">Tidak ada data transaksi</p>'}
+            
+            <div style="text-align: center; margin-top: 30px;">
+                <a href="/dashboard" class="btn">Kembali ke Dashboard</a>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+    return html
+
+# ============================================================
+# 🔹 ROUTE: Buku Besar Pembantu Utang 
+# ============================================================
+def buku_besar_pembantu_utang():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Ambil data utang dari pembelian kredit dan pelunasan
+        utang_data = get_utang_data()
+        
+        # Hitung total utang
+        total_utang = sum(supplier['sisa_utang'] for supplier in utang_data.values())
+        
+        # Format currency helper
+        def rp(amount):
+            return f"Rp {amount:,.0f}".replace(",", ".")
+        
+        # Generate HTML untuk setiap supplier
+        supplier_sections = ""
+        for supplier_name, data in utang_data.items():
+            supplier_sections += generate_supplier_section(supplier_name, data, rp)
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Buku Besar Pembantu Utang - PINKILANG</title>
+            <meta charset="utf-8">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Arial', sans-serif;
+                    background: linear-gradient(135deg, #fff0f5, #ffe6f2);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #ff6666, #ff4d4d);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    font-size: 14px;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                }}
+                
+                .content {{
+                    padding: 25px;
+                }}
+                
+                .summary-card {{
+                    background: linear-gradient(135deg, #ff6666, #ff4d4d);
+                    color: white;
+                    padding: 20px;
+                    border-radius: 10px;
+                    text-align: center;
+                    margin-bottom: 25px;
+                    box-shadow: 0 4px 15px rgba(255,102,102,0.3);
+                }}
+                
+                .summary-number {{
+                    font-size: 32px;
+                    font-weight: bold;
+                    margin: 10px 0;
+                }}
+                
+                .supplier-section {{
+                    background: #f8f9fa;
+                    border-radius: 10px;
+                    padding: 20px;
+                    margin-bottom: 20px;
+                    border-left: 5px solid #ff6666;
+                }}
+                
+                .supplier-header {{
+                    display: flex;
+                    justify-content: space-between;
+                    align-items: center;
+                    margin-bottom: 15px;
+                    padding-bottom: 10px;
+                    border-bottom: 2px solid #e9ecef;
+                }}
+                
+                .supplier-name {{
+                    font-size: 20px;
+                    font-weight: bold;
+                    color: #333;
+                }}
+                
+                .supplier-total {{
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #ff6666;
+                }}
+                
+                table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin-top: 10px;
+                    background: white;
+                    border-radius: 8px;
+                    overflow: hidden;
+                }}
+                
+                th, td {{
+                    padding: 12px;
+                    text-align: left;
+                    border-bottom: 1px solid #dee2e6;
+                }}
+                
+                th {{
+                    background: #ff6666;
+                    color: white;
+                    font-weight: bold;
+                }}
+                
+                tr:hover {{
+                    background: #fff5f5;
+                }}
+                
+                .debit {{
+                    color: #009933;
+                    font-weight: bold;
+                }}
+                
+                .kredit {{
+                    color: #cc0000;
+                    font-weight: bold;
+                }}
+                
+                .saldo {{
+                    font-weight: bold;
+                    color: #cc0000;
+                }}
+                
+                .status-badge {{
+                    padding: 4px 8px;
+                    border-radius: 12px;
+                    font-size: 12px;
+                    font-weight: bold;
+                    color: white;
+                }}
+                
+                .status-lunas {{
+                    background: #00cc66;
+                }}
+                
+                .status-belum {{
+                    background: #ff6666;
+                }}
+                
+                .empty-state {{
+                    text-align: center;
+                    padding: 40px;
+                    color: #999;
+                    font-style: italic;
+                }}
+                
+                .info-box {{
+                    background: #ffe6e6;
+                    border: 1px solid #ffb3b3;
+                    border-radius: 8px;
+                    padding: 15px;
+                    margin: 15px 0;
+                    color: #cc0000;
+                }}
+                
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 20px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    margin: 0 5px;
+                    background: #ff6666;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 5px;
+                    font-size: 14px;
+                }}
+                
+                .btn:hover {{
+                    background: #ff4d4d;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <!-- Header -->
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📋 Buku Besar Pembantu Utang</h1>
+                    <p>Sistem Terintegrasi dengan Pembelian Kredit - PINKILANG</p>
+                </div>
+                    
+                    <!-- Summary Card -->
+                    <div class="summary-card">
+                        <div>💰 Total Utang Usaha</div>
+                        <div class="summary-number">{rp(total_utang)}</div>
+                        <div>{len(utang_data)} Supplier</div>
+                    </div>
+                    
+                    <!-- Supplier Sections -->
+                    {supplier_sections if utang_data else '''
+                    <div class="empty-state">
+                        📊 Tidak ada data utang
+                        <br><br>
+                        <a href="/pembelian" class="btn">🛒 Input Pembelian Kredit</a>
+                    </div>
+                    '''}
+                    
+                    <!-- Action Buttons -->
+                    <div class="action-buttons">
+                        <a href="/pembelian" class="btn">🛒 Ke Modul Pembelian</a>
+                        <a href="/buku-besar" class="btn">📚 Ke Buku Besar</a>
+                        <a href="/neraca-saldo-setelah-penyesuaian" class="btn">🏦 Ke Neraca Saldo Setelah Penyesuaian</a>
+                        <button onclick="window.print()" class="btn">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di buku besar pembantu utang: {str(e)}")
+        return f"Error: {str(e)}"
+
+def get_utang_data():
+    """Ambil data utang dari pembelian kredit dan pelunasan"""
+    utang_data = {}
+    
+    try:
+        # Ambil semua pembelian kredit
+        pembelian_kredit = supabase.table("pembelian").select("*").eq("metode_pembayaran", "KREDIT").execute().data or []
+        pelunasan_per_pembelian = get_pelunasan_per_faktur("utang")
+        
+        for pembelian in pembelian_kredit:
+            supplier_name = pembelian.get('nama_supplier', 'Tidak Diketahui')
+            
+            if supplier_name not in utang_data:
+                utang_data[supplier_name] = {
+                    'transaksi': [],
+                    'total_utang': 0,
+                    'total_pelunasan': 0,
+                    'sisa_utang': 0
+                }
+            
+            # Ambil data pelunasan untuk pembelian ini
+            pelunasan_data = pelunasan_per_pembelian.get(pembelian['id'], [])
+            
+            total_pelunasan = sum(p['jumlah_bayar'] for p in pelunasan_data)
+            sisa_utang = pembelian['total_pembelian'] - total_pelunasan
+            
+            # Simpan transaksi utang
+            transaksi_data = {
+                'tanggal': pembelian['tanggal'],
+                'keterangan': f"Pembelian {pembelian['nama_barang']}",
+                'debit': 0,
+                'kredit': pembelian['total_pembelian'],
+                'saldo': pembelian['total_pembelian'],
+                'type': 'UTANG'
+            }
+            utang_data[supplier_name]['transaksi'].append(transaksi_data)
+            
+            # Simpan pelunasan
+            for pelunasan in pelunasan_data:
+                pelunasan_transaksi = {
+                    'tanggal': pelunasan['tanggal_bayar'],
+                    'keterangan': f"Pelunasan utang",
+                    'debit': pelunasan['jumlah_bayar'],
+                    'kredit': 0,
+                    'saldo': sisa_utang,
+                    'type': 'PELUNASAN'
+                }
+                utang_data[supplier_name]['transaksi'].append(pelunasan_transaksi)
+            
+            # Update totals
+            utang_data[supplier_name]['total_utang'] += pembelian['total_pembelian']
+            utang_data[supplier_name]['total_pelunasan'] += total_pelunasan
+            utang_data[supplier_name]['sisa_utang'] += sisa_utang
+        
+        # Sort transaksi by date untuk setiap supplier
+        for supplier in utang_data.values():
+            supplier['transaksi'] = sorted(supplier['transaksi'], key=lambda x: x['tanggal'])
+            
+            # Hitung saldo running (utang saldo normal kredit)
+            saldo = 0
+            for transaksi in supplier['transaksi']:
+                saldo += transaksi['kredit'] - transaksi['debit']  # Utang bertambah di kredit, berkurang di debit
+                transaksi['saldo'] = saldo
+        
+    except Exception as e:
+        logger.error(f"❌ Error get_utang_data: {str(e)}")
+    
+    return utang_data
+
+def generate_supplier_section(supplier_name, data, rp_func):
+    """Generate HTML section untuk setiap supplier"""
+    
+    transaksi_rows = ""
+    
+    for i, transaksi in enumerate(data['transaksi']):
+        status_badge = '<span class="status-badge status-lunas">LUNAS</span>' if transaksi['saldo'] == 0 else '<span class="status-badge status-belum">BELUM</span>'
+        
+        transaksi_rows += f"""
+        <tr>
+            <td>{datetime.strptime(transaksi['tanggal'], '%Y-%m-%d').strftime('%d/%m/%Y')}</td>
+            <td>{transaksi['keterangan']}</td>
+            <td class="debit">{rp_func(transaksi['debit']) if transaksi['debit'] > 0 else '-'}</td>
+            <td class="kredit">{rp_func(transaksi['kredit']) if transaksi['kredit'] > 0 else '-'}</td>
+            <td class="saldo">{rp_func(transaksi['saldo'])}</td>
+            <td>{status_badge}</td>
+        </tr>
+        """
+    
+    return f"""
+    <div class="supplier-section">
+        <div class="supplier-header">
+            <div class="supplier-name">🏭 {supplier_name}</div>
+            <div class="supplier-total">Sisa: {rp_func(data['sisa_utang'])}</div>
+        </div>
+        
+        <table>
+            <thead>
+                <tr>
+                    <th>Tanggal</th>
+                    <th>Keterangan</th>
+                    <th>Debit (Pelunasan)</th>
+                    <th>Kredit (Utang)</th>
+                    <th>Saldo</th>
+                    <th>Status</th>
+                </tr>
+            </thead>
+            <tbody>
+                {transaksi_rows}
+                <tr style="background: #f8f9fa; font-weight: bold;">
+                    <td colspan="2">TOTAL</td>
+                    <td class="debit">{rp_func(data['total_pelunasan'])}</td>
+                    <td class="kredit">{rp_func(data['total_utang'])}</td>
+                    <td class="saldo">{rp_func(data['sisa_utang'])}</td>
+                    <td>{'<span class="status-badge status-lunas">LUNAS</span>' if data['sisa_utang'] == 0 else '<span class="status-badge status-belum">BELUM LUNAS</span>'}</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """
+
+# ============================================================
+# 🔹 ROUTE: Buku Besar Pembantu Piutang 
+# ============================================================
+def buku_besar_pembantu_piutang():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Ambil data piutang dari penjualan kredit dan pelunasan
+        piutang_data = get_piutang_data()
+        
+        # Hitung total piutang
+        total_piutang = sum(customer['sisa_piutang'] for customer in piutang_data.values())
+        
+        # Format currency helper
+        def rp(amount):
+            return f"Rp {amount:,.0f}".replace(",", ".")
+        
+        # Generate HTML untuk setiap pelanggan
+        customer_sections = ""
+        for customer_name, data in piutang_data.items():
+            customer_sections += generate_customer_section(customer_name, data, rp)
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Buku Besar Pembantu Piutang - PINKILANG</title>
+            <meta charset="utf-8">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Arial', sans-serif;
+                    background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    font-size: 14px;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                }}
+                
+                .content {{
+                    padding: 25px;
+                }}
+                
+                .summary-card {{
+                    background: linear-gradient(135deg, #66b3ff, #4d94ff);
+                    color: white;
+                    padding: 20px;
+                    border-radius: 10px;
+                    text-align: center;
+                    margin-bottom: 25px;
+                    box-shadow: 0 4px 15px rgba(102,179,255,0.3);
+                }}
+                
+                .summary-number {{
+                    font-size: 32px;
+                    font-weight: bold;
+                    margin: 10px 0;
+                }}
+                
+                .customer-section {{
+                    background: #f8f9fa;
+                    border-radius: 10px;
+                    padding: 20px;
+                    margin-bottom: 20px;
+                    border-left: 5px solid #66b3ff;
+                }}
+                
+                .customer-header {{
+                    display: flex;
+                    justify-content: space-between;
+                    align-items: center;
+                    margin-bottom: 15px;
+                    padding-bottom: 10px;
+                    border-bottom: 2px solid #e9ecef;
+                }}
+                
+                .customer-name {{
+                    font-size: 20px;
+                    font-weight: bold;
+                    color: #333;
+                }}
+                
+                .customer-total {{
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #ff6666;
+                }}
+                
+                table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin-top: 10px;
+                    background: white;
+                    border-radius: 8px;
+                    overflow: hidden;
+                }}
+                
+                th, td {{
+                    padding: 12px;
+                    text-align: left;
+                    border-bottom: 1px solid #dee2e6;
+                }}
+                
+                th {{
+                    background: #ff85b3;
+                    color: white;
+                    font-weight: bold;
+                }}
+                
+                tr:hover {{
+                    background: #fff5f9;
+                }}
+                
+                .debit {{
+                    color: #009933;
+                    font-weight: bold;
+                }}
+                
+                .kredit {{
+                    color: #cc0000;
+                    font-weight: bold;
+                }}
+                
+                .saldo {{
+                    font-weight: bold;
+                    color: #0066cc;
+                }}
+                
+                .status-badge {{
+                    padding: 4px 8px;
+                    border-radius: 12px;
+                    font-size: 12px;
+                    font-weight: bold;
+                    color: white;
+                }}
+                
+                .status-lunas {{
+                    background: #00cc66;
+                }}
+                
+                .status-belum {{
+                    background: #ff6666;
+                }}
+                
+                .empty-state {{
+                    text-align: center;
+                    padding: 40px;
+                    color: #999;
+                    font-style: italic;
+                }}
+                
+                .info-box {{
+                    background: #e6f7ff;
+                    border: 1px solid #91d5ff;
+                    border-radius: 8px;
+                    padding: 15px;
+                    margin: 15px 0;
+                    color: #1890ff;
+                }}
+                
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 20px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    margin: 0 5px;
+                    background: #ff66a3;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 5px;
+                    font-size: 14px;
+                }}
+                
+                .btn:hover {{
+                    background: #ff4d94;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <!-- Header -->
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📋 Buku Besar Pembantu Piutang</h1>
+                    <p>Sistem Terintegrasi dengan Penjualan Kredit - PINKILANG</p>
+                </div>
+                    
+                    <!-- Summary Card -->
+                    <div class="summary-card">
+                        <div>💰 Total Piutang Usaha</div>
+                        <div class="summary-number">{rp(total_piutang)}</div>
+                        <div>{len(piutang_data)} Pelanggan</div>
+                    </div>
+                    
+                    <!-- Customer Sections -->
+                    {customer_sections if piutang_data else '''
+                    <div class="empty-state">
+                        📊 Tidak ada data piutang
+                        <br><br>
+                        <a href="/penjualan" class="btn">🛍️ Input Penjualan Kredit</a>
+                    </div>
+                    '''}
+                    
+                    <!-- Action Buttons -->
+                    <div class="action-buttons">
+                        <a href="/penjualan" class="btn">🛍️ Ke Modul Penjualan</a>
+                        <a href="/buku-besar" class="btn">📚 Ke Buku Besar</a>
+                        <a href="/neraca-saldo-setelah-penyesuaian" class="btn">🏦 Ke Neraca Saldo Setelah Penyesuaian</a>
+                        <button onclick="window.print()" class="btn">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+            
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di buku besar pembantu piutang: {str(e)}")
+        return f"Error: {str(e)}"
+
+def get_piutang_data():
+    """Ambil data piutang dari penjualan kredit dan pelunasan"""
+    piutang_data = {}
+    
+    try:
+        # Ambil semua penjualan kredit
+        penjualan_kredit = supabase.table("penjualan").select("*").eq("metode_pembayaran", "KREDIT").execute().data or []
+        pelunasan_per_penjualan = get_pelunasan_per_faktur("piutang")
+        
+        for penjualan in penjualan_kredit:
+            customer_name = penjualan.get('nama_pelanggan', 'Tidak Diketahui')
+            
+            if customer_name not in piutang_data:
+                piutang_data[customer_name] = {
+                    'transaksi': [],
+                    'total_piutang': 0,
+                    'total_pelunasan': 0,
+                    'sisa_piutang': 0
+                }
+            
+            # Ambil data pelunasan untuk penjualan ini
+            pelunasan_data = pelunasan_per_penjualan.get(penjualan['id'], [])
+            
+            total_pelunasan = sum(p['jumlah_bayar'] for p in pelunasan_data)
+            sisa_piutang = penjualan['total_penjualan'] - total_pelunasan
+            
+            # Simpan transaksi
+            transaksi_data = {
+                'tanggal': penjualan['tanggal'],
+                'keterangan': f"Penjualan {penjualan['nama_barang']}",
+                'debit': penjualan['total_penjualan'],
+                'kredit': 0,
+                'saldo': penjualan['total_penjualan'],
+                'type': 'PIUTANG'
+            }
+            piutang_data[customer_name]['transaksi'].append(transaksi_data)
+            
+            # Simpan pelunasan
+            for pelunasan in pelunasan_data:
+                pelunasan_transaksi = {
+                    'tanggal': pelunasan['tanggal_bayar'],
+                    'keterangan': f"Pelunasan piutang",
+                    'debit': 0,
+                    'kredit': pelunasan['jumlah_bayar'],
+                    'saldo': sisa_piutang,
+                    'type': 'PELUNASAN'
+                }
+                piutang_data[customer_name]['transaksi'].append(pelunasan_transaksi)
+            
+            # Update totals
+            piutang_data[customer_name]['total_piutang'] += penjualan['total_penjualan']
+            piutang_data[customer_name]['total_pelunasan'] += total_pelunasan
+            piutang_data[customer_name]['sisa_piutang'] += sisa_piutang
+        
+        # Sort transaksi by date untuk setiap customer
+        for customer in piutang_data.values():
+            customer['transaksi'] = sorted(customer['transaksi'], key=lambda x: x['tanggal'])
+            
+            # Hitung saldo running
+            saldo = 0
+            for transaksi in customer['transaksi']:
+                saldo += transaksi['debit'] - transaksi['kredit']
+                transaksi['saldo'] = saldo
+        
+    except Exception as e:
+        logger.error(f"❌ Error get_piutang_data: {str(e)}")
+    
+    return piutang_data
+
+def generate_customer_section(customer_name, data, rp_func):
+    """Generate HTML section untuk setiap customer"""
+    
+    transaksi_rows = ""
+    saldo_awal = 0
+    
+    for i, transaksi in enumerate(data['transaksi']):
+        status_badge = '<span class="status-badge status-lunas">LUNAS</span>' if transaksi['saldo'] == 0 else '<span class="status-badge status-belum">BELUM</span>'
+        
+        transaksi_rows += f"""
+        <tr>
+            <td>{datetime.strptime(transaksi['tanggal'], '%Y-%m-%d').strftime('%d/%m/%Y')}</td>
+            <td>{transaksi['keterangan']}</td>
+            <td class="debit">{rp_func(transaksi['debit']) if transaksi['debit'] > 0 else '-'}</td>
+            <td class="kredit">{rp_func(transaksi['kredit']) if transaksi['kredit'] > 0 else '-'}</td>
+            <td class="saldo">{rp_func(transaksi['saldo'])}</td>
+            <td>{status_badge}</td>
+        </tr>
+        """
+    
+    return f"""
+    <div class="customer-section">
+        <div class="customer-header">
+            <div class="customer-name">👤 {customer_name}</div>
+            <div class="customer-total">Sisa: {rp_func(data['sisa_piutang'])}</div>
+        </div>
+        
+        <table>
+            <thead>
+                <tr>
+                    <th>Tanggal</th>
+                    <th>Keterangan</th>
+                    <th>Debit (Piutang)</th>
+                    <th>Kredit (Pelunasan)</th>
+                    <th>Saldo</th>
+                    <th>Status</th>
+                </tr>
+            </thead>
+            <tbody>
+                {transaksi_rows}
+                <tr style="background: #f8f9fa; font-weight: bold;">
+                    <td colspan="2">TOTAL</td>
+                    <td class="debit">{rp_func(data['total_piutang'])}</td>
+                    <td class="kredit">{rp_func(data['total_pelunasan'])}</td>
+                    <td class="saldo">{rp_func(data['sisa_piutang'])}</td>
+                    <td>{'<span class="status-badge status-lunas">LUNAS</span>' if data['sisa_piutang'] == 0 else '<span class="status-badge status-belum">BELUM LUNAS</span>'}</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """
@@ -0,0 +1,680 @@
+"""Jurnal penutup"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import CHART_OF_ACCOUNTS, filter_akun_tidak_diinginkan, get_initial_balance_data
+from pinkilang.penyusutan import get_aset_tetap_data
+
+    
+# ============================================================
+# 🔹 ROUTE: Jurnal Penutup (Closing Entries)
+# ============================================================
+def jurnal_penutup():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    current_period = datetime.now().strftime('%Y-%m')
+    
+    try:
+        # 1. AMBIL DATA DARI NERACA LAJUR
+        jurnal_result = supabase.table("jurnal_umum").select("*").order("tanggal").execute()
+        jurnal_data = jurnal_result.data or []
+        nsa_consolidated = get_initial_balance_data()
+        jurnal_data = filter_akun_tidak_diinginkan(jurnal_data)
+        akun_standar = {kode: info['nama'] for kode, info in CHART_OF_ACCOUNTS.items()}
+        
+        # Proses data akun
+        akun_data = {}
+        for akun_nama, nsa_info in nsa_consolidated.items():
+            kode_akun = next((kode for kode, nama in akun_standar.items() if nama.lower() == akun_nama.lower()), akun_nama)
+            akun_data[kode_akun] = {
+                'nama_akun': akun_nama,
+                'kode_akun': kode_akun,
+                'neraca_debit': nsa_info['debit'],
+                'neraca_kredit': nsa_info['kredit'],
+                'penyesuaian_debit': 0,
+                'penyesuaian_kredit': 0,
+                'nssp_debit': 0,
+                'nssp_kredit': 0
+            }
+
+        # Proses jurnal
+        for jurnal in jurnal_data:
+            akun_nama = jurnal.get('nama_akun', 'Unknown')
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            kode_akun = next((kode for kode, nama in akun_standar.items() if nama.lower() == akun_nama.lower()), akun_nama)
+            
+            if kode_akun not in akun_data:
+                 akun_data[kode_akun] = {
+                    'nama_akun': akun_nama,
+                    'kode_akun': kode_akun,
+                    'neraca_debit': 0, 'neraca_kredit': 0,
+                    'penyesuaian_debit': 0, 'penyesuaian_kredit': 0,
+                    'nssp_debit': 0, 'nssp_kredit': 0
+                }
+            
+            if jurnal.get('transaksi_type', '').lower() in ['penyesuaian', 'penyesuaian_manual', 'penyesuaian_aset', 'penyesuaian_otomatis']:
+                akun_data[kode_akun]['penyesuaian_debit'] += debit
+                akun_data[kode_akun]['penyesuaian_kredit'] += kredit
+            else:
+                akun_data[kode_akun]['neraca_debit'] += debit
+                akun_data[kode_akun]['neraca_kredit'] += kredit
+        
+        # Hitung NSSP
+        for kode_akun, data in akun_data.items():
+            data['nssp_debit'] = data['neraca_debit'] + data['penyesuaian_debit']
+            data['nssp_kredit'] = data['neraca_kredit'] + data['penyesuaian_kredit']
+        
+        # 2. IDENTIFIKASI AKUN NOMINAL (Pendapatan & Beban)
+        akun_pendapatan = {}
+        akun_beban = {}
+        akun_hpp = {}
+        akun_pembelian = {}
+        
+        for kode_akun, data in akun_data.items():
+            nama_akun = data['nama_akun'].lower()
+            saldo_nssp = data['nssp_debit'] - data['nssp_kredit']
+            
+            # Akun Pendapatan (saldo normal kredit)
+            if any(keyword in nama_akun for keyword in ['penjualan', 'pendapatan']):
+                if data['nssp_kredit'] > 0:
+                    akun_pendapatan[kode_akun] = data
+            
+            # Akun Beban (saldo normal debit)
+            elif any(keyword in nama_akun for keyword in ['beban', 'biaya']):
+                if data['nssp_debit'] > 0:
+                    akun_beban[kode_akun] = data
+            
+            # HPP (saldo normal debit)
+            elif 'hpp' in nama_akun or 'harga pokok penjualan' in nama_akun:
+                if data['nssp_debit'] > 0:
+                    akun_hpp[kode_akun] = data
+            
+            # Pembelian (saldo normal debit)
+            elif 'pembelian' in nama_akun and 'penjualan' not in nama_akun:
+                if data['nssp_debit'] > 0:
+                    akun_pembelian[kode_akun] = data
+        
+        # 3. HITUNG TOTAL UNTUK JURNAL PENUTUP
+        total_penjualan = sum(data['nssp_kredit'] for data in akun_pendapatan.values())
+        total_hpp = sum(data['nssp_debit'] for data in akun_hpp.values())
+        total_pembelian = sum(data['nssp_debit'] for data in akun_pembelian.values())
+        total_beban = sum(data['nssp_debit'] for data in akun_beban.values())
+        
+        # Hitung beban penyusutan dari aset tetap
+        aset_tetap_data = get_aset_tetap_data(user_email)
+        total_penyusutan = sum(float(aset.get('akumulasi_penyusutan', 0) or 0) for aset in aset_tetap_data)
+        
+        # Hitung laba bersih
+        laba_bersih = total_penjualan - total_hpp - total_pembelian - total_beban - total_penyusutan
+        
+        # 4. AMBIL DATA PRIVE
+        prive_result = supabase.table("prive").select("jumlah").eq("user_email", user_email).execute()
+        prive_data = prive_result.data or []
+        total_prive = sum(float(prive.get('jumlah', 0) or 0) for prive in prive_data)
+        
+        # 5. GENERATE ENTRIES JURNAL PENUTUP
+        entries = []
+        total_debit = 0
+        total_kredit = 0
+        
+        # Entry 1: Menutup Pendapatan ke Ikhtisar L/R
+        if total_penjualan > 0:
+            entries.append({
+                'tanggal': '30',
+                'keterangan': 'Penjualan',
+                'ref': '',
+                'debit': 0,
+                'kredit': total_penjualan,
+                'indent': 0
+            })
+            entries.append({
+                'tanggal': '',
+                'keterangan': 'Ikhtisar L/R',
+                'ref': '',
+                'debit': total_penjualan,
+                'kredit': 0,
+                'indent': 1
+            })
+            entries.append({
+                'tanggal': '',
+                'keterangan': '(Menutup Penjualan)',
+                'ref': '',
+                'debit': 0,
+                'kredit': 0,
+                'indent': 0
+            })
+            entries.append({'empty': True})
+            total_debit += total_penjualan
+            total_kredit += total_penjualan
+        
+        # Entry 2: Menutup HPP, Pembelian, dan Beban ke Ikhtisar L/R
+        total_beban_dan_hpp = total_hpp + total_pembelian + total_beban + total_penyusutan
+        if total_beban_dan_hpp > 0:
+            entries.append({
+                'tanggal': '30',
+                'keterangan': 'Ikhtisar L/R',
+                'ref': '',
+                'debit': total_beban_dan_hpp,
+                'kredit': 0,
+                'indent': 0
+            })
+            
+            # Detail HPP
+            if total_hpp > 0:
+                entries.append({
+                    'tanggal': '',
+                    'keterangan': 'HPP',
+                    'ref': '',
+                    'debit': 0,
+                    'kredit': total_hpp,
+                    'indent': 1
+                })
+            
+            # Detail Pembelian
+            if total_pembelian > 0:
+                entries.append({
+                    'tanggal': '',
+                    'keterangan': 'Pembelian',
+                    'ref': '',
+                    'debit': 0,
+                    'kredit': total_pembelian,
+                    'indent': 1
+                })
+            
+            # Detail Beban
+            for kode_akun, data in akun_beban.items():
+                if data['nssp_debit'] > 0:
+                    entries.append({
+                        'tanggal': '',
+                        'keterangan': data['nama_akun'],
+                        'ref': '',
+                        'debit': 0,
+                        'kredit': data['nssp_debit'],
+                        'indent': 1
+                    })
+            
+            # Detail Beban Penyusutan
+            if total_penyusutan > 0:
+                entries.append({
+                    'tanggal': '',
+                    'keterangan': 'Beban Penyusutan',
+                    'ref': '',
+                    'debit': 0,
+                    'kredit': total_penyusutan,
+                    'indent': 1
+                })
+            
+            entries.append({
+                'tanggal': '',
+                'keterangan': '(Menutup HPP dan Beban)',
+                'ref': '',
+                'debit': 0,
+                'kredit': 0,
+                'indent': 0
+            })
+            entries.append({'empty': True})
+            total_debit += total_beban_dan_hpp
+            total_kredit += total_beban_dan_hpp
+        
+        # Entry 3: Menutup Laba ke Modal
+        if laba_bersih > 0:
+            entries.append({
+                'tanggal': '30',
+                'keterangan': 'Ikhtisar L/R',
+                'ref': '',
+                'debit': laba_bersih,
+                'kredit': 0,
+                'indent': 0
+            })
+            entries.append({
+                'tanggal': '',
+                'keterangan': 'Modal',
+                'ref': '',
+                'debit': 0,
+                'kredit': laba_bersih,
+                'indent': 1
+            })
+            entries.append({
+                'tanggal': '',
+                'keterangan': '(Menutup Laba)',
+                'ref': '',
+                'debit': 0,
+                'kredit': 0,
+                'indent': 0
+            })
+            entries.append({'empty': True})
+            total_debit += laba_bersih
+            total_kredit += laba_bersih
+        
+        # Entry 4: Menutup Prive ke Modal
+        if total_prive > 0:
+            entries.append({
+                'tanggal': '30',
+                'keterangan': 'Modal',
+                'ref': '',
+                'debit': total_prive,
+                'kredit': 0,
+                'indent': 0
+            })
+            entries.append({
+                'tanggal': '',
+                'keterangan': 'Prive',
+                'ref': '',
+                'debit': 0,
+                'kredit': total_prive,
+                'indent': 1
+            })
+            total_debit += total_prive
+            total_kredit += total_prive
+        
+        # 6. FORMAT CURRENCY HELPER
+        def rp(val):
+            try:
+                return f"Rp {int(val):,}".replace(",", ".")
+            except:
+                return "Rp 0"
+        
+        # 7. GENERATE HTML TABLE ROWS
+        entries_html = ""
+        for entry in entries:
+            if 'empty' in entry:
+                entries_html += '<tr><td colspan="5" style="height: 10px;"></td></tr>'
+            else:
+                indent_class = "indent-1" if entry['indent'] == 1 else ""
+                debit_display = rp(entry['debit']) if entry['debit'] > 0 else ""
+                kredit_display = rp(entry['kredit']) if entry['kredit'] > 0 else ""
+                
+                entries_html += f"""
+                <tr>
+                    <td>{entry['tanggal']}</td>
+                    <td class="{indent_class}">{entry['keterangan']}</td>
+                    <td>{entry['ref']}</td>
+                    <td class="number">{debit_display}</td>
+                    <td class="number">{kredit_display}</td>
+                </tr>
+                """
+        
+        # 8. GENERATE SUMMARY INFO
+        summary_html = f"""
+        <div class="summary-info">
+            <div class="summary-item">
+                <div class="summary-value">{rp(total_penjualan)}</div>
+                <div class="summary-label">Total Penjualan</div>
+            </div>
+            <div class="summary-item">
+                <div class="summary-value">{rp(total_beban_dan_hpp)}</div>
+                <div class="summary-label">Total Beban & HPP</div>
+            </div>
+            <div class="summary-item">
+                <div class="summary-value">{rp(laba_bersih)}</div>
+                <div class="summary-label">Laba Bersih</div>
+            </div>
+            <div class="summary-item">
+                <div class="summary-value">{rp(total_prive)}</div>
+                <div class="summary-label">Total Prive</div>
+            </div>
+        </div>
+        """
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Jurnal Penutup - PINKILANG</title>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #fff0f5, #ffe6f2);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 1000px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #ff6ea9, #c4006e);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                    font-weight: 600;
+                }}
+                
+                .company-info {{
+                    font-size: 18px;
+                    margin-bottom: 5px;
+                    font-weight: 500;
+                }}
+                
+                .period-info {{
+                    font-size: 14px;
+                    opacity: 0.9;
+                }}
+                
+                .content {{
+                    padding: 30px;
+                }}
+                
+                .closing-journal {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                    font-size: 14px;
+                }}
+                
+                .closing-journal th {{
+                    background: #f8f9fa;
+                    padding: 12px 8px;
+                    text-align: left;
+                    border: 1px solid #dee2e6;
+                    font-weight: 600;
+                    color: #495057;
+                }}
+                
+                .closing-journal td {{
+                    padding: 10px 8px;
+                    border: 1px solid #dee2e6;
+                    color: #333;
+                }}
+                
+                .closing-journal .indent-1 {{
+                    padding-left: 30px;
+                    font-style: italic;
+                }}
+                
+                .closing-journal .total-row {{
+                    background: #fff3cd;
+                    font-weight: bold;
+                    font-size: 15px;
+                }}
+                
+                .number {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                    font-weight: 500;
+                }}
+                
+                .balance-status {{
+                    text-align: center;
+                    padding: 15px;
+                    margin: 20px 0;
+                    border-radius: 10px;
+                    font-weight: 600;
+                    font-size: 16px;
+                }}
+                
+                .balance-correct {{
+                    background: #d4edda;
+                    color: #155724;
+                    border: 2px solid #c3e6cb;
+                }}
+                
+                .balance-incorrect {{
+                    background: #f8d7da;
+                    color: #721c24;
+                    border: 2px solid #f5c6cb;
+                }}
+                
+                .summary-info {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 15px;
+                    margin: 20px 0;
+                }}
+                
+                .summary-item {{
+                    background: #f8f9fa;
+                    padding: 15px;
+                    border-radius: 8px;
+                    text-align: center;
+                    border-left: 4px solid #c4006e;
+                }}
+                
+                .summary-value {{
+                    font-size: 16px;
+                    font-weight: bold;
+                    color: #c4006e;
+                    margin-bottom: 5px;
+                }}
+                
+                .summary-label {{
+                    font-size: 12px;
+                    color: #666;
+                }}
+                
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                    display: flex;
+                    gap: 10px;
+                    justify-content: center;
+                    flex-wrap: wrap;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 12px 24px;
+                    background: #6c757d;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 6px;
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                    border: none;
+                    cursor: pointer;
+                    font-size: 14px;
+                }}
+                
+                .btn:hover {{
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+                }}
+                
+                .btn-primary {{
+                    background: #c4006e;
+                }}
+                
+                .btn-info {{
+                    background: #17a2b8;
+                }}
+                
+                .btn-success {{
+                    background: #28a745;
+                }}
+                
+                .btn-warning {{
+                    background: #ffc107;
+                    color: #000;
+                }}
+                
+                @media print {{
+                    body {{
+                        background: white;
+                        padding: 0;
+                    }}
+                    .container {{
+                        box-shadow: none;
+                        border-radius: 0;
+                    }}
+                    .action-buttons {{
+                        display: none;
+                    }}
+                    .summary-info {{
+                        display: none;
+                    }}
+                }}
+                
+                @media (max-width: 768px) {{
+                    .container {{
+                        margin: 10px;
+                        border-radius: 10px;
+                    }}
+                    
+                    .content {{
+                        padding: 15px;
+                    }}
+                    
+                    .closing-journal {{
+                        font-size: 12px;
+                    }}
+                    
+                    .closing-journal td,
+                    .closing-journal th {{
+                        padding: 8px 6px;
+                    }}
+                    
+                    .action-buttons {{
+                        flex-direction: column;
+                    }}
+                    
+                    .btn {{
+                        width: 100%;
+                        margin: 2px 0;
+                    }}
+                    
+                    .summary-info {{
+                        grid-template-columns: 1fr;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📒 JURNAL PENUTUP</h1>
+                    <div class="company-info">RUMAH BIBIT MAS ANGGA</div>
+                    <div class="period-info">Periode: {datetime.now().strftime('%B %Y')}</div>
+                    <div class="period-info">Login sebagai: {user_email}</div>
+                </div>
+                
+                <div class="content">
+                    {summary_html}
+                    
+                    <div class="balance-status {'balance-correct' if abs(total_debit - total_kredit) < 0.01 else 'balance-incorrect'}">
+                        {'✅ JURNAL PENUTUP SEIMBANG' if abs(total_debit - total_kredit) < 0.01 else '❌ JURNAL PENUTUP TIDAK SEIMBANG'}
+                        <br>
+                        <small>Total Debit: {rp(total_debit)} | Total Kredit: {rp(total_kredit)}</small>
+                    </div>
+                    
+                    <table class="closing-journal">
+                        <thead>
+                            <tr>
+                                <th width="60">TGL</th>
+                                <th>KETERANGAN</th>
+                                <th width="80">REF</th>
+                                <th width="150">DEBIT</th>
+                                <th width="150">KREDIT</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            {entries_html if entries_html else """
+                            <tr>
+                                <td colspan="5" style="text-align: center; padding: 40px; color: #666;">
+                                    <h3>📒 Belum ada data untuk jurnal penutup</h3>
+                                    <p>Pastikan sudah ada transaksi pendapatan dan beban pada periode ini.</p>
+                                </td>
+                            </tr>
+                            """}
+                            
+                            <!-- TOTAL ROW -->
+                            <tr class="total-row">
+                                <td colspan="3"><strong>TOTAL</strong></td>
+                                <td class="number"><strong>{rp(total_debit)}</strong></td>
+                                <td class="number"><strong>{rp(total_kredit)}</strong></td>
+                            </tr>
+                        </tbody>
+                    </table>
+                    
+                    <div class="action-buttons">
+                        <a href="/dashboard" class="btn btn-primary">🏠 Dashboard</a>
+                        <a href="/neraca-lajur" class="btn btn-info">📊 Neraca Lajur</a>
+                        <a href="/laporan-laba-rugi" class="btn btn-success">📈 Laporan Laba Rugi</a>
+                        <a href="/laporan-posisi-keuangan" class="btn btn-warning">💰 Neraca</a>
+                        <button onclick="window.print()" class="btn" style="background: #17a2b8;">🖨️ Cetak Jurnal</button>
+                    </div>
+                </div>
+            </div>
+            
+            <script>
+                document.addEventListener('DOMContentLoaded', function() {{
+                    // Add animation
+                    const rows = document.querySelectorAll('.closing-journal tbody tr');
+                    rows.forEach((row, index) => {{
+                        row.style.opacity = '0';
+                        row.style.transform = 'translateX(20px)';
+                        setTimeout(() => {{
+                            row.style.transition = 'all 0.3s ease';
+                            row.style.opacity = '1';
+                            row.style.transform = 'translateX(0)';
+                        }}, index * 30);
+                    }});
+                }});
+            </script>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di Jurnal Penutup: {str(e)}")
+        import traceback
+        error_details = traceback.format_exc()
+        
+        return f"""
+        <html>
+        <body style="font-family: Arial; padding: 20px; background: #f8f9fa;">
+            <div style="max-width: 600px; margin: 50px auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center;">
+                <h1 style="color: #dc3545; margin-bottom: 20px;">❌ Error Jurnal Penutup</h1>
+                <p style="color: #666; margin-bottom: 20px;">Terjadi kesalahan saat memproses data:</p>
+                <p style="background: #f8d7da; color: #721c24; padding: 15px; border-radius: 5px; font-family: monospace; font-size: 12px; text-align: left; overflow-x: auto;">
+                    {str(e)}
+                </p>
+                <a href="/dashboard" style="display: inline-block; margin-top: 20px; padding: 10px 20px; background: #c4006e; color: white; text-decoration: none; border-radius: 5px;">← Kembali ke Dashboard</a>
+            </div>
+        </body>
+        </html>
+        """
@@ -0,0 +1,644 @@
+"""Jurnal penyesuaian: input manual, penyusutan aset dan job akhir bulan"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, format_currency
+from pinkilang.akuntansi import get_kode_akun, get_kode_akumulasi_penyusutan
+from pinkilang.penyusutan import get_aset_tetap_data
+from pinkilang.penyesuaian import periode_sebelumnya, jalankan_penyesuaian_bulanan
+
+# ============================================================
+# 🔹 ROUTE: Jurnal Penyesuaian 
+# ============================================================
+def jurnal_penyesuaian():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get('user_email')
+    message = ""
+    
+    # Handle form submission untuk penyesuaian manual
+    if request.method == "POST" and 'add_penyesuaian' in request.form:
+        message = process_penyesuaian_manual(user_email)
+    
+    # Handle form submission untuk penyesuaian aset
+    if request.method == "POST" and 'penyesuaian_aset' in request.form:
+        message = process_penyesuaian_aset(user_email)
+
+    # Handle generate otomatis (job yang sama dengan CLI penyesuaian-bulanan, hanya untuk user ini)
+    if request.method == "POST" and 'generate_penyesuaian' in request.form:
+        message = process_penyesuaian_bulanan(user_email, request.form.get("periode") or None)
+    
+    # Ambil data jurnal penyesuaian
+    jurnal_data = get_jurnal_penyesuaian_data()
+    
+    # Ambil data aset tetap untuk form penyesuaian
+    aset_tetap_data = get_aset_tetap_data()
+    
+    # Hitung totals
+    total_debit = sum(j.get("debit", 0) for j in jurnal_data)
+    total_kredit = sum(j.get("kredit", 0) for j in jurnal_data)
+    
+    return generate_jurnal_penyesuaian_html(
+        user_email, message, jurnal_data, aset_tetap_data, 
+        total_debit, total_kredit
+    )
+
+def process_penyesuaian_manual(user_email):
+    """Process penyesuaian manual dari form"""
+    try:
+        tanggal = request.form["tanggal"]
+        akun_debit = request.form["akun_debit"]
+        akun_kredit = request.form["akun_kredit"]
+        jumlah = int(request.form["jumlah"])
+        keterangan = request.form["keterangan"]
+        
+        if jumlah <= 0:
+            return '<div class="message error">❌ Jumlah penyesuaian harus lebih dari 0!</div>'
+        
+        # Buat entri jurnal penyesuaian
+        jurnal_entries = [
+            {
+                "tanggal": tanggal,
+                "nama_akun": akun_debit,
+                "ref": get_kode_akun(akun_debit),
+                "debit": jumlah,
+                "kredit": 0,
+                "deskripsi": f"Penyesuaian: {keterangan}",
+                "transaksi_type": "PENYESUAIAN_MANUAL",
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            },
+            {
+                "tanggal": tanggal,
+                "nama_akun": akun_kredit,
+                "ref": get_kode_akun(akun_kredit),
+                "debit": 0,
+                "kredit": jumlah,
+                "deskripsi": f"Penyesuaian: {keterangan}",
+                "transaksi_type": "PENYESUAIAN_MANUAL",
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            }
+        ]
+        
+        # Simpan ke database
+        success_count = 0
+        for entry in jurnal_entries:
+            try:
+                result = supabase.table("jurnal_umum").insert(entry).execute()
+                if result.data:
+                    success_count += 1
+            except Exception as e:
+                logger.error(f"Error insert jurnal penyesuaian: {str(e)}")
+        
+        if success_count == len(jurnal_entries):
+            return f'<div class="message success">✅ Penyesuaian manual berhasil dicatat!</div>'
+        else:
+            return f'<div class="message error">❌ Sebagian jurnal gagal disimpan ({success_count}/{len(jurnal_entries)})</div>'
+            
+    except Exception as e:
+        logger.error(f"❌ Error proses penyesuaian manual: {str(e)}")
+        return f'<div class="message error">❌ Error: {str(e)}</div>'
+
+def process_penyesuaian_aset(user_email):
+    """Process penyesuaian untuk penyusutan aset tetap"""
+    try:
+        tanggal = request.form["tanggal_aset"]
+        aset_id = request.form["aset_id"]
+        periode_bulan = int(request.form["periode_bulan"])
+        
+        # Ambil data aset
+        aset_result = supabase.table("aset_tetap").select("*").eq("id", aset_id).execute()
+        if not aset_result.data:
+            return '<div class="message error">❌ Data aset tidak ditemukan!</div>'
+        
+        aset = aset_result.data[0]
+        
+        # Hitung penyusutan untuk periode tertentu
+        penyusutan_per_bulan = aset['penyusutan_tahunan'] / 12
+        total_penyusutan = penyusutan_per_bulan * periode_bulan
+        
+        # Cek apakah penyusutan melebihi nilai perolehan
+        if total_penyusutan > aset['nilai_buku']:
+            total_penyusutan = aset['nilai_buku']  # Jangan melebihi nilai buku
+        
+        if total_penyusutan <= 0:
+            return '<div class="message error">❌ Tidak ada penyusutan yang perlu dicatat!</div>'
+        
+        # Buat jurnal penyesuaian penyusutan
+        jurnal_entries = [
+            {
+                "tanggal": tanggal,
+                "nama_akun": "Beban Penyusutan",
+                "ref": "6130",
+                "debit": total_penyusutan,
+                "kredit": 0,
+                "deskripsi": f"Penyusutan {aset['nama_aset']} ({periode_bulan} bulan)",
+                "transaksi_type": "PENYESUAIAN_ASET",
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            },
+            {
+                "tanggal": tanggal,
+                "nama_akun": "Akumulasi Penyusutan",
+                "ref": get_kode_akumulasi_penyusutan(aset['jenis_aset']),
+                "debit": 0,
+                "kredit": total_penyusutan,
+                "deskripsi": f"Akumulasi penyusutan {aset['nama_aset']}",
+                "transaksi_type": "PENYESUAIAN_ASET",
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            }
+        ]
+        
+        # Simpan jurnal
+        success_count = 0
+        for entry in jurnal_entries:
+            try:
+                result = supabase.table("jurnal_umum").insert(entry).execute()
+                if result.data:
+                    success_count += 1
+            except Exception as e:
+                logger.error(f"Error insert jurnal penyusutan: {str(e)}")
+        
+        # Update data aset
+        if success_count == len(jurnal_entries):
+            akumulasi_baru = aset['akumulasi_penyusutan'] + total_penyusutan
+            nilai_buku_baru = aset['nilai_perolehan'] - akumulasi_baru
+            
+            update_data = {
+                "akumulasi_penyusutan": akumulasi_baru,
+                "nilai_buku": nilai_buku_baru,
+                "updated_at": datetime.now().isoformat()
+            }
+            
+            supabase.table("aset_tetap").update(update_data).eq("id", aset_id).execute()
+            
+            logger.info(f"✅ Penyesuaian penyusutan aset {aset['nama_aset']}: {total_penyusutan}")
+            return f'<div class="message success">✅ Penyesuaian penyusutan berhasil! Nilai: {format_currency(total_penyusutan)}</div>'
+        else:
+            return f'<div class="message error">❌ Sebagian jurnal gagal disimpan</div>'
+            
+    except Exception as e:
+        logger.error(f"❌ Error proses penyesuaian aset: {str(e)}")
+        return f'<div class="message error">❌ Error: {str(e)}</div>'
+
+def process_penyesuaian_bulanan(user_email, periode=None):
+    """Tombol 'Generate Penyesuaian Otomatis' - jalankan job untuk user yang login"""
+    try:
+        periode = periode or periode_sebelumnya()
+        hasil = jalankan_penyesuaian_bulanan(periode, [user_email]).get(user_email, {})
+        status = hasil.get('status')
+
+        if status == 'posted':
+            return f'<div class="message success">✅ Penyesuaian periode {periode} diposting: {hasil["entri"]} entri, penyusutan {format_currency(hasil["total_penyusutan"])}</div>'
+        if status == 'sudah':
+            return f'<div class="message info">ℹ Penyesuaian periode {periode} sudah pernah diposting</div>'
+        if status == 'gagal':
+            return f'<div class="message error">❌ Gagal posting penyesuaian: {hasil.get("error")}</div>'
+        return '<div class="message info">ℹ Tidak ada penyesuaian yang diperlukan</div>'
+
+    except Exception as e:
+        logger.error(f"❌ Error generate penyesuaian otomatis: {str(e)}")
+        return f'<div class="message error">❌ Error: {str(e)}</div>'
+
+def get_jurnal_penyesuaian_data():
+    """Ambil data jurnal penyesuaian"""
+    try:
+        result = supabase.table("jurnal_umum")\
+            .select("*")\
+            .in_("transaksi_type", ["PENYESUAIAN_MANUAL", "PENYESUAIAN_ASET", "PENYESUAIAN_OTOMATIS"])\
+            .order("tanggal", desc=True)\
+            .execute()
+        return result.data or []
+    except Exception as e:
+        logger.error(f"Error ambil data penyesuaian: {str(e)}")
+        return []
+
+def generate_jurnal_penyesuaian_html(user_email, message, jurnal_data, aset_tetap_data, total_debit, total_kredit):
+    """Generate HTML untuk halaman jurnal penyesuaian"""
+    
+    def format_currency(amount):
+        return f"Rp {amount:,.0f}".replace(",", ".")
+    
+    # Generate table rows
+    rows_html = ""
+    if jurnal_data:
+        for jurnal in jurnal_data:
+            rows_html += f"""
+            <tr>
+                <td>{jurnal['tanggal']}</td>
+                <td>{jurnal['nama_akun']}</td>
+                <td>{jurnal.get('deskripsi', '')}</td>
+                <td class="number {'debit' if jurnal['debit'] > 0 else ''}">
+                    {format_currency(jurnal['debit']) if jurnal['debit'] > 0 else '-'}
+                </td>
+                <td class="number {'kredit' if jurnal['kredit'] > 0 else ''}">
+                    {format_currency(jurnal['kredit']) if jurnal['kredit'] > 0 else '-'}
+                </td>
+                <td>
+                    <span class="badge {jurnal['transaksi_type'].lower()}">
+                        {jurnal['transaksi_type'].replace('_', ' ').title()}
+                    </span>
+                </td>
+            </tr>
+            """
+    else:
+        rows_html = """
+        <tr>
+            <td colspan="6" class="empty-state">
+                📊 Belum ada jurnal penyesuaian
+            </td>
+        </tr>
+        """
+    
+    # Generate options untuk aset tetap
+    aset_options = ""
+    for aset in aset_tetap_data:
+        aset_options += f"""
+        <option value="{aset['id']}">
+            {aset['nama_aset']} - {format_currency(aset['nilai_buku'])} (Penyusutan: {format_currency(aset['penyusutan_tahunan'])}/tahun)
+        </option>
+        """
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Jurnal Penyesuaian - PINKILANG</title>
+        <meta charset="utf-8">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                padding: 20px;
+                min-height: 100vh;
+            }}
+            
+            .container {{
+                max-width: 1400px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 15px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                padding: 25px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 8px;
+                margin-bottom: 15px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 28px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 25px;
+            }}
+            
+            .section {{
+                margin: 25px 0;
+                padding: 20px;
+                background: #fff5f9;
+                border-radius: 12px;
+                border-left: 5px solid #ff85b3;
+            }}
+            
+            .section-title {{
+                color: #ff66a3;
+                font-size: 22px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #ffe6f2;
+            }}
+            
+            .form-grid {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 20px;
+                margin-bottom: 20px;
+            }}
+            
+            .form-group {{
+                margin-bottom: 15px;
+            }}
+            
+            label {{
+                display: block;
+                margin-bottom: 5px;
+                color: #d63384;
+                font-weight: bold;
+            }}
+            
+            input, select, textarea {{
+                width: 100%;
+                padding: 10px;
+                border: 2px solid #ffd1e6;
+                border-radius: 8px;
+                font-size: 14px;
+            }}
+            
+            .btn {{
+                padding: 12px 25px;
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                border: none;
+                border-radius: 8px;
+                cursor: pointer;
+                font-size: 16px;
+                margin: 5px;
+            }}
+            
+            .btn:hover {{
+                background: linear-gradient(135deg, #ff66a3, #ff4d94);
+            }}
+            
+            .btn-secondary {{
+                background: linear-gradient(135deg, #66b3ff, #4d94ff);
+            }}
+            
+            .btn-success {{
+                background: linear-gradient(135deg, #00cc66, #00b359);
+            }}
+            
+            table {{
+                width: 100%;
+                border-collapse: collapse;
+                margin-top: 15px;
+                background: white;
+                border-radius: 8px;
+                overflow: hidden;
+            }}
+            
+            th, td {{
+                padding: 12px;
+                text-align: left;
+                border-bottom: 1px solid #ffe6f2;
+            }}
+            
+            th {{
+                background: #ff85b3;
+                color: white;
+                font-weight: bold;
+            }}
+            
+            .number {{
+                text-align: right;
+                font-family: 'Courier New', monospace;
+            }}
+            
+            .debit {{
+                color: #009933;
+                font-weight: bold;
+            }}
+            
+            .kredit {{
+                color: #cc0000;
+                font-weight: bold;
+            }}
+            
+            .badge {{
+                padding: 4px 8px;
+                border-radius: 12px;
+                font-size: 11px;
+                font-weight: bold;
+                color: white;
+            }}
+            
+            .badge.penyesuaian_manual {{ background: #66b3ff; }}
+            .badge.penyesuaian_aset {{ background: #00cc66; }}
+            .badge.penyesuaian_otomatis {{ background: #ff9966; }}
+            
+            .total-row {{
+                background: #ffe6f2;
+                font-weight: bold;
+            }}
+            
+            .info-box {{
+                background: #e6f7ff;
+                border: 1px solid #91d5ff;
+                border-radius: 8px;
+                padding: 15px;
+                margin: 15px 0;
+                color: #0066cc;
+            }}
+            
+            .message {{
+                padding: 15px;
+                margin: 15px 0;
+                border-radius: 8px;
+            }}
+            
+            .success {{
+                background: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }}
+            
+            .error {{
+                background: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }}
+            
+            .empty-state {{
+                text-align: center;
+                padding: 40px;
+                color: #999;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <!-- Header -->
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>🔄 Jurnal Penyesuaian</h1>
+                <p>Terintegrasi dengan Modul Aset - PINKILANG</p>
+            </div>
+            
+            <!-- Content -->
+            <div class="content">
+                {message}
+                
+                <!-- Form Penyesuaian Manual -->
+                <div class="section">
+                    <h2 class="section-title">📝 Penyesuaian Manual</h2>
+                    
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal">📅 Tanggal Penyesuaian:</label>
+                                <input type="date" id="tanggal" name="tanggal" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="akun_debit">💚 Akun Debit:</label>
+                                <select id="akun_debit" name="akun_debit" required>
+                                    <option value="">Pilih Akun Debit</option>
+                                    <option value="Beban Penyusutan">Beban Penyusutan</option>
+                                    <option value="Beban Perlengkapan">Beban Perlengkapan</option>
+                                    <option value="HPP">HPP</option>
+                                    <option value="Persediaan Barang Dagang">Persediaan Barang Dagang</option>
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="akun_kredit">❤ Akun Kredit:</label>
+                                <select id="akun_kredit" name="akun_kredit" required>
+                                    <option value="">Pilih Akun Kredit</option>
+                                    <option value="Akumulasi Penyusutan">Akumulasi Penyusutan</option>
+                                    <option value="Perlengkapan">Perlengkapan</option>
+                                    <option value="Persediaan Barang Dagang">Persediaan Barang Dagang</option>
+                                    <option value="Pembelian">Pembelian</option>
+                                    <option value="HPP">HPP</option>
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="jumlah">💰 Jumlah Penyesuaian (Rp):</label>
+                                <input type="number" id="jumlah" name="jumlah" 
+                                       placeholder="0" step="1" min="1" required>
+                            </div>
+                            <div class="form-group" style="grid-column: span 2;">
+                                <label for="keterangan">📋 Keterangan Penyesuaian:</label>
+                                <textarea id="keterangan" name="keterangan" 
+                                          placeholder="Jelaskan alasan penyesuaian..." required></textarea>
+                            </div>
+                        </div>
+                        <button type="submit" name="add_penyesuaian" class="btn">💾 Simpan Penyesuaian Manual</button>
+                    </form>
+                </div>
+                
+                <!-- Form Penyesuaian Aset -->
+                <div class="section">
+                    <h2 class="section-title">🏢 Penyesuaian Penyusutan Aset</h2>
+                    
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal_aset">📅 Tanggal Penyesuaian:</label>
+                                <input type="date" id="tanggal_aset" name="tanggal_aset" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="aset_id">🏗 Pilih Aset Tetap:</label>
+                                <select id="aset_id" name="aset_id" required>
+                                    <option value="">Pilih Aset Tetap</option>
+                                    {aset_options if aset_tetap_data else '<option value="">Tidak ada data aset</option>'}
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="periode_bulan">⏰ Periode Penyusutan (bulan):</label>
+                                <input type="number" id="periode_bulan" name="periode_bulan" 
+                                       value="1" min="1" max="12" required>
+                            </div>
+                        </div>
+                        <button type="submit" name="penyesuaian_aset" class="btn btn-success" 
+                                {"disabled" if not aset_tetap_data else ""}>
+                            📊 Hitung & Simpan Penyusutan
+                        </button>
+                    </form>
+                </div>
+                
+                <!-- Generate Otomatis -->
+                <div class="section" style="text-align: center;">
+                    <h2 class="section-title">⚡ Penyesuaian Otomatis</h2>
+                    <p>Generate penyesuaian penyusutan & akrual berulang untuk satu periode (default: bulan lalu).
+                    Job yang sama berjalan terjadwal lewat <code>flask --app pinky2 penyesuaian-bulanan</code>.</p>
+                    
+                    <form method="POST">
+                        <input type="month" name="periode" value="{periode_sebelumnya()}">
+                        <button type="submit" name="generate_penyesuaian" class="btn btn-secondary">
+                            🔄 Generate Penyesuaian Otomatis
+                        </button>
+                    </form>
+                </div>
+                
+                <!-- Daftar Jurnal Penyesuaian -->
+                <div class="section">
+                    <h2 class="section-title">📋 Daftar Jurnal Penyesuaian</h2>
+                    
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Tanggal</th>
+                                <th>Akun</th>
+                                <th>Keterangan</th>
+                                <th>Debit</th>
+                                <th>Kredit</th>
+                                <th>Jenis</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            {rows_html}
+                            <tr class="total-row">
+                                <td colspan="3"><strong>TOTAL</strong></td>
+                                <td class="number debit"><strong>{format_currency(total_debit)}</strong></td>
+                                <td class="number kredit"><strong>{format_currency(total_kredit)}</strong></td>
+                                <td></td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+                
+                <!-- Action Buttons -->
+                <div style="text-align: center; margin-top: 30px;">
+                    <a href="/aset-tetap" class="btn btn-secondary">🏢 Kelola Aset Tetap</a>
+                    <a href="/jurnal-umum" class="btn">📝 Lihat Jurnal Umum</a>
+                    <a href="/neraca-saldo-setelah-penyesuaian" class="btn btn-success">🏦 Lihat NSSP</a>
+                    <button onclick="window.print()" class="btn">🖨 Cetak Laporan</button>
+                </div>
+            </div>
+        </div>
+
+    </body>
+    </html>
+    """
+    return html
+
+def hitung_penyusutan_otomatis():
+    """Hitung total penyusutan yang perlu disesuaikan"""
+    try:
+        aset_data = get_aset_tetap_data()
+        total_penyusutan = 0
+        
+        # akumulasi_penyusutan = hasil engine per hari ini, *_tercatat = yang sudah dijurnal
+        for aset in aset_data:
+            penyusutan_belum = float(aset.get('akumulasi_penyusutan') or 0) - float(aset.get('akumulasi_penyusutan_tercatat') or 0)
+            if penyusutan_belum > 0:
+                total_penyusutan += penyusutan_belum
+        
+        return total_penyusutan
+    except Exception as e:
+        logger.error(f"Error hitung penyusutan otomatis: {str(e)}")
+        return 0
+
+# ============================================================
+# 🔹 ROUTE: Generate Penyesuaian Otomatis
+# ============================================================
+def generate_penyesuaian_otomatis():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get('user_email')
+    return redirect("/jurnal-penyesuaian")
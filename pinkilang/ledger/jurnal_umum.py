@@ -0,0 +1,730 @@
+"""Jurnal umum dan generate jurnal dari semua transaksi"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, JURNAL_IDEMPOTEN
+from pinkilang.akuntansi import create_journal_entries, buat_entri_jurnal, posting_jurnal, UKURAN_BATCH_JURNAL
+
+# ============================================================
+# 🎀 ROUTE: Generate Jurnal Otomatis - PINK THEME
+# ============================================================
+
+def generate_jurnal_otomatis():
+    """Generate jurnal dari SEMUA transaksi - PINK THEME"""
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    success_count = 0
+    total_processed = 0
+    error_messages = []
+    antrean = []   # JURNAL_IDEMPOTEN: baris jurnal semua dokumen, disimpan per batch di akhir
+    
+    def posting(transaksi_type, journal_data):
+        """Posting langsung, atau antrekan kalau idempoten (tanpa cek jurnal yang sudah ada)"""
+        if not JURNAL_IDEMPOTEN:
+            return create_journal_entries(transaksi_type, journal_data, user_email)
+        entries = buat_entri_jurnal(transaksi_type, journal_data, user_email)
+        antrean.extend(entries)
+        return bool(entries)
+    
+    try:
+        logger.info(f"🎀 Memulai generate jurnal otomatis oleh {user_email}")
+        
+        # 🎯 1. GENERATE DARI PENJUALAN
+        try:
+            result = supabase.table("penjualan").select("*").execute()
+            penjualan_data = result.data if result else []
+            logger.info(f"📊 Found {len(penjualan_data)} penjualan records")
+            
+            for penjualan in penjualan_data:
+                total_processed += 1
+                penjualan_id = str(penjualan.get('id', ''))
+                
+                # Cek apakah sudah ada jurnal (posting idempoten tidak perlu: duplikat diabaikan database)
+                existing = None if JURNAL_IDEMPOTEN else supabase.table("jurnal_umum").select("*").eq("transaksi_id", penjualan_id).eq("transaksi_type", "PENJUALAN").execute()
+                
+                if not (existing and existing.data):  
+                    # Buat data jurnal
+                    journal_data = {
+                        'tanggal': penjualan.get('tanggal', datetime.now().strftime('%Y-%m-%d')),
+                        'nama_barang': penjualan.get('nama_barang', 'Produk'),
+                        'jumlah': penjualan.get('jumlah', 0),
+                        'total_penjualan': float(penjualan.get('total_penjualan', 0)),
+                        'hpp': float(penjualan.get('hpp', 0)),
+                        'metode_pembayaran': penjualan.get('metode_pembayaran', 'CASH'),
+                        'nama_pelanggan': penjualan.get('nama_pelanggan', 'Pelanggan'),
+                        'transaksi_id': penjualan_id
+                    }
+                    
+                    if posting("PENJUALAN", journal_data):
+                        success_count += 1
+                        logger.info(f"✅ Jurnal dibuat untuk penjualan ID: {penjualan_id}")
+                    else:
+                        error_msg = f"Gagal buat jurnal untuk penjualan ID: {penjualan_id}"
+                        error_messages.append(error_msg)
+                        logger.error(f"❌ {error_msg}")
+                else:
+                    logger.info(f"⏭️ Penjualan ID {penjualan_id} sudah memiliki jurnal")
+        except Exception as e:
+            error_msg = f"Error proses penjualan: {str(e)}"
+            error_messages.append(error_msg)
+            logger.error(f"❌ {error_msg}")
+        
+        # 🎯 2. GENERATE DARI PEMBELIAN
+        try:
+            result = supabase.table("pembelian").select("*").execute()
+            pembelian_data = result.data if result else []
+            logger.info(f"📊 Found {len(pembelian_data)} pembelian records")
+            
+            for pembelian in pembelian_data:
+                total_processed += 1
+                pembelian_id = str(pembelian.get('id', ''))
+                
+                existing = None if JURNAL_IDEMPOTEN else supabase.table("jurnal_umum").select("*").eq("transaksi_id", pembelian_id).eq("transaksi_type", "PEMBELIAN").execute()
+                
+                if not (existing and existing.data):
+                    journal_data = {
+                        'tanggal': pembelian.get('tanggal', datetime.now().strftime('%Y-%m-%d')),
+                        'nama_barang': pembelian.get('nama_barang', 'Barang'),
+                        'jumlah': pembelian.get('jumlah', 0),
+                        'total_pembelian': float(pembelian.get('total_pembelian', 0)),
+                        'metode_pembayaran': pembelian.get('metode_pembayaran', 'CASH'),
+                        'nama_supplier': pembelian.get('nama_supplier', 'Supplier'),
+                        'transaksi_id': pembelian_id
+                    }
+                    
+                    if posting("PEMBELIAN", journal_data):
+                        success_count += 1
+                        logger.info(f"✅ Jurnal dibuat untuk pembelian ID: {pembelian_id}")
+                    else:
+                        error_msg = f"Gagal buat jurnal untuk pembelian ID: {pembelian_id}"
+                        error_messages.append(error_msg)
+                        logger.error(f"❌ {error_msg}")
+                else:
+                    logger.info(f"⏭️ Pembelian ID {pembelian_id} sudah memiliki jurnal")
+        except Exception as e:
+            error_msg = f"Error proses pembelian: {str(e)}"
+            error_messages.append(error_msg)
+            logger.error(f"❌ {error_msg}")
+        
+        # 🎯 3. GENERATE DARI OPERASIONAL
+        try:
+            result = supabase.table("operasional").select("*").execute()
+            operasional_data = result.data if result else []
+            logger.info(f"📊 Found {len(operasional_data)} operasional records")
+            
+            for operasional in operasional_data:
+                total_processed += 1
+                operasional_id = str(operasional.get('id', ''))
+                
+                existing = None if JURNAL_IDEMPOTEN else supabase.table("jurnal_umum").select("*").eq("transaksi_id", operasional_id).eq("transaksi_type", "OPERASIONAL").execute()
+                
+                if not (existing and existing.data):
+                    journal_data = {
+                        'tanggal': operasional.get('tanggal', datetime.now().strftime('%Y-%m-%d')),
+                        'jenis_pengeluaran': operasional.get('jenis_pengeluaran', 'LAINNYA'),
+                        'nama_barang': operasional.get('nama_barang', 'Pengeluaran'),
+                        'total_pengeluaran': float(operasional.get('total_pengeluaran', 0)),
+                        'metode_pembayaran': operasional.get('metode_pembayaran', 'CASH'),
+                        'supplier': operasional.get('supplier', 'Supplier'),
+                        'transaksi_id': operasional_id
+                    }
+                    
+                    if posting("OPERASIONAL", journal_data):
+                        success_count += 1
+                        logger.info(f"✅ Jurnal dibuat untuk operasional ID: {operasional_id}")
+                    else:
+                        error_msg = f"Gagal buat jurnal untuk operasional ID: {operasional_id}"
+                        error_messages.append(error_msg)
+                        logger.error(f"❌ {error_msg}")
+                else:
+                    logger.info(f"⏭️ Operasional ID {operasional_id} sudah memiliki jurnal")
+        except Exception as e:
+            error_msg = f"Error proses operasional: {str(e)}"
+            error_messages.append(error_msg)
+            logger.error(f"❌ {error_msg}")
+        
+        # 🎯 4. GENERATE DARI PRIVE
+        try:
+            result = supabase.table("prive").select("*").execute()
+            prive_data = result.data if result else []
+            logger.info(f"📊 Found {len(prive_data)} prive records")
+            
+            for prive in prive_data:
+                total_processed += 1
+                prive_id = str(prive.get('id', ''))
+                
+                existing = None if JURNAL_IDEMPOTEN else supabase.table("jurnal_umum").select("*").eq("transaksi_id", prive_id).eq("transaksi_type", "PRIVE").execute()
+                
+                if not (existing and existing.data):
+                    journal_data = {
+                        'tanggal': prive.get('tanggal', datetime.now().strftime('%Y-%m-%d')),
+                        'jumlah': float(prive.get('jumlah', 0)),
+                        'keterangan': prive.get('keterangan', 'Pengambilan prive'),
+                        'metode_pembayaran': prive.get('metode_pembayaran', 'CASH'),
+                        'transaksi_id': prive_id
+                    }
+                    
+                    if posting("PRIVE", journal_data):
+                        success_count += 1
+                        logger.info(f"✅ Jurnal dibuat untuk prive ID: {prive_id}")
+                    else:
+                        error_msg = f"Gagal buat jurnal untuk prive ID: {prive_id}"
+                        error_messages.append(error_msg)
+                        logger.error(f"❌ {error_msg}")
+                else:
+                    logger.info(f"⏭️ Prive ID {prive_id} sudah memiliki jurnal")
+        except Exception as e:
+            error_msg = f"Error proses prive: {str(e)}"
+            error_messages.append(error_msg)
+            logger.error(f"❌ {error_msg}")
+        
+        # 🎯 5. GENERATE DARI MODAL
+        try:
+            result = supabase.table("modal").select("*").eq("tipe", "TAMBAHAN_MODAL").execute()
+            modal_data = result.data if result else []
+            logger.info(f"📊 Found {len(modal_data)} modal records")
+            
+            for modal in modal_data:
+                total_processed += 1
+                modal_id = str(modal.get('id', ''))
+                
+                existing = None if JURNAL_IDEMPOTEN else supabase.table("jurnal_umum").select("*").eq("transaksi_id", modal_id).eq("transaksi_type", "TAMBAHAN_MODAL").execute()
+                
+                if not (existing and existing.data):
+                    journal_data = {
+                        'tanggal': modal.get('tanggal', datetime.now().strftime('%Y-%m-%d')),
+                        'jumlah': float(modal.get('jumlah', 0)),
+                        'keterangan': modal.get('keterangan', 'Tambahan modal'),
+                        'sumber_modal': modal.get('sumber_modal', 'CASH'),
+                        'transaksi_id': modal_id
+                    }
+                    
+                    if posting("TAMBAHAN_MODAL", journal_data):
+                        success_count += 1
+                        logger.info(f"✅ Jurnal dibuat untuk modal ID: {modal_id}")
+                    else:
+                        error_msg = f"Gagal buat jurnal untuk modal ID: {modal_id}"
+                        error_messages.append(error_msg)
+                        logger.error(f"❌ {error_msg}")
+                else:
+                    logger.info(f"⏭️ Modal ID {modal_id} sudah memiliki jurnal")
+        except Exception as e:
+            error_msg = f"Error proses modal: {str(e)}"
+            error_messages.append(error_msg)
+            logger.error(f"❌ {error_msg}")
+        
+        if JURNAL_IDEMPOTEN:
+            # Satu upsert per batch; dokumen yang jurnalnya sudah ada tidak menambah baris
+            baru = []
+            for i in range(0, len(antrean), UKURAN_BATCH_JURNAL):
+                try:
+                    baru.extend(posting_jurnal(antrean[i:i + UKURAN_BATCH_JURNAL]))
+                except Exception as e:
+                    error_msg = f"Error simpan jurnal baris {i + 1}-{i + len(antrean[i:i + UKURAN_BATCH_JURNAL])}: {str(e)}"
+                    error_messages.append(error_msg)
+                    logger.error(f"❌ {error_msg}")
+            success_count = len({r.get('ref_id') for r in baru})
+        
+        logger.info(f"🎀 Generate selesai: {success_count}/{total_processed} berhasil")
+        
+        # Tampilkan pesan hasil
+        if success_count > 0:
+            session['flash_message'] = f"🎀 Berhasil membuat {success_count} jurnal dari {total_processed} transaksi!"
+        else:
+            if total_processed > 0:
+                session['flash_message'] = f"💖 Semua {total_processed} transaksi sudah memiliki jurnal"
+            else:
+                session['flash_message'] = "🌸 Tidak ada transaksi yang ditemukan"
+        
+        if error_messages:
+            session['flash_message'] += f"<br>⚠️ {len(error_messages)} error: {', '.join(error_messages[:2])}"
+        
+    except Exception as e:
+        logger.error(f"❌ Error generate jurnal: {str(e)}")
+        session['flash_message'] = f"❌ Error sistem: {str(e)}"
+    
+    return redirect('/jurnal-umum')
+
+
+# ============================================================
+# 🎀 ROUTE: Jurnal Umum - PINK SOFT THEME
+# ============================================================
+
+def jurnal_umum():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get('user_email')
+    flash_message = session.pop('flash_message', None)
+    
+    try:
+        # Ambil data jurnal
+        result = supabase.table("jurnal_umum").select("*").order("tanggal", desc=True).order("created_at", desc=True).execute()
+        jurnal_data = result.data if result else []
+        
+        # Filter hanya yang valid
+        jurnal_data = [j for j in jurnal_data if j.get('nama_akun')]
+        
+        logger.info(f"📊 Loaded {len(jurnal_data)} jurnal records")
+        
+    except Exception as e:
+        logger.error(f"Error ambil jurnal: {str(e)}")
+        jurnal_data = []
+
+    # Hitung totals
+    total_debit = sum((float(j.get("debit")) if j.get("debit") else 0) for j in jurnal_data)
+    total_kredit = sum((float(j.get("kredit")) if j.get("kredit") else 0) for j in jurnal_data)
+
+    # Format currency
+    def format_currency(val):
+        try:
+            if val is None or val == 0:
+                return "Rp 0"
+            return f"Rp {float(val):,.0f}".replace(",", ".")
+        except:
+            return "Rp 0"
+
+    # Generate table rows
+    rows_html = ""
+    if jurnal_data:
+        for j in jurnal_data:
+            tanggal = j.get("tanggal", "")
+            try:
+                if isinstance(tanggal, str) and "-" in tanggal:
+                    parts = tanggal.split("-")
+                    if len(parts) == 3:
+                        tanggal_fmt = f"{parts[2]}/{parts[1]}/{parts[0]}"
+                    else:
+                        tanggal_fmt = tanggal
+                else:
+                    tanggal_fmt = str(tanggal)
+            except:
+                tanggal_fmt = str(tanggal)
+            
+            nama_akun = j.get('nama_akun', 'Tidak Diketahui')
+            ref = j.get('ref', '-')
+            keterangan = j.get('keterangan', 'Tidak ada keterangan')
+            transaksi_type = j.get('transaksi_type', 'General')
+            user_email_jurnal = j.get('user_email', 'System')
+            transaksi_id = j.get('transaksi_id', '')
+            
+            debit_val = j.get('debit') or 0
+            kredit_val = j.get('kredit') or 0
+            
+            debit_class = "debit" if debit_val and float(debit_val) > 0 else ""
+            kredit_class = "kredit" if kredit_val and float(kredit_val) > 0 else ""
+            
+            rows_html += f"""
+                <tr>
+                    <td>{tanggal_fmt}</td>
+                    <td><strong>{nama_akun}</strong></td>
+                    <td>{ref}</td>
+                    <td class="{debit_class}">{format_currency(debit_val) if debit_val and float(debit_val) > 0 else '-'}</td>
+                    <td class="{kredit_class}">{format_currency(kredit_val) if kredit_val and float(kredit_val) > 0 else '-'}</td>
+                    <td>{keterangan}</td>
+                    <td>
+                        <span class="transaksi-badge">{transaksi_type}</span>
+                        <br><small>{user_email_jurnal}</small>
+                    </td>
+                </tr>
+            """
+    else:
+        rows_html = """
+            <tr>
+                <td colspan="7" class="empty-state">
+                    <div style="text-align: center; padding: 40px;">
+                        <h3 style="color: #666; margin-bottom: 20px;">🌸 Belum ada entri jurnal</h3>
+                        <p style="color: #888; margin-bottom: 30px;">Mulai dengan membuat transaksi atau generate jurnal otomatis</p>
+                        <a href="/generate-jurnal-otomatis" class="btn-generate">
+                            🎀 GENERATE JURNAL OTOMATIS
+                        </a>
+                    </div>
+                </td>
+            </tr>
+        """
+
+    # Balance check
+    selisih = abs(total_debit - total_kredit)
+    is_balanced = selisih < 0.01
+    
+    # Flash message
+    flash_html = ""
+    if flash_message:
+        flash_type = "success" if "Berhasil" in flash_message or "Semua" in flash_message or "Tidak ada" in flash_message else "error"
+        flash_html = f'<div class="flash-message {flash_type}">{flash_message}</div>'
+
+    # 🎀 PINK SOFT THEME HTML
+    html = f"""
+    <!DOCTYPE html>
+    <html lang="id">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Jurnal Umum - PINKILANG</title>
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                background: linear-gradient(135deg, #ffafbd 0%, #ffc3a0 100%);
+                min-height: 100vh;
+                padding: 20px;
+            }}
+            
+            .container {{
+                max-width: 1400px;
+                margin: 0 auto;
+                background: rgba(255, 255, 255, 0.95);
+                border-radius: 20px;
+                box-shadow: 0 20px 40px rgba(255, 182, 193, 0.3);
+                overflow: hidden;
+                backdrop-filter: blur(10px);
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff758c 0%, #ff7eb3 100%);
+                color: white;
+                padding: 30px;
+                text-align: center;
+                position: relative;
+            }}
+            
+            .back-btn {{
+                position: absolute;
+                left: 30px;
+                top: 30px;
+                padding: 12px 20px;
+                background: rgba(255, 255, 255, 0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 10px;
+                border: 1px solid rgba(255, 255, 255, 0.3);
+                transition: all 0.3s ease;
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255, 255, 255, 0.3);
+                transform: translateY(-2px);
+            }}
+            
+            .header h1 {{
+                font-size: 2.5rem;
+                margin-bottom: 10px;
+                font-weight: 700;
+            }}
+            
+            .header p {{
+                font-size: 1.1rem;
+                opacity: 0.9;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            .flash-message {{
+                padding: 20px;
+                margin-bottom: 25px;
+                border-radius: 15px;
+                text-align: center;
+                font-weight: 600;
+                font-size: 1.1rem;
+                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+            }}
+            
+            .flash-message.success {{
+                background: linear-gradient(135deg, #a8e6cf, #dcedc1);
+                color: #2d5016;
+                border-left: 5px solid #7bc043;
+            }}
+            
+            .flash-message.error {{
+                background: linear-gradient(135deg, #ffaaa5, #ff8b94);
+                color: #8b0000;
+                border-left: 5px solid #ff6b6b;
+            }}
+            
+            .summary-cards {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 20px;
+                margin-bottom: 30px;
+            }}
+            
+            .summary-card {{
+                background: linear-gradient(135deg, #ffb6c1, #ffacc5);
+                color: white;
+                padding: 25px;
+                border-radius: 20px;
+                text-align: center;
+                box-shadow: 0 8px 25px rgba(255, 182, 193, 0.4);
+                transition: transform 0.3s ease;
+            }}
+            
+            .summary-card:hover {{
+                transform: translateY(-5px);
+            }}
+            
+            .summary-card h3 {{
+                font-size: 1.2rem;
+                margin-bottom: 15px;
+                opacity: 0.9;
+            }}
+            
+            .summary-number {{
+                font-size: 2.5rem;
+                font-weight: bold;
+                margin: 10px 0;
+                text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+            }}
+            
+            .balance-check {{
+                padding: 20px;
+                margin: 25px 0;
+                border-radius: 15px;
+                text-align: center;
+                font-weight: bold;
+                font-size: 1.2rem;
+                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+            }}
+            
+            .balanced {{
+                background: linear-gradient(135deg, #a8e6cf, #dcedc1);
+                color: #2d5016;
+                border-left: 5px solid #7bc043;
+            }}
+            
+            .not-balanced {{
+                background: linear-gradient(135deg, #ffaaa5, #ff8b94);
+                color: #8b0000;
+                border-left: 5px solid #ff6b6b;
+            }}
+            
+            .table-container {{
+                background: white;
+                border-radius: 20px;
+                overflow: hidden;
+                box-shadow: 0 10px 30px rgba(255, 182, 193, 0.2);
+                margin: 30px 0;
+                overflow-x: auto;
+                border: 1px solid #ffe4e9;
+            }}
+            
+            table {{
+                width: 100%;
+                border-collapse: collapse;
+                min-width: 1000px;
+            }}
+            
+            th {{
+                background: linear-gradient(135deg, #ff758c, #ff7eb3);
+                color: white;
+                padding: 18px 15px;
+                text-align: left;
+                font-weight: 600;
+                font-size: 1rem;
+            }}
+            
+            td {{
+                padding: 16px 15px;
+                border-bottom: 1px solid #ffe4e9;
+                font-size: 0.95rem;
+            }}
+            
+            tr:hover {{
+                background: #fff5f7;
+                transform: translateY(-1px);
+                transition: all 0.2s ease;
+            }}
+            
+            .debit {{
+                color: #27ae60;
+                font-weight: bold;
+                font-size: 1.1rem;
+            }}
+            
+            .kredit {{
+                color: #e74c3c;
+                font-weight: bold;
+                font-size: 1.1rem;
+            }}
+            
+            .transaksi-badge {{
+                background: #ffeaa7;
+                color: #e17055;
+                padding: 6px 12px;
+                border-radius: 20px;
+                font-size: 0.8rem;
+                font-weight: bold;
+                display: inline-block;
+            }}
+            
+            .action-buttons {{
+                display: flex;
+                justify-content: center;
+                gap: 15px;
+                flex-wrap: wrap;
+                margin-top: 30px;
+            }}
+            
+            .btn {{
+                padding: 14px 28px;
+                border: none;
+                border-radius: 15px;
+                font-size: 1rem;
+                font-weight: 600;
+                cursor: pointer;
+                text-decoration: none;
+                display: inline-flex;
+                align-items: center;
+                gap: 8px;
+                transition: all 0.3s ease;
+                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+            }}
+            
+            .btn:hover {{
+                transform: translateY(-3px);
+                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+            }}
+            
+            .btn-danger {{
+                background: linear-gradient(135deg, #ff758c, #ff7eb3);
+                color: white;
+            }}
+            
+            .btn-primary {{
+                background: linear-gradient(135deg, #ffb6c1, #ffacc5);
+                color: white;
+            }}
+            
+            .btn-secondary {{
+                background: linear-gradient(135deg, #a8e6cf, #dcedc1);
+                color: #2d5016;
+            }}
+            
+            .empty-state {{
+                text-align: center;
+                padding: 60px 20px;
+                color: #888;
+            }}
+            
+            .btn-generate {{
+                background: linear-gradient(135deg, #ff758c, #ff7eb3);
+                color: white;
+                padding: 15px 30px;
+                border-radius: 15px;
+                text-decoration: none;
+                font-weight: bold;
+                display: inline-block;
+                transition: all 0.3s ease;
+                box-shadow: 0 4px 15px rgba(255, 107, 107, 0.3);
+            }}
+            
+            .btn-generate:hover {{
+                transform: translateY(-3px);
+                box-shadow: 0 8px 25px rgba(255, 107, 107, 0.4);
+            }}
+            
+            @media (max-width: 768px) {{
+                .summary-cards {{
+                    grid-template-columns: 1fr;
+                }}
+                
+                .action-buttons {{
+                    flex-direction: column;
+                    align-items: center;
+                }}
+                
+                .btn {{
+                    width: 100%;
+                    max-width: 300px;
+                    justify-content: center;
+                }}
+                
+                th, td {{
+                    padding: 12px 8px;
+                    font-size: 0.9rem;
+                }}
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Dashboard</a>
+                <h1>📝 Jurnal Umum</h1>
+                <p>Sistem Pencatatan Double Entry - PINKILANG Accounting</p>
+            </div>
+            
+            <div class="content">
+                {flash_html}
+                
+                <div class="summary-cards">
+                    <div class="summary-card">
+                        <h3>💰 Total Debit</h3>
+                        <div class="summary-number">{format_currency(total_debit)}</div>
+                        <p>Total semua transaksi debit</p>
+                    </div>
+                    <div class="summary-card">
+                        <h3>💳 Total Kredit</h3>
+                        <div class="summary-number">{format_currency(total_kredit)}</div>
+                        <p>Total semua transaksi kredit</p>
+                    </div>
+                </div>
+                
+                <div class="balance-check {'balanced' if is_balanced else 'not-balanced'}">
+                    {'🌸 JURNAL SEIMBANG' if is_balanced else '🎀 JURNAL TIDAK SEIMBANG'}
+                    {f'<br><small style="opacity: 0.8;">Selisih: {format_currency(selisih)}</small>' if not is_balanced else ''}
+                </div>
+                
+                <div class="table-container">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Tanggal</th>
+                                <th>Akun</th>
+                                <th>Ref</th>
+                                <th>Debit</th>
+                                <th>Kredit</th>
+                                <th>Keterangan</th>
+                                <th>Info</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            {rows_html}
+                        </tbody>
+                    </table>
+                </div>
+                
+                <div class="action-buttons">
+                    <a href="/generate-jurnal-otomatis" class="btn btn-danger">
+                        🎀 Generate Jurnal Otomatis
+                    </a>
+                    <a href="/penjualan" class="btn btn-primary">🛍️ Input Penjualan</a>
+                    <a href="/pembelian" class="btn btn-primary">🛒 Input Pembelian</a>
+                    <a href="/operasional" class="btn btn-primary">💰 Input Operasional</a>
+                    <a href="/prive" class="btn btn-secondary">💼 Input Prive</a>
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            // Auto refresh flash message
+            setTimeout(() => {{
+                const flashMsg = document.querySelector('.flash-message');
+                if (flashMsg) {{
+                    flashMsg.style.opacity = '0';
+                    flashMsg.style.transition = 'opacity 0.5s ease';
+                    setTimeout(() => flashMsg.remove(), 500);
+                }}
+            }}, 5000);
+        </script>
+    </body>
+    </html>
+    """
+    return html
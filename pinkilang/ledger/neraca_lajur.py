@@ -0,0 +1,645 @@
+"""Neraca lajur (worksheet)"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import CHART_OF_ACCOUNTS, filter_akun_tidak_diinginkan, get_initial_balance_data
+
+# ============================================================
+# 🔹 ROUTE: Neraca Lajur (Worksheet) 
+# ============================================================
+def neraca_lajur():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Ambil semua data jurnal (Transaksi)
+        jurnal_result = supabase.table("jurnal_umum").select("*").order("tanggal").execute()
+        jurnal_data = jurnal_result.data or []
+        
+        # Ambil data Neraca Saldo Awal (NSA)
+        nsa_consolidated = get_initial_balance_data()
+        
+        # Filter: hapus akun tidak diinginkan (jika ada)
+        jurnal_data = filter_akun_tidak_diinginkan(jurnal_data)
+        
+        # Daftar akun standar (gunakan CHART_OF_ACCOUNTS untuk mapping kode/nama)
+        akun_standar = {kode: info['nama'] for kode, info in CHART_OF_ACCOUNTS.items()}
+        
+        # 1. INISIALISASI AKUN_DATA DENGAN SALDO AWAL (NSA)
+        akun_data = {}
+        for akun_nama, nsa_info in nsa_consolidated.items():
+            # Cari kode akun berdasarkan nama
+            kode_akun = next((kode for kode, nama in akun_standar.items() if nama.lower() == akun_nama.lower()), akun_nama)
+            
+            akun_data[kode_akun] = {
+                'nama_akun': akun_nama,
+                'kode_akun': kode_akun,
+                # Kolom 1-2: Neraca Saldo (Dimulai dari NSA)
+                'neraca_debit': nsa_info['debit'],
+                'neraca_kredit': nsa_info['kredit'],
+                # Kolom 3-10: Inisialisasi nol
+                'penyesuaian_debit': 0,
+                'penyesuaian_kredit': 0,
+                'nssp_debit': 0,
+                'nssp_kredit': 0,
+                'laba_rugi_debit': 0,
+                'laba_rugi_kredit': 0,
+                'posisi_keuangan_debit': 0,
+                'posisi_keuangan_kredit': 0
+            }
+
+        # 2. INTEGRASI DENGAN JURNAL UMUM (Transaksi)
+        for jurnal in jurnal_data:
+            akun_nama = jurnal.get('nama_akun', 'Unknown')
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            # Cari kode akun untuk integrasi
+            kode_akun = next((kode for kode, nama in akun_standar.items() if nama.lower() == akun_nama.lower()), akun_nama)
+            
+            if kode_akun not in akun_data:
+                 akun_data[kode_akun] = {
+                    'nama_akun': akun_nama,
+                    'kode_akun': kode_akun,
+                    'neraca_debit': 0, 'neraca_kredit': 0,
+                    'penyesuaian_debit': 0, 'penyesuaian_kredit': 0,
+                    'nssp_debit': 0, 'nssp_kredit': 0,
+                    'laba_rugi_debit': 0, 'laba_rugi_kredit': 0,
+                    'posisi_keuangan_debit': 0, 'posisi_keuangan_kredit': 0
+                }
+            
+            # Pisahkan antara jurnal biasa (Neraca Saldo) dan jurnal penyesuaian
+            if jurnal.get('transaksi_type', '').lower() in ['penyesuaian', 'penyesuaian_manual', 'penyesuaian_aset', 'penyesuaian_otomatis']:
+                # Jurnal penyesuaian
+                akun_data[kode_akun]['penyesuaian_debit'] += debit
+                akun_data[kode_akun]['penyesuaian_kredit'] += kredit
+            else:
+                # Jurnal biasa (Transaksi) -> DITAMBAHKAN ke Saldo Awal
+                akun_data[kode_akun]['neraca_debit'] += debit
+                akun_data[kode_akun]['neraca_kredit'] += kredit
+        
+        # 3. HITUNG Neraca Saldo Setelah Penyesuaian (NSSP) DAN KLASIFIKASI
+        for kode_akun, data in akun_data.items():
+            # A. Hitung NSSP
+            data['nssp_debit'] = data['neraca_debit'] + data['penyesuaian_debit']
+            data['nssp_kredit'] = data['neraca_kredit'] + data['penyesuaian_kredit']
+            
+            saldo_nssp = data['nssp_debit'] - data['nssp_kredit']
+            
+            # B. Klasifikasi Laba Rugi vs Posisi Keuangan
+            data['laba_rugi_debit'] = 0; data['laba_rugi_kredit'] = 0
+            data['posisi_keuangan_debit'] = 0; data['posisi_keuangan_kredit'] = 0
+            
+            # Tentukan klasifikasi berdasarkan kode akun (Asumsi kode 1-3 Neraca, 4-6 L/R)
+            kode_utama = kode_akun[0] if isinstance(kode_akun, str) and kode_akun.isdigit() else '0'
+            nama_akun_lower = data['nama_akun'].lower()
+            
+            is_neraca_akun = kode_utama in ['1', '2', '3'] or any(keyword in nama_akun_lower for keyword in ['kas', 'bank', 'piutang', 'persediaan', 'aset', 'utang', 'modal', 'prive', 'akumulasi penyusutan'])
+            is_laba_rugi_akun = kode_utama in ['4', '5', '6'] or any(keyword in nama_akun_lower for keyword in ['penjualan', 'hpp', 'beban', 'biaya', 'pendapatan', 'retur'])
+
+            if is_laba_rugi_akun:
+                if saldo_nssp > 0:
+                    data['laba_rugi_debit'] = saldo_nssp
+                else:
+                    data['laba_rugi_kredit'] = abs(saldo_nssp)
+            elif is_neraca_akun:
+                if saldo_nssp > 0:
+                    data['posisi_keuangan_debit'] = saldo_nssp
+                else:
+                    data['posisi_keuangan_kredit'] = abs(saldo_nssp)
+
+        
+        # 4. FINALISASI
+        akun_terurut = sorted(akun_data.items(), key=lambda x: x[0])
+        
+        # Hitung totals untuk setiap kolom
+        totals = {
+            'neraca_debit': 0, 'neraca_kredit': 0,
+            'penyesuaian_debit': 0, 'penyesuaian_kredit': 0,
+            'nssp_debit': 0, 'nssp_kredit': 0,
+            'laba_rugi_debit': 0, 'laba_rugi_kredit': 0,
+            'posisi_keuangan_debit': 0, 'posisi_keuangan_kredit': 0
+        }
+        
+        for kode_akun, data in akun_terurut:
+            for key in totals:
+                totals[key] += data.get(key, 0)
+        
+        # Format currency helper
+        def rp(val):
+            try:
+                return f"Rp {int(val):,}".replace(",", ".")
+            except:
+                return "Rp 0"
+        
+        # Generate table rows
+        rows_html = ""
+        for kode_akun, data in akun_terurut:
+            if any(data[key] for key in totals): # Hanya tampilkan akun yang memiliki nilai
+                rows_html += f"""
+                <tr>
+                    <td class="akun-name">{data['kode_akun']} - {data['nama_akun']}</td>
+                    <td class="number">{rp(data['neraca_debit'])}</td>
+                    <td class="number">{rp(data['neraca_kredit'])}</td>
+                    <td class="number">{rp(data['penyesuaian_debit'])}</td>
+                    <td class="number">{rp(data['penyesuaian_kredit'])}</td>
+                    <td class="number">{rp(data['nssp_debit'])}</td>
+                    <td class="number">{rp(data['nssp_kredit'])}</td>
+                    <td class="number">{rp(data['laba_rugi_debit'])}</td>
+                    <td class="number">{rp(data['laba_rugi_kredit'])}</td>
+                    <td class="number">{rp(data['posisi_keuangan_debit'])}</td>
+                    <td class="number">{rp(data['posisi_keuangan_kredit'])}</td>
+                </tr>
+                """
+        
+        # Hitung Selisih Laba/Rugi (Kredit - Debit)
+        laba_rugi_bersih = totals['laba_rugi_kredit'] - totals['laba_rugi_debit']
+        
+        # Hitung Selisih Neraca (Debit - Kredit)
+        selisih_neraca_debit = totals['posisi_keuangan_debit'] + laba_rugi_bersih
+        selisih_neraca_kredit = totals['posisi_keuangan_kredit']
+
+        # Cek Keseimbangan Awal
+        is_balanced = abs(totals['neraca_debit'] - totals['neraca_kredit']) < 0.01
+
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Neraca Lajur - PINKILANG</title>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #ffe6f2, #ffccde);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 95vw;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                    overflow-x: auto;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #ff6ea9, #c4006e);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                    position: sticky;
+                    left: 0;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                    font-weight: 600;
+                }}
+                
+                .user-info {{
+                    font-size: 14px;
+                    opacity: 0.9;
+                    margin-top: 5px;
+                }}
+                
+                .content {{
+                    padding: 20px;
+                    overflow-x: auto;
+                }}
+                
+                /* Table Styling */
+                .worksheet-table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    font-size: 12px;
+                    min-width: 1200px;
+                }}
+                
+                .worksheet-table thead {{
+                    background: linear-gradient(135deg, #ff6ea9, #c4006e);
+                    position: sticky;
+                    top: 0;
+                }}
+                
+                .worksheet-table th {{
+                    padding: 12px 8px;
+                    text-align: center;
+                    color: white;
+                    font-weight: 600;
+                    font-size: 11px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    white-space: nowrap;
+                }}
+                
+                .worksheet-table td {{
+                    padding: 10px 8px;
+                    border: 1px solid #e0e0e0;
+                    color: #333;
+                }}
+                
+                .worksheet-table tbody tr:hover {{
+                    background: #f8f8f8;
+                }}
+                
+                .worksheet-table tfoot {{
+                    font-weight: bold;
+                }}
+                
+                .worksheet-table tfoot td {{
+                    padding: 12px 8px;
+                    border: 1px solid #e0e0e0;
+                }}
+                
+                /* Column Styles */
+                .akun-name {{
+                    font-weight: 600;
+                    background: #f8f9fa;
+                    position: sticky;
+                    left: 0;
+                    min-width: 200px;
+                }}
+                
+                .number {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                    font-size: 11px;
+                    min-width: 100px;
+                }}
+                
+                .column-group {{
+                    background: rgba(255,110,169,0.1);
+                }}
+                
+                /* Balance Status */
+                .balance-status {{
+                    text-align: center;
+                    padding: 15px;
+                    margin: 20px 0;
+                    border-radius: 10px;
+                    font-weight: 600;
+                    font-size: 16px;
+                }}
+                
+                .balance-correct {{
+                    background: #d4edda;
+                    color: #155724;
+                    border: 1px solid #c3e6cb;
+                }}
+                
+                .balance-incorrect {{
+                    background: #f8d7da;
+                    color: #721c24;
+                    border: 1px solid #f5c6cb;
+                }}
+                
+                /* Summary Info */
+                .summary-info {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 10px;
+                    margin: 20px 0;
+                    font-size: 14px;
+                }}
+                
+                .summary-item {{
+                    background: #f8f9fa;
+                    padding: 15px;
+                    border-radius: 8px;
+                    text-align: center;
+                }}
+                
+                .summary-value {{
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #c4006e;
+                    margin-bottom: 5px;
+                }}
+                
+                .summary-label {{
+                    font-size: 12px;
+                    color: #666;
+                }}
+                
+                /* Action Buttons */
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                    display: flex;
+                    gap: 10px;
+                    justify-content: center;
+                    flex-wrap: wrap;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: #6c757d;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 6px;
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                    border: none;
+                    cursor: pointer;
+                    font-size: 14px;
+                }}
+                
+                .btn:hover {{
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+                }}
+                
+                .btn-primary {{
+                    background: #c4006e;
+                }}
+                
+                .btn-info {{
+                    background: #17a2b8;
+                }}
+                
+                .btn-success {{
+                    background: #28a745;
+                }}
+                
+                .btn-warning {{
+                    background: #ffc107;
+                    color: #000;
+                }}
+                
+                /* Style untuk selisih */
+                .positive {{
+                    color: #008000;
+                    font-weight: bold;
+                }}
+                
+                .negative {{
+                    color: #ff0000;
+                    font-weight: bold;
+                }}
+                
+                .laba-rugi-section {{
+                    background: #e6f7ff;
+                }}
+                
+                .posisi-keuangan-section {{
+                    background: #fff0f5;
+                }}
+                
+                @media (max-width: 768px) {{
+                    .container {{
+                        margin: 10px;
+                        border-radius: 10px;
+                    }}
+                    
+                    .content {{
+                        padding: 15px;
+                    }}
+                    
+                    .worksheet-table {{
+                        font-size: 10px;
+                    }}
+                    
+                    .worksheet-table th,
+                    .worksheet-table td {{
+                        padding: 8px 6px;
+                    }}
+                    
+                    .action-buttons {{
+                        flex-direction: column;
+                    }}
+                    
+                    .btn {{
+                        width: 100%;
+                        margin: 2px 0;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📊 Neraca Lajur (Worksheet)</h1>
+                    <div class="user-info">
+                        Login sebagai: <strong>{user_email}</strong> | 
+                        Jurnal: <strong>{len(jurnal_data)} entri</strong> | 
+                        Akun: <strong>{len(akun_data)} akun</strong> | 
+                        Periode: <strong>{datetime.now().strftime('%B %Y')}</strong>
+                    </div>
+                </div>
+                
+                <div class="content">
+                    <div class="summary-info">
+                        <div class="summary-item">
+                            <div class="summary-value">{len(akun_data)}</div>
+                            <div class="summary-label">Total Akun</div>
+                        </div>
+                        <div class="summary-item">
+                            <div class="summary-value">{len(jurnal_data)}</div>
+                            <div class="summary-label">Total Jurnal</div>
+                        </div>
+                        <div class="summary-item">
+                            <div class="summary-value">{rp(laba_rugi_bersih)}</div>
+                            <div class="summary-label">Laba/Rugi</div>
+                        </div>
+                        <div class="summary-item">
+                            <div class="summary-value">{'✅' if is_balanced else '❌'}</div>
+                            <div class="summary-label">Status</div>
+                        </div>
+                    </div>
+                    
+                    <div class="balance-status {'balance-correct' if is_balanced else 'balance-incorrect'}">
+                        {'✅ NERACA SALDO SEIMBANG' if is_balanced else '❌ NERACA SALDO TIDAK SEIMBANG'}
+                        <br>
+                        <small>Total Debit: {rp(totals['neraca_debit'])} | Total Kredit: {rp(totals['neraca_kredit'])} | Terakhir update: {datetime.now().strftime('%H:%M:%S')}</small>
+                    </div>
+                    
+                    <div style="overflow-x: auto;">
+                        <table class="worksheet-table">
+                            <thead>
+                                <tr>
+                                    <th rowspan="2">Kode & Nama Akun</th>
+                                    <th colspan="2" class="column-group">Neraca Saldo (Awal + Transaksi)</th>
+                                    <th colspan="2" class="column-group">Penyesuaian</th>
+                                    <th colspan="2" class="column-group">NSSP</th>
+                                    <th colspan="2" class="column-group">Laba Rugi</th>
+                                    <th colspan="2" class="column-group">Laporan Posisi Keuangan</th>
+                                </tr>
+                                <tr>
+                                    <th>Debit</th>
+                                    <th>Kredit</th>
+                                    <th>Debit</th>
+                                    <th>Kredit</th>
+                                    <th>Debit</th>
+                                    <th>Kredit</th>
+                                    <th>Debit</th>
+                                    <th>Kredit</th>
+                                    <th>Debit</th>
+                                    <th>Kredit</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {rows_html if rows_html else """
+                                <tr>
+                                    <td colspan="11" style="text-align: center; padding: 40px; color: #666;">
+                                        <h3>📊 Belum ada data transaksi</h3>
+                                        <p>Mulai dengan membuat transaksi pertama Anda:</p>
+                                        <div style="margin-top: 15px;">
+                                            <a href="/neraca-saldo-awal" class="btn" style="background: #ff9966; margin: 5px;">➕ Input Saldo Awal</a>
+                                            <a href="/tambah-penjualan" class="btn" style="background: #28a745; margin: 5px;">➕ Input Penjualan</a>
+                                            <a href="/tambah-pembelian" class="btn" style="background: #007bff; margin: 5px;">🛒 Input Pembelian</a>
+                                        </div>
+                                    </td>
+                                </tr>
+                                """}
+                            </tbody>
+                            <tfoot>
+                                <tr>
+                                    <td><strong>TOTAL NERACA SALDO</strong></td>
+                                    <td class="number"><strong>{rp(totals['neraca_debit'])}</strong></td>
+                                    <td class="number"><strong>{rp(totals['neraca_kredit'])}</strong></td>
+                                    <td colspan="2"></td>
+                                    <td colspan="2"></td>
+                                    <td colspan="2"></td>
+                                    <td colspan="2"></td>
+                                </tr>
+                                
+                                <tr>
+                                    <td><strong>TOTAL PENYESUAIAN</strong></td>
+                                    <td colspan="2"></td>
+                                    <td class="number"><strong>{rp(totals['penyesuaian_debit'])}</strong></td>
+                                    <td class="number"><strong>{rp(totals['penyesuaian_kredit'])}</strong></td>
+                                    <td colspan="2"></td>
+                                    <td colspan="2"></td>
+                                    <td colspan="2"></td>
+                                </tr>
+                                
+                                <tr>
+                                    <td><strong>TOTAL NSSP</strong></td>
+                                    <td colspan="4"></td>
+                                    <td class="number"><strong>{rp(totals['nssp_debit'])}</strong></td>
+                                    <td class="number"><strong>{rp(totals['nssp_kredit'])}</strong></td>
+                                    <td colspan="2"></td>
+                                    <td colspan="2"></td>
+                                </tr>
+                                
+                                <tr class="laba-rugi-section">
+                                    <td><strong>TOTAL LABA RUGI</strong></td>
+                                    <td colspan="6"></td>
+                                    <td class="number"><strong>{rp(totals['laba_rugi_debit'])}</strong></td>
+                                    <td class="number"><strong>{rp(totals['laba_rugi_kredit'])}</strong></td>
+                                    <td colspan="2"></td>
+                                </tr>
+                                
+                                <tr class="laba-rugi-section">
+                                    <td><strong>SELISIH LABA RUGI</strong></td>
+                                    <td colspan="6"></td>
+                                    <td colspan="2" class="number {'positive' if laba_rugi_bersih >= 0 else 'negative'}">
+                                        <strong>{rp(abs(laba_rugi_bersih))} {'(Laba)' if laba_rugi_bersih >= 0 else '(Rugi)'}</strong>
+                                    </td>
+                                    <td colspan="2"></td>
+                                </tr>
+                                
+                                <tr class="posisi-keuangan-section">
+                                    <td><strong>TOTAL LAPORAN POSISI KEUANGAN</strong></td>
+                                    <td colspan="8"></td>
+                                    <td class="number"><strong>{rp(totals['posisi_keuangan_debit'])}</strong></td>
+                                    <td class="number"><strong>{rp(totals['posisi_keuangan_kredit'])}</strong></td>
+                                </tr>
+                                
+                                <tr class="posisi-keuangan-section">
+                                    <td><strong>SELISIH LAPORAN POSISI KEUANGAN</strong></td>
+                                    <td colspan="8"></td>
+                                    <td colspan="2" class="number {'positive' if selisih_neraca_debit >= selisih_neraca_kredit else 'negative'}">
+                                        <strong>{rp(abs(selisih_neraca_debit - selisih_neraca_kredit))}</strong>
+                                    </td>
+                                </tr>
+                                
+                                <tr style="background: #fde3ef;">
+                                    <td><strong>STATUS KESEIMBANGAN</strong></td>
+                                    <td colspan="10" class="{'balance-correct' if is_balanced else 'balance-incorrect'}" style="text-align: center;">
+                                        {'✅ NERACA LAJUR SEIMBANG' if is_balanced else '❌ NERACA LAJUR TIDAK SEIMBANG'}
+                                    </td>
+                                </tr>
+                            </tfoot>
+                        </table>
+                    </div>
+                    
+                    <div class="action-buttons">
+                        <a href="/dashboard" class="btn btn-primary">🏠 Dashboard</a>
+                        <a href="/neraca-saldo-awal" class="btn btn-warning">➕ Neraca Saldo Awal</a>
+                        <a href="/neraca-saldo-setelah-penyesuaian" class="btn btn-success">🔄 NSSP</a>
+                        <a href="/jurnal-umum" class="btn btn-info">📝 Lihat Jurnal</a>
+                        <button onclick="window.print()" class="btn" style="background: #17a2b8;">🖨️ Cetak</button>
+                    </div>
+                </div>
+            </div>
+            
+            <script>
+                // Add subtle animation
+                document.addEventListener('DOMContentLoaded', function() {{
+                    const rows = document.querySelectorAll('.worksheet-table tbody tr');
+                    rows.forEach((row, index) => {{
+                        row.style.opacity = '0';
+                        row.style.transform = 'translateX(20px)';
+                        setTimeout(() => {{
+                            row.style.transition = 'all 0.3s ease';
+                            row.style.opacity = '1';
+                            row.style.transform = 'translateX(0)';
+                        }}, index * 30);
+                    }});
+                }});
+            </script>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di Neraca Lajur: {str(e)}")
+        return f"""
+        <html>
+        <body style="font-family: Arial; padding: 20px; background: #f8f9fa;">
+            <div style="max-width: 600px; margin: 50px auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center;">
+                <h1 style="color: #dc3545; margin-bottom: 20px;">❌ Error Neraca Lajur</h1>
+                <p style="color: #666; margin-bottom: 20px;">Terjadi kesalahan saat memproses data:</p>
+                <p style="background: #f8d7da; color: #721c24; padding: 15px; border-radius: 5px; font-family: monospace;">{str(e)}</p>
+                <a href="/dashboard" style="display: inline-block; margin-top: 20px; padding: 10px 20px; background: #c4006e; color: white; text-decoration: none; border-radius: 5px;">← Kembali ke Dashboard</a>
+            </div>
+        </body>
+        </html>
+        """
@@ -0,0 +1,1806 @@
+"""Neraca saldo: awal, sebelum/setelah penyesuaian dan setelah penutupan"""
+from flask import request, redirect, session
+from datetime import datetime
+from decimal import Decimal
+from pinkilang.core import logger, supabase, format_currency
+from pinkilang.akuntansi import CHART_OF_ACCOUNTS, filter_akun_tidak_diinginkan, get_initial_balance_data
+from pinkilang.penyusutan import terapkan_penyusutan
+from pinkilang.async_db import ambil_paralel
+
+# ============================================================
+# ROUTE: Neraca Saldo
+# ============================================================
+def neraca_saldo():
+    # auth check
+    try:
+        if not session.get("logged_in"):
+            return redirect("/login")
+    except Exception:
+        return "Session not available - ensure `from flask import session` is imported.", 500
+
+    user_email = session.get("user_email", "Unknown")
+
+    # ambil data dari supabase; aman terhadap method order yang berbeda
+    try:
+        try:
+            res = supabase.table("jurnal_umum").select("*").order("tanggal", asc=True).execute()
+        except Exception:
+            # fallback bila client tidak mengenali asc param
+            res = supabase.table("jurnal_umum").select("*").order("tanggal", desc=False).execute()
+        jurnal_data = res.data or []
+    except NameError:
+        return "Supabase client not initialized (variable `supabase` not found).", 500
+    except Exception as e:
+        # tampilkan pesan singkat di browser agar mudah debug di lingkungan development
+        logger.error(f"Error saat load jurnal: {e}")
+        return f"Error load jurnal: {str(e)}", 500
+
+    # group per akun dan hitung total debit/kredit
+    saldo_akun = {}
+
+    for row in jurnal_data:
+        akun = row.get("nama_akun") or "UNKNOWN"
+
+        if akun not in saldo_akun:
+            saldo_akun[akun] = {"debit": Decimal("0"), "kredit": Decimal("0")}
+
+        # ambil nilai debit/kredit aman
+        raw_d = row.get("debit", 0) or 0
+        raw_k = row.get("kredit", 0) or 0
+
+        try:
+            d = Decimal(str(raw_d))
+        except Exception:
+            d = Decimal("0")
+
+        try:
+            k = Decimal(str(raw_k))
+        except Exception:
+            k = Decimal("0")
+
+        saldo_akun[akun]["debit"] += d
+        saldo_akun[akun]["kredit"] += k
+
+    # helper format rupiah
+    def rp(v):
+        try:
+            # v bisa Decimal
+            return f"Rp {int(v):,}".replace(",", ".")
+        except Exception:
+            return "Rp 0"
+
+    # generate rows
+    rows_html = ""
+    total_debit = Decimal("0")
+    total_kredit = Decimal("0")
+
+    for akun, val in sorted(saldo_akun.items()):
+        d = val["debit"]
+        k = val["kredit"]
+        total_debit += d
+        total_kredit += k
+
+        rows_html += f"""
+        <tr>
+            <td>{akun}</td>
+            <td class="debit">{rp(d)}</td>
+            <td class="kredit">{rp(k)}</td>
+        </tr>
+        """
+
+    # render page
+        html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Neraca Saldo - PINKILANG</title>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #ffccde);
+                padding: 20px;
+                min-height: 100vh;
+            }}
+            
+            .container {{
+                max-width: 1000px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 15px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff6ea9, #c4006e);
+                color: white;
+                padding: 25px;
+                text-align: center;
+                position: relative;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 8px;
+                margin-bottom: 15px;
+                border: 1px solid rgba(255,255,255,0.3);
+                transition: all 0.3s ease;
+                font-weight: 500;
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+                transform: translateY(-2px);
+            }}
+            
+            h1 {{
+                font-size: 28px;
+                margin-bottom: 10px;
+                font-weight: 600;
+            }}
+            
+            .user-info {{
+                font-size: 16px;
+                opacity: 0.9;
+                margin-top: 5px;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            /* Table Styling */
+            .table-container {{
+                background: white;
+                border-radius: 10px;
+                overflow: hidden;
+                box-shadow: 0 4px 15px rgba(0,0,0,0.08);
+                margin: 20px 0;
+            }}
+            
+            .neraca-table {{
+                width: 100%;
+                border-collapse: collapse;
+                font-size: 14px;
+            }}
+            
+            .neraca-table thead {{
+                background: linear-gradient(135deg, #ff6ea9, #c4006e);
+            }}
+            
+            .neraca-table th {{
+                padding: 16px 12px;
+                text-align: left;
+                color: white;
+                font-weight: 600;
+                font-size: 14px;
+                border: none;
+            }}
+            
+            .neraca-table th:first-child {{
+                border-radius: 8px 0 0 0;
+            }}
+            
+            .neraca-table th:last-child {{
+                border-radius: 0 8px 0 0;
+            }}
+            
+            .neraca-table td {{
+                padding: 14px 12px;
+                border-bottom: 1px solid #f0f0f0;
+                color: #333;
+            }}
+            
+            .neraca-table tbody tr:hover {{
+                background: #f8f8f8;
+                transform: translateY(-1px);
+                transition: all 0.2s ease;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+            }}
+            
+            .neraca-table tfoot {{
+                background: #fde3ef;
+                font-weight: bold;
+            }}
+            
+            .neraca-table tfoot td {{
+                padding: 16px 12px;
+                border-bottom: none;
+                font-size: 15px;
+            }}
+            
+            .neraca-table tfoot td:first-child {{
+                border-radius: 0 0 0 8px;
+            }}
+            
+            .neraca-table tfoot td:last-child {{
+                border-radius: 0 0 8px 0;
+            }}
+            
+            /* Color Coding */
+            .debit {{
+                color: #008000;
+                font-weight: 600;
+            }}
+            
+            .kredit {{
+                color: #b30000;
+                font-weight: 600;
+            }}
+            
+            .akun-name {{
+                font-weight: 500;
+                color: #333;
+            }}
+            
+            /* Balance Status */
+            .balance-status {{
+                text-align: center;
+                padding: 15px;
+                margin: 20px 0;
+                border-radius: 10px;
+                font-weight: 600;
+                font-size: 16px;
+            }}
+            
+            .balance-correct {{
+                background: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }}
+            
+            .balance-incorrect {{
+                background: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }}
+            
+            /* Summary Cards */
+            .summary-cards {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                gap: 15px;
+                margin: 25px 0;
+            }}
+            
+            .summary-card {{
+                background: #f8f9fa;
+                padding: 20px;
+                border-radius: 10px;
+                text-align: center;
+                border-left: 4px solid #ff6ea9;
+            }}
+            
+            .summary-number {{
+                font-size: 24px;
+                font-weight: bold;
+                color: #c4006e;
+                margin-bottom: 5px;
+            }}
+            
+            .summary-label {{
+                font-size: 14px;
+                color: #666;
+            }}
+            
+            /* Action Buttons */
+            .action-buttons {{
+                text-align: center;
+                margin-top: 30px;
+                padding-top: 20px;
+                border-top: 1px solid #eee;
+            }}
+            
+            .btn {{
+                display: inline-block;
+                padding: 12px 24px;
+                background: #6c757d;
+                color: white;
+                text-decoration: none;
+                border-radius: 6px;
+                margin: 0 5px;
+                transition: all 0.3s ease;
+                font-weight: 500;
+                border: none;
+                cursor: pointer;
+            }}
+            
+            .btn:hover {{
+                transform: translateY(-2px);
+                box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+            }}
+            
+            .btn-primary {{
+                background: #c4006e;
+            }}
+            
+            .btn-secondary {{
+                background: #6c757d;
+            }}
+            
+            .btn-success {{
+                background: #28a745;
+            }}
+            
+            /* Responsive */
+            @media (max-width: 768px) {{
+                .container {{
+                    margin: 10px;
+                }}
+                
+                .content {{
+                    padding: 20px;
+                }}
+                
+                .neraca-table {{
+                    font-size: 12px;
+                }}
+                
+                .neraca-table th,
+                .neraca-table td {{
+                    padding: 10px 8px;
+                }}
+                
+                .summary-cards {{
+                    grid-template-columns: 1fr;
+                }}
+                
+                .action-buttons {{
+                    display: flex;
+                    flex-direction: column;
+                    gap: 10px;
+                }}
+                
+                .btn {{
+                    width: 100%;
+                    margin: 2px 0;
+                }}
+            }}
+            
+            /* Print Styles */
+            @media print {{
+                body {{
+                    background: white;
+                    padding: 0;
+                }}
+                
+                .container {{
+                    box-shadow: none;
+                    margin: 0;
+                }}
+                
+                .back-btn, .action-buttons {{
+                    display: none;
+                }}
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <!-- Header -->
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>📊 Neraca Saldo</h1>
+                <div class="user-info">Login sebagai: <strong>{user_email}</strong></div>
+            </div>
+            
+            <!-- Content -->
+            <div class="content">
+                <!-- Summary Cards -->
+                <div class="summary-cards">
+                    <div class="summary-card">
+                        <div class="summary-number">{len(saldo_akun)}</div>
+                        <div class="summary-label">Total Akun</div>
+                    </div>
+                    <div class="summary-card">
+                        <div class="summary-number">{rp(total_debit)}</div>
+                        <div class="summary-label">Total Debit</div>
+                    </div>
+                    <div class="summary-card">
+                        <div class="summary-number">{rp(total_kredit)}</div>
+                        <div class="summary-label">Total Kredit</div>
+                    </div>
+                </div>
+                
+                <!-- Balance Status -->
+                <div class="balance-status { 'balance-correct' if total_debit == total_kredit else 'balance-incorrect' }">
+                    { '✅ NERACA SEIMBANG' if total_debit == total_kredit else '❌ NERACA TIDAK SEIMBANG' }
+                    <br>
+                    <small>Total Debit: {rp(total_debit)} | Total Kredit: {rp(total_kredit)}</small>
+                </div>
+                
+                <!-- Neraca Table -->
+                <div class="table-container">
+                    <table class="neraca-table">
+                        <thead>
+                            <tr>
+                                <th>Nama Akun</th>
+                                <th>Total Debit</th>
+                                <th>Total Kredit</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            {rows_html}
+                        </tbody>
+                        <tfoot>
+                            <tr>
+                                <td><strong>TOTAL</strong></td>
+                                <td class="debit"><strong>{rp(total_debit)}</strong></td>
+                                <td class="kredit"><strong>{rp(total_kredit)}</strong></td>
+                            </tr>
+                        </tfoot>
+                    </table>
+                </div>
+                
+                <!-- Action Buttons -->
+                <div class="action-buttons">
+                    <a href="/dashboard" class="btn btn-primary">🏠 Dashboard</a>
+                    <a href="/jurnal-umum" class="btn btn-secondary">📝 Jurnal Umum</a>
+                    <a href="/laporan-posisi-keuangan" class="btn btn-success">📈 Laporan Posisi Keuangan</a>
+                    <button onclick="window.print()" class="btn" style="background: #17a2b8;">🖨️ Cetak Laporan</button>
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            // Add subtle animation to table rows
+            document.addEventListener('DOMContentLoaded', function() {{
+                const rows = document.querySelectorAll('.neraca-table tbody tr');
+                rows.forEach((row, index) => {{
+                    row.style.opacity = '0';
+                    row.style.transform = 'translateY(10px)';
+                    setTimeout(() => {{
+                        row.style.transition = 'all 0.3s ease';
+                        row.style.opacity = '1';
+                        row.style.transform = 'translateY(0)';
+                    }}, index * 50);
+                }});
+            }});
+            
+            // Highlight balanced/unbalanced status
+            const balanceStatus = document.querySelector('.balance-status');
+            if (balanceStatus.classList.contains('balance-correct')) {{
+                setTimeout(() => {{
+                    balanceStatus.style.transform = 'scale(1.02)';
+                    balanceStatus.style.transition = 'transform 0.3s ease';
+                }}, 500);
+            }}
+        </script>
+    </body>
+    </html>
+    """
+    return html
+
+# ============================================================
+# 🔹 ROUTE: Neraca Saldo Setelah Penutupan
+# ============================================================
+def neraca_saldo_setelah_penutupan():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    current_period = datetime.now().strftime('%Y-%m')
+    
+    try:
+        # FORMAT CURRENCY HELPER
+        def rp(val):
+            try:
+                return f"Rp {int(val):,}".replace(",", ".")
+            except:
+                return "Rp 0"
+
+        # 1 & 2. GENERATE NERACA LAJUR LALU AMBIL DATANYA
+        # Berurutan (RPC dulu), tapi paralel dengan query aset/modal/prive di bawah
+        hasil = ambil_paralel({
+            'neraca_lajur': [
+                lambda db: db.rpc('generate_neraca_lajur', {'p_period': current_period, 'p_user_email': user_email}),
+                lambda db: db.table("neraca_lajur").select("*").eq("period", current_period).eq("user_email", user_email).order("account_code"),
+            ],
+            'aset_tetap': lambda db: db.table("aset_tetap").select("*").eq("user_email", user_email).order("tanggal_perolehan", desc=True),
+            'modal_awal': lambda db: db.table("modal").select("jumlah").eq("user_email", user_email).eq("tipe", "MODAL_AWAL"),
+            'tambahan_modal': lambda db: db.table("modal").select("jumlah").eq("user_email", user_email).eq("tipe", "TAMBAHAN_MODAL"),
+            'prive': lambda db: db.table("prive").select("jumlah").eq("user_email", user_email),
+        })
+
+        neraca_lajur_data = hasil['neraca_lajur'] or []
+
+        # DEBUG: Cek apakah ada data
+        print(f"=== CEK DATA NERACA LAJUR ===")
+        print(f"Periode: {current_period}")
+        print(f"User: {user_email}") 
+        print(f"Jumlah data ditemukan: {len(neraca_lajur_data)}")
+
+        if len(neraca_lajur_data) == 0:
+            print("⚠️  WARNING: Data neraca_lajur KOSONG!")
+            # Coba generate ulang
+            print("Mencoba generate ulang neraca lajur...")
+            generate_result = supabase.rpc(
+                'generate_neraca_lajur',
+                {'p_period': current_period, 'p_user_email': user_email}
+            ).execute()
+            
+            # Ambil data lagi
+            neraca_lajur_result = supabase.table("neraca_lajur")\
+                .eq("period", current_period)\
+                .select("*")\
+                .eq("user_email", user_email)\
+                .order("account_code")\
+                .execute()
+            neraca_lajur_data = neraca_lajur_result.data or []
+            print(f"Jumlah data setelah regenerate: {len(neraca_lajur_data)}")
+
+        # 3. DATA ASET TETAP
+        aset_tetap_data = terapkan_penyusutan(hasil['aset_tetap'] or [])
+
+        # 4. DATA MODAL DAN PRIVE
+        total_modal_awal = sum(float(modal.get('jumlah', 0) or 0) for modal in hasil['modal_awal'] or [])
+        total_tambahan_modal = sum(float(modal.get('jumlah', 0) or 0) for modal in hasil['tambahan_modal'] or [])
+        total_prive = sum(float(prive.get('jumlah', 0) or 0) for prive in hasil['prive'] or [])
+        
+        # 5. HITUNG LABA RUGI DARI NERACA LAJUR
+        total_laba_rugi_debit = sum(float(item.get('laba_rugi_debit', 0) or 0) for item in neraca_lajur_data)
+        total_laba_rugi_kredit = sum(float(item.get('laba_rugi_kredit', 0) or 0) for item in neraca_lajur_data)
+        laba_bersih = total_laba_rugi_kredit - total_laba_rugi_debit
+        
+        # Hitung Modal Akhir (setelah penutupan)
+        modal_akhir = total_modal_awal + total_tambahan_modal + laba_bersih - total_prive
+
+        # 6. STRUKTUR AKUN UNTUK NERACA SALDO SETELAH PENUTUPAN
+        struktur_akun = {
+            '1100': {'nama': 'Aset Lancar', 'type': 'header'},
+            '1110': {'nama': 'Kas', 'type': 'detail', 'saldo_debit': 0},
+            '1120': {'nama': 'Piutang Usaha', 'type': 'detail', 'saldo_debit': 0},
+            '1130': {'nama': 'Persediaan Barang Dagang', 'type': 'detail', 'saldo_debit': 0},
+            '1140': {'nama': 'Perlengkapan', 'type': 'detail', 'saldo_debit': 0},
+            
+            '1200': {'nama': 'Aset Tetap', 'type': 'header'},
+            '1210': {'nama': 'Tanah', 'type': 'detail', 'saldo_debit': 0},
+            '1220': {'nama': 'Bangunan', 'type': 'detail', 'saldo_debit': 0},
+            '1221': {'nama': 'Akumulasi Penyusutan Bangunan', 'type': 'detail', 'saldo_kredit': 0},
+            '1230': {'nama': 'Kendaraan', 'type': 'detail', 'saldo_debit': 0},
+            '1231': {'nama': 'Akumulasi Penyusutan Kendaraan', 'type': 'detail', 'saldo_kredit': 0},
+            '1240': {'nama': 'Peralatan', 'type': 'detail', 'saldo_debit': 0},
+            '1241': {'nama': 'Akumulasi Penyusutan Peralatan', 'type': 'detail', 'saldo_kredit': 0},
+            
+            '2000': {'nama': 'Utang', 'type': 'header'},
+            '2100': {'nama': 'Utang', 'type': 'detail', 'saldo_kredit': 0},
+            '2200': {'nama': 'Pendapatan ddm', 'type': 'detail', 'saldo_kredit': 0},
+            
+            '3000': {'nama': 'Modal', 'type': 'header'},
+            '3100': {'nama': 'Modal', 'type': 'detail', 'saldo_kredit': modal_akhir},
+            '3200': {'nama': 'Prive Mas Angga', 'type': 'detail', 'saldo_debit': 0},  # SUDAH DITUTUP = 0
+            '3300': {'nama': 'Ikhitsar L/R', 'type': 'detail', 'saldo_debit': 0},     # SUDAH DITUTUP = 0
+            
+            '4000': {'nama': 'Pendapatan', 'type': 'header'},
+            '4100': {'nama': 'Penjualan', 'type': 'detail', 'saldo_kredit': 0},       # SUDAH DITUTUP = 0
+            '4200': {'nama': 'Retur Penjualan', 'type': 'detail', 'saldo_debit': 0},  # SUDAH DITUTUP = 0
+            '4300': {'nama': 'Potongan Penjualan', 'type': 'detail', 'saldo_debit': 0}, # SUDAH DITUTUP = 0
+            
+            '5110': {'nama': 'HPP', 'type': 'detail', 'saldo_debit': 0},              # SUDAH DITUTUP = 0
+            '5200': {'nama': 'Pembelian', 'type': 'detail', 'saldo_debit': 0},        # SUDAH DITUTUP = 0
+            
+            '6000': {'nama': 'Beban', 'type': 'header'},
+            '6100': {'nama': 'Beban Perlengkapan', 'type': 'detail', 'saldo_debit': 0}, # SUDAH DITUTUP = 0
+            '6200': {'nama': 'Beban air, listrik dan telepon', 'type': 'detail', 'saldo_debit': 0}, # SUDAH DITUTUP = 0
+            '6300': {'nama': 'Beban Penyusutan', 'type': 'detail', 'saldo_debit': 0}  # SUDAH DITUTUP = 0
+        }
+
+        # 7. MAPPING DARI NERACA LAJUR KE STRUKTUR AKUN
+        mapping_neraca_lajur = {
+            '1110': '1110',  # Kas
+            '102': '1120',  # Piutang
+            '201': '2100',  # Utang
+            '301': '3100',  # Modal
+            '401': '4100',  # Penjualan
+            '501': '5110',  # HPP
+            '502': '6100',  # Beban Perlengkapan
+            '503': '6200',  # Beban lain
+        }
+
+        # 8. UPDATE SALDO DARI NERACA LAJUR
+        for item in neraca_lajur_data:
+            account_code = item.get('account_code', '')
+            account_name = item.get('account_name', '')
+            neraca_debit = float(item.get('neraca_debit', 0) or 0)
+            neraca_kredit = float(item.get('neraca_kredit', 0) or 0)
+            
+            # Map dari neraca lajur ke struktur akun
+            target_kode = mapping_neraca_lajur.get(account_code, '')
+            
+            if target_kode and target_kode in struktur_akun:
+                if neraca_debit > 0:
+                    struktur_akun[target_kode]['saldo_debit'] = neraca_debit
+                if neraca_kredit > 0:
+                    struktur_akun[target_kode]['saldo_kredit'] = neraca_kredit
+            
+            # Handle akun khusus berdasarkan nama
+            if 'piutang' in account_name.lower() and neraca_debit > 0:
+                struktur_akun['1120']['saldo_debit'] = neraca_debit
+            elif 'persediaan' in account_name.lower() and neraca_debit > 0:
+                struktur_akun['1130']['saldo_debit'] = neraca_debit
+            elif 'perlengkapan' in account_name.lower() and neraca_debit > 0:
+                struktur_akun['1140']['saldo_debit'] = neraca_debit
+            elif 'pendapatan diterima dimuka' in account_name.lower() and neraca_kredit > 0:
+                struktur_akun['2200']['saldo_kredit'] = neraca_kredit
+
+        # 9. UPDATE SALDO ASET TETAP DARI DATABASE
+        for aset in aset_tetap_data:
+            jenis_aset = aset.get('jenis_aset', '').lower()
+            nama_aset = aset.get('nama_aset', '').lower()
+            nilai_perolehan = float(aset.get('nilai_perolehan', 0) or 0)
+            akumulasi_penyusutan = float(aset.get('akumulasi_penyusutan', 0) or 0)
+            
+            if 'tanah' in jenis_aset or 'tanah' in nama_aset:
+                struktur_akun['1210']['saldo_debit'] = nilai_perolehan
+            elif 'bangunan' in jenis_aset or 'bangunan' in nama_aset:
+                struktur_akun['1220']['saldo_debit'] = nilai_perolehan
+                struktur_akun['1221']['saldo_kredit'] = akumulasi_penyusutan
+            elif 'kendaraan' in jenis_aset or 'kendaraan' in nama_aset or 'mobil' in nama_aset:
+                struktur_akun['1230']['saldo_debit'] = nilai_perolehan
+                struktur_akun['1231']['saldo_kredit'] = akumulasi_penyusutan
+            elif 'peralatan' in jenis_aset or 'peralatan' in nama_aset or 'mesin' in nama_aset:
+                struktur_akun['1240']['saldo_debit'] = nilai_perolehan
+                struktur_akun['1241']['saldo_kredit'] = akumulasi_penyusutan
+
+        # 10. HITUNG TOTAL DEBIT DAN KREDIT
+        total_debit = 0
+        total_kredit = 0
+        
+        for kode_akun, data in struktur_akun.items():
+            if data['type'] == 'detail':
+                total_debit += data.get('saldo_debit', 0)
+                total_kredit += data.get('saldo_kredit', 0)
+
+        #AMBIL DATA DARI TABLE neraca_lajur - TAMBAHKAN DEBUG
+        neraca_lajur_result = supabase.table("neraca_lajur")\
+            .select("*")\
+            .eq("period", current_period)\
+            .eq("user_email", user_email)\
+            .order("account_code")\
+            .execute()
+
+        neraca_lajur_data = neraca_lajur_result.data or []
+
+        # DEBUG: Lihat apa yang ada di neraca_lajur
+        print("=== DEBUG NERACA LAJUR ===")
+        print(f"Periode: {current_period}")
+        print(f"User: {user_email}")
+        print(f"Jumlah data: {len(neraca_lajur_data)}")
+        for item in neraca_lajur_data:
+            print(f"Kode: {item.get('account_code')} | Nama: {item.get('account_name')} | Debit: {item.get('neraca_debit')} | Kredit: {item.get('neraca_kredit')}")
+        print("==========================")
+
+        # 11. GENERATE HTML TABLE ROWS
+        rows_html = ""
+        for kode_akun in sorted(struktur_akun.keys()):
+            data = struktur_akun[kode_akun]
+            
+            if data['type'] == 'header':
+                rows_html += f"""
+                <tr class="header-row">
+                    <td><strong>{kode_akun}</strong></td>
+                    <td><strong>{data['nama']}</strong></td>
+                    <td class="number"></td>
+                    <td class="number"></td>
+                </tr>
+                """
+            else:
+                saldo_debit = data.get('saldo_debit', 0)
+                saldo_kredit = data.get('saldo_kredit', 0)
+                
+                debit_display = rp(saldo_debit) if saldo_debit > 0 else ""
+                kredit_display = rp(saldo_kredit) if saldo_kredit > 0 else ""
+                
+                # Tandai akun yang sudah ditutup (saldo = 0)
+                row_class = "closed-account" if saldo_debit == 0 and saldo_kredit == 0 else ""
+                
+                rows_html += f"""
+                <tr class="{row_class}">
+                    <td>{kode_akun}</td>
+                    <td class="detail">{data['nama']}</td>
+                    <td class="number">{debit_display}</td>
+                    <td class="number">{kredit_display}</td>
+                </tr>
+                """
+        
+        # 12. GENERATE SUMMARY INFO
+        summary_html = f"""
+        <div class="summary-info">
+            <div class="summary-item">
+                <div class="summary-value">{rp(total_debit)}</div>
+                <div class="summary-label">Total Debit</div>
+            </div>
+            <div class="summary-item">
+                <div class="summary-value">{rp(total_kredit)}</div>
+                <div class="summary-label">Total Kredit</div>
+            </div>
+            <div class="summary-item">
+                <div class="summary-value">{rp(modal_akhir)}</div>
+                <div class="summary-label">Modal Akhir</div>
+            </div>
+            <div class="summary-item">
+                <div class="summary-value">{'✅' if abs(total_debit - total_kredit) < 0.01 else '❌'}</div>
+                <div class="summary-label">Status</div>
+            </div>
+        </div>
+        """
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Neraca Saldo Setelah Penutupan - PINKILANG</title>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #f0f8ff, #e6f7ff);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 900px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #28a745, #20c997);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                    font-weight: 600;
+                }}
+                
+                .company-info {{
+                    font-size: 18px;
+                    margin-bottom: 5px;
+                    font-weight: 500;
+                }}
+                
+                .period-info {{
+                    font-size: 14px;
+                    opacity: 0.9;
+                }}
+                
+                .content {{
+                    padding: 30px;
+                }}
+                
+                .post-closing-tb {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                    font-size: 14px;
+                }}
+                
+                .post-closing-tb th {{
+                    background: #f8f9fa;
+                    padding: 12px 8px;
+                    text-align: left;
+                    border: 1px solid #dee2e6;
+                    font-weight: 600;
+                    color: #495057;
+                }}
+                
+                .post-closing-tb td {{
+                    padding: 10px 8px;
+                    border: 1px solid #dee2e6;
+                    color: #333;
+                }}
+                
+                .post-closing-tb .header-row {{
+                    background: #e3f2fd;
+                    font-weight: bold;
+                }}
+                
+                .post-closing-tb .detail {{
+                    padding-left: 20px;
+                }}
+                
+                .post-closing-tb .closed-account {{
+                    background-color: #f8f9fa;
+                    color: #6c757d;
+                    font-style: italic;
+                }}
+                
+                .post-closing-tb .total-row {{
+                    background: #fff3cd;
+                    font-weight: bold;
+                    font-size: 15px;
+                }}
+                
+                .number {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                    font-weight: 500;
+                }}
+                
+                .balance-status {{
+                    text-align: center;
+                    padding: 15px;
+                    margin: 20px 0;
+                    border-radius: 10px;
+                    font-weight: 600;
+                    font-size: 16px;
+                }}
+                
+                .balance-correct {{
+                    background: #d4edda;
+                    color: #155724;
+                    border: 2px solid #c3e6cb;
+                }}
+                
+                .balance-incorrect {{
+                    background: #f8d7da;
+                    color: #721c24;
+                    border: 2px solid #f5c6cb;
+                }}
+                
+                .summary-info {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 15px;
+                    margin: 20px 0;
+                }}
+                
+                .summary-item {{
+                    background: #f8f9fa;
+                    padding: 15px;
+                    border-radius: 8px;
+                    text-align: center;
+                    border-left: 4px solid #28a745;
+                }}
+                
+                .summary-value {{
+                    font-size: 16px;
+                    font-weight: bold;
+                    color: #28a745;
+                    margin-bottom: 5px;
+                }}
+                
+                .summary-label {{
+                    font-size: 12px;
+                    color: #666;
+                }}
+                
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                    display: flex;
+                    gap: 10px;
+                    justify-content: center;
+                    flex-wrap: wrap;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 12px 24px;
+                    background: #6c757d;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 6px;
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                    border: none;
+                    cursor: pointer;
+                    font-size: 14px;
+                }}
+                
+                .btn:hover {{
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+                }}
+                
+                .btn-primary {{
+                    background: #28a745;
+                }}
+                
+                .btn-info {{
+                    background: #17a2b8;
+                }}
+                
+                .btn-success {{
+                    background: #20c997;
+                }}
+                
+                .btn-warning {{
+                    background: #ffc107;
+                    color: #000;
+                }}
+                
+                @media print {{
+                    body {{
+                        background: white;
+                        padding: 0;
+                    }}
+                    .container {{
+                        box-shadow: none;
+                        border-radius: 0;
+                    }}
+                    .action-buttons {{
+                        display: none;
+                    }}
+                    .summary-info {{
+                        display: none;
+                    }}
+                    .closed-account {{
+                        display: none;
+                    }}
+                }}
+                
+                @media (max-width: 768px) {{
+                    .container {{
+                        margin: 10px;
+                        border-radius: 10px;
+                    }}
+                    
+                    .content {{
+                        padding: 15px;
+                    }}
+                    
+                    .post-closing-tb {{
+                        font-size: 12px;
+                    }}
+                    
+                    .post-closing-tb td,
+                    .post-closing-tb th {{
+                        padding: 8px 6px;
+                    }}
+                    
+                    .action-buttons {{
+                        flex-direction: column;
+                    }}
+                    
+                    .btn {{
+                        width: 100%;
+                        margin: 2px 0;
+                    }}
+                    
+                    .summary-info {{
+                        grid-template-columns: 1fr;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📋 NERACA SALDO SETELAH PENUTUPAN</h1>
+                    <div class="company-info">RUMAH BIBIT MAS ANGGA</div>
+                    <div class="period-info">Periode: {datetime.now().strftime('%B %Y')}</div>
+                    <div class="period-info">Login sebagai: {user_email}</div>
+                </div>
+                
+                <div class="content">
+                    {summary_html}
+                    
+                    <div class="balance-status {'balance-correct' if abs(total_debit - total_kredit) < 0.01 else 'balance-incorrect'}">
+                        {'✅ NERACA SALDO SETELAH PENUTUPAN SEIMBANG' if abs(total_debit - total_kredit) < 0.01 else '❌ NERACA SALDO SETELAH PENUTUPAN TIDAK SEIMBANG'}
+                        <br>
+                        <small>Total Debit: {rp(total_debit)} | Total Kredit: {rp(total_kredit)}</small>
+                    </div>
+                    
+                    <table class="post-closing-tb">
+                        <thead>
+                            <tr>
+                                <th width="80">NO</th>
+                                <th>NAMA AKUN</th>
+                                <th width="180">DEBIT</th>
+                                <th width="180">KREDIT</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            {rows_html}
+                            
+                            <!-- TOTAL ROW -->
+                            <tr class="total-row">
+                                <td colspan="2"><strong>TOTAL</strong></td>
+                                <td class="number"><strong>{rp(total_debit)}</strong></td>
+                                <td class="number"><strong>{rp(total_kredit)}</strong></td>
+                            </tr>
+                        </tbody>
+                    </table>
+                    
+                    <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 20px; font-size: 12px; color: #666;">
+                        <strong>Keterangan:</strong><br>
+                        • Akun dengan warna abu-abu adalah akun nominal yang sudah ditutup (saldo = 0)<br>
+                        • Prive, Ikhtisar L/R, Pendapatan, dan Beban sudah ditutup ke Modal<br>
+                        • Hanya akun riil (Aset, Utang, Modal) yang memiliki saldo<br>
+                        • Data diambil otomatis dari Neraca Lajur periode {current_period}
+                    </div>
+                    
+                    <div class="action-buttons">
+                        <a href="/dashboard" class="btn btn-primary">🏠 Dashboard</a>
+                        <a href="/neraca-lajur" class="btn btn-info">📊 Neraca Lajur</a>
+                        <a href="/jurnal-penutup" class="btn btn-success">📒 Jurnal Penutup</a>
+                        <a href="/laporan-posisi-keuangan" class="btn btn-warning">💰 Neraca</a>
+                        <button onclick="window.print()" class="btn" style="background: #17a2b8;">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+            
+            <script>
+                document.addEventListener('DOMContentLoaded', function() {{
+                    // Add animation
+                    const rows = document.querySelectorAll('.post-closing-tb tbody tr');
+                    rows.forEach((row, index) => {{
+                        row.style.opacity = '0';
+                        row.style.transform = 'translateY(10px)';
+                        setTimeout(() => {{
+                            row.style.transition = 'all 0.3s ease';
+                            row.style.opacity = '1';
+                            row.style.transform = 'translateY(0)';
+                        }}, index * 30);
+                    }});
+                }});
+            </script>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di Neraca Saldo Setelah Penutupan: {str(e)}")
+        import traceback
+        error_details = traceback.format_exc()
+        
+        return f"""
+        <html>
+        <body style="font-family: Arial; padding: 20px; background: #f8f9fa;">
+            <div style="max-width: 600px; margin: 50px auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center;">
+                <h1 style="color: #dc3545; margin-bottom: 20px;">❌ Error Neraca Saldo Setelah Penutupan</h1>
+                <p style="color: #666; margin-bottom: 20px;">Terjadi kesalahan saat memproses data:</p>
+                <p style="background: #f8d7da; color: #721c24; padding: 15px; border-radius: 5px; font-family: monospace; font-size: 12px; text-align: left; overflow-x: auto;">
+                    {str(e)}
+                </p>
+                <a href="/dashboard" style="display: inline-block; margin-top: 20px; padding: 10px 20px; background: #28a745; color: white; text-decoration: none; border-radius: 5px;">← Kembali ke Dashboard</a>
+            </div>
+        </body>
+        </html>
+        """
+
+# ============================================================
+# 🔹 ROUTE: Neraca Saldo Setelah Penyesuaian (NSSP) 
+# ============================================================
+def neraca_saldo_setelah_penyesuaian():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Ambil data jurnal umum
+        jurnal_result = supabase.table("jurnal_umum").select("*").order("tanggal").execute()
+        jurnal_data = jurnal_result.data or []
+        
+        # Filter: hapus Utang Beban dan Beban Listrik, Air dan Telepon 
+        jurnal_data = filter_akun_tidak_diinginkan(jurnal_data)
+        
+        # Kelompokkan per akun dan hitung saldo
+        akun_data = {}
+        
+        for jurnal in jurnal_data:
+            akun_nama = jurnal.get('nama_akun', 'Unknown')
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            if akun_nama not in akun_data:
+                akun_data[akun_nama] = {
+                    'neraca_saldo_debit': 0,
+                    'neraca_saldo_kredit': 0,
+                    'penyesuaian_debit': 0,
+                    'penyesuaian_kredit': 0,
+                    'saldo_setelah_debit': 0,
+                    'saldo_setelah_kredit': 0
+                }
+            
+            # Pisahkan antara jurnal biasa dan jurnal penyesuaian
+            if jurnal.get('transaksi_type') == 'PENYESUAIAN':
+                # Ini jurnal penyesuaian
+                akun_data[akun_nama]['penyesuaian_debit'] += debit
+                akun_data[akun_nama]['penyesuaian_kredit'] += kredit
+            else:
+                # Ini jurnal biasa (neraca saldo)
+                akun_data[akun_nama]['neraca_saldo_debit'] += debit
+                akun_data[akun_nama]['neraca_saldo_kredit'] += kredit
+        
+        # Hitung saldo setelah penyesuaian
+        for akun_nama, data in akun_data.items():
+            data['saldo_setelah_debit'] = data['neraca_saldo_debit'] + data['penyesuaian_debit']
+            data['saldo_setelah_kredit'] = data['neraca_saldo_kredit'] + data['penyesuaian_kredit']
+        
+        # Format currency helper
+        def rp(val):
+            try:
+                return f"Rp {int(val):,}".replace(",", ".")
+            except:
+                return "Rp 0"
+        
+        # Generate table rows - HANYA TAMPILKAN SALDO SETELAH PENYESUAIAN
+        rows_html = ""
+        total_setelah_debit = 0
+        total_setelah_kredit = 0
+        
+        for akun_nama, data in sorted(akun_data.items()):
+            # Hanya tampilkan akun yang memiliki saldo (tidak nol semua)
+            if data['saldo_setelah_debit'] > 0 or data['saldo_setelah_kredit'] > 0:
+                total_setelah_debit += data['saldo_setelah_debit']
+                total_setelah_kredit += data['saldo_setelah_kredit']
+                
+                rows_html += f"""
+                <tr>
+                    <td>{akun_nama}</td>
+                    <td class="number">{rp(data['saldo_setelah_debit'])}</td>
+                    <td class="number">{rp(data['saldo_setelah_kredit'])}</td>
+                </tr>
+                """
+        
+        # Cek keseimbangan
+        is_balanced = abs(total_setelah_debit - total_setelah_kredit) < 0.01
+        
+        # Debug info
+        logger.info(f"🔍 DEBUG NSSP:")
+        logger.info(f"   Total Debit: {total_setelah_debit}")
+        logger.info(f"   Total Kredit: {total_setelah_kredit}")
+        logger.info(f"   Selisih: {total_setelah_debit - total_setelah_kredit}")
+        logger.info(f"   Seimbang: {is_balanced}")
+
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Neraca Saldo Setelah Penyesuaian - PINKILANG</title>
+            <meta charset="utf-8">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #ffe6f2, #ffccde);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 900px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #ff6ea9, #c4006e);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                    font-weight: 600;
+                }}
+                
+                .user-info {{
+                    font-size: 16px;
+                    opacity: 0.9;
+                    margin-top: 5px;
+                }}
+                
+                .content {{
+                    padding: 30px;
+                }}
+                
+                /* Table Styling */
+                .table-container {{
+                    background: white;
+                    border-radius: 10px;
+                    overflow: hidden;
+                    box-shadow: 0 4px 15px rgba(0,0,0,0.08);
+                    margin: 20px 0;
+                }}
+                
+                .neraca-table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    font-size: 14px;
+                }}
+                
+                .neraca-table thead {{
+                    background: linear-gradient(135deg, #ff6ea9, #c4006e);
+                }}
+                
+                .neraca-table th {{
+                    padding: 16px 12px;
+                    text-align: left;
+                    color: white;
+                    font-weight: 600;
+                    font-size: 14px;
+                    border: none;
+                }}
+                
+                .neraca-table th:first-child {{
+                    border-radius: 8px 0 0 0;
+                }}
+                
+                .neraca-table th:last-child {{
+                    border-radius: 0 8px 0 0;
+                }}
+                
+                .neraca-table td {{
+                    padding: 14px 12px;
+                    border-bottom: 1px solid #f0f0f0;
+                    color: #333;
+                }}
+                
+                .neraca-table tbody tr:hover {{
+                    background: #f8f8f8;
+                    transition: all 0.2s ease;
+                }}
+                
+                .neraca-table tfoot {{
+                    background: #fde3ef;
+                    font-weight: bold;
+                }}
+                
+                .neraca-table tfoot td {{
+                    padding: 16px 12px;
+                    border-bottom: none;
+                    font-size: 15px;
+                }}
+                
+                .neraca-table tfoot td:first-child {{
+                    border-radius: 0 0 0 8px;
+                }}
+                
+                .neraca-table tfoot td:last-child {{
+                    border-radius: 0 0 8px 0;
+                }}
+                
+                /* Number alignment */
+                .number {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                }}
+                
+                /* Color Coding */
+                .debit {{
+                    color: #008000;
+                    font-weight: 600;
+                }}
+                
+                .kredit {{
+                    color: #b30000;
+                    font-weight: 600;
+                }}
+                
+                /* Balance Status */
+                .balance-status {{
+                    text-align: center;
+                    padding: 15px;
+                    margin: 20px 0;
+                    border-radius: 10px;
+                    font-weight: 600;
+                    font-size: 16px;
+                }}
+                
+                .balance-correct {{
+                    background: #d4edda;
+                    color: #155724;
+                    border: 1px solid #c3e6cb;
+                }}
+                
+                .balance-incorrect {{
+                    background: #f8d7da;
+                    color: #721c24;
+                    border: 1px solid #f5c6cb;
+                }}
+                
+                /* Summary Cards */
+                .summary-cards {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 15px;
+                    margin: 25px 0;
+                }}
+                
+                .summary-card {{
+                    background: #f8f9fa;
+                    padding: 20px;
+                    border-radius: 10px;
+                    text-align: center;
+                    border-left: 4px solid #ff6ea9;
+                }}
+                
+                .summary-number {{
+                    font-size: 24px;
+                    font-weight: bold;
+                    color: #c4006e;
+                    margin-bottom: 5px;
+                }}
+                
+                .summary-label {{
+                    font-size: 14px;
+                    color: #666;
+                }}
+                
+                /* Action Buttons */
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 12px 24px;
+                    background: #6c757d;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 6px;
+                    margin: 0 5px;
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                    border: none;
+                    cursor: pointer;
+                }}
+                
+                .btn:hover {{
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+                }}
+                
+                .btn-primary {{
+                    background: #c4006e;
+                }}
+                
+                .btn-info {{
+                    background: #17a2b8;
+                }}
+                
+                .btn-success {{
+                    background: #28a745;
+                }}
+                
+                @media (max-width: 768px) {{
+                    .container {{
+                        margin: 10px;
+                    }}
+                    
+                    .content {{
+                        padding: 20px;
+                    }}
+                    
+                    .neraca-table {{
+                        font-size: 12px;
+                    }}
+                    
+                    .neraca-table th,
+                    .neraca-table td {{
+                        padding: 10px 8px;
+                    }}
+                    
+                    .summary-cards {{
+                        grid-template-columns: 1fr;
+                    }}
+                    
+                    .action-buttons {{
+                        display: flex;
+                        flex-direction: column;
+                        gap: 10px;
+                    }}
+                    
+                    .btn {{
+                        width: 100%;
+                        margin: 2px 0;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <!-- Header -->
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📊 Neraca Saldo Setelah Penyesuaian</h1>
+                    <div class="user-info">Login sebagai: <strong>{user_email}</strong></div>
+                </div>
+                
+                <!-- Content -->
+                <div class="content">
+                    <!-- Summary Cards -->
+                    <div class="summary-cards">
+                        <div class="summary-card">
+                            <div class="summary-number">{len([akun for akun, data in akun_data.items() if data['saldo_setelah_debit'] > 0 or data['saldo_setelah_kredit'] > 0])}</div>
+                            <div class="summary-label">Total Akun</div>
+                        </div>
+                        <div class="summary-card">
+                            <div class="summary-number">{rp(total_setelah_debit)}</div>
+                            <div class="summary-label">Total Debit</div>
+                        </div>
+                        <div class="summary-card">
+                            <div class="summary-number">{rp(total_setelah_kredit)}</div>
+                            <div class="summary-label">Total Kredit</div>
+                        </div>
+                    </div>
+                    
+                    <!-- Balance Status -->
+                    <div class="balance-status {'balance-correct' if is_balanced else 'balance-incorrect'}">
+                        {'✅ NERACA SALDO SETELAH PENYESUAIAN SEIMBANG' if is_balanced else '❌ NERACA SALDO SETELAH PENYESUAIAN TIDAK SEIMBANG'}
+                        <br>
+                        <small>Total Debit: {rp(total_setelah_debit)} | Total Kredit: {rp(total_setelah_kredit)}</small>
+                    </div>
+                    
+                    <!-- Neraca Table -->
+                    <div class="table-container">
+                        <table class="neraca-table">
+                            <thead>
+                                <tr>
+                                    <th>Nama Akun</th>
+                                    <th>Debit</th>
+                                    <th>Kredit</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {rows_html}
+                            </tbody>
+                            <tfoot>
+                                <tr>
+                                    <td><strong>TOTAL</strong></td>
+                                    <td class="number debit"><strong>{rp(total_setelah_debit)}</strong></td>
+                                    <td class="number kredit"><strong>{rp(total_setelah_kredit)}</strong></td>
+                                </tr>
+                            </tfoot>
+                        </table>
+                    </div>
+                    
+                    <!-- Action Buttons -->
+                    <div class="action-buttons">
+                        <a href="/dashboard" class="btn btn-primary">🏠 Dashboard</a>
+                        <a href="/neraca-saldo" class="btn btn-info">📋 Neraca Saldo</a>
+                        <a href="/jurnal-penyesuaian" class="btn btn-success">🔄 Jurnal Penyesuaian</a>
+                        <button onclick="window.print()" class="btn" style="background: #17a2b8;">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+            
+            <script>
+                // Add subtle animation to table rows
+                document.addEventListener('DOMContentLoaded', function() {{
+                    const rows = document.querySelectorAll('.neraca-table tbody tr');
+                    rows.forEach((row, index) => {{
+                        row.style.opacity = '0';
+                        row.style.transform = 'translateY(10px)';
+                        setTimeout(() => {{
+                            row.style.transition = 'all 0.3s ease';
+                            row.style.opacity = '1';
+                            row.style.transform = 'translateY(0)';
+                        }}, index * 50);
+                    }});
+                }});
+            </script>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di NSSP: {str(e)}")
+        return f"""
+        <html>
+        <body style="font-family: Arial; padding: 20px; background: #f8f9fa;">
+            <div style="max-width: 600px; margin: 50px auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center;">
+                <h1 style="color: #dc3545; margin-bottom: 20px;">❌ Error Neraca Saldo Setelah Penyesuaian</h1>
+                <p style="color: #666; margin-bottom: 20px;">Terjadi kesalahan saat memproses data:</p>
+                <p style="background: #f8d7da; color: #721c24; padding: 15px; border-radius: 5px; font-family: monospace;">{str(e)}</p>
+                <a href="/dashboard" style="display: inline-block; margin-top: 20px; padding: 10px 20px; background: #c4006e; color: white; text-decoration: none; border-radius: 5px;">← Kembali ke Dashboard</a>
+            </div>
+        </body>
+        </html>
+        """
+
+# ============================================================
+# 🔹 ROUTE: Neraca Saldo Awal (Input Manual)
+# ============================================================
+def neraca_saldo_awal():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get('user_email')
+    message = ""
+
+    # Dapatkan daftar akun dari CHART_OF_ACCOUNTS
+    account_options = ""
+    for kode, info in CHART_OF_ACCOUNTS.items():
+        account_options += f'<option value="{info["nama"]}">{info["nama"]} ({kode})</option>'
+
+    # Handle POST request untuk simpan saldo
+    if request.method == "POST" and 'add_saldo' in request.form:
+        try:
+            tanggal = request.form["tanggal"]
+            nama_akun = request.form["nama_akun"]
+            debit = int(request.form.get("debit", 0) or 0)
+            kredit = int(request.form.get("kredit", 0) or 0)
+            keterangan = request.form.get("keterangan", "Saldo Awal")
+
+            if debit < 0 or kredit < 0:
+                message = '<div class="message error">❌ Nilai harus positif.</div>'
+            elif debit > 0 and kredit > 0:
+                message = '<div class="message error">❌ Saldo harus di Debit ATAU Kredit, tidak keduanya.</div>'
+            elif debit == 0 and kredit == 0:
+                message = '<div class="message error">❌ Jumlah tidak boleh nol.</div>'
+            else:
+                nsa_data = {
+                    "user_email": user_email,
+                    "tanggal": tanggal,
+                    "nama_akun": nama_akun,
+                    "debit": debit,
+                    "kredit": kredit,
+                    "keterangan": keterangan,
+                    "created_at": datetime.now().isoformat()
+                }
+
+                if supabase:
+                    supabase.table("neraca_saldo_awal").insert(nsa_data).execute()
+                    message = f'<div class="message success">✅ Saldo awal {nama_akun} berhasil dicatat!</div>'
+                else:
+                    message = '<div class="message error">❌ Database tidak terhubung.</div>'
+
+        except Exception as e:
+            message = f'<div class="message error">❌ Error menyimpan saldo: {str(e)}</div>'
+            logger.error(f"Error simpan NSA: {str(e)}")
+
+    # Ambil data Neraca Saldo Awal yang sudah ada
+    nsa_consolidated = get_initial_balance_data()
+
+    # Generate tabel data
+    nsa_rows = ""
+    total_debit = 0
+    total_kredit = 0
+
+    if nsa_consolidated:
+        for akun, data in nsa_consolidated.items():
+            debit = data['debit']
+            kredit = data['kredit']
+            total_debit += debit
+            total_kredit += kredit
+
+            nsa_rows += f"""
+            <tr>
+                <td>{akun}</td>
+                <td class="number debit-cell">{format_currency(debit)}</td>
+                <td class="number kredit-cell">{format_currency(kredit)}</td>
+                <td style="font-size: 11px;">{len(data['data'])} entri</td>
+            </tr>
+            """
+    else:
+        nsa_rows = """
+        <tr>
+            <td colspan="4" class="empty-state">
+                📊 Belum ada data Neraca Saldo Awal.
+            </td>
+        </tr>
+        """
+
+    # Hitung keseimbangan
+    is_balanced = abs(total_debit - total_kredit) < 0.01
+
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Neraca Saldo Awal - PINKILANG</title>
+        <meta charset="utf-8">
+        <style>
+            /* Styles similar to aset-tetap and jurnal-umum */
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            body {{ font-family: 'Arial', sans-serif; background: linear-gradient(135deg, #ffe6f2, #fff0f7); padding: 20px; min-height: 100vh; }}
+            .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.1); overflow: hidden; }}
+            .header {{ background: linear-gradient(135deg, #ff9966, #ff7e46); color: white; padding: 25px; text-align: center; }}
+            .back-btn {{ display: inline-block; padding: 10px 20px; background: rgba(255,255,255,0.2); color: white; text-decoration: none; border-radius: 8px; margin-bottom: 15px; border: 1px solid rgba(255,255,255,0.3); }}
+            h1 {{ font-size: 28px; margin-bottom: 10px; }}
+            .content {{ padding: 25px; }}
+            .section {{ margin: 30px 0; padding: 25px; background: #f0faf5; border-radius: 12px; border-left: 5px solid #ff9966; }}
+            .section-title {{ color: #ff9966; font-size: 22px; margin-bottom: 20px; padding-bottom: 10px; border-bottom: 2px solid #ff9966; }}
+            .form-grid {{ display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 20px; margin-bottom: 20px; }}
+            .form-group {{ margin-bottom: 15px; }}
+            label {{ display: block; margin-bottom: 5px; color: #ff7e46; font-weight: bold; }}
+            input, select, textarea {{ width: 100%; padding: 12px; border: 2px solid #ffd1b3; border-radius: 8px; font-size: 16px; background: white; }}
+            .btn {{ padding: 12px 30px; background: linear-gradient(135deg, #ff9966, #ff7e46); color: white; border: none; border-radius: 8px; cursor: pointer; font-size: 16px; font-weight: bold; }}
+            .message {{ padding: 15px; margin: 15px 0; border-radius: 8px; font-size: 14px; }}
+            .success {{ background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }}
+            .error {{ background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }}
+            .stats-grid {{ display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 20px; margin: 20px 0; }}
+            .stat-card {{ background: white; padding: 20px; border-radius: 10px; text-align: center; border: 2px solid #ffd1b3; }}
+            .stat-number {{ font-size: 24px; font-weight: bold; color: #ff9966; margin: 10px 0; }}
+            .table-container {{ overflow-x: auto; margin-top: 15px; }}
+            table {{ width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden; }}
+            th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #f0faf5; }}
+            th {{ background: #ff9966; color: white; font-weight: bold; }}
+            .number {{ text-align: right; font-family: 'Courier New', monospace; }}
+            .debit-cell {{ color: #009933; }}
+            .kredit-cell {{ color: #cc0000; }}
+            .total-row {{ background: #ffd1b3; font-weight: bold; }}
+            .balance-status {{ padding: 15px; margin-bottom: 15px; border-radius: 8px; text-align: center; font-weight: bold; }}
+            .balanced {{ background: #d4edda; color: #155724; }}
+            .unbalanced {{ background: #f8d7da; color: #721c24; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>📋 Neraca Saldo Awal</h1>
+                <p>Input Manual Saldo Awal Akun sebelum Periode Transaksi</p>
+            </div>
+            
+            <div class="content">
+                {message}
+
+                <div class="section">
+                    <h2 class="section-title">➕ Input Saldo Awal</h2>
+                    
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal">📅 Tanggal:</label>
+                                <input type="date" id="tanggal" name="tanggal" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="nama_akun">🏷️ Nama Akun:</label>
+                                <select id="nama_akun" name="nama_akun" required>
+                                    <option value="">Pilih Akun</option>
+                                    {account_options}
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="keterangan">📝 Keterangan:</label>
+                                <input type="text" id="keterangan" name="keterangan" value="Saldo Awal" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="debit">💚 Debit (Isi jika saldo normal Debit):</label>
+                                <input type="number" id="debit" name="debit" placeholder="0" min="0" step="1">
+                            </div>
+                            <div class="form-group">
+                                <label for="kredit">❤️ Kredit (Isi jika saldo normal Kredit):</label>
+                                <input type="number" id="kredit" name="kredit" placeholder="0" min="0" step="1">
+                            </div>
+                            <div class="form-group" style="display: flex; align-items: flex-end;">
+                                <button type="submit" name="add_saldo" class="btn">💾 Catat Saldo Awal</button>
+                            </div>
+                        </div>
+                    </form>
+                </div>
+
+                <div class="section">
+                    <h2 class="section-title">📋 Rekap Neraca Saldo Awal</h2>
+
+                    <div class="balance-status {'balanced' if is_balanced else 'unbalanced'}">
+                        { '✅ SALDO AWAL SEIMBANG' if is_balanced else '❌ SALDO AWAL TIDAK SEIMBANG' }
+                        {f'<br><small>Selisih: {format_currency(abs(total_debit - total_kredit))}</small>' if not is_balanced else ''}
+                    </div>
+
+                    <div class="stats-grid">
+                        <div class="stat-card">
+                            <div class="stat-number debit-cell">{format_currency(total_debit)}</div>
+                            <div class="stat-label">Total Debit</div>
+                        </div>
+                        <div class="stat-card">
+                            <div class="stat-number kredit-cell">{format_currency(total_kredit)}</div>
+                            <div class="stat-label">Total Kredit</div>
+                        </div>
+                        <div class="stat-card">
+                            <div class="stat-number">{len(nsa_consolidated)}</div>
+                            <div class="stat-label">Jumlah Akun</div>
+                        </div>
+                    </div>
+                    
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>Nama Akun</th>
+                                    <th style="text-align: right;">Debit</th>
+                                    <th style="text-align: right;">Kredit</th>
+                                    <th>Info</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {nsa_rows}
+                                <tr class="total-row">
+                                    <td><strong>TOTAL KESELURUHAN</strong></td>
+                                    <td class="number">{format_currency(total_debit)}</td>
+                                    <td class="number">{format_currency(total_kredit)}</td>
+                                    <td></td>
+                                </tr>
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+
+                <div style="text-align: center; margin-top: 30px;">
+                    <a href="/neraca-lajur" class="btn" style="background: #ff66a3;">📊 Lihat Neraca Lajur Terintegrasi</a>
+                    <button onclick="window.print()" class="btn" style="background: #6c757d;">🖨️ Cetak</button>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    return html
@@ -0,0 +1,783 @@
+"""
+Backend lokal pengganti Supabase: SQLite di satu file, tanpa jaringan.
+
+Aktif dengan DB_BACKEND=local (file di LOCAL_DB_PATH). Mengimplementasikan
+bagian query builder supabase-py yang dipakai aplikasi:
+
+    table(...).select(kolom, count="exact", head=...) / insert / upsert / update / delete
+    .eq .neq .gt .gte .lt .lte .in_ .is_ .like .ilike .order .limit .range .execute()
+    rpc("generate_neraca_lajur", {...}), rpc("ringkasan_dashboard"), rpc("posting_transaksi", {...}), rpc("posting_jurnal", {...}) ...
+
+Tabel dan view (view_laporan_modal, view_riwayat_modal) dibuat otomatis saat
+client pertama dipakai, termasuk kolom deleted_at untuk soft delete dan kunci
+unik jurnal (ref_id, ref_baris) untuk baris yang belum dihapus; file lama dimigrasi otomatis. RPC dan view
+mengabaikan tombstone. Kolom yang tidak dikenal di insert/update ditambahkan
+otomatis dengan peringatan (LOCAL_DB_STRICT=1 untuk error seperti PostgREST).
+Dipakai untuk development, benchmark dan load test di laptop.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import os
+import re
+import sqlite3
+import threading
+from pinkilang.core import TABEL_SOFT_DELETE, logger
+
+LOCAL_DB_STRICT = os.getenv("LOCAL_DB_STRICT", "0") == "1"
+
+_SEKARANG = "(strftime('%Y-%m-%dT%H:%M:%f', 'now'))"
+
+SCHEMA_LOKAL = f"""
+CREATE TABLE IF NOT EXISTS "user" (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    password TEXT,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS penjualan (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    user_email TEXT,
+    tanggal TEXT,
+    nama_barang TEXT,
+    nama_pegawai TEXT,
+    nama_pelanggan TEXT,
+    jumlah NUMERIC,
+    harga_beli NUMERIC,
+    harga_jual NUMERIC,
+    total_penjualan NUMERIC,
+    hpp NUMERIC,
+    metode_pembayaran TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS pembelian (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    user_email TEXT,
+    tanggal TEXT,
+    nama_barang TEXT,
+    nama_supplier TEXT,
+    jumlah NUMERIC,
+    harga_beli_per_ekor NUMERIC,
+    total_pembelian NUMERIC,
+    metode_pembayaran TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS pelunasan_piutang (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    penjualan_id INTEGER,
+    tanggal_bayar TEXT,
+    jumlah_bayar NUMERIC,
+    metode_pembayaran TEXT,
+    user_email TEXT,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS pelunasan_utang (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pembelian_id INTEGER,
+    tanggal_bayar TEXT,
+    jumlah_bayar NUMERIC,
+    metode_pembayaran TEXT,
+    nama_supplier TEXT,
+    user_email TEXT,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS utang (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    user_email TEXT,
+    tanggal TEXT,
+    keterangan TEXT,
+    akun_lawan TEXT,
+    debit NUMERIC DEFAULT 0,
+    kredit NUMERIC DEFAULT 0,
+    jenis TEXT,
+    ref_id INTEGER,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS operasional (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    user_email TEXT,
+    tanggal TEXT,
+    jenis_pengeluaran TEXT,
+    nama_barang TEXT,
+    jumlah NUMERIC,
+    satuan TEXT,
+    harga_satuan NUMERIC,
+    total_pengeluaran NUMERIC,
+    supplier TEXT,
+    metode_pembayaran TEXT,
+    keterangan TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS prive (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    user_email TEXT,
+    tanggal TEXT,
+    jumlah NUMERIC,
+    keterangan TEXT,
+    metode_pembayaran TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS modal (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    user_email TEXT,
+    tanggal TEXT,
+    jumlah NUMERIC,
+    keterangan TEXT,
+    tipe TEXT,
+    sumber_modal TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS jurnal_umum (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tanggal TEXT,
+    nama_akun TEXT,
+    ref TEXT,
+    ref_id TEXT,
+    ref_baris INTEGER,
+    akun_debit TEXT,
+    akun_kredit TEXT,
+    jumlah NUMERIC,
+    debit NUMERIC DEFAULT 0,
+    kredit NUMERIC DEFAULT 0,
+    deskripsi TEXT,
+    keterangan TEXT,
+    transaksi_type TEXT,
+    transaksi_id TEXT,
+    referensi_id TEXT,
+    user_email TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    updated_at TEXT,
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS aset_tetap (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_email TEXT NOT NULL,
+    tanggal_perolehan TEXT NOT NULL,
+    jenis_aset TEXT NOT NULL,
+    nama_aset TEXT NOT NULL,
+    nilai_perolehan NUMERIC NOT NULL,
+    masa_manfaat INTEGER NOT NULL,
+    nilai_residu NUMERIC DEFAULT 0,
+    metode_penyusutan TEXT DEFAULT 'GARIS_LURUS',
+    penyusutan_tahunan NUMERIC NOT NULL,
+    akumulasi_penyusutan NUMERIC DEFAULT 0,
+    nilai_buku NUMERIC NOT NULL,
+    keterangan TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    updated_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS neraca_saldo_awal (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_email TEXT,
+    tanggal TEXT,
+    nama_akun TEXT,
+    debit NUMERIC DEFAULT 0,
+    kredit NUMERIC DEFAULT 0,
+    keterangan TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    deleted_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS pendapatan_diterima_dimuka (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_email TEXT,
+    tanggal TEXT,
+    nama_customer TEXT,
+    jenis_ikan TEXT,
+    jumlah_ekor NUMERIC,
+    harga_jual_per_ekor NUMERIC,
+    total_harga_jual NUMERIC,
+    dp_persen NUMERIC,
+    jumlah_dp NUMERIC,
+    metode_pembayaran TEXT,
+    keterangan TEXT,
+    status TEXT,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS persediaan_terintegrasi (
+    id INTEGER PRIMARY KEY,
+    jumlah_persediaan NUMERIC DEFAULT 0,
+    created_by TEXT,
+    updated_by TEXT,
+    created_at TEXT DEFAULT {_SEKARANG},
+    updated_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS penyesuaian_berulang (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_email TEXT,
+    akun_debit TEXT,
+    akun_kredit TEXT,
+    jumlah NUMERIC,
+    keterangan TEXT,
+    aktif BOOLEAN DEFAULT 1,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE TABLE IF NOT EXISTS neraca_lajur (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    period TEXT,
+    user_email TEXT,
+    account_code TEXT,
+    account_name TEXT,
+    neraca_saldo_debit NUMERIC DEFAULT 0,
+    neraca_saldo_kredit NUMERIC DEFAULT 0,
+    penyesuaian_debit NUMERIC DEFAULT 0,
+    penyesuaian_kredit NUMERIC DEFAULT 0,
+    nssp_debit NUMERIC DEFAULT 0,
+    nssp_kredit NUMERIC DEFAULT 0,
+    laba_rugi_debit NUMERIC DEFAULT 0,
+    laba_rugi_kredit NUMERIC DEFAULT 0,
+    neraca_debit NUMERIC DEFAULT 0,
+    neraca_kredit NUMERIC DEFAULT 0,
+    created_at TEXT DEFAULT {_SEKARANG}
+);
+
+CREATE INDEX IF NOT EXISTS idx_jurnal_umum_user ON jurnal_umum(user_email, transaksi_type);
+CREATE INDEX IF NOT EXISTS idx_jurnal_umum_transaksi ON jurnal_umum(transaksi_id);
+CREATE INDEX IF NOT EXISTS idx_jurnal_umum_tipe_transaksi ON jurnal_umum(transaksi_type, transaksi_id);
+CREATE INDEX IF NOT EXISTS idx_penjualan_user ON penjualan(user_email);
+CREATE INDEX IF NOT EXISTS idx_pembelian_user ON pembelian(user_email);
+CREATE INDEX IF NOT EXISTS idx_operasional_user ON operasional(user_email);
+CREATE INDEX IF NOT EXISTS idx_modal_user ON modal(user_email, tipe);
+CREATE INDEX IF NOT EXISTS idx_prive_user ON prive(user_email);
+CREATE INDEX IF NOT EXISTS idx_aset_tetap_user ON aset_tetap(user_email);
+CREATE INDEX IF NOT EXISTS idx_pelunasan_piutang_penjualan ON pelunasan_piutang(penjualan_id);
+CREATE INDEX IF NOT EXISTS idx_pelunasan_utang_pembelian ON pelunasan_utang(pembelian_id);
+CREATE INDEX IF NOT EXISTS idx_neraca_lajur_period ON neraca_lajur(period, user_email);
+"""
+
+# Dibuat setelah migrasi kolom (file lokal lama belum punya deleted_at / ref_baris)
+SCHEMA_LOKAL_VIEW = """
+DROP INDEX IF EXISTS uq_jurnal_umum_ref;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jurnal_umum_ref_aktif ON jurnal_umum(ref_id, ref_baris) WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_penjualan_terhapus ON penjualan(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_pembelian_terhapus ON pembelian(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_operasional_terhapus ON operasional(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_prive_terhapus ON prive(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_modal_terhapus ON modal(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_aset_tetap_terhapus ON aset_tetap(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_neraca_saldo_awal_terhapus ON neraca_saldo_awal(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_jurnal_umum_terhapus ON jurnal_umum(deleted_at) WHERE deleted_at IS NOT NULL;
+
+DROP VIEW IF EXISTS view_laporan_modal;
+CREATE VIEW view_laporan_modal AS
+SELECT
+    COALESCE((SELECT SUM(jumlah) FROM modal WHERE tipe = 'MODAL_AWAL' AND deleted_at IS NULL), 0) AS modal_awal,
+    COALESCE((SELECT SUM(jumlah) FROM modal WHERE tipe = 'TAMBAHAN_MODAL' AND deleted_at IS NULL), 0) AS total_tambahan,
+    COALESCE((SELECT SUM(jumlah) FROM prive WHERE deleted_at IS NULL), 0) AS total_prive;
+
+DROP VIEW IF EXISTS view_riwayat_modal;
+CREATE VIEW view_riwayat_modal AS
+SELECT id, user_email, tanggal, keterangan, jumlah, tipe, created_at
+FROM modal
+WHERE deleted_at IS NULL
+ORDER BY tanggal DESC, id DESC;
+"""
+
+# Jurnal dokumen lama: ref_id + nomor baris per dokumen (sama dengan akuntansi.SQL_JURNAL_IDEMPOTEN)
+SQL_ISI_REF_BARIS = """
+UPDATE jurnal_umum SET ref_id = COALESCE(jurnal_umum.ref_id, b.ref_id_baru), ref_baris = b.nomor
+FROM (
+    SELECT id,
+           CASE transaksi_type WHEN 'TAMBAHAN_MODAL' THEN 'MODAL' ELSE transaksi_type END || '_' || transaksi_id AS ref_id_baru,
+           ROW_NUMBER() OVER (PARTITION BY transaksi_type, transaksi_id ORDER BY id) AS nomor
+    FROM jurnal_umum
+    WHERE ref_baris IS NULL AND transaksi_id IS NOT NULL
+      AND transaksi_type IN ('PENJUALAN', 'PEMBELIAN', 'OPERASIONAL', 'PRIVE', 'TAMBAHAN_MODAL')
+) AS b
+WHERE jurnal_umum.id = b.id
+"""
+
+# Jurnal yang masuk kolom penyesuaian di neraca lajur (sama dengan ledger.neraca_lajur)
+_TIPE_PENYESUAIAN = ("penyesuaian", "penyesuaian_manual", "penyesuaian_aset", "penyesuaian_otomatis")
+
+class ErrorLokal(Exception):
+    """Padanan postgrest.exceptions.APIError untuk backend lokal"""
+
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+class ResponseLokal:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+def _nilai_sql(nilai):
+    if isinstance(nilai, (dict, list)):
+        return json.dumps(nilai, default=str)
+    if isinstance(nilai, (datetime, date)):
+        return nilai.isoformat()
+    if isinstance(nilai, Decimal):
+        return float(nilai)
+    return nilai
+
+def _kutip(nama):
+    if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", nama):
+        raise ErrorLokal(f"nama kolom/tabel tidak valid: {nama!r}", "PGRST100")
+    return f'"{nama}"'
+
+class QueryLokal:
+    """Request builder satu tabel; dieksekusi sebagai satu statement SQLite"""
+
+    def __init__(self, client, tabel):
+        self.client = client
+        self.tabel = tabel
+        self.operasi = "select"
+        self.kolom = "*"
+        self.data = None
+        self.count = None
+        self.head = False
+        self.on_conflict = None
+        self.ignore_duplicates = False
+        self.where = []
+        self.params = []
+        self.urutan = []
+        self.batas = None
+        self.offset = None
+
+    # --- operasi ---
+    def select(self, kolom="*", count=None, head=False):
+        self.operasi, self.kolom, self.count, self.head = "select", kolom, count, head
+        return self
+
+    def insert(self, data, count=None, returning=None, upsert=False, **kwargs):
+        self.operasi, self.data, self.count = ("upsert" if upsert else "insert"), data, count
+        return self
+
+    def upsert(self, data, count=None, returning=None, ignore_duplicates=False, on_conflict="", **kwargs):
+        self.operasi, self.data, self.count = "upsert", data, count
+        self.ignore_duplicates = ignore_duplicates
+        self.on_conflict = on_conflict or None
+        return self
+
+    def update(self, data, count=None, **kwargs):
+        self.operasi, self.data, self.count = "update", data, count
+        return self
+
+    def delete(self, count=None, **kwargs):
+        self.operasi, self.count = "delete", count
+        return self
+
+    # --- filter ---
+    def _filter(self, kolom, op, nilai):
+        self.where.append(f"{_kutip(kolom)} {op} ?")
+        self.params.append(_nilai_sql(nilai))
+        return self
+
+    def eq(self, kolom, nilai):
+        return self._filter(kolom, "=", nilai)
+
+    def neq(self, kolom, nilai):
+        return self._filter(kolom, "!=", nilai)
+
+    def gt(self, kolom, nilai):
+        return self._filter(kolom, ">", nilai)
+
+    def gte(self, kolom, nilai):
+        return self._filter(kolom, ">=", nilai)
+
+    def lt(self, kolom, nilai):
+        return self._filter(kolom, "<", nilai)
+
+    def lte(self, kolom, nilai):
+        return self._filter(kolom, "<=", nilai)
+
+    def like(self, kolom, pola):
+        return self._filter(kolom, "LIKE", pola.replace("*", "%"))
+
+    def ilike(self, kolom, pola):
+        self.where.append(f"LOWER({_kutip(kolom)}) LIKE LOWER(?)")
+        self.params.append(pola.replace("*", "%"))
+        return self
+
+    def in_(self, kolom, nilai):
+        nilai = list(nilai)
+        if not nilai:
+            self.where.append("0")
+            return self
+        self.where.append(f"{_kutip(kolom)} IN ({', '.join('?' * len(nilai))})")
+        self.params.extend(_nilai_sql(v) for v in nilai)
+        return self
+
+    def is_(self, kolom, nilai):
+        nilai = str(nilai).lower() if nilai is not None else "null"
+        if nilai not in ("null", "true", "false"):
+            raise ErrorLokal(f"nilai is_ tidak valid: {nilai}", "PGRST100")
+        self.where.append(f"{_kutip(kolom)} IS {nilai.upper() if nilai == 'null' else ('1' if nilai == 'true' else '0')}")
+        return self
+
+    def order(self, kolom, desc=False, nullsfirst=None, **kwargs):
+        if nullsfirst is None:
+            nullsfirst = desc   # default Postgres: NULL dianggap paling besar
+        self.urutan.append(f"{_kutip(kolom)} {'DESC' if desc else 'ASC'} NULLS {'FIRST' if nullsfirst else 'LAST'}")
+        return self
+
+    def limit(self, n, **kwargs):
+        self.batas = int(n)
+        return self
+
+    def range(self, awal, akhir, **kwargs):
+        self.offset = int(awal)
+        self.batas = int(akhir) - int(awal) + 1
+        return self
+
+    # --- eksekusi ---
+    def _klausa_where(self):
+        return f" WHERE {' AND '.join(self.where)}" if self.where else ""
+
+    def _kolom_select(self):
+        if self.kolom.strip() == "*":
+            return "*"
+        return ", ".join(_kutip(k.strip()) for k in self.kolom.split(",") if k.strip())
+
+    def execute(self):
+        try:
+            if self.operasi == "select":
+                # SELECT tunggal tidak perlu mengunci database (WAL: pembaca tidak menunggu penulis)
+                return self._select(self.client.koneksi())
+            with self.client.transaksi() as conn:
+                return getattr(self, f"_{self.operasi}")(conn)
+        except sqlite3.IntegrityError as e:
+            raise ErrorLokal(str(e), "23505" if "UNIQUE" in str(e) else "23502") from e
+        except sqlite3.OperationalError as e:
+            raise ErrorLokal(str(e), "42P01" if "no such table" in str(e) else "42703") from e
+
+    def _select(self, conn):
+        where = self._klausa_where()
+        jumlah = None
+        if self.count:
+            jumlah = conn.execute(f"SELECT COUNT(*) FROM {_kutip(self.tabel)}{where}", self.params).fetchone()[0]
+        if self.head:
+            return ResponseLokal([], jumlah)
+
+        sql = f"SELECT {self._kolom_select()} FROM {_kutip(self.tabel)}{where}"
+        if self.urutan:
+            sql += f" ORDER BY {', '.join(self.urutan)}"
+        if self.batas is not None or self.offset:
+            sql += f" LIMIT {self.batas if self.batas is not None else -1} OFFSET {self.offset or 0}"
+        return ResponseLokal(self.client.baris(conn, self.tabel, conn.execute(sql, self.params)), jumlah)
+
+    def _baris_data(self, conn):
+        rows = self.data if isinstance(self.data, list) else [self.data]
+        for row in rows:
+            self.client.pastikan_kolom(conn, self.tabel, row)
+        return rows
+
+    def _insert(self, conn):
+        hasil = []
+        for row in self._baris_data(conn):
+            kolom = list(row)
+            if kolom:
+                sql = (f"INSERT INTO {_kutip(self.tabel)} ({', '.join(map(_kutip, kolom))}) "
+                       f"VALUES ({', '.join('?' * len(kolom))}) RETURNING *")
+            else:
+                sql = f"INSERT INTO {_kutip(self.tabel)} DEFAULT VALUES RETURNING *"
+            hasil.extend(self.client.baris(conn, self.tabel, conn.execute(sql, [_nilai_sql(row[k]) for k in kolom])))
+        return ResponseLokal(hasil, len(hasil) if self.count else None)
+
+    def _upsert(self, conn):
+        target = self.on_conflict or "id"
+        kunci = [k.strip() for k in target.split(",")]
+        hasil = []
+        for row in self._baris_data(conn):
+            kolom = list(row)
+            ubah = [k for k in kolom if k not in kunci]
+            if self.ignore_duplicates or not ubah:
+                aksi = "DO NOTHING"
+            else:
+                aksi = "DO UPDATE SET " + ", ".join(f"{_kutip(k)} = excluded.{_kutip(k)}" for k in ubah)
+            sql = (f"INSERT INTO {_kutip(self.tabel)} ({', '.join(map(_kutip, kolom))}) "
+                   f"VALUES ({', '.join('?' * len(kolom))}) "
+                   f"ON CONFLICT ({', '.join(map(_kutip, kunci))}) {aksi} RETURNING *")
+            hasil.extend(self.client.baris(conn, self.tabel, conn.execute(sql, [_nilai_sql(row[k]) for k in kolom])))
+        return ResponseLokal(hasil, len(hasil) if self.count else None)
+
+    def _update(self, conn):
+        self.client.pastikan_kolom(conn, self.tabel, self.data)
+        kolom = list(self.data)
+        sql = (f"UPDATE {_kutip(self.tabel)} SET {', '.join(f'{_kutip(k)} = ?' for k in kolom)}"
+               f"{self._klausa_where()} RETURNING *")
+        params = [_nilai_sql(self.data[k]) for k in kolom] + self.params
+        hasil = self.client.baris(conn, self.tabel, conn.execute(sql, params))
+        return ResponseLokal(hasil, len(hasil) if self.count else None)
+
+    def _delete(self, conn):
+        sql = f"DELETE FROM {_kutip(self.tabel)}{self._klausa_where()} RETURNING *"
+        hasil = self.client.baris(conn, self.tabel, conn.execute(sql, self.params))
+        return ResponseLokal(hasil, len(hasil) if self.count else None)
+
+class RPCLokal:
+    def __init__(self, client, fn, params):
+        self.client = client
+        self.fn = fn
+        self.params = params or {}
+
+    def execute(self):
+        fungsi = RPC_LOKAL.get(self.fn)
+        if fungsi is None:
+            raise ErrorLokal(f"Could not find the function public.{self.fn} in the schema cache", "PGRST202")
+        with self.client.transaksi() as conn:
+            return ResponseLokal(fungsi(self.client, conn, **self.params))
+
+class ClientLokal:
+    """Client pengganti supabase.Client: satu koneksi SQLite per thread, skema dibuat sekali"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lokal = threading.local()
+        self._tipe_kolom = {}
+        self._lock = threading.Lock()
+        conn = self.koneksi()
+        conn.executescript(SCHEMA_LOKAL)
+        # File lama belum punya kolom soft delete / kunci jurnal idempoten
+        for tabel, nama, tipe in [(t, "deleted_at", "TEXT") for t in TABEL_SOFT_DELETE] + [("jurnal_umum", "ref_baris", "INTEGER")]:
+            kolom = {row["name"] for row in conn.execute(f"PRAGMA table_info({_kutip(tabel)})")}
+            if nama not in kolom:
+                conn.execute(f"ALTER TABLE {_kutip(tabel)} ADD COLUMN {nama} {tipe}")
+                if nama == "ref_baris":
+                    conn.execute(SQL_ISI_REF_BARIS)
+        conn.executescript(SCHEMA_LOKAL_VIEW)
+
+    def koneksi(self):
+        conn = getattr(self._lokal, "conn", None)
+        if conn is None or getattr(self._lokal, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._lokal.conn, self._lokal.pid = conn, os.getpid()
+        return conn
+
+    def transaksi(self):
+        return _Transaksi(self.koneksi())
+
+    def tipe_kolom(self, conn, tabel):
+        if tabel not in self._tipe_kolom:
+            info = conn.execute(f"PRAGMA table_info({_kutip(tabel)})").fetchall()
+            if not info:
+                raise ErrorLokal(f'relation "public.{tabel}" does not exist', "42P01")
+            self._tipe_kolom[tabel] = {row["name"]: (row["type"] or "").upper() for row in info}
+        return self._tipe_kolom[tabel]
+
+    def baris(self, conn, tabel, cursor):
+        tipe = self.tipe_kolom(conn, tabel)
+        hasil = []
+        for row in cursor.fetchall():
+            data = dict(row)
+            for kolom, nilai in data.items():
+                if nilai is not None and tipe.get(kolom) == "BOOLEAN":
+                    data[kolom] = bool(nilai)
+            hasil.append(data)
+        return hasil
+
+    def pastikan_kolom(self, conn, tabel, row):
+        """Kolom yang belum ada ditambahkan (atau error kalau LOCAL_DB_STRICT)"""
+        tipe = self.tipe_kolom(conn, tabel)
+        for kolom, nilai in row.items():
+            if kolom in tipe:
+                continue
+            if LOCAL_DB_STRICT:
+                raise ErrorLokal(f"Could not find the '{kolom}' column of '{tabel}' in the schema cache", "PGRST204")
+            jenis = "NUMERIC" if isinstance(nilai, (int, float, Decimal)) and not isinstance(nilai, bool) else "TEXT"
+            with self._lock:
+                if kolom not in self.tipe_kolom(conn, tabel):
+                    try:
+                        conn.execute(f"ALTER TABLE {_kutip(tabel)} ADD COLUMN {_kutip(kolom)} {jenis}")
+                    except sqlite3.OperationalError as e:
+                        if "duplicate column" not in str(e):
+                            raise
+                    logger.warning(f"⚠️ DB lokal: kolom {tabel}.{kolom} ditambahkan otomatis")
+                    self._tipe_kolom.pop(tabel, None)
+                    tipe = self.tipe_kolom(conn, tabel)
+
+    def table(self, nama):
+        return QueryLokal(self, nama)
+
+    from_ = table
+
+    def rpc(self, fn, params=None, **kwargs):
+        return RPCLokal(self, fn, params)
+
+class _Transaksi:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK, supaya satu statement query builder atomik"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+# ============================================================
+# 🔹 RPC (padanan fungsi Postgres)
+# ============================================================
+def _rpc_ringkasan_dashboard(client, conn):
+    row = conn.execute("""
+        SELECT
+            (SELECT COALESCE(SUM(total_penjualan), 0) FROM penjualan WHERE deleted_at IS NULL) AS total_penjualan,
+            (SELECT COUNT(*) FROM penjualan WHERE deleted_at IS NULL) AS jumlah_penjualan,
+            (SELECT COALESCE(SUM(total_pembelian), 0) FROM pembelian WHERE deleted_at IS NULL) AS total_pembelian,
+            (SELECT COUNT(*) FROM pembelian WHERE deleted_at IS NULL) AS jumlah_pembelian,
+            (SELECT COALESCE(MAX(jumlah_persediaan), 0) FROM persediaan_terintegrasi WHERE id = 1) AS persediaan_saat_ini
+    """).fetchone()
+    return [dict(row)]
+
+def _rpc_generate_neraca_lajur(client, conn, p_period, p_user_email):
+    """Isi ulang neraca_lajur (period, user) dari saldo awal + jurnal s.d. akhir periode"""
+    from pinkilang.akuntansi import CHART_OF_ACCOUNTS
+
+    kode_per_nama = {info['nama'].lower(): kode for kode, info in CHART_OF_ACCOUNTS.items()}
+    akun = {}
+
+    def baris_akun(nama):
+        nama = nama or "Unknown"
+        kode = kode_per_nama.get(nama.lower(), nama)
+        return akun.setdefault(kode, {"account_name": nama, "ns_d": 0.0, "ns_k": 0.0, "adj_d": 0.0, "adj_k": 0.0})
+
+    for row in conn.execute("SELECT nama_akun, SUM(debit) d, SUM(kredit) k FROM neraca_saldo_awal "
+                           "WHERE user_email = ? AND deleted_at IS NULL GROUP BY nama_akun", (p_user_email,)):
+        a = baris_akun(row["nama_akun"])
+        a["ns_d"] += row["d"] or 0
+        a["ns_k"] += row["k"] or 0
+
+    for row in conn.execute(
+        "SELECT nama_akun, LOWER(COALESCE(transaksi_type, '')) tipe, SUM(debit) d, SUM(kredit) k "
+        "FROM jurnal_umum WHERE user_email = ? AND deleted_at IS NULL AND substr(tanggal, 1, 7) <= ? GROUP BY nama_akun, tipe",
+        (p_user_email, p_period)
+    ):
+        a = baris_akun(row["nama_akun"])
+        kolom = "adj" if row["tipe"] in _TIPE_PENYESUAIAN else "ns"
+        a[f"{kolom}_d"] += row["d"] or 0
+        a[f"{kolom}_k"] += row["k"] or 0
+
+    conn.execute("DELETE FROM neraca_lajur WHERE period = ? AND user_email = ?", (p_period, p_user_email))
+    baris = []
+    for kode, a in akun.items():
+        nssp_d, nssp_k = a["ns_d"] + a["adj_d"], a["ns_k"] + a["adj_k"]
+        saldo = nssp_d - nssp_k
+        laba_rugi = kode[:1] in ("4", "5", "6")
+        baris.append((
+            p_period, p_user_email, kode, a["account_name"],
+            a["ns_d"], a["ns_k"], a["adj_d"], a["adj_k"], nssp_d, nssp_k,
+            max(saldo, 0) if laba_rugi else 0, max(-saldo, 0) if laba_rugi else 0,
+            0 if laba_rugi else max(saldo, 0), 0 if laba_rugi else max(-saldo, 0),
+        ))
+    conn.executemany(
+        "INSERT INTO neraca_lajur (period, user_email, account_code, account_name, "
+        "neraca_saldo_debit, neraca_saldo_kredit, penyesuaian_debit, penyesuaian_kredit, nssp_debit, nssp_kredit, "
+        "laba_rugi_debit, laba_rugi_kredit, neraca_debit, neraca_kredit) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        baris
+    )
+    return None
+
+def _rpc_rencana_hapus_semua(client, conn, p_user_email):
+    rows = conn.execute("""
+        SELECT 'penjualan' AS tabel, COUNT(*) AS jumlah, COALESCE(SUM(total_penjualan), 0) AS total FROM penjualan WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'pembelian', COUNT(*), COALESCE(SUM(total_pembelian), 0) FROM pembelian WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'operasional', COUNT(*), COALESCE(SUM(total_pengeluaran), 0) FROM operasional WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'prive', COUNT(*), COALESCE(SUM(jumlah), 0) FROM prive WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'modal', COUNT(*), COALESCE(SUM(jumlah), 0) FROM modal WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'aset_tetap', COUNT(*), COALESCE(SUM(nilai_perolehan), 0) FROM aset_tetap WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'neraca_saldo_awal', COUNT(*), COALESCE(SUM(COALESCE(debit, 0) + COALESCE(kredit, 0)), 0) FROM neraca_saldo_awal WHERE user_email = :e AND deleted_at IS NULL
+        UNION ALL SELECT 'jurnal_umum', COUNT(*), 0 FROM jurnal_umum WHERE user_email = :e AND deleted_at IS NULL
+    """, {"e": p_user_email}).fetchall()
+    return [dict(row) for row in rows]
+
+_KOLOM_JURNAL_POSTING = ("tanggal", "nama_akun", "akun_debit", "akun_kredit", "ref", "ref_id", "ref_baris", "jumlah", "debit",
+                         "kredit", "deskripsi", "keterangan", "transaksi_type", "transaksi_id", "user_email", "created_at")
+
+def _rpc_posting_transaksi(client, conn, p_tabel, p_dokumen, p_jurnal, p_ref_prefix, p_delta_persediaan=0, p_updated_by=None):
+    """Padanan posting.SQL_POSTING_TRANSAKSI - seluruh RPC sudah di dalam BEGIN IMMEDIATE"""
+    if p_tabel not in ("penjualan", "pembelian", "operasional", "modal"):
+        raise ErrorLokal(f"TABEL_TIDAK_DIDUKUNG:{p_tabel}", "P0001")
+
+    stok = None
+    if p_delta_persediaan:
+        row = conn.execute("SELECT jumlah_persediaan FROM persediaan_terintegrasi WHERE id = 1").fetchone()
+        if row is None:
+            if p_delta_persediaan < 0:
+                raise ErrorLokal("PERSEDIAAN_BELUM_DIATUR", "P0001")
+            conn.execute(
+                f"INSERT INTO persediaan_terintegrasi (id, jumlah_persediaan, created_by, updated_by, created_at, updated_at) "
+                f"VALUES (1, 0, ?, ?, {_SEKARANG}, {_SEKARANG})", (p_updated_by, p_updated_by)
+            )
+            stok = 0
+        else:
+            stok = row["jumlah_persediaan"] or 0
+        if stok + p_delta_persediaan < 0:
+            raise ErrorLokal(f"STOK_TIDAK_CUKUP:{stok}", "P0001")
+        conn.execute(
+            f"UPDATE persediaan_terintegrasi SET jumlah_persediaan = ?, updated_by = ?, updated_at = {_SEKARANG} WHERE id = 1",
+            (stok + p_delta_persediaan, p_updated_by)
+        )
+
+    client.pastikan_kolom(conn, p_tabel, p_dokumen)
+    kolom = list(p_dokumen)
+    cursor = conn.execute(
+        f"INSERT INTO {_kutip(p_tabel)} ({', '.join(map(_kutip, kolom))}) VALUES ({', '.join('?' * len(kolom))}) RETURNING *",
+        [_nilai_sql(p_dokumen[k]) for k in kolom]
+    )
+    dokumen = client.baris(conn, p_tabel, cursor)[0]
+
+    transaksi_id = str(dokumen["id"])
+    _insert_jurnal(client, conn, [
+        {**entry, "ref_id": f"{p_ref_prefix}_{transaksi_id}", "transaksi_id": transaksi_id} for entry in p_jurnal or []
+    ])
+    return {"dokumen": dokumen, "persediaan": stok + p_delta_persediaan if stok is not None else None}
+
+def _insert_jurnal(client, conn, jurnal):
+    """Insert baris jurnal, kunci (ref_id, ref_baris) yang masih aktif dilewati; return baris baru"""
+    sql = (f"INSERT INTO jurnal_umum ({', '.join(_KOLOM_JURNAL_POSTING)}) VALUES ({', '.join('?' * len(_KOLOM_JURNAL_POSTING))}) "
+           f"ON CONFLICT (ref_id, ref_baris) WHERE deleted_at IS NULL DO NOTHING RETURNING *")
+    baru = []
+    for entry in jurnal:
+        row = {**entry, "debit": entry.get("debit") or 0, "kredit": entry.get("kredit") or 0,
+               "created_at": entry.get("created_at") or datetime.now().isoformat()}
+        params = [_nilai_sql(row.get(k)) for k in _KOLOM_JURNAL_POSTING]
+        baru.extend(client.baris(conn, "jurnal_umum", conn.execute(sql, params)))
+    return baru
+
+def _rpc_posting_jurnal(client, conn, p_jurnal):
+    """Padanan posting_jurnal di akuntansi.SQL_JURNAL_IDEMPOTEN"""
+    return _insert_jurnal(client, conn, p_jurnal or [])
+
+RPC_LOKAL = {
+    "ringkasan_dashboard": _rpc_ringkasan_dashboard,
+    "rencana_hapus_semua": _rpc_rencana_hapus_semua,
+    "generate_neraca_lajur": _rpc_generate_neraca_lajur,
+    "posting_transaksi": _rpc_posting_transaksi,
+    "posting_jurnal": _rpc_posting_jurnal,
+}
@@ -0,0 +1,323 @@
+"""Antrean email persisten dan pengirim SMTP di background"""
+from email import message_from_bytes
+from email.message import EmailMessage
+from contextlib import closing
+import smtplib
+import socketserver
+import sqlite3
+import threading
+import random
+import os
+import time
+from pinkilang.core import logger, EMAIL_SENDER, EMAIL_PASSWORD
+
+# ============================================================
+# 🔹 Fungsi Email
+# ============================================================
+# Email dikirim lewat antrean persisten (SQLite) yang diproses thread pengirim
+# di background; tiap thread memakai ulang satu koneksi SMTP yang sudah login.
+# Untuk development/test: jalankan `flask --app pinky2 smtp-lokal` lalu set
+# SMTP_HOST=localhost SMTP_PORT=1025 SMTP_STARTTLS=0.
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "1") != "0"
+EMAIL_QUEUE_PATH = os.getenv("EMAIL_QUEUE_PATH", "email_queue.db")
+EMAIL_SENDER_THREADS = int(os.getenv("EMAIL_SENDER_THREADS", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BASE = float(os.getenv("EMAIL_RETRY_BASE", "5"))        # detik, dikali 2 tiap percobaan
+EMAIL_POLL_INTERVAL = float(os.getenv("EMAIL_POLL_INTERVAL", "5"))   # detik
+SMTP_IDLE_CHECK = 60                                                 # NOOP dulu kalau koneksi idle > 60 detik
+
+class EmailQueue:
+    """Antrean email persisten di SQLite - aman dipakai beberapa worker gunicorn di host yang sama"""
+
+    def __init__(self, path):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS email_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    recipient TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    claimed_at REAL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    sent_at REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_email_queue_due ON email_queue(status, next_attempt_at)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def put(self, recipient, subject, body):
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cur = conn.execute(
+                "INSERT INTO email_queue (recipient, subject, body, next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?)",
+                (recipient, subject, body, now, now)
+            )
+            return cur.lastrowid
+
+    def claim(self, limit=10, stale_after=300):
+        """Ambil email yang jatuh tempo dan tandai 'sending' secara atomik"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Email yang di-claim worker yang mati dikembalikan ke antrean
+            conn.execute(
+                "UPDATE email_queue SET status = 'pending' WHERE status = 'sending' AND claimed_at < ?",
+                (now - stale_after,)
+            )
+            rows = conn.execute(
+                "SELECT id, recipient, subject, body, attempts FROM email_queue "
+                "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    "UPDATE email_queue SET status = 'sending', claimed_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows]
+                )
+            conn.execute("COMMIT")
+        return [dict(zip(("id", "recipient", "subject", "body", "attempts"), row)) for row in rows]
+
+    def mark_sent(self, job_id):
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE email_queue SET status = 'sent', sent_at = ? WHERE id = ?", (time.time(), job_id))
+
+    def mark_retry(self, job, error, permanent=False):
+        """Jadwalkan ulang dengan exponential backoff, atau 'failed' kalau sudah habis percobaan"""
+        attempts = job['attempts'] + 1
+        with closing(self._connect()) as conn:
+            if permanent or attempts >= EMAIL_MAX_ATTEMPTS:
+                conn.execute(
+                    "UPDATE email_queue SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+                    (attempts, error, job['id'])
+                )
+            else:
+                delay = EMAIL_RETRY_BASE * (2 ** (attempts - 1)) * random.uniform(1.0, 1.5)
+                conn.execute(
+                    "UPDATE email_queue SET status = 'pending', attempts = ?, last_error = ?, next_attempt_at = ? WHERE id = ?",
+                    (attempts, error, time.time() + delay, job['id'])
+                )
+
+    def depth(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM email_queue WHERE status IN ('pending', 'sending')").fetchone()[0]
+
+def open_smtp_connection():
+    """Buka koneksi SMTP yang sudah STARTTLS + login"""
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+    server.ehlo()
+    if SMTP_STARTTLS:
+        server.starttls()
+        server.ehlo()
+    if server.has_extn("auth"):
+        server.login(EMAIL_SENDER, EMAIL_PASSWORD)
+    return server
+
+def build_email(recipient, subject, body):
+    msg = EmailMessage()
+    msg["From"] = EMAIL_SENDER
+    msg["To"] = recipient
+    msg["Subject"] = subject
+    msg.set_content(body)
+    return msg
+
+class EmailSender(threading.Thread):
+    """Thread pengirim: ambil email dari antrean, kirim lewat koneksi SMTP miliknya sendiri"""
+
+    def __init__(self, queue, wakeup, name):
+        super().__init__(name=name, daemon=True)
+        self.queue = queue
+        self.wakeup = wakeup
+        self.server = None
+        self.last_used = 0
+
+    def connection(self):
+        if self.server is not None and time.time() - self.last_used > SMTP_IDLE_CHECK:
+            try:
+                self.server.noop()
+            except smtplib.SMTPException:
+                self.close()
+        if self.server is None:
+            self.server = open_smtp_connection()
+        return self.server
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except Exception:
+                pass
+        self.server = None
+
+    def deliver(self, job):
+        msg = build_email(job['recipient'], job['subject'], job['body'])
+        try:
+            try:
+                self.connection().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Koneksi lama diputus server, coba sekali lagi dengan koneksi baru
+                self.close()
+                self.connection().send_message(msg)
+            self.last_used = time.time()
+            self.queue.mark_sent(job['id'])
+            logger.info(f"✅ Email berhasil dikirim ke: {job['recipient']}")
+        except smtplib.SMTPAuthenticationError:
+            logger.error("❌ Gagal autentikasi Gmail. Pastikan:")
+            logger.error("1. Menggunakan App Password, bukan password biasa")
+            logger.error("2. App Password 16 karakter tanpa spasi")
+            logger.error("3. 2FA diaktifkan di akun Gmail")
+            self.close()
+            self.queue.mark_retry(job, "SMTP authentication error")
+        except smtplib.SMTPRecipientsRefused as e:
+            logger.error(f"❌ Penerima ditolak {job['recipient']}: {e}")
+            self.queue.mark_retry(job, str(e), permanent=True)
+        except Exception as e:
+            logger.error(f"❌ Error mengirim email ke {job['recipient']}: {e}")
+            self.close()
+            self.queue.mark_retry(job, str(e))
+
+    def run(self):
+        while True:
+            try:
+                jobs = self.queue.claim()
+            except Exception as e:
+                logger.error(f"❌ Error membaca antrean email: {e}")
+                jobs = []
+
+            if not jobs:
+                self.wakeup.wait(EMAIL_POLL_INTERVAL)
+                self.wakeup.clear()
+                continue
+
+            for job in jobs:
+                self.deliver(job)
+
+_email_queue = None
+_email_wakeup = threading.Event()
+_email_senders_pid = None
+_email_lock = threading.Lock()
+
+def get_email_queue():
+    """Antrean + thread pengirim, dibuat saat pertama dipakai (setelah fork gunicorn)"""
+    global _email_queue, _email_senders_pid
+    with _email_lock:
+        if _email_queue is None:
+            _email_queue = EmailQueue(EMAIL_QUEUE_PATH)
+        if _email_senders_pid != os.getpid():
+            for i in range(EMAIL_SENDER_THREADS):
+                EmailSender(_email_queue, _email_wakeup, f"email-sender-{i}").start()
+            _email_senders_pid = os.getpid()
+    return _email_queue
+
+def enqueue_email(recipient, subject, body):
+    """Masukkan email ke antrean dan langsung kembali; pengiriman di background"""
+    try:
+        if not EMAIL_SENDER or not EMAIL_PASSWORD:
+            logger.error("❌ Konfigurasi email tidak lengkap")
+            return False
+
+        job_id = get_email_queue().put(recipient, subject, body)
+        _email_wakeup.set()
+        logger.info(f"📧 Email #{job_id} ke {recipient} masuk antrean")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Error antre email: {e}")
+        return False
+
+def send_email(recipient, subject, body):
+    """Kirim email langsung (sinkron) - untuk skrip/CLI; request web pakai enqueue_email"""
+    try:
+        if not EMAIL_SENDER or not EMAIL_PASSWORD:
+            logger.error("❌ Konfigurasi email tidak lengkap")
+            return False
+
+        logger.info(f"📧 Mengirim email ke: {recipient}")
+        server = open_smtp_connection()
+        try:
+            server.send_message(build_email(recipient, subject, body))
+        finally:
+            server.quit()
+
+        logger.info(f"✅ Email berhasil dikirim ke: {recipient}")
+        return True
+
+    except smtplib.SMTPAuthenticationError:
+        logger.error("❌ Gagal autentikasi Gmail. Pastikan:")
+        logger.error("1. Menggunakan App Password, bukan password biasa")
+        logger.error("2. App Password 16 karakter tanpa spasi")
+        logger.error("3. 2FA diaktifkan di akun Gmail")
+        return False
+    except Exception as e:
+        logger.error(f"❌ Error mengirim email: {e}")
+        return False
+
+# ============================================================
+# 🔹 SMTP Lokal (pengganti Gmail untuk development & test)
+# ============================================================
+class LocalSMTPHandler(socketserver.StreamRequestHandler):
+    """Server SMTP minimal: terima semua pesan, simpan di server.messages"""
+
+    def reply(self, line):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        self.reply("220 pinkilang-local ESMTP")
+        mail_from, rcpt_to = None, []
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb == "EHLO":
+                self.wfile.write(b"250-pinkilang-local\r\n250-AUTH PLAIN\r\n250 8BITMIME\r\n")
+            elif verb == "HELO":
+                self.reply("250 pinkilang-local")
+            elif verb == "AUTH":
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "MAIL":
+                mail_from, rcpt_to = command[10:].strip(" <>"), []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                rcpt_to.append(command[8:].strip(" <>"))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    lines.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                message = message_from_bytes(b"".join(lines))
+                self.server.messages.append({'from': mail_from, 'to': rcpt_to, 'message': message})
+                logger.info(f"📬 [smtp-lokal] {mail_from} -> {', '.join(rcpt_to)}: {message['Subject']}")
+                self.reply("250 OK: queued")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=1025):
+        super().__init__((host, port), LocalSMTPHandler)
+        self.messages = []
@@ -0,0 +1,251 @@
+"""
+Metrics format Prometheus untuk /metrics.
+
+Tiap worker gunicorn menghitung di memori (latensi per route, query Supabase per
+tabel, cache, error) lalu menulis snapshot kumulatifnya ke SQLite bersama
+(METRICS_PATH) paling lama tiap METRICS_FLUSH_INTERVAL detik. /metrics menjumlahkan
+snapshot semua worker, jadi angka yang di-scrape tetap benar walaupun request
+jatuh ke worker yang berbeda. Snapshot worker yang sudah mati tetap disimpan agar
+counter tidak turun; file dihapus saat master gunicorn start (gunicorn.conf.py).
+
+Contoh alert p95:
+    histogram_quantile(0.95, sum by (le) (rate(
+        pinkilang_http_request_duration_seconds_bucket{route="/neraca-lajur"}[5m]))) > 2
+"""
+from contextlib import closing
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from flask import request
+from pinkilang import core
+
+METRICS_PATH = os.getenv("METRICS_PATH", "metrics.db")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))   # detik
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")   # kalau di-set, /metrics butuh "Authorization: Bearer <token>"
+
+BUCKET_REQUEST = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BUCKET_QUERY = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+METRIK = {
+    "pinkilang_http_requests_total": ("counter", "Jumlah request HTTP per route, method dan status"),
+    "pinkilang_http_request_duration_seconds": ("histogram", "Latensi request HTTP per route"),
+    "pinkilang_http_errors_total": ("counter", "Response 5xx per route"),
+    "pinkilang_db_queries_total": ("counter", "Jumlah query Supabase per tabel dan operasi"),
+    "pinkilang_db_query_errors_total": ("counter", "Query Supabase yang gagal per tabel"),
+    "pinkilang_db_query_duration_seconds": ("histogram", "Latensi query Supabase per tabel"),
+    "pinkilang_log_errors_total": ("counter", "Log level ERROR (termasuk error yang ditangkap dan ditampilkan ke user)"),
+    "pinkilang_cache_hits_total": ("counter", "Cache hit per cache in-process"),
+    "pinkilang_cache_misses_total": ("counter", "Cache miss per cache in-process"),
+    "pinkilang_cache_hit_ratio": ("gauge", "Rasio hit / (hit + miss) per cache, semua worker"),
+    "pinkilang_email_queue_depth": ("gauge", "Email pending/sending di antrean"),
+}
+
+class MetricsStore:
+    """Nilai kumulatif milik satu proses + snapshot ke SQLite bersama"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pid = None
+        self._proses = None
+        self._nilai = {}
+        self._flush_terakhir = 0
+        self._siap = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        if not self._siap:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS metrik (
+                    proses TEXT NOT NULL,
+                    nama TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    nilai REAL NOT NULL,
+                    PRIMARY KEY (proses, nama, label)
+                )
+            """)
+            self._siap = True
+        return conn
+
+    def _cek_proses(self):
+        # Setelah fork (atau pid dipakai ulang) mulai dari nol dengan identitas baru
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._proses = f"{self._pid}-{uuid.uuid4().hex[:8]}"
+            self._nilai = {}
+
+    def inc(self, nama, label, nilai=1):
+        key = (nama, json.dumps(label, sort_keys=True))
+        with self._lock:
+            self._cek_proses()
+            self._nilai[key] = self._nilai.get(key, 0) + nilai
+
+    def set(self, nama, label, nilai):
+        with self._lock:
+            self._cek_proses()
+            self._nilai[(nama, json.dumps(label, sort_keys=True))] = nilai
+
+    def observe(self, nama, label, detik, buckets):
+        for le in buckets:
+            if detik <= le:
+                self.inc(f"{nama}_bucket", {**label, "le": str(le)})
+        self.inc(f"{nama}_bucket", {**label, "le": "+Inf"})
+        self.inc(f"{nama}_sum", label, detik)
+        self.inc(f"{nama}_count", label)
+
+    def flush(self, paksa=False):
+        now = time.time()
+        with self._lock:
+            if not paksa and now - self._flush_terakhir < METRICS_FLUSH_INTERVAL:
+                return
+            self._cek_proses()
+            self._flush_terakhir = now
+            baris = [(self._proses, nama, label, nilai) for (nama, label), nilai in self._nilai.items()]
+        if not baris:
+            return
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("INSERT OR REPLACE INTO metrik (proses, nama, label, nilai) VALUES (?, ?, ?, ?)", baris)
+                conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            core.logger.error(f"❌ Gagal menulis metrics: {e}")
+
+    def total(self):
+        """Jumlah semua worker: {(nama, label_json): nilai}"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT nama, label, SUM(nilai) FROM metrik GROUP BY nama, label").fetchall()
+        return {(nama, label): nilai for nama, label, nilai in rows}
+
+    def reset(self):
+        for akhiran in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + akhiran)
+            except FileNotFoundError:
+                pass
+
+_store = MetricsStore(METRICS_PATH)
+
+def reset_metrics():
+    """Hapus snapshot lama - dipanggil sekali saat master gunicorn start"""
+    _store.reset()
+
+# ============================================================
+# 🔹 Pencatatan
+# ============================================================
+def _catat_query(info):
+    label = {"tabel": info["tabel"], "operasi": info["operasi"]}
+    _store.inc("pinkilang_db_queries_total", label)
+    if info["error"]:
+        _store.inc("pinkilang_db_query_errors_total", {"tabel": info["tabel"]})
+    _store.observe("pinkilang_db_query_duration_seconds", {"tabel": info["tabel"]},
+                   info["durasi_ms"] / 1000, BUCKET_QUERY)
+
+class _HitungError(logging.Handler):
+    def emit(self, record):
+        _store.inc("pinkilang_log_errors_total", {})
+
+def _catat_cache():
+    for nama, cache in core.CACHES.items():
+        _store.set("pinkilang_cache_hits_total", {"cache": nama}, cache.hits)
+        _store.set("pinkilang_cache_misses_total", {"cache": nama}, cache.misses)
+
+def pasang_metrics(app):
+    """Daftarkan hook request/query/log yang mengisi metrics"""
+    core.QUERY_HOOKS.append(_catat_query)
+    core.logger.addHandler(_HitungError(level=logging.ERROR))
+    atexit.register(lambda: (_catat_cache(), _store.flush(paksa=True)))
+
+    @app.before_request
+    def _mulai_metrics():
+        request.environ["pinkilang.metrics_mulai"] = time.perf_counter()
+
+    @app.after_request
+    def _catat_request(response):
+        mulai = request.environ.get("pinkilang.metrics_mulai")
+        route = request.url_rule.rule if request.url_rule else "tidak_dikenal"
+        _store.inc("pinkilang_http_requests_total",
+                   {"route": route, "method": request.method, "status": str(response.status_code)})
+        if response.status_code >= 500:
+            _store.inc("pinkilang_http_errors_total", {"route": route})
+        if mulai is not None:
+            _store.observe("pinkilang_http_request_duration_seconds", {"route": route},
+                           time.perf_counter() - mulai, BUCKET_REQUEST)
+        _catat_cache()
+        _store.flush()
+        return response
+
+# ============================================================
+# 🔹 Eksposisi
+# ============================================================
+def _kedalaman_antrean_email():
+    from pinkilang.mailer import EmailQueue, EMAIL_QUEUE_PATH
+
+    if not os.path.exists(EMAIL_QUEUE_PATH):
+        return 0
+    return EmailQueue(EMAIL_QUEUE_PATH).depth()
+
+def _escape(nilai):
+    return str(nilai).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+def _format_label(label):
+    if not label:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in label.items()) + "}"
+
+def _format_nilai(nilai):
+    return str(int(nilai)) if float(nilai).is_integer() else repr(float(nilai))
+
+def _nama_dasar(nama):
+    for akhiran in ("_bucket", "_sum", "_count"):
+        if nama.endswith(akhiran) and nama[:-len(akhiran)] in METRIK:
+            return nama[:-len(akhiran)]
+    return nama
+
+def _urutan(item):
+    (nama, label), _ = item
+    label = dict(label)
+    le = label.pop("le", None)
+    urut_le = float("inf") if le == "+Inf" else float(le) if le is not None else -1
+    akhiran = 0 if nama.endswith("_bucket") else 1 if nama.endswith("_sum") else 2
+    return (json.dumps(label, sort_keys=True), akhiran, urut_le)
+
+def render_metrics():
+    """Teks exposition format Prometheus, gabungan semua worker"""
+    _catat_cache()
+    _store.flush(paksa=True)
+    total = {(nama, tuple(json.loads(label).items())): nilai for (nama, label), nilai in _store.total().items()}
+
+    hits, misses = {}, {}
+    for (nama, label), nilai in total.items():
+        if nama == "pinkilang_cache_hits_total":
+            hits[label] = nilai
+        elif nama == "pinkilang_cache_misses_total":
+            misses[label] = nilai
+    for label in hits:
+        semua = hits[label] + misses.get(label, 0)
+        total[("pinkilang_cache_hit_ratio", label)] = hits[label] / semua if semua else 0
+
+    try:
+        total[("pinkilang_email_queue_depth", ())] = _kedalaman_antrean_email()
+    except sqlite3.Error as e:
+        core.logger.error(f"❌ Gagal membaca antrean email untuk metrics: {e}")
+
+    per_metrik = {}
+    for (nama, label), nilai in total.items():
+        per_metrik.setdefault(_nama_dasar(nama), []).append(((nama, label), nilai))
+
+    baris = []
+    for dasar in sorted(per_metrik):
+        tipe, bantuan = METRIK.get(dasar, ("untyped", dasar))
+        baris.append(f"# HELP {dasar} {bantuan}")
+        baris.append(f"# TYPE {dasar} {tipe}")
+        for (nama, label), nilai in sorted(per_metrik[dasar], key=_urutan):
+            baris.append(f"{nama}{_format_label(dict(label))} {_format_nilai(nilai)}")
+    return "\n".join(baris) + "\n"
@@ -0,0 +1,191 @@
+"""Penyimpanan dan verifikasi OTP registrasi"""
+from flask import request, current_app
+from contextlib import closing
+import sqlite3
+import threading
+import os
+import hashlib
+import hmac
+import secrets
+import time
+
+# ============================================================
+# 🔹 OTP Store (server-side, TTL + rate limit)
+# ============================================================
+# Status OTP registrasi disimpan di server, bukan di session cookie.
+# OTP_STORE=sqlite (default, dipakai bersama semua worker di host yang sama)
+# atau OTP_STORE=memory (satu proses / test).
+OTP_STORE = os.getenv("OTP_STORE", "sqlite")
+OTP_STORE_PATH = os.getenv("OTP_STORE_PATH", "otp_store.db")
+OTP_TTL = int(os.getenv("OTP_TTL", "600"))                          # detik
+OTP_MAX_ATTEMPTS = int(os.getenv("OTP_MAX_ATTEMPTS", "5"))
+OTP_SEND_WINDOW = int(os.getenv("OTP_SEND_WINDOW", "900"))          # detik
+OTP_SEND_LIMIT_EMAIL = int(os.getenv("OTP_SEND_LIMIT_EMAIL", "3"))  # kirim per email per window
+OTP_SEND_LIMIT_IP = int(os.getenv("OTP_SEND_LIMIT_IP", "10"))       # kirim per IP per window
+
+def hash_otp(email, otp):
+    return hmac.new(current_app.secret_key.encode(), f"{email}:{otp}".encode(), hashlib.sha256).hexdigest()
+
+class MemoryOTPStore:
+    """OTP store dalam memori proses - untuk satu worker atau test"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.hits = {}
+
+    def hit(self, key, limit, window):
+        """Sliding window: catat 1 hit kalau masih di bawah limit, return True bila diizinkan"""
+        now = time.time()
+        with self.lock:
+            recent = [t for t in self.hits.get(key, []) if t > now - window]
+            allowed = len(recent) < limit
+            if allowed:
+                recent.append(now)
+            if recent:
+                self.hits[key] = recent
+            else:
+                self.hits.pop(key, None)
+            return allowed
+
+    def put(self, email, otp_hash, password, ttl):
+        with self.lock:
+            self.pending[email] = {'otp_hash': otp_hash, 'password': password, 'expires_at': time.time() + ttl, 'attempts': 0}
+            # Bersihkan entri kedaluwarsa supaya memori tetap terbatas
+            now = time.time()
+            for key in [k for k, v in self.pending.items() if v['expires_at'] < now]:
+                del self.pending[key]
+
+    def get(self, email):
+        with self.lock:
+            record = self.pending.get(email)
+            if record and record['expires_at'] < time.time():
+                del self.pending[email]
+                return None
+            return dict(record) if record else None
+
+    def add_attempt(self, email):
+        with self.lock:
+            record = self.pending.get(email)
+            if not record:
+                return OTP_MAX_ATTEMPTS
+            record['attempts'] += 1
+            return record['attempts']
+
+    def delete(self, email):
+        with self.lock:
+            self.pending.pop(email, None)
+
+class SQLiteOTPStore:
+    """OTP store di SQLite - dipakai bersama semua worker gunicorn di host yang sama"""
+
+    def __init__(self, path):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS otp_pending (
+                    email TEXT PRIMARY KEY,
+                    otp_hash TEXT NOT NULL,
+                    password TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS otp_rate (key TEXT NOT NULL, ts REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_otp_rate_key ON otp_rate(key, ts)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def hit(self, key, limit, window):
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM otp_rate WHERE key = ? AND ts <= ?", (key, now - window))
+            count = conn.execute("SELECT COUNT(*) FROM otp_rate WHERE key = ?", (key,)).fetchone()[0]
+            allowed = count < limit
+            if allowed:
+                conn.execute("INSERT INTO otp_rate (key, ts) VALUES (?, ?)", (key, now))
+            conn.execute("COMMIT")
+            return allowed
+
+    def put(self, email, otp_hash, password, ttl):
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO otp_pending (email, otp_hash, password, expires_at, attempts) VALUES (?, ?, ?, ?, 0)",
+                (email, otp_hash, password, now + ttl)
+            )
+            conn.execute("DELETE FROM otp_pending WHERE expires_at < ?", (now,))
+            conn.execute("DELETE FROM otp_rate WHERE ts <= ?", (now - OTP_SEND_WINDOW,))
+
+    def get(self, email):
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT otp_hash, password, expires_at, attempts FROM otp_pending WHERE email = ? AND expires_at >= ?",
+                (email, time.time())
+            ).fetchone()
+        return dict(zip(("otp_hash", "password", "expires_at", "attempts"), row)) if row else None
+
+    def add_attempt(self, email):
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE otp_pending SET attempts = attempts + 1 WHERE email = ?", (email,))
+            row = conn.execute("SELECT attempts FROM otp_pending WHERE email = ?", (email,)).fetchone()
+        return row[0] if row else OTP_MAX_ATTEMPTS
+
+    def delete(self, email):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM otp_pending WHERE email = ?", (email,))
+
+_otp_store = None
+
+def get_otp_store():
+    global _otp_store
+    if _otp_store is None:
+        _otp_store = MemoryOTPStore() if OTP_STORE == "memory" else SQLiteOTPStore(OTP_STORE_PATH)
+    return _otp_store
+
+def get_client_ip():
+    """
+    IP klien untuk limit per IP. Di belakang proxy (Heroku) set TRUSTED_PROXY_COUNT:
+    ProxyFix (lihat create_app) lalu mengisi remote_addr dari X-Forwarded-For.
+    """
+    return request.remote_addr or "unknown"
+
+def otp_boleh_dikirim(email, ip):
+    """Cek limit kirim OTP per IP dan per email sebelum kerja apa pun (DB / SMTP)"""
+    store = get_otp_store()
+    if not store.hit(f"ip:{ip}", OTP_SEND_LIMIT_IP, OTP_SEND_WINDOW):
+        return False
+    return store.hit(f"email:{email}", OTP_SEND_LIMIT_EMAIL, OTP_SEND_WINDOW)
+
+def buat_otp(email, password):
+    """Generate OTP baru, simpan hash-nya di server. Return OTP plaintext untuk dikirim"""
+    otp = f"{secrets.randbelow(900000) + 100000}"
+    get_otp_store().put(email, hash_otp(email, otp), password, OTP_TTL)
+    return otp
+
+def verifikasi_otp(email, otp_input):
+    """
+    Return (status, data):
+    ('ok', password) | ('salah', sisa_percobaan) | ('kedaluwarsa', None) | ('terkunci', None)
+    """
+    store = get_otp_store()
+    record = store.get(email)
+    if not record:
+        return 'kedaluwarsa', None
+    if record['attempts'] >= OTP_MAX_ATTEMPTS:
+        store.delete(email)
+        return 'terkunci', None
+
+    if hmac.compare_digest(record['otp_hash'], hash_otp(email, otp_input)):
+        store.delete(email)
+        return 'ok', record['password']
+
+    attempts = store.add_attempt(email)
+    if attempts >= OTP_MAX_ATTEMPTS:
+        store.delete(email)
+        return 'terkunci', None
+    return 'salah', OTP_MAX_ATTEMPTS - attempts
@@ -0,0 +1,185 @@
+"""Job penyesuaian akhir bulan (penyusutan + akrual berulang)"""
+from datetime import datetime, date, timedelta
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import get_kode_akun, posting_jurnal_utuh
+from pinkilang.penyusutan import (
+    terapkan_penyusutan,
+    simpan_penyusutan_aset,
+    index_bulan,
+    label_bulan,
+    generate_jadwal_penyusutan,
+    akhir_bulan,
+    buat_jurnal_penyusutan_periode,
+)
+
+# ============================================================
+# 🔹 JOB: Penyesuaian Akhir Bulan (CLI / cron)
+# ============================================================
+# Cron (tanggal 1 tiap bulan, posting periode bulan lalu):
+#   0 1 1 * *  cd /app && flask --app pinky2 penyesuaian-bulanan
+TRANSAKSI_PENYESUAIAN_BULANAN = "PENYESUAIAN_OTOMATIS"
+
+def periode_sebelumnya(hari=None):
+    """Periode 'YYYY-MM' bulan sebelum `hari` (default hari ini)"""
+    hari = hari or date.today()
+    return (hari.replace(day=1) - timedelta(days=1)).strftime('%Y-%m')
+
+def daftar_periode(dari, sampai):
+    """Semua periode 'YYYY-MM' dari..sampai (inklusif)"""
+    awal = index_bulan(datetime.strptime(dari, '%Y-%m'))
+    akhir = index_bulan(datetime.strptime(sampai, '%Y-%m'))
+    return [label_bulan(i) for i in range(awal, akhir + 1)]
+
+def get_penyesuaian_berulang(user_emails=None):
+    """
+    Akrual berulang per tenant dari tabel penyesuaian_berulang
+    (user_email, akun_debit, akun_kredit, jumlah, keterangan, aktif).
+    Tabel opsional: kalau belum ada, job hanya memposting penyusutan.
+    """
+    try:
+        query = supabase.table("penyesuaian_berulang").select("*").eq("aktif", True)
+        if user_emails:
+            query = query.in_("user_email", list(user_emails))
+        rows = query.execute().data or []
+    except Exception as e:
+        logger.warning(f"⚠️ Akrual berulang dilewati: {str(e)}")
+        return {}
+
+    per_user = {}
+    for row in rows:
+        per_user.setdefault(row['user_email'], []).append(row)
+    return per_user
+
+def buat_jurnal_akrual(akrual_rows, tanggal, periode, user_email):
+    """Pasangan jurnal untuk setiap akrual berulang"""
+    entries = []
+    for akrual in akrual_rows:
+        jumlah = float(akrual.get('jumlah', 0) or 0)
+        if jumlah <= 0:
+            continue
+        keterangan = akrual.get('keterangan') or 'Akrual'
+        entries.extend([
+            {
+                "tanggal": tanggal,
+                "nama_akun": akrual['akun_debit'],
+                "ref": get_kode_akun(akrual['akun_debit']),
+                "debit": jumlah,
+                "kredit": 0,
+                "deskripsi": f"Penyesuaian: {keterangan} periode {periode}",
+                "transaksi_type": TRANSAKSI_PENYESUAIAN_BULANAN,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            },
+            {
+                "tanggal": tanggal,
+                "nama_akun": akrual['akun_kredit'],
+                "ref": get_kode_akun(akrual['akun_kredit']),
+                "debit": 0,
+                "kredit": jumlah,
+                "deskripsi": f"Penyesuaian: {keterangan} periode {periode}",
+                "transaksi_type": TRANSAKSI_PENYESUAIAN_BULANAN,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            }
+        ])
+    return entries
+
+def sinkronkan_penyusutan_aset(aset_data, tanggal_akhir):
+    """
+    Akumulasi penyusutan tersimpan diturunkan ulang dari jadwal s.d. tanggal_akhir,
+    juga untuk tenant yang jurnal periodenya sudah ada: upsert aset yang gagal
+    setelah jurnal terposting diperbaiki di run berikutnya. Tidak pernah mundur,
+    backfill periode lama tidak menimpa akumulasi yang lebih baru.
+    """
+    aset_data = terapkan_penyusutan(aset_data, tanggal_akhir)
+    return simpan_penyusutan_aset([
+        aset for aset in aset_data
+        if float(aset.get('akumulasi_penyusutan') or 0) >= float(aset.get('akumulasi_penyusutan_tercatat') or 0)
+    ])
+
+def jalankan_penyesuaian_bulanan(periode=None, user_emails=None, dry_run=False):
+    """
+    Posting semua jurnal penyesuaian satu periode untuk setiap tenant.
+
+    Idempoten per (tenant, periode): entri diberi kunci ref_id
+    PENYESUAIAN_<periode>_<tenant> + ref_baris, diposting lewat posting_jurnal, jadi
+    cron dan tombol generate yang jalan bersamaan tidak menggandakan jurnal.
+    Tenant yang sudah punya SEMUA kunci entri periode itu dilewati; kalau baru
+    sebagian, hanya baris yang belum ada yang diposting. Per tenant: 1 posting
+    jurnal semua-atau-tidak (penyusutan per jenis aset + akrual berulang) dan 1 upsert
+    aset_tetap yang selalu disinkronkan (lihat sinkronkan_penyusutan_aset).
+    Return {user_email: {'status', 'entri', 'total_penyusutan'}}.
+    """
+    periode = periode or periode_sebelumnya()
+    tanggal_akhir = akhir_bulan(periode)
+    logger.info(f"🗓️ Penyesuaian bulanan periode {periode}")
+
+    query = supabase.table("jurnal_umum")\
+        .select("user_email, ref_id, ref_baris")\
+        .eq("transaksi_type", TRANSAKSI_PENYESUAIAN_BULANAN)\
+        .eq("transaksi_id", periode)
+    if user_emails:
+        query = query.in_("user_email", list(user_emails))
+    kunci_tersimpan = {}
+    for row in query.execute().data or []:
+        kunci_tersimpan.setdefault(row['user_email'], set()).add((row.get('ref_id'), row.get('ref_baris')))
+
+    query = supabase.table("aset_tetap").select("*")
+    if user_emails:
+        query = query.in_("user_email", list(user_emails))
+    aset_per_user = {}
+    for aset in query.execute().data or []:
+        aset_per_user.setdefault(aset['user_email'], []).append(aset)
+
+    akrual_per_user = get_penyesuaian_berulang(user_emails)
+
+    hasil = {}
+    for user_email in sorted(set(aset_per_user) | set(akrual_per_user) | set(user_emails or [])):
+        aset_data = aset_per_user.get(user_email, [])
+        jadwal = generate_jadwal_penyusutan(aset_data, tanggal_akhir)
+        entries = buat_jurnal_penyusutan_periode(jadwal, periode, user_email, TRANSAKSI_PENYESUAIAN_BULANAN)
+        total_penyusutan = sum(e['debit'] for e in entries)
+        entries += buat_jurnal_akrual(akrual_per_user.get(user_email, []), tanggal_akhir.isoformat(), periode, user_email)
+
+        if not entries:
+            hasil[user_email] = {'status': 'kosong', 'entri': 0, 'total_penyusutan': 0}
+            continue
+
+        for nomor, entry in enumerate(entries, 1):
+            entry['transaksi_id'] = periode
+            entry['ref_id'] = f"PENYESUAIAN_{periode}_{user_email}"
+            entry['ref_baris'] = nomor
+
+        # Posting lama tanpa ref_baris (satu insert, selalu utuh) dianggap lengkap
+        tersimpan = kunci_tersimpan.get(user_email, set())
+        if any(ref_baris is None for _, ref_baris in tersimpan):
+            entries = []
+        else:
+            entries = [e for e in entries if (e['ref_id'], e['ref_baris']) not in tersimpan]
+        if not entries:
+            if not dry_run and aset_data:
+                try:
+                    sinkronkan_penyusutan_aset(aset_data, tanggal_akhir)
+                except Exception as e:
+                    logger.error(f"❌ Gagal sinkron penyusutan aset {periode} {user_email}: {str(e)}")
+            hasil[user_email] = {'status': 'sudah', 'entri': 0, 'total_penyusutan': 0}
+            continue
+
+        if dry_run:
+            hasil[user_email] = {'status': 'dry-run', 'entri': len(entries), 'total_penyusutan': total_penyusutan}
+            continue
+
+        try:
+            baru = posting_jurnal_utuh(entries)
+            sinkronkan_penyusutan_aset(aset_data, tanggal_akhir)
+            if not baru:
+                # Run lain (cron / tombol) memposting periode ini lebih dulu
+                hasil[user_email] = {'status': 'sudah', 'entri': 0, 'total_penyusutan': 0}
+                continue
+            hasil[user_email] = {'status': 'posted', 'entri': len(baru), 'total_penyusutan': total_penyusutan}
+            logger.info(f"✅ Penyesuaian {periode} {user_email}: {len(baru)} entri")
+        except Exception as e:
+            logger.error(f"❌ Gagal posting penyesuaian {periode} {user_email}: {str(e)}")
+            hasil[user_email] = {'status': 'gagal', 'entri': 0, 'total_penyusutan': 0, 'error': str(e)}
+
+    return hasil
@@ -0,0 +1,314 @@
+"""Mesin penyusutan aset tetap (numpy) dan penyimpanan hasilnya"""
+from flask import session
+from datetime import datetime, date, timedelta
+import numpy as np
+from functools import lru_cache
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import get_kode_akumulasi_penyusutan
+
+def get_aset_tetap_data(user_email=None, as_of=None):
+    """
+    Ambil data aset tetap + penyusutan terhitung per as_of - READ ONLY.
+    Nilai tersimpan di DB dipertahankan di *_tercatat; simpan lewat simpan_penyusutan_aset().
+    """
+    try:
+        if not supabase:
+            logger.error("❌ Supabase connection tidak tersedia")
+            return []
+
+        user_email = user_email or session.get('user_email')
+        result = supabase.table("aset_tetap")\
+            .select("*")\
+            .eq("user_email", user_email)\
+            .order("tanggal_perolehan", desc=True)\
+            .execute()
+
+        aset_data = result.data or []
+        logger.info(f"🔧 Data aset tetap ditemukan: {len(aset_data)} item untuk user {user_email}")
+
+        return terapkan_penyusutan(aset_data, as_of)
+
+    except Exception as e:
+        logger.error(f"❌ Error ambil data aset tetap: {str(e)}")
+        return []
+
+def terapkan_penyusutan(aset_data, as_of=None):
+    """Timpa akumulasi/nilai buku dengan hasil hitung per as_of; nilai DB disimpan di *_tercatat"""
+    for aset in aset_data:
+        aset['akumulasi_penyusutan_tercatat'] = aset.get('akumulasi_penyusutan')
+        aset['nilai_buku_tercatat'] = aset.get('nilai_buku')
+
+        if aset.get('jenis_aset') != 'TANAH':  # Tanah tidak disusutkan
+            hasil = calculate_depreciation(aset, as_of)
+            if hasil:
+                aset['akumulasi_penyusutan'] = hasil['akumulasi_penyusutan']
+                aset['nilai_buku'] = hasil['nilai_buku']
+
+    return aset_data
+
+def simpan_penyusutan_aset(aset_data):
+    """
+    Persist penyusutan hasil get_aset_tetap_data() dalam 1 upsert.
+    Hanya baris yang nilainya berubah dari yang tercatat yang ditulis.
+    """
+    rows = []
+    for aset in aset_data:
+        akumulasi_lama = float(aset.get('akumulasi_penyusutan_tercatat') or 0)
+        nilai_buku_lama = float(aset.get('nilai_buku_tercatat') or 0)
+        akumulasi_baru = float(aset.get('akumulasi_penyusutan') or 0)
+        nilai_buku_baru = float(aset.get('nilai_buku') or 0)
+
+        if round(akumulasi_lama, 2) == round(akumulasi_baru, 2) and round(nilai_buku_lama, 2) == round(nilai_buku_baru, 2):
+            continue
+
+        row = {k: v for k, v in aset.items() if not k.endswith('_tercatat')}
+        rows.append(row)
+
+    if not rows:
+        logger.info("✅ Penyusutan aset sudah up to date, tidak ada yang disimpan")
+        return 0
+
+    supabase.table("aset_tetap").upsert(rows).execute()
+    for aset in aset_data:
+        aset['akumulasi_penyusutan_tercatat'] = aset.get('akumulasi_penyusutan')
+        aset['nilai_buku_tercatat'] = aset.get('nilai_buku')
+
+    logger.info(f"✅ Berhasil simpan penyusutan {len(rows)} aset")
+    return len(rows)
+
+def parse_tanggal_aset(tanggal_str):
+    """Parse tanggal_perolehan (date, 'YYYY-MM-DD' atau ISO timestamp) ke date"""
+    if isinstance(tanggal_str, datetime):
+        return tanggal_str.date()
+    if isinstance(tanggal_str, date):
+        return tanggal_str
+    return datetime.strptime(str(tanggal_str).split('T')[0], '%Y-%m-%d').date()
+
+# ============================================================
+# 🔹 ENGINE JADWAL PENYUSUTAN (vektor aset × bulan)
+# ============================================================
+METODE_PENYUSUTAN = {
+    "GARIS_LURUS": "Garis Lurus",
+    "SALDO_MENURUN": "Saldo Menurun Ganda",
+    "JUMLAH_ANGKA_TAHUN": "Jumlah Angka Tahun",
+}
+_KODE_METODE = {kode: i for i, kode in enumerate(METODE_PENYUSUTAN)}
+
+# Kolom pilihan metode di aset_tetap; jalankan sekali di Supabase SQL Editor. Sebelum itu
+# aset disimpan tanpa kolom ini dan dihitung garis lurus (lihat assets/aset_tetap.py).
+SQL_METODE_PENYUSUTAN = """
+ALTER TABLE aset_tetap ADD COLUMN IF NOT EXISTS metode_penyusutan VARCHAR(30) DEFAULT 'GARIS_LURUS';
+"""
+
+def index_bulan(tanggal):
+    """Nomor bulan absolut (tahun*12 + bulan-1) untuk aritmetika bulan kalender"""
+    return tanggal.year * 12 + tanggal.month - 1
+
+def label_bulan(idx):
+    """Kebalikan index_bulan -> 'YYYY-MM'"""
+    return f"{idx // 12:04d}-{idx % 12 + 1:02d}"
+
+def hitung_matriks_penyusutan(nilai_perolehan, nilai_residu, masa_manfaat, metode, bulan_perolehan, bulan_awal, bulan_akhir):
+    """
+    Penyusutan per bulan untuk banyak aset sekaligus.
+
+    Semua argumen aset berupa array sejajar (satu elemen per aset); hasil matriks
+    (aset × bulan) untuk bulan_awal..bulan_akhir (index_bulan). Bulan pertama
+    penyusutan = bulan setelah bulan perolehan, sama seperti hitungan bulan kalender
+    sebelumnya. Saldo menurun & jumlah angka tahun dihitung per tahun umur aset
+    lalu dibagi rata 12 bulan.
+    """
+    C = np.asarray(nilai_perolehan, dtype=float)[:, None]
+    R = np.minimum(np.asarray(nilai_residu, dtype=float), C[:, 0])[:, None]
+    N = np.asarray(masa_manfaat, dtype=float)[:, None]
+    M = np.asarray(metode, dtype=int)[:, None]
+    A = np.asarray(bulan_perolehan, dtype=int)[:, None]
+
+    bulan = np.arange(bulan_awal, bulan_akhir + 1)[None, :]
+    umur_bulan = bulan - A                                  # bulan ke-k umur aset (1-based)
+    aktif = (umur_bulan >= 1) & (umur_bulan <= N * 12) & (N > 0)
+
+    N_aman = np.where(N > 0, N, 1)
+    tahun = np.clip((umur_bulan - 1) // 12 + 1, 1, N_aman)  # tahun ke-y umur aset
+    dasar = C - R
+
+    garis_lurus = np.broadcast_to(dasar / (N_aman * 12), umur_bulan.shape)
+
+    jumlah_angka = N_aman * (N_aman + 1) / 2
+    jumlah_angka_tahun = dasar * (N_aman - tahun + 1) / jumlah_angka / 12
+
+    # Nilai buku awal tahun ke-y = max(C·(1-r)^(y-1), R); tahun terakhir habis ke residu
+    r = np.minimum(2 / N_aman, 1.0)
+    def nilai_buku_awal(y):
+        nb = np.maximum(C * (1 - r) ** (y - 1), R)
+        return np.where(y > N_aman, R, nb)
+    saldo_menurun = (nilai_buku_awal(tahun) - nilai_buku_awal(tahun + 1)) / 12
+
+    penyusutan = np.select(
+        [M == _KODE_METODE["SALDO_MENURUN"], M == _KODE_METODE["JUMLAH_ANGKA_TAHUN"]],
+        [saldo_menurun, jumlah_angka_tahun],
+        default=garis_lurus
+    )
+    return np.where(aktif, penyusutan, 0.0)
+
+def parameter_penyusutan(aset):
+    """(nilai_perolehan, nilai_residu, masa_manfaat, metode) aset; tanah tidak disusutkan"""
+    nilai_perolehan = float(aset.get('nilai_perolehan', 0) or 0)
+    if aset.get('jenis_aset') == 'TANAH':
+        return nilai_perolehan, nilai_perolehan, 0, "GARIS_LURUS"
+
+    masa_manfaat = int(aset.get('masa_manfaat', 0) or 0)
+    nilai_residu = float(aset.get('nilai_residu', 0) or 0)
+    metode = aset.get('metode_penyusutan') or "GARIS_LURUS"
+    if metode not in METODE_PENYUSUTAN:
+        metode = "GARIS_LURUS"
+
+    # Data lama tanpa masa_manfaat: turunkan dari penyusutan_tahunan tersimpan
+    penyusutan_tahunan = float(aset.get('penyusutan_tahunan', 0) or 0)
+    if masa_manfaat <= 0 and penyusutan_tahunan > 0:
+        masa_manfaat = round((nilai_perolehan - nilai_residu) / penyusutan_tahunan)
+
+    return nilai_perolehan, nilai_residu, masa_manfaat, metode
+
+def generate_jadwal_penyusutan(aset_data, sampai, dari=None):
+    """
+    Jadwal penyusutan bulanan semua aset dalam satu perhitungan matriks.
+
+    Kolom dimulai dari bulan perolehan paling awal supaya akumulasi bisa
+    di-cumsum; `dari` hanya memotong kolom yang dikembalikan.
+    Return dict: bulan (label), penyusutan, akumulasi, nilai_buku (matriks aset × bulan).
+    """
+    bulan_akhir = index_bulan(sampai)
+    if not aset_data:
+        return {'aset': [], 'bulan': [], 'penyusutan': np.zeros((0, 0)),
+                'akumulasi': np.zeros((0, 0)), 'nilai_buku': np.zeros((0, 0))}
+
+    params = [parameter_penyusutan(a) for a in aset_data]
+    bulan_perolehan = [index_bulan(parse_tanggal_aset(a['tanggal_perolehan'])) for a in aset_data]
+    bulan_awal = min(min(bulan_perolehan) + 1, bulan_akhir)
+
+    penyusutan = hitung_matriks_penyusutan(
+        [p[0] for p in params],
+        [p[1] for p in params],
+        [p[2] for p in params],
+        [_KODE_METODE[p[3]] for p in params],
+        bulan_perolehan, bulan_awal, bulan_akhir
+    )
+    akumulasi = np.cumsum(penyusutan, axis=1)
+    nilai_buku = np.array([p[0] for p in params])[:, None] - akumulasi
+
+    potong = max(index_bulan(dari) - bulan_awal, 0) if dari else 0
+    return {
+        'aset': aset_data,
+        'bulan': [label_bulan(i) for i in range(bulan_awal + potong, bulan_akhir + 1)],
+        'penyusutan': penyusutan[:, potong:],
+        'akumulasi': akumulasi[:, potong:],
+        'nilai_buku': nilai_buku[:, potong:],
+    }
+
+def akhir_bulan(periode):
+    """Tanggal terakhir periode 'YYYY-MM'"""
+    tahun, bulan = map(int, periode.split('-'))
+    return date(tahun + bulan // 12, bulan % 12 + 1, 1) - timedelta(days=1)
+
+def buat_jurnal_penyusutan(aset_data, nilai_per_aset, tanggal, periode, user_email, transaksi_type="PENYESUAIAN_OTOMATIS"):
+    """Satu pasang Beban Penyusutan / Akumulasi Penyusutan per jenis aset"""
+    per_jenis = {}
+    for aset, nilai in zip(aset_data, nilai_per_aset):
+        if nilai > 0.005:
+            jenis = aset.get('jenis_aset', '')
+            per_jenis[jenis] = per_jenis.get(jenis, 0) + float(nilai)
+
+    entries = []
+    for jenis, nilai in sorted(per_jenis.items()):
+        nilai = round(nilai, 2)
+        entries.extend([
+            {
+                "tanggal": tanggal,
+                "nama_akun": "Beban Penyusutan",
+                "ref": "6130",
+                "debit": nilai,
+                "kredit": 0,
+                "deskripsi": f"Penyusutan {jenis.lower()} periode {periode}",
+                "transaksi_type": transaksi_type,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            },
+            {
+                "tanggal": tanggal,
+                "nama_akun": "Akumulasi Penyusutan",
+                "ref": get_kode_akumulasi_penyusutan(jenis),
+                "debit": 0,
+                "kredit": nilai,
+                "deskripsi": f"Akumulasi penyusutan {jenis.lower()} periode {periode}",
+                "transaksi_type": transaksi_type,
+                "user_email": user_email,
+                "created_at": datetime.now().isoformat()
+            }
+        ])
+    return entries
+
+def buat_jurnal_penyusutan_periode(jadwal, periode, user_email, transaksi_type="PENYESUAIAN_OTOMATIS"):
+    """Jurnal penyesuaian penyusutan satu bulan (periode 'YYYY-MM') dari jadwal"""
+    if periode not in jadwal['bulan']:
+        return []
+
+    kolom = jadwal['bulan'].index(periode)
+    return buat_jurnal_penyusutan(
+        jadwal['aset'], jadwal['penyusutan'][:, kolom],
+        akhir_bulan(periode).isoformat(), periode, user_email, transaksi_type
+    )
+
+@lru_cache(maxsize=8192)
+def hitung_penyusutan_aset(tanggal_perolehan, nilai_perolehan, nilai_residu, masa_manfaat, metode, as_of):
+    """
+    Penyusutan satu aset per as_of - fungsi murni di atas hitung_matriks_penyusutan.
+    Argumen = versi aset (nilai-nilai yang mempengaruhi penyusutan), jadi cache
+    otomatis tidak berlaku lagi begitu aset diubah.
+    """
+    # Jika tanggal perolehan di masa depan, tidak ada penyusutan
+    if tanggal_perolehan > as_of:
+        return 0, 0.0, nilai_perolehan
+
+    bulan_perolehan = index_bulan(tanggal_perolehan)
+    bulan_as_of = index_bulan(as_of)
+    total_bulan = bulan_as_of - bulan_perolehan
+    if total_bulan <= 0:
+        return 0, 0.0, nilai_perolehan
+
+    penyusutan = hitung_matriks_penyusutan(
+        [nilai_perolehan], [nilai_residu], [masa_manfaat], [_KODE_METODE[metode]],
+        [bulan_perolehan], bulan_perolehan + 1, bulan_as_of
+    )
+    akumulasi_penyusutan = float(penyusutan.sum())
+    return total_bulan, akumulasi_penyusutan, nilai_perolehan - akumulasi_penyusutan
+
+def calculate_depreciation(aset, as_of=None):
+    """Hitung penyusutan aset tetap per as_of (default hari ini) - tanpa menulis ke DB"""
+    try:
+        tanggal_perolehan_str = aset.get('tanggal_perolehan')
+        if not tanggal_perolehan_str:
+            logger.error("❌ Tanggal perolehan tidak ditemukan")
+            return None
+
+        try:
+            tanggal_perolehan = parse_tanggal_aset(tanggal_perolehan_str)
+        except ValueError:
+            logger.error(f"❌ Format tanggal tidak dikenali: {tanggal_perolehan_str}")
+            return None
+
+        total_bulan, akumulasi_penyusutan, nilai_buku = hitung_penyusutan_aset(
+            tanggal_perolehan,
+            *parameter_penyusutan(aset),
+            as_of or date.today()
+        )
+
+        return {
+            'bulan_berjalan': total_bulan,
+            'akumulasi_penyusutan': akumulasi_penyusutan,
+            'nilai_buku': nilai_buku
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Error hitung penyusutan untuk aset {aset.get('id')}: {str(e)}")
+        return None
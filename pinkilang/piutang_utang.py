@@ -0,0 +1,310 @@
+"""Umur piutang/utang dan alokasi pelunasan massal"""
+from datetime import datetime
+import os
+from pinkilang.core import logger, supabase, format_currency, TTLCache
+from pinkilang.akuntansi import posting_jurnal_utuh, get_kode_akun
+
+# ============================================================
+# 🔹 LAPORAN UMUR PIUTANG & UTANG (AGING)
+# ============================================================
+# Bucket umur: (kode, label, batas atas hari; None = tanpa batas)
+AGING_BUCKETS = [
+    ("current", "Current", 0),
+    ("1_30", "1–30 Hari", 30),
+    ("31_60", "31–60 Hari", 60),
+    ("61_90", "61–90 Hari", 90),
+    ("over_90", "> 90 Hari", None),
+]
+
+# Termin kredit (hari) sebelum faktur dianggap lewat jatuh tempo.
+# Default 0 = umur dihitung langsung dari tanggal faktur.
+AGING_TERMIN_HARI = int(os.getenv("AGING_TERMIN_HARI", "0"))
+AGING_CACHE_TTL = int(os.getenv("AGING_CACHE_TTL", "300"))
+
+# Sumber data per jenis laporan: tabel faktur, tabel pelunasan, kolom FK, kolom total, kolom pihak
+AGING_SOURCES = {
+    "piutang": ("penjualan", "pelunasan_piutang", "penjualan_id", "total_penjualan", "nama_pelanggan"),
+    "utang": ("pembelian", "pelunasan_utang", "pembelian_id", "total_pembelian", "nama_supplier"),
+}
+
+_aging_cache = TTLCache("aging", AGING_CACHE_TTL)
+
+def invalidate_aging_cache():
+    """Buang cache aging setelah ada penjualan/pembelian/pelunasan baru"""
+    _aging_cache.clear()
+
+def get_aging_bucket(umur_hari):
+    """Kode bucket untuk umur (hari lewat termin)"""
+    for kode, _, batas in AGING_BUCKETS:
+        if batas is None or umur_hari <= batas:
+            return kode
+    return AGING_BUCKETS[-1][0]
+
+def hitung_aging(jenis, as_of):
+    """
+    Hitung umur piutang/utang per pihak pada tanggal as_of.
+
+    Dua query (faktur kredit + pelunasan), lalu satu sweep berurutan
+    (pihak, tanggal) dengan akumulator bucket per pihak.
+    """
+    faktur_table, pelunasan_table, fk_col, total_col, pihak_col = AGING_SOURCES[jenis]
+    as_of_str = as_of.strftime('%Y-%m-%d')
+
+    faktur = supabase.table(faktur_table)\
+        .select(f"id, tanggal, {total_col}, {pihak_col}")\
+        .eq("metode_pembayaran", "KREDIT")\
+        .lte("tanggal", as_of_str)\
+        .execute().data or []
+    pelunasan = supabase.table(pelunasan_table)\
+        .select(f"{fk_col}, jumlah_bayar")\
+        .lte("tanggal_bayar", as_of_str)\
+        .execute().data or []
+
+    dibayar = {}
+    for p in pelunasan:
+        dibayar[p[fk_col]] = dibayar.get(p[fk_col], 0) + (p.get('jumlah_bayar') or 0)
+
+    faktur.sort(key=lambda f: ((f.get(pihak_col) or 'Tidak Diketahui'), f['tanggal']))
+
+    per_pihak = []
+    total_bucket = {kode: 0 for kode, _, _ in AGING_BUCKETS}
+    pihak_aktif = None
+    akumulator = None
+
+    for f in faktur:
+        sisa = (f.get(total_col) or 0) - dibayar.get(f['id'], 0)
+        if sisa <= 0:
+            continue
+
+        pihak = f.get(pihak_col) or 'Tidak Diketahui'
+        if pihak != pihak_aktif:
+            akumulator = {
+                'nama': pihak,
+                'buckets': {kode: 0 for kode, _, _ in AGING_BUCKETS},
+                'total': 0,
+                'jumlah_faktur': 0,
+                'faktur_tertua': f['tanggal'],
+            }
+            per_pihak.append(akumulator)
+            pihak_aktif = pihak
+
+        umur = (as_of - datetime.strptime(f['tanggal'][:10], '%Y-%m-%d').date()).days - AGING_TERMIN_HARI
+        kode = get_aging_bucket(umur)
+        akumulator['buckets'][kode] += sisa
+        akumulator['total'] += sisa
+        akumulator['jumlah_faktur'] += 1
+        total_bucket[kode] += sisa
+
+    return {
+        'jenis': jenis,
+        'as_of': as_of_str,
+        'termin_hari': AGING_TERMIN_HARI,
+        'buckets': [{'kode': kode, 'label': label} for kode, label, _ in AGING_BUCKETS],
+        'per_pihak': per_pihak,
+        'total_bucket': total_bucket,
+        'total': sum(total_bucket.values()),
+    }
+
+def get_pelunasan_per_faktur(jenis):
+    """
+    Semua baris pelunasan piutang/utang dalam satu query, dikelompokkan per id
+    faktur - pengganti query pelunasan per faktur di halaman daftar.
+    """
+    _, pelunasan_table, fk_col, _, _ = AGING_SOURCES[jenis]
+    per_faktur = {}
+    for p in supabase.table(pelunasan_table).select("*").execute().data or []:
+        per_faktur.setdefault(p[fk_col], []).append(p)
+    return per_faktur
+
+def get_aging_data(jenis, as_of):
+    """hitung_aging dengan cache per (jenis, as_of)"""
+    return _aging_cache.get_or_set((jenis, as_of.isoformat()), lambda: hitung_aging(jenis, as_of))
+
+# ============================================================
+# 🔹 PELUNASAN MASSAL PIUTANG & UTANG
+# ============================================================
+STRATEGI_ALOKASI = {
+    "fifo": "FIFO (urutan input)",
+    "oldest": "Faktur tertua dulu",
+    "list": "Daftar faktur pilihan",
+}
+
+def get_faktur_terbuka(jenis, pihak):
+    """Faktur kredit milik satu pelanggan/supplier yang masih punya sisa (2 query)"""
+    faktur_table, pelunasan_table, fk_col, total_col, pihak_col = AGING_SOURCES[jenis]
+
+    faktur = supabase.table(faktur_table)\
+        .select("*")\
+        .eq("metode_pembayaran", "KREDIT")\
+        .eq(pihak_col, pihak)\
+        .execute().data or []
+    if not faktur:
+        return []
+
+    pelunasan = supabase.table(pelunasan_table)\
+        .select(f"{fk_col}, jumlah_bayar")\
+        .in_(fk_col, [f['id'] for f in faktur])\
+        .execute().data or []
+
+    dibayar = {}
+    for p in pelunasan:
+        dibayar[p[fk_col]] = dibayar.get(p[fk_col], 0) + (p.get('jumlah_bayar') or 0)
+
+    terbuka = []
+    for f in faktur:
+        sisa = (f.get(total_col) or 0) - dibayar.get(f['id'], 0)
+        if sisa > 0:
+            terbuka.append({**f, 'sisa': sisa})
+    return terbuka
+
+def alokasikan_pembayaran(faktur_terbuka, jumlah, strategi="fifo", faktur_ids=None):
+    """
+    Bagi jumlah pembayaran ke faktur terbuka.
+
+    fifo   : urutan input (id/created_at)
+    oldest : tanggal faktur tertua dulu
+    list   : hanya faktur di faktur_ids, sesuai urutan daftar
+    Return: (list of (faktur, jumlah_bayar), sisa pembayaran yang tidak teralokasi)
+    """
+    if strategi == "list":
+        by_id = {str(f['id']): f for f in faktur_terbuka}
+        urutan = [by_id[str(i)] for i in (faktur_ids or []) if str(i) in by_id]
+    elif strategi == "oldest":
+        urutan = sorted(faktur_terbuka, key=lambda f: (f.get('tanggal') or '', f['id']))
+    else:
+        urutan = sorted(faktur_terbuka, key=lambda f: (f.get('created_at') or '', f['id']))
+
+    alokasi = []
+    sisa_bayar = jumlah
+    for f in urutan:
+        if sisa_bayar <= 0:
+            break
+        bayar = min(f['sisa'], sisa_bayar)
+        alokasi.append((f, bayar))
+        sisa_bayar -= bayar
+    return alokasi, sisa_bayar
+
+def proses_pelunasan_massal(jenis, pihak, jumlah, tanggal_bayar, metode_pembayaran, strategi, faktur_ids, user_email):
+    """
+    Alokasikan satu pembayaran ke banyak faktur.
+    Semua baris pelunasan_* disimpan dalam 1 insert, jurnalnya 1 pasang lewat
+    posting_jurnal_utuh (semua-atau-tidak) dengan kunci PELUNASAN_<JENIS>_<id pelunasan
+    pertama> + ref_baris. Kalau jurnal gagal, baris pelunasan dan jurnal dengan ref_id
+    itu dihapus lagi dan hasilnya success False.
+    """
+    _, pelunasan_table, fk_col, _, pihak_col = AGING_SOURCES[jenis]
+
+    if jumlah <= 0:
+        return {'success': False, 'message': "Jumlah bayar harus > 0"}
+
+    faktur_terbuka = get_faktur_terbuka(jenis, pihak)
+    if not faktur_terbuka:
+        return {'success': False, 'message': f"Tidak ada {jenis} terbuka untuk {pihak}"}
+
+    total_terbuka = sum(f['sisa'] for f in faktur_terbuka)
+    if jumlah > total_terbuka:
+        return {'success': False, 'message': f"Jumlah bayar melebihi sisa {jenis} ({format_currency(total_terbuka)})"}
+
+    alokasi, sisa_bayar = alokasikan_pembayaran(faktur_terbuka, jumlah, strategi, faktur_ids)
+    if sisa_bayar > 0:
+        return {'success': False, 'message': f"Faktur terpilih hanya menampung {format_currency(jumlah - sisa_bayar)}"}
+
+    now_iso = datetime.now().isoformat()
+    pelunasan_rows = []
+    for faktur, bayar in alokasi:
+        row = {
+            fk_col: faktur['id'],
+            "tanggal_bayar": tanggal_bayar,
+            "jumlah_bayar": bayar,
+            "metode_pembayaran": metode_pembayaran,
+            "user_email": user_email,
+            "created_at": now_iso
+        }
+        if jenis == "utang":
+            row["nama_supplier"] = pihak
+        pelunasan_rows.append(row)
+
+    insert_result = supabase.table(pelunasan_table).insert(pelunasan_rows).execute()
+    if not insert_result.data:
+        return {'success': False, 'message': "Gagal menyimpan pelunasan (DB)"}
+    pelunasan_ids = [row['id'] for row in insert_result.data]
+
+    akun_kas = "Kas" if metode_pembayaran == "CASH" else "Bank"
+    if jenis == "piutang":
+        jurnal_entries = [
+            {
+                "tanggal": tanggal_bayar,
+                "nama_akun": akun_kas,
+                "ref": get_kode_akun(akun_kas),
+                "debit": jumlah,
+                "kredit": 0,
+                "deskripsi": f"Pelunasan massal piutang dari {pihak} ({len(alokasi)} faktur)",
+                "transaksi_type": "PELUNASAN_PIUTANG",
+                "user_email": user_email,
+                "created_at": now_iso
+            },
+            {
+                "tanggal": tanggal_bayar,
+                "nama_akun": "Piutang Usaha",
+                "ref": "1120",
+                "debit": 0,
+                "kredit": jumlah,
+                "deskripsi": f"Pelunasan massal piutang {pihak}",
+                "transaksi_type": "PELUNASAN_PIUTANG",
+                "user_email": user_email,
+                "created_at": now_iso
+            }
+        ]
+    else:
+        jurnal_entries = [
+            {
+                "tanggal": tanggal_bayar,
+                "nama_akun": "Utang Usaha",
+                "ref": "2110",
+                "debit": jumlah,
+                "kredit": 0,
+                "deskripsi": f"Pelunasan massal utang supplier {pihak} ({len(alokasi)} faktur)",
+                "transaksi_type": "PELUNASAN_UTANG",
+                "user_email": user_email,
+                "created_at": now_iso
+            },
+            {
+                "tanggal": tanggal_bayar,
+                "nama_akun": akun_kas,
+                "ref": get_kode_akun(akun_kas),
+                "debit": 0,
+                "kredit": jumlah,
+                "deskripsi": f"Pembayaran pelunasan massal utang {pihak}",
+                "transaksi_type": "PELUNASAN_UTANG",
+                "user_email": user_email,
+                "created_at": now_iso
+            }
+        ]
+
+    transaksi_id = str(pelunasan_ids[0])
+    ref_id = f"PELUNASAN_{jenis.upper()}_{transaksi_id}"
+    for nomor, entry in enumerate(jurnal_entries, 1):
+        entry.update(ref_id=ref_id, ref_baris=nomor, transaksi_id=transaksi_id)
+
+    try:
+        baru = posting_jurnal_utuh(jurnal_entries)
+        if len(baru) < len(jurnal_entries):
+            raise RuntimeError(f"hanya {len(baru)}/{len(jurnal_entries)} baris jurnal tersimpan")
+    except Exception as je:
+        logger.error(f"❌ Gagal membuat jurnal pelunasan massal: {str(je)}")
+        try:
+            # Jangan tinggalkan jurnal sepihak: kunci ref_id ini baru dibuat di atas
+            supabase.table("jurnal_umum").delete(returning="minimal").eq("ref_id", ref_id).execute()
+            supabase.table(pelunasan_table).delete(returning="minimal").in_("id", pelunasan_ids).execute()
+        except Exception as e:
+            logger.error(f"❌ Gagal membatalkan pelunasan {pelunasan_ids}: {str(e)}")
+        invalidate_aging_cache()
+        return {'success': False, 'message': f"Gagal membuat jurnal pelunasan, pembayaran dibatalkan: {str(je)}"}
+
+    invalidate_aging_cache()
+    logger.info(f"✅ Pelunasan massal {jenis} {pihak}: {jumlah} ke {len(alokasi)} faktur oleh {user_email}")
+    return {
+        'success': True,
+        'message': f"Pelunasan {jenis} {pihak} berhasil: {format_currency(jumlah)} ke {len(alokasi)} faktur",
+        'alokasi': [{'id': f['id'], 'tanggal': f.get('tanggal'), 'jumlah_bayar': bayar} for f, bayar in alokasi]
+    }
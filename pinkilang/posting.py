@@ -0,0 +1,164 @@
+"""Posting dokumen transaksi + persediaan + jurnal dalam satu transaksi database"""
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import posting_jurnal
+
+# ============================================================
+# 🔹 FUNGSI POSTGRES posting_transaksi
+# ============================================================
+# Satu RPC = satu transaksi: kunci baris persediaan, cek stok, ubah persediaan,
+# insert dokumen, lalu insert jurnalnya (transaksi_id dan ref_id diisi id dokumen
+# baru, duplikat (ref_id, ref_baris) diabaikan). Gagal di tengah = tidak ada yang
+# tersimpan, jadi tidak ada lagi dokumen tanpa jurnal / stok yang tidak cocok.
+# Jalankan sekali di Supabase SQL Editor setelah SQL_JURNAL_IDEMPOTEN
+# (pinkilang.akuntansi); selama fungsi belum ada dipakai urutan query lama.
+SQL_POSTING_TRANSAKSI = """
+CREATE OR REPLACE FUNCTION posting_transaksi(
+    p_tabel TEXT, p_dokumen JSONB, p_jurnal JSONB, p_ref_prefix TEXT,
+    p_delta_persediaan NUMERIC DEFAULT 0, p_updated_by TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_stok NUMERIC;
+    v_dokumen JSONB;
+    v_id BIGINT;
+BEGIN
+    IF p_tabel NOT IN ('penjualan', 'pembelian', 'operasional', 'modal') THEN
+        RAISE EXCEPTION 'TABEL_TIDAK_DIDUKUNG:%', p_tabel;
+    END IF;
+
+    IF p_delta_persediaan <> 0 THEN
+        SELECT jumlah_persediaan INTO v_stok FROM persediaan_terintegrasi WHERE id = 1 FOR UPDATE;
+        IF NOT FOUND THEN
+            IF p_delta_persediaan < 0 THEN
+                RAISE EXCEPTION 'PERSEDIAAN_BELUM_DIATUR';
+            END IF;
+            INSERT INTO persediaan_terintegrasi (id, jumlah_persediaan, created_by, updated_by, created_at, updated_at)
+            VALUES (1, 0, p_updated_by, p_updated_by, now(), now());
+            v_stok := 0;
+        END IF;
+        IF v_stok + p_delta_persediaan < 0 THEN
+            RAISE EXCEPTION 'STOK_TIDAK_CUKUP:%', v_stok;
+        END IF;
+        UPDATE persediaan_terintegrasi
+        SET jumlah_persediaan = v_stok + p_delta_persediaan, updated_by = p_updated_by, updated_at = now()
+        WHERE id = 1;
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO %1$I (%2$s) SELECT %2$s FROM jsonb_populate_record(NULL::%1$I, $1) RETURNING to_jsonb(%1$I.*)',
+        p_tabel, (SELECT string_agg(quote_ident(k), ', ') FROM jsonb_object_keys(p_dokumen) AS k)
+    ) INTO v_dokumen USING p_dokumen;
+    v_id := (v_dokumen->>'id')::BIGINT;
+
+    INSERT INTO jurnal_umum (tanggal, nama_akun, akun_debit, akun_kredit, ref, ref_id, ref_baris, jumlah, debit, kredit,
+                             deskripsi, keterangan, transaksi_type, transaksi_id, user_email, created_at)
+    SELECT j.tanggal, j.nama_akun, j.akun_debit, j.akun_kredit, j.ref, p_ref_prefix || '_' || v_id, j.ref_baris,
+           j.jumlah, COALESCE(j.debit, 0), COALESCE(j.kredit, 0), j.deskripsi, j.keterangan, j.transaksi_type,
+           v_id::TEXT, j.user_email, COALESCE(j.created_at, now())
+    FROM jsonb_populate_recordset(NULL::jurnal_umum, p_jurnal) AS j
+    ON CONFLICT (ref_id, ref_baris) WHERE deleted_at IS NULL DO NOTHING;
+
+    RETURN jsonb_build_object('dokumen', v_dokumen, 'persediaan', v_stok + p_delta_persediaan);
+END;
+$$;
+"""
+
+# Tabel dokumen yang boleh diposting lewat posting_transaksi (sama dengan fungsi SQL-nya)
+TABEL_POSTING = ("penjualan", "pembelian", "operasional", "modal")
+ID_BARU = "0"   # transaksi_id sementara untuk buat_entri_jurnal; diganti id dokumen saat posting
+
+_rpc_posting_tersedia = True
+
+class PersediaanBelumDiatur(Exception):
+    """Penjualan sebelum ada baris persediaan_terintegrasi"""
+
+class StokTidakCukup(Exception):
+    """Stok kurang dari jumlah yang keluar - dicek di dalam transaksi yang sama dengan update-nya"""
+
+    def __init__(self, tersedia):
+        super().__init__(f"Stok tidak mencukupi, tersedia {tersedia}")
+        self.tersedia = tersedia
+
+def _error_posting(e):
+    """Error dari RPC -> exception bisnis (stok/persediaan), atau None kalau error lain"""
+    pesan = getattr(e, "message", None) or str(e)
+    if "STOK_TIDAK_CUKUP:" in pesan:
+        tersedia = pesan.split("STOK_TIDAK_CUKUP:", 1)[1].split()[0].strip("'\",")
+        return StokTidakCukup(int(float(tersedia)))
+    if "PERSEDIAAN_BELUM_DIATUR" in pesan:
+        return PersediaanBelumDiatur()
+    return None
+
+def _rpc_tidak_ada(e):
+    return getattr(e, "code", None) in ("PGRST202", "42883")
+
+def posting_transaksi(tabel, dokumen, jurnal, ref_prefix, delta_persediaan=0, updated_by=None):
+    """
+    Simpan dokumen + perubahan persediaan + baris jurnalnya sekaligus; return
+    {"dokumen": baris tersimpan, "persediaan": stok baru (None kalau tidak berubah)}.
+
+    `jurnal` dari akuntansi.buat_entri_jurnal(..., transaksi_id=ID_BARU); transaksi_id
+    dan ref_id (`ref_prefix`_id) diisi id dokumen baru. Raise StokTidakCukup /
+    PersediaanBelumDiatur tanpa ada yang tersimpan.
+    """
+    global _rpc_posting_tersedia
+    if tabel not in TABEL_POSTING:
+        raise ValueError(f"Tabel {tabel} tidak bisa diposting")
+
+    if _rpc_posting_tersedia:
+        try:
+            hasil = supabase.rpc("posting_transaksi", {
+                "p_tabel": tabel,
+                "p_dokumen": dokumen,
+                "p_jurnal": jurnal,
+                "p_ref_prefix": ref_prefix,
+                "p_delta_persediaan": delta_persediaan,
+                "p_updated_by": updated_by,
+            }).execute().data
+            return {"dokumen": hasil["dokumen"], "persediaan": hasil.get("persediaan")}
+        except Exception as e:
+            error = _error_posting(e)
+            if error is not None:
+                raise error from e
+            if not _rpc_tidak_ada(e):
+                raise
+            _rpc_posting_tersedia = False
+            logger.warning(f"⚠️ RPC posting_transaksi belum tersedia, pakai query bertahap: {e}")
+
+    return _posting_bertahap(tabel, dokumen, jurnal, ref_prefix, delta_persediaan, updated_by)
+
+def _posting_bertahap(tabel, dokumen, jurnal, ref_prefix, delta_persediaan, updated_by):
+    """Urutan query lama (tidak atomik), dipakai selama fungsi posting_transaksi belum dibuat"""
+    persediaan = None
+    if delta_persediaan:
+        rows = supabase.table("persediaan_terintegrasi").select("*").eq("id", 1).execute().data
+        now_iso = datetime.now().isoformat()
+        if not rows:
+            if delta_persediaan < 0:
+                raise PersediaanBelumDiatur()
+            persediaan = delta_persediaan
+            supabase.table("persediaan_terintegrasi").insert({
+                "id": 1,
+                "jumlah_persediaan": persediaan,
+                "created_by": updated_by,
+                "updated_by": updated_by,
+                "created_at": now_iso,
+                "updated_at": now_iso
+            }).execute()
+        else:
+            stok = rows[0]['jumlah_persediaan'] or 0
+            if stok + delta_persediaan < 0:
+                raise StokTidakCukup(stok)
+            persediaan = stok + delta_persediaan
+            supabase.table("persediaan_terintegrasi").update({
+                "jumlah_persediaan": persediaan,
+                "updated_by": updated_by,
+                "updated_at": now_iso
+            }).eq("id", 1).execute()
+
+    row = supabase.table(tabel).insert(dokumen).execute().data[0]
+    transaksi_id = str(row['id'])
+    posting_jurnal([{**entry, "transaksi_id": transaksi_id, "ref_id": f"{ref_prefix}_{transaksi_id}"} for entry in jurnal])
+    return {"dokumen": row, "persediaan": persediaan}
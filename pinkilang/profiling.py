@@ -0,0 +1,168 @@
+"""
+Profiling per request (opt-in) untuk melacak halaman laporan yang lambat.
+
+Request diprofil kalau:
+- admin (email di ADMIN_EMAILS, atau header X-Profile-Token = PROFILE_TOKEN)
+  menambahkan `?_profile=1` atau header `X-Profile: 1`, atau
+- terpilih acak dengan peluang PROFILE_SAMPLE_RATE (0 = mati, default).
+
+Request dijalankan di bawah cProfile (deterministik -> file .prof untuk pstats /
+snakeviz) sekaligus sampler stack tiap PROFILE_INTERVAL detik (-> file .collapsed,
+format `a;b;c jumlah` untuk flamegraph.pl / speedscope). Hasil disimpan di
+PROFILE_DIR dan bisa dilihat di /admin/profiles.
+"""
+import cProfile
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from flask import request, session
+from pinkilang.core import logger, get_catatan_query
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))   # detik antar sampel stack
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "200"))               # jumlah profil terbaru yang disimpan
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN")
+ADMIN_EMAILS = {e.strip().lower() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()}
+
+_ENV_PROFIL = "pinkilang.profil"
+# cProfile hanya bisa aktif satu per proses (Python 3.12+), request lain saat itu tidak diprofil
+_profil_lock = threading.Lock()
+
+def is_admin():
+    if PROFILE_TOKEN and request.headers.get("X-Profile-Token") == PROFILE_TOKEN:
+        return True
+    return bool(session.get('logged_in')) and (session.get('user_email') or "").lower() in ADMIN_EMAILS
+
+def _alasan_profil():
+    diminta = request.args.get("_profile") == "1" or request.headers.get("X-Profile") == "1"
+    if diminta and is_admin():
+        return "diminta"
+    if PROFILE_SAMPLE_RATE and random.random() < PROFILE_SAMPLE_RATE:
+        return "sampling"
+    return None
+
+class SamplerStack(threading.Thread):
+    """Ambil stack thread target secara berkala dan hitung per stack (collapsed)"""
+
+    def __init__(self, target, interval):
+        super().__init__(name="profil-sampler", daemon=True)
+        self.target = target
+        self.interval = interval
+        self.stacks = {}
+        self._selesai = threading.Event()
+
+    def run(self):
+        while not self._selesai.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            stack = []
+            while frame is not None:
+                kode = frame.f_code
+                stack.append(f"{kode.co_name} ({os.path.basename(kode.co_filename)}:{kode.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def berhenti(self):
+        self._selesai.set()
+        self.join()
+
+def _slug(route):
+    return re.sub(r"[^a-zA-Z0-9]+", "-", route).strip("-") or "root"
+
+def _simpan(profil, sampler, info):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    nama = f"{time.strftime('%Y%m%d-%H%M%S')}-{_slug(info['route'])}-{os.getpid()}-{int(time.time() * 1000) % 1000:03d}"
+    dasar = os.path.join(PROFILE_DIR, nama)
+
+    profil.dump_stats(dasar + ".prof")
+    with open(dasar + ".collapsed", "w") as f:
+        for stack, jumlah in sorted(sampler.stacks.items(), key=lambda x: -x[1]):
+            f.write(f"{stack} {jumlah}\n")
+    with open(dasar + ".json", "w") as f:
+        json.dump({**info, "nama": nama, "sampel": sum(sampler.stacks.values())}, f)
+
+    # Buang profil lama, simpan PROFILE_KEEP terbaru
+    semua = sorted(n for n in os.listdir(PROFILE_DIR) if n.endswith(".json"))
+    for lama in semua[:-PROFILE_KEEP]:
+        for ext in (".json", ".prof", ".collapsed"):
+            try:
+                os.remove(os.path.join(PROFILE_DIR, lama[:-5] + ext))
+            except FileNotFoundError:
+                pass
+    return nama
+
+def daftar_profil(route=None):
+    """Metadata profil terbaru (baru -> lama), opsional difilter per route"""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    hasil = []
+    for nama in sorted((n for n in os.listdir(PROFILE_DIR) if n.endswith(".json")), reverse=True):
+        try:
+            with open(os.path.join(PROFILE_DIR, nama)) as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if route is None or info.get("route") == route:
+            hasil.append(info)
+    return hasil
+
+def path_profil(nama, ext):
+    """Path file profil; None kalau nama tidak valid atau file tidak ada"""
+    if ext not in (".prof", ".collapsed", ".json") or not re.fullmatch(r"[a-zA-Z0-9-]+", nama):
+        return None
+    path = os.path.join(PROFILE_DIR, nama + ext)
+    return path if os.path.exists(path) else None
+
+def pasang_profiling(app):
+    """Daftarkan hook yang menyalakan/mematikan profiler per request"""
+
+    @app.before_request
+    def _mulai_profil():
+        alasan = _alasan_profil()
+        if alasan is None:
+            return
+        profil = cProfile.Profile()
+        sampler = SamplerStack(threading.get_ident(), PROFILE_INTERVAL)
+        if not _profil_lock.acquire(blocking=False):
+            return
+        try:
+            profil.enable()
+        except ValueError:
+            # profiler lain (mis. debugger) sedang aktif
+            _profil_lock.release()
+            return
+        sampler.start()
+        request.environ[_ENV_PROFIL] = (profil, sampler, alasan, time.perf_counter())
+
+    @app.teardown_request
+    def _selesai_profil(error=None):
+        data = request.environ.pop(_ENV_PROFIL, None)
+        if data is None:
+            return
+        profil, sampler, alasan, mulai = data
+        try:
+            profil.disable()
+            sampler.berhenti()
+            catatan = get_catatan_query() or []
+            info = {
+                "route": request.url_rule.rule if request.url_rule else request.path,
+                "method": request.method,
+                "path": request.full_path.rstrip("?"),
+                "alasan": alasan,
+                "waktu": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "durasi_ms": round((time.perf_counter() - mulai) * 1000, 1),
+                "query": len(catatan),
+                "error": str(error) if error else None,
+            }
+            nama = _simpan(profil, sampler, info)
+            logger.info(f"🔬 Profil {info['method']} {info['path']} ({info['durasi_ms']}ms) disimpan: {nama}")
+        except Exception as e:
+            logger.error(f"❌ Gagal menyimpan profil: {e}")
+        finally:
+            _profil_lock.release()
@@ -0,0 +1,84 @@
+"""Agregat halaman depan dan dashboard: dihitung di server dan di-cache dengan TTL pendek"""
+import os
+from pinkilang.core import logger, supabase, TTLCache, jalankan_paralel
+
+# ============================================================
+# 🔹 RINGKASAN DASHBOARD (SUM/COUNT di database)
+# ============================================================
+# Total dihitung oleh fungsi Postgres, bukan dengan mengunduh semua baris
+# penjualan/pembelian. Jalankan SQL ini sekali di Supabase SQL Editor;
+# selama fungsi belum ada, dashboard memakai cara lama (jumlah di Python).
+SQL_RINGKASAN_DASHBOARD = """
+CREATE OR REPLACE FUNCTION ringkasan_dashboard()
+RETURNS TABLE (
+    total_penjualan NUMERIC, jumlah_penjualan BIGINT,
+    total_pembelian NUMERIC, jumlah_pembelian BIGINT,
+    persediaan_saat_ini NUMERIC
+)
+LANGUAGE sql STABLE AS $$
+    SELECT
+        (SELECT COALESCE(SUM(total_penjualan), 0) FROM penjualan),
+        (SELECT COUNT(*) FROM penjualan),
+        (SELECT COALESCE(SUM(total_pembelian), 0) FROM pembelian),
+        (SELECT COUNT(*) FROM pembelian),
+        (SELECT COALESCE(MAX(jumlah_persediaan), 0) FROM persediaan_terintegrasi WHERE id = 1);
+$$;
+"""
+
+RINGKASAN_CACHE_TTL = int(os.getenv("RINGKASAN_CACHE_TTL", "60"))
+TRANSAKSI_TERBARU_LIMIT = 5
+
+_ringkasan_cache = TTLCache("ringkasan", RINGKASAN_CACHE_TTL)
+_rpc_ringkasan_tersedia = True
+
+def invalidate_ringkasan_cache():
+    """Buang cache ringkasan setelah ada user/penjualan/pembelian/persediaan yang berubah"""
+    _ringkasan_cache.clear()
+
+def get_jumlah_user():
+    """Jumlah user terdaftar untuk halaman depan (COUNT tanpa mengunduh baris)"""
+    return _ringkasan_cache.get_or_set(
+        "jumlah_user",
+        lambda: supabase.table("user").select("id", count="exact", head=True).execute().count or 0
+    )
+
+def hitung_total_dashboard():
+    """Total penjualan/pembelian dan persediaan: satu RPC, atau fallback query lama"""
+    global _rpc_ringkasan_tersedia
+    if _rpc_ringkasan_tersedia:
+        try:
+            rows = supabase.rpc("ringkasan_dashboard").execute().data or []
+            if rows:
+                return {
+                    'total_penjualan': float(rows[0]['total_penjualan'] or 0),
+                    'total_pembelian': float(rows[0]['total_pembelian'] or 0),
+                    'persediaan_saat_ini': rows[0]['persediaan_saat_ini'] or 0,
+                }
+        except Exception as e:
+            _rpc_ringkasan_tersedia = False
+            logger.warning(f"⚠️ RPC ringkasan_dashboard belum tersedia, pakai agregasi di Python: {e}")
+
+    total_penjualan = sum(r['total_penjualan'] or 0 for r in supabase.table("penjualan").select("total_penjualan").execute().data)
+    total_pembelian = sum(r['total_pembelian'] or 0 for r in supabase.table("pembelian").select("total_pembelian").execute().data)
+    persediaan = supabase.table("persediaan_terintegrasi").select("jumlah_persediaan").eq("id", 1).execute().data
+    return {
+        'total_penjualan': total_penjualan,
+        'total_pembelian': total_pembelian,
+        'persediaan_saat_ini': persediaan[0]['jumlah_persediaan'] if persediaan else 0,
+    }
+
+def hitung_ringkasan_dashboard():
+    """Total + transaksi terbaru: jumlah query tetap, tidak tergantung banyaknya data"""
+    hasil = jalankan_paralel({
+        'total': hitung_total_dashboard,
+        'transaksi_penjualan_terbaru': lambda: supabase.table("penjualan").select("*")
+            .order("created_at", desc=True).limit(TRANSAKSI_TERBARU_LIMIT).execute().data,
+        'transaksi_pembelian_terbaru': lambda: supabase.table("pembelian").select("*")
+            .order("created_at", desc=True).limit(TRANSAKSI_TERBARU_LIMIT).execute().data,
+    })
+    data = hasil.pop('total')
+    data.update(hasil)
+    return data
+
+def get_ringkasan_dashboard():
+    return _ringkasan_cache.get_or_set("dashboard", hitung_ringkasan_dashboard)
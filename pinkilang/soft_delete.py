@@ -0,0 +1,219 @@
+"""
+Soft delete: transaksi yang dihapus diberi tombstone (deleted_at), bukan langsung DELETE.
+
+- Semua select lewat core.supabase ke TABEL_SOFT_DELETE otomatis memakai filter
+  deleted_at IS NULL (lihat core.QueryTercatat), jadi laporan dan agregat tidak
+  perlu diubah satu per satu. table(nama, termasuk_terhapus=True) untuk membaca
+  tombstone (halaman pulihkan, purge).
+- hapus(tabel) mengganti .delete(): UPDATE deleted_at per batch id, murah dan
+  bisa dibatalkan selama SOFT_DELETE_RETENSI_HARI.
+- PurgeWorker menghapus permanen tombstone yang lewat retensi, PURGE_BATCH baris
+  per query dengan jeda, di thread background tiap worker gunicorn (file lock
+  supaya hanya satu worker yang purge per putaran). Bisa juga lewat cron:
+  `flask --app pinky2 purge-terhapus`.
+
+Di Supabase jalankan SQL_SOFT_DELETE sekali lalu set SOFT_DELETE=1.
+"""
+from contextlib import closing
+from datetime import datetime, timedelta
+import fcntl
+import os
+import threading
+import time
+from pinkilang.core import logger, supabase, SOFT_DELETE, TABEL_SOFT_DELETE
+
+SOFT_DELETE_RETENSI_HARI = int(os.getenv("SOFT_DELETE_RETENSI_HARI", "30"))
+PURGE_BATCH = int(os.getenv("PURGE_BATCH", "500"))               # baris per DELETE
+PURGE_JEDA = float(os.getenv("PURGE_JEDA", "0.2"))                # detik antar batch, beri ruang query lain
+PURGE_INTERVAL = int(os.getenv("PURGE_INTERVAL", "3600"))         # detik antar putaran; 0 = hanya lewat CLI
+PURGE_LOCK_PATH = os.getenv("PURGE_LOCK_PATH", "purge_terhapus.lock")
+
+# Jalankan sekali di Supabase SQL Editor sebelum SOFT_DELETE=1.
+# View / fungsi yang membaca tabel ini langsung (tidak lewat filter core.supabase)
+# didefinisikan ulang di sini dengan "deleted_at IS NULL", padanan local_db.
+SQL_SOFT_DELETE = """
+ALTER TABLE penjualan ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE pembelian ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE operasional ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE prive ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE modal ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE aset_tetap ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE neraca_saldo_awal ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+ALTER TABLE jurnal_umum ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ;
+
+-- Index parsial: hanya tombstone, untuk purge dan halaman pulihkan
+CREATE INDEX IF NOT EXISTS idx_penjualan_terhapus ON penjualan(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_pembelian_terhapus ON pembelian(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_operasional_terhapus ON operasional(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_prive_terhapus ON prive(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_modal_terhapus ON modal(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_aset_tetap_terhapus ON aset_tetap(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_neraca_saldo_awal_terhapus ON neraca_saldo_awal(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_jurnal_umum_terhapus ON jurnal_umum(deleted_at) WHERE deleted_at IS NOT NULL;
+
+CREATE OR REPLACE FUNCTION ringkasan_dashboard()
+RETURNS TABLE (
+    total_penjualan NUMERIC, jumlah_penjualan BIGINT,
+    total_pembelian NUMERIC, jumlah_pembelian BIGINT,
+    persediaan_saat_ini NUMERIC
+)
+LANGUAGE sql STABLE AS $$
+    SELECT
+        (SELECT COALESCE(SUM(total_penjualan), 0) FROM penjualan WHERE deleted_at IS NULL),
+        (SELECT COUNT(*) FROM penjualan WHERE deleted_at IS NULL),
+        (SELECT COALESCE(SUM(total_pembelian), 0) FROM pembelian WHERE deleted_at IS NULL),
+        (SELECT COUNT(*) FROM pembelian WHERE deleted_at IS NULL),
+        (SELECT COALESCE(MAX(jumlah_persediaan), 0) FROM persediaan_terintegrasi WHERE id = 1);
+$$;
+
+CREATE OR REPLACE FUNCTION rencana_hapus_semua(p_user_email TEXT)
+RETURNS TABLE (tabel TEXT, jumlah BIGINT, total NUMERIC)
+LANGUAGE sql STABLE AS $$
+    SELECT 'penjualan', COUNT(*), COALESCE(SUM(total_penjualan), 0) FROM penjualan WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'pembelian', COUNT(*), COALESCE(SUM(total_pembelian), 0) FROM pembelian WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'operasional', COUNT(*), COALESCE(SUM(total_pengeluaran), 0) FROM operasional WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'prive', COUNT(*), COALESCE(SUM(jumlah), 0) FROM prive WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'modal', COUNT(*), COALESCE(SUM(jumlah), 0) FROM modal WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'aset_tetap', COUNT(*), COALESCE(SUM(nilai_perolehan), 0) FROM aset_tetap WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'neraca_saldo_awal', COUNT(*), COALESCE(SUM(COALESCE(debit, 0) + COALESCE(kredit, 0)), 0) FROM neraca_saldo_awal WHERE user_email = p_user_email AND deleted_at IS NULL
+    UNION ALL SELECT 'jurnal_umum', COUNT(*), 0 FROM jurnal_umum WHERE user_email = p_user_email AND deleted_at IS NULL;
+$$;
+
+CREATE OR REPLACE VIEW view_laporan_modal AS
+SELECT
+    COALESCE((SELECT SUM(jumlah) FROM modal WHERE tipe = 'MODAL_AWAL' AND deleted_at IS NULL), 0) AS modal_awal,
+    COALESCE((SELECT SUM(jumlah) FROM modal WHERE tipe = 'TAMBAHAN_MODAL' AND deleted_at IS NULL), 0) AS total_tambahan,
+    COALESCE((SELECT SUM(jumlah) FROM prive WHERE deleted_at IS NULL), 0) AS total_prive;
+
+CREATE OR REPLACE VIEW view_riwayat_modal AS
+SELECT id, user_email, tanggal, keterangan, jumlah, tipe, created_at
+FROM modal
+WHERE deleted_at IS NULL
+ORDER BY tanggal DESC, id DESC;
+
+-- Isi ulang neraca_lajur (period 'YYYY-MM', user) dari saldo awal + jurnal s.d. akhir periode.
+-- Kode akun diambil dari kolom ref jurnal; akun tanpa ref numerik memakai namanya.
+CREATE OR REPLACE FUNCTION generate_neraca_lajur(p_period TEXT, p_user_email TEXT)
+RETURNS VOID
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM neraca_lajur WHERE period = p_period AND user_email = p_user_email;
+
+    INSERT INTO neraca_lajur (period, user_email, account_code, account_name,
+                              neraca_saldo_debit, neraca_saldo_kredit, penyesuaian_debit, penyesuaian_kredit,
+                              nssp_debit, nssp_kredit, laba_rugi_debit, laba_rugi_kredit, neraca_debit, neraca_kredit)
+    WITH mutasi AS (
+        SELECT COALESCE(nama_akun, 'Unknown') AS nama_akun, NULL::TEXT AS ref, FALSE AS penyesuaian,
+               COALESCE(debit, 0) AS debit, COALESCE(kredit, 0) AS kredit
+        FROM neraca_saldo_awal
+        WHERE user_email = p_user_email AND deleted_at IS NULL
+        UNION ALL
+        SELECT COALESCE(nama_akun, 'Unknown'), ref,
+               LOWER(COALESCE(transaksi_type, '')) IN ('penyesuaian', 'penyesuaian_manual', 'penyesuaian_aset', 'penyesuaian_otomatis'),
+               COALESCE(debit, 0), COALESCE(kredit, 0)
+        FROM jurnal_umum
+        WHERE user_email = p_user_email AND deleted_at IS NULL AND LEFT(tanggal::TEXT, 7) <= p_period
+    ), akun AS (
+        SELECT COALESCE(MAX(ref) FILTER (WHERE ref ~ '^[0-9]+$'), MIN(nama_akun)) AS kode, MIN(nama_akun) AS nama,
+               SUM(debit) FILTER (WHERE NOT penyesuaian) AS ns_d, SUM(kredit) FILTER (WHERE NOT penyesuaian) AS ns_k,
+               SUM(debit) FILTER (WHERE penyesuaian) AS adj_d, SUM(kredit) FILTER (WHERE penyesuaian) AS adj_k
+        FROM mutasi
+        GROUP BY LOWER(nama_akun)
+    ), saldo AS (
+        SELECT kode, nama, COALESCE(ns_d, 0) AS ns_d, COALESCE(ns_k, 0) AS ns_k,
+               COALESCE(adj_d, 0) AS adj_d, COALESCE(adj_k, 0) AS adj_k,
+               LEFT(kode, 1) IN ('4', '5', '6') AS laba_rugi
+        FROM akun
+    )
+    SELECT p_period, p_user_email, kode, nama, ns_d, ns_k, adj_d, adj_k, ns_d + adj_d, ns_k + adj_k,
+           CASE WHEN laba_rugi THEN GREATEST(ns_d + adj_d - ns_k - adj_k, 0) ELSE 0 END,
+           CASE WHEN laba_rugi THEN GREATEST(ns_k + adj_k - ns_d - adj_d, 0) ELSE 0 END,
+           CASE WHEN laba_rugi THEN 0 ELSE GREATEST(ns_d + adj_d - ns_k - adj_k, 0) END,
+           CASE WHEN laba_rugi THEN 0 ELSE GREATEST(ns_k + adj_k - ns_d - adj_d, 0) END
+    FROM saldo;
+END;
+$$;
+"""
+
+def soft_delete_aktif(tabel):
+    return SOFT_DELETE and tabel in TABEL_SOFT_DELETE
+
+def batas_retensi():
+    """Tombstone yang lebih tua dari ini boleh di-purge dan tidak bisa dipulihkan lagi"""
+    return (datetime.now() - timedelta(days=SOFT_DELETE_RETENSI_HARI)).isoformat()
+
+def hapus(tabel, returning="representation"):
+    """
+    Pengganti supabase.table(tabel).delete(): lanjutkan dengan filter lalu .execute().
+
+    Tabel soft delete -> UPDATE deleted_at pada baris yang belum terhapus (hasilnya
+    tetap baris yang "terhapus", sama seperti delete). Tabel lain -> DELETE biasa.
+    """
+    if not soft_delete_aktif(tabel):
+        return supabase.table(tabel).delete(returning=returning)
+    get_purge_worker()
+    return supabase.table(tabel).update({"deleted_at": datetime.now().isoformat()}, returning=returning).is_("deleted_at", "null")
+
+def pulihkan(tabel, returning="representation"):
+    """Hapus tombstone (deleted_at = NULL); lanjutkan dengan filter lalu .execute()"""
+    return supabase.table(tabel, termasuk_terhapus=True).update({"deleted_at": None}, returning=returning) \
+        .gte("deleted_at", batas_retensi())
+
+# ============================================================
+# 🔹 PURGE TOMBSTONE (hapus permanen setelah masa retensi)
+# ============================================================
+def purge_terhapus(batch=PURGE_BATCH, jeda=PURGE_JEDA):
+    """Hapus permanen tombstone lewat retensi, `batch` id per query; return jumlah per tabel"""
+    batas = batas_retensi()
+    hasil = {}
+    for tabel in TABEL_SOFT_DELETE:
+        terhapus = 0
+        while True:
+            ids = [r['id'] for r in supabase.table(tabel, termasuk_terhapus=True).select("id")
+                   .lt("deleted_at", batas).limit(batch).execute().data or []]
+            if not ids:
+                break
+            supabase.table(tabel).delete(returning="minimal").in_("id", ids).execute()
+            terhapus += len(ids)
+            if len(ids) < batch:
+                break
+            time.sleep(jeda)
+        if terhapus:
+            hasil[tabel] = terhapus
+            logger.info(f"🧹 Purge {tabel}: {terhapus} tombstone dihapus permanen")
+    return hasil
+
+class PurgeWorker(threading.Thread):
+    """Thread purge per worker; hanya yang memegang PURGE_LOCK_PATH yang jalan tiap putaran"""
+
+    def __init__(self):
+        super().__init__(name="purge-terhapus", daemon=True)
+
+    def putaran(self):
+        with closing(open(PURGE_LOCK_PATH, "a")) as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None   # worker lain sedang purge
+            return purge_terhapus()
+
+    def run(self):
+        while True:
+            time.sleep(PURGE_INTERVAL)
+            try:
+                self.putaran()
+            except Exception as e:
+                logger.error(f"❌ Error purge tombstone: {e}")
+
+_purge_pid = None
+_purge_lock = threading.Lock()
+
+def get_purge_worker():
+    """Thread purge dibuat saat pertama dipakai (setelah fork gunicorn), sekali per proses"""
+    global _purge_pid
+    if not SOFT_DELETE or PURGE_INTERVAL <= 0:
+        return
+    with _purge_lock:
+        if _purge_pid != os.getpid():
+            PurgeWorker().start()
+            _purge_pid = os.getpid()
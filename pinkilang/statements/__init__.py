@@ -0,0 +1,11 @@
+"""Blueprint statements: laporan keuangan"""
+from flask import Blueprint
+from pinkilang.lazy import lazy_route
+
+bp = Blueprint("statements", __name__)
+
+lazy_route(bp, "/laba-rugi", "laba_rugi.laba_rugi")
+lazy_route(bp, "/laporan-posisi-keuangan", "posisi_keuangan.laporan_posisi_keuangan")
+lazy_route(bp, "/arus-kas", "arus_kas.arus_kas")
+lazy_route(bp, "/laporan-perubahan-modal", "perubahan_modal.laporan_perubahan_modal")
+lazy_route(bp, "/laporan-umur-piutang-utang", "umur_piutang_utang.laporan_umur_piutang_utang")
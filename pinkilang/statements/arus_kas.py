@@ -0,0 +1,725 @@
+"""Laporan arus kas"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, create_error_page
+from pinkilang.akuntansi import hitung_laba_bersih_otomatis
+
+# ============================================================
+# 🔹 FUNGSI BANTU ARUS KAS 
+# ============================================================
+
+def hitung_arus_kas_fixed():
+    """
+    Hitung arus kas secara otomatis (Metode Tidak Langsung)
+    Terintegrasi dengan Laba Rugi dan Prive.
+    """
+    try:
+        # 1. AMBIL LABA BERSIH (dari Laporan Laba Rugi)
+        laba_bersih = hitung_laba_bersih_otomatis()
+        
+        # 2. AMBIL SEMUA DATA JURNAL
+        jurnal_result = supabase.table("jurnal_umum").select("*").execute()
+        jurnal_data = jurnal_result.data or []
+        
+        if not jurnal_data:
+            logger.warning("⚠️ Tidak ada data transaksi untuk arus kas")
+            return None
+        
+        # 3. INISIALISASI VARIABEL ARUS KAS
+        data = {
+            'laba_bersih': laba_bersih,
+            
+            # Penyesuaian Operasi (Non-Kas/Modal Kerja)
+            'beban_penyusutan': 0,
+            'perubahan_persediaan': 0,  # Penurunan Persediaan (D)/Kenaikan Persediaan (K)
+            'perubahan_perlengkapan': 0, # Penurunan Perlengkapan (D)/Kenaikan Perlengkapan (K)
+            'perubahan_piutang': 0,      # Penurunan Piutang (D)/Kenaikan Piutang (K)
+            'perubahan_utang_dagang': 0, # Kenaikan Utang (D)/Penurunan Utang (K)
+
+            # Aktivitas Investasi
+            'pembelian_aset': 0,
+            'penjualan_aset': 0,
+            
+            # Aktivitas Pendanaan (Prive, Modal, Pinjaman)
+            'tambahan_modal': 0,
+            'prive': 0,
+            'pinjaman': 0,
+            'pelunasan_pinjaman': 0,
+            
+            # Saldo Kas
+            'saldo_kas_awal': 150885000,  # Saldo awal default
+            'periode': datetime.now().strftime('%B %Y').upper(),
+            'jurnal_diproses': len(jurnal_data)
+        }
+        
+        # 4. LOOP & KLASIFIKASI TRANSAKSI
+        for jurnal in jurnal_data:
+            nama_akun = jurnal.get('nama_akun', '').lower()
+            transaksi_type = jurnal.get('transaksi_type', '').lower()
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            # A. PENYESUAIAN OPERASI (Hanya Akun yang TIDAK terkait Kas/Bank)
+            
+            # Beban Penyusutan (Non-Kas)
+            if 'beban penyusutan' in nama_akun and debit > 0:
+                data['beban_penyusutan'] += debit
+                
+            # Perubahan Modal Kerja (Ambil dari Jurnal Umum BUKAN dari transaksi Kas)
+            if 'kas' not in nama_akun and 'bank' not in nama_akun and 'modal' not in nama_akun and 'prive' not in nama_akun:
+                
+                # Aset Lancar Selain Kas (Perubahan Piutang, Persediaan, Perlengkapan)
+                if 'piutang usaha' in nama_akun:
+                    # Penambahan piutang (Debit) = Pengurangan kas di operasi
+                    # Pengurangan piutang (Kredit) = Penambahan kas di operasi
+                    data['perubahan_piutang'] += (kredit - debit) 
+
+                elif 'persediaan barang dagang' in nama_akun:
+                    # Penambahan persediaan (Debit) = Pengurangan kas di operasi
+                    # Pengurangan persediaan (Kredit) = Penambahan kas di operasi
+                    data['perubahan_persediaan'] += (kredit - debit)
+                    
+                elif 'perlengkapan' in nama_akun:
+                    data['perubahan_perlengkapan'] += (kredit - debit)
+                
+                # Utang Lancar (Perubahan Utang Dagang)
+                elif 'utang usaha' in nama_akun:
+                    # Penambahan utang (Kredit) = Penambahan kas di operasi
+                    # Pengurangan utang (Debit) = Pengurangan kas di operasi
+                    data['perubahan_utang_dagang'] += (kredit - debit)
+
+
+            # B. AKTIVITAS INVESTASI
+            # Hanya perlu mencatat nilai pembelian aset (Kas Keluar) dan penjualan aset (Kas Masuk)
+            if transaksi_type == 'pembelian_aset' and 'kas' in nama_akun:
+                if kredit > 0: # Kas keluar untuk beli aset
+                    data['pembelian_aset'] += kredit
+                elif debit > 0: # Kas masuk dari jual aset
+                    data['penjualan_aset'] += debit
+            
+            # C. AKTIVITAS PENDANAAN
+            
+            # Tambahan Modal/Setoran Modal
+            if transaksi_type == 'tambahan_modal' and 'modal' in nama_akun:
+                data['tambahan_modal'] += kredit
+                
+            # Prive (Pengurangan Modal/Kas)
+            elif transaksi_type == 'prive' and 'prive' in nama_akun:
+                data['prive'] += debit # Prive selalu Debit (bertambah)
+                
+            # Pinjaman / Pelunasan Pinjaman (Asumsi akun utang jangka panjang/bank)
+            elif 'utang bank' in nama_akun:
+                if kredit > 0: # Pinjaman diterima
+                    data['pinjaman'] += kredit
+                elif debit > 0: # Pelunasan pinjaman
+                    data['pelunasan_pinjaman'] += debit
+
+
+        # 5. FINAL CALCULATION
+        
+        # --- Operasi ---
+        # Net Working Capital Adjustments
+        total_penyesuaian_modal_kerja = (
+            data['perubahan_piutang'] +
+            data['perubahan_persediaan'] +
+            data['perubahan_perlengkapan'] +
+            data['perubahan_utang_dagang']
+        )
+        
+        # Arus kas operasi (Laba Bersih + Beban Penyusutan + Penyesuaian Modal Kerja)
+        arus_kas_operasi = (
+            data['laba_bersih'] +
+            data['beban_penyusutan'] + 
+            total_penyesuaian_modal_kerja
+        )
+        
+        # --- Investasi ---
+        arus_kas_investasi = data['penjualan_aset'] - data['pembelian_aset']
+        
+        # --- Pendanaan ---
+        arus_kas_pendanaan = (
+            data['tambahan_modal'] - 
+            data['prive'] + 
+            data['pinjaman'] - 
+            data['pelunasan_pinjaman']
+        )
+        
+        # --- Akhir ---
+        kenaikan_bersih_kas = arus_kas_operasi + arus_kas_investasi + arus_kas_pendanaan
+        saldo_kas_akhir = data['saldo_kas_awal'] + kenaikan_bersih_kas
+        
+        # 6. RETURN RESULT
+        return {
+            **data,
+            'arus_kas_operasi': arus_kas_operasi,
+            'arus_kas_investasi': arus_kas_investasi,
+            'arus_kas_pendanaan': arus_kas_pendanaan,
+            'kenaikan_bersih_kas': kenaikan_bersih_kas,
+            'saldo_kas_akhir': saldo_kas_akhir,
+            'total_penyesuaian_modal_kerja': total_penyesuaian_modal_kerja
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error hitung_arus_kas_fixed: {str(e)}")
+        import traceback
+        logger.error(f"🔍 Traceback: {traceback.format_exc()}")
+        return None
+
+def generate_tabel_arus_kas_otomatis(arus_kas_data, rp_func):
+    """Generate tabel arus kas otomatis"""
+    
+    def format_amount(amount, show_plus=False):
+        if amount == 0:
+            return "Rp0"
+        sign = ""
+        if amount < 0:
+            sign = "-"
+            amount = abs(amount)
+        elif show_plus and amount > 0:
+            sign = "+"
+        return f"{sign}{rp_func(amount)}"
+    
+    # Penyesuaian Operasi
+    operasi_items = []
+    
+    # Penambah Laba Bersih (Kenaikan)
+    if arus_kas_data['beban_penyusutan'] > 0:
+        operasi_items.append(f'<tr><td class="description">Beban Penyusutan (Non-Kas)</td><td class="amount">{format_amount(arus_kas_data["beban_penyusutan"], True)}</td></tr>')
+        
+    # Perubahan Modal Kerja
+    
+    # Piutang
+    if arus_kas_data['perubahan_piutang'] < 0:
+        operasi_items.append(f'<tr><td class="description">Kenaikan Piutang Usaha</td><td class="amount negative">{format_amount(arus_kas_data["perubahan_piutang"])}</td></tr>')
+    elif arus_kas_data['perubahan_piutang'] > 0:
+        operasi_items.append(f'<tr><td class="description">Penurunan Piutang Usaha</td><td class="amount">{format_amount(arus_kas_data["perubahan_piutang"], True)}</td></tr>')
+        
+    # Persediaan
+    if arus_kas_data['perubahan_persediaan'] < 0:
+        operasi_items.append(f'<tr><td class="description">Kenaikan Persediaan Barang</td><td class="amount negative">{format_amount(arus_kas_data["perubahan_persediaan"])}</td></tr>')
+    elif arus_kas_data['perubahan_persediaan'] > 0:
+        operasi_items.append(f'<tr><td class="description">Penurunan Persediaan Barang</td><td class="amount">{format_amount(arus_kas_data["perubahan_persediaan"], True)}</td></tr>')
+        
+    # Perlengkapan
+    if arus_kas_data['perubahan_perlengkapan'] < 0:
+        operasi_items.append(f'<tr><td class="description">Kenaikan Perlengkapan</td><td class="amount negative">{format_amount(arus_kas_data["perubahan_perlengkapan"])}</td></tr>')
+    elif arus_kas_data['perubahan_perlengkapan'] > 0:
+        operasi_items.append(f'<tr><td class="description">Penurunan Perlengkapan</td><td class="amount">{format_amount(arus_kas_data["perubahan_perlengkapan"], True)}</td></tr>')
+
+    # Utang Dagang
+    if arus_kas_data['perubahan_utang_dagang'] < 0:
+        operasi_items.append(f'<tr><td class="description">Penurunan Utang Dagang</td><td class="amount negative">{format_amount(arus_kas_data["perubahan_utang_dagang"])}</td></tr>')
+    elif arus_kas_data['perubahan_utang_dagang'] > 0:
+        operasi_items.append(f'<tr><td class="description">Kenaikan Utang Dagang</td><td class="amount">{format_amount(arus_kas_data["perubahan_utang_dagang"], True)}</td></tr>')
+
+    operasi_html = '\n'.join(operasi_items) if operasi_items else '<tr><td class="description" colspan="2" style="text-align: center; color: #999;">Tidak ada penyesuaian modal kerja</td></tr>'
+
+    # Aktivitas Investasi
+    investasi_items = []
+    if arus_kas_data['penjualan_aset'] > 0:
+        investasi_items.append(f'<tr><td class="description">Penerimaan dari Penjualan Aset Tetap</td><td class="amount">{format_amount(arus_kas_data["penjualan_aset"], True)}</td></tr>')
+    if arus_kas_data['pembelian_aset'] > 0:
+        investasi_items.append(f'<tr><td class="description">Pengeluaran untuk Pembelian Aset Tetap</td><td class="amount negative">{format_amount(-arus_kas_data["pembelian_aset"])}</td></tr>')
+    
+    investasi_html = '\n'.join(investasi_items) if investasi_items else '<tr><td class="description" colspan="2" style="text-align: center; color: #999;">Tidak ada aktivitas investasi</td></tr>'
+    
+    # Aktivitas Pendanaan
+    pendanaan_items = []
+    
+    # Tambahan Modal & Pinjaman (Kas Masuk)
+    if arus_kas_data['tambahan_modal'] > 0:
+        pendanaan_items.append(f'<tr><td class="description">Penerimaan dari Tambahan Modal</td><td class="amount">{format_amount(arus_kas_data["tambahan_modal"], True)}</td></tr>')
+    if arus_kas_data['pinjaman'] > 0:
+        pendanaan_items.append(f'<tr><td class="description">Penerimaan dari Pinjaman Bank</td><td class="amount">{format_amount(arus_kas_data["pinjaman"], True)}</td></tr>')
+        
+    # Prive & Pelunasan (Kas Keluar)
+    if arus_kas_data['prive'] > 0:
+        pendanaan_items.append(f'<tr><td class="description">Pengambilan Prive</td><td class="amount negative">{format_amount(-arus_kas_data["prive"])}</td></tr>')
+    if arus_kas_data['pelunasan_pinjaman'] > 0:
+        pendanaan_items.append(f'<tr><td class="description">Pengeluaran untuk Pelunasan Pinjaman</td><td class="amount negative">{format_amount(-arus_kas_data["pelunasan_pinjaman"])}</td></tr>')
+    
+    pendanaan_html = '\n'.join(pendanaan_items) if pendanaan_items else '<tr><td class="description" colspan="2" style="text-align: center; color: #999;">Tidak ada aktivitas pendanaan</td></tr>'
+    
+    return f"""
+    <table class="cash-flow-table">
+        <tr class="section-header">
+            <td colspan="2">Arus Kas Dari Aktivitas Operasional (Metode Tidak Langsung)</td>
+        </tr>
+        <tr>
+            <td><strong>Laba Bersih</strong></td>
+            <td class="amount">{format_amount(arus_kas_data['laba_bersih'])}</td>
+        </tr>
+        
+        <tr class="sub-header">
+            <td colspan="2">Penyesuaian terhadap Laba Bersih:</td>
+        </tr>
+        {operasi_html}
+        
+        <tr class="grand-total">
+            <td><strong>Arus Kas Bersih Dari Aktivitas Operasional</strong></td>
+            <td class="amount">{format_amount(arus_kas_data['arus_kas_operasi'])}</td>
+        </tr>
+        
+        <tr class="section-header">
+            <td colspan="2">Arus Kas Dari Aktivitas Investasi</td>
+        </tr>
+        {investasi_html}
+        
+        <tr class="grand-total" style="background: #e6ffe6; color: #006600;">
+            <td><strong>Arus Kas Bersih Dari Aktivitas Investasi</strong></td>
+            <td class="amount">{format_amount(arus_kas_data['arus_kas_investasi'])}</td>
+        </tr>
+        
+        <tr class="section-header">
+            <td colspan="2">Arus Kas Dari Aktivitas Pembiayaan</td>
+        </tr>
+        {pendanaan_html}
+        
+        <tr class="grand-total" style="background: #fce4ec; color: #ad1457;">
+            <td><strong>Arus Kas Bersih Dari Aktivitas Pembiayaan</strong></td>
+            <td class="amount">{format_amount(arus_kas_data['arus_kas_pendanaan'])}</td>
+        </tr>
+        
+        <tr class="final-total">
+            <td><strong>Kenaikan Bersih (atau Penurunan) Kas</strong></td>
+            <td class="amount">{format_amount(arus_kas_data['kenaikan_bersih_kas'])}</td>
+        </tr>
+        
+        <tr>
+            <td>Saldo Kas Awal Periode</td>
+            <td class="amount">{format_amount(arus_kas_data['saldo_kas_awal'])}</td>
+        </tr>
+        
+        <tr class="final-total">
+            <td><strong>Saldo Kas Akhir Periode</strong></td>
+            <td class="amount">{format_amount(arus_kas_data['saldo_kas_akhir'])}</td>
+        </tr>
+    </table>
+    
+    <div class="stats-grid">
+        <div class="stat-item">
+            <div class="stat-value">{rp_func(arus_kas_data['laba_bersih'])}</div>
+            <div class="stat-label">Laba Bersih</div>
+        </div>
+        <div class="stat-item">
+            <div class="stat-value">{rp_func(arus_kas_data['arus_kas_operasi'])}</div>
+            <div class="stat-label">Kas dari Operasi</div>
+        </div>
+        <div class="stat-item">
+            <div class="stat-value {'positive' if arus_kas_data['kenaikan_bersih_kas'] >= 0 else 'negative'}">{rp_func(arus_kas_data['kenaikan_bersih_kas'])}</div>
+            <div class="stat-label">Kenaikan Bersih Kas</div>
+        </div>
+        <div class="stat-item">
+            <div class="stat-value">{rp_func(arus_kas_data['saldo_kas_akhir'])}</div>
+            <div class="stat-label">Saldo Kas Akhir</div>
+        </div>
+    </div>
+    """
+
+
+# ============================================================
+# 🔹 ROUTE: Laporan Arus Kas - FIXED VERSION
+# ============================================================
+def arus_kas():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    try:
+        # Ambil data arus kas dari fungsi yang sudah diperbaiki
+        arus_kas_data = hitung_arus_kas_fixed()
+        
+        # Jika tidak ada data, tampilkan pesan
+        if not arus_kas_data:
+            return """
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>Laporan Arus Kas - PINKILANG</title>
+                <style>
+                    body { font-family: Arial, sans-serif; background: #f5f5f5; padding: 20px; }
+                    .container { max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center; }
+                    .back-btn { display: inline-block; padding: 10px 20px; background: #e91e63; color: white; text-decoration: none; border-radius: 5px; margin: 10px; }
+                </style>
+            </head>
+            <body>
+                <div class="container">
+                    <h1>💧 Laporan Arus Kas</h1>
+                    <p>Belum ada data transaksi yang valid untuk ditampilkan.</p>
+                    <p>Silakan pastikan Jurnal Umum sudah terisi dan seimbang.</p>
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <a href="/jurnal-umum" class="back-btn">📝 Ke Jurnal Umum</a>
+                </div>
+            </body>
+            </html>
+            """
+        
+        # Format currency helper
+        def rp(amount):
+            return f"Rp{int(amount):,}".replace(",", ".")
+        
+        # Generate HTML
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Laporan Arus Kas - PINKILANG</title>
+            <meta charset="utf-8">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #f8b7d8 0%, #f48fb1 100%);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 1000px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #e91e63, #ad1457);
+                    color: white;
+                    padding: 30px;
+                    text-align: center;
+                    position: relative;
+                }}
+                
+                .header::before {{
+                    content: '';
+                    position: absolute;
+                    top: 0;
+                    left: 0;
+                    right: 0;
+                    height: 4px;
+                    background: linear-gradient(90deg, #f8bbd0, #f48fb1, #e91e63, #ad1457);
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 25px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    font-size: 14px;
+                    transition: all 0.3s ease;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                    font-weight: 700;
+                }}
+                
+                .company-name {{
+                    font-size: 20px;
+                    font-weight: 600;
+                    margin-bottom: 5px;
+                    opacity: 0.9;
+                }}
+                
+                .period {{
+                    font-size: 16px;
+                    opacity: 0.8;
+                    margin-bottom: 10px;
+                }}
+                
+                .summary-cards {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 15px;
+                    margin: 20px 0;
+                }}
+                
+                .summary-card {{
+                    background: white;
+                    padding: 20px;
+                    border-radius: 12px;
+                    text-align: center;
+                    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+                    border-left: 4px solid #e91e63;
+                }}
+                
+                .summary-card.positive {{
+                    border-left-color: #4caf50;
+                }}
+                
+                .summary-card.negative {{
+                    border-left-color: #f44336;
+                }}
+                
+                .summary-number {{
+                    font-size: 24px;
+                    font-weight: bold;
+                    margin: 10px 0;
+                    font-family: 'Courier New', monospace;
+                }}
+                
+                .summary-label {{
+                    color: #666;
+                    font-size: 14px;
+                    font-weight: 600;
+                }}
+                
+                .content {{
+                    padding: 30px;
+                }}
+                
+                .cash-flow-table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 25px 0;
+                    font-size: 14px;
+                    background: white;
+                    border-radius: 12px;
+                    overflow: hidden;
+                    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+                }}
+                
+                .cash-flow-table td {{
+                    padding: 12px 15px;
+                    border-bottom: 1px solid #f8f9fa;
+                }}
+                
+                .cash-flow-table .description {{
+                    padding-left: 25px;
+                    color: #2d3436;
+                    font-weight: 500;
+                }}
+                
+                .cash-flow-table .amount {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                    font-weight: bold;
+                    width: 200px;
+                    border-left: 1px solid #f8f9fa;
+                }}
+                
+                .cash-flow-table .section-header {{
+                    background: linear-gradient(135deg, #f8bbd0, #f48fb1);
+                    color: #ad1457;
+                    font-weight: 700;
+                    font-size: 15px;
+                    border: none;
+                }}
+                
+                .cash-flow-table .section-header td {{
+                    padding: 15px;
+                    border: none;
+                }}
+                
+                .cash-flow-table .sub-header {{
+                    background: #fce4ec;
+                    font-weight: 600;
+                    color: #ad1457;
+                    font-size: 13px;
+                }}
+                
+                .cash-flow-table .sub-total {{
+                    background: #f8bbd0;
+                    font-weight: 700;
+                    border-top: 2px solid #f48fb1;
+                    border-bottom: 2px solid #f48fb1;
+                }}
+                
+                .cash-flow-table .grand-total {{
+                    background: linear-gradient(135deg, #4caf50, #66bb6a);
+                    color: white;
+                    font-weight: 700;
+                    font-size: 15px;
+                    border: none;
+                }}
+                
+                .cash-flow-table .grand-total td {{
+                    border: none;
+                    padding: 16px 15px;
+                }}
+                
+                .cash-flow-table .final-total {{
+                    background: linear-gradient(135deg, #e91e63, #ad1457);
+                    color: white;
+                    font-weight: 700;
+                    font-size: 16px;
+                    border: none;
+                }}
+                
+                .cash-flow-table .final-total td {{
+                    border: none;
+                    padding: 18px 15px;
+                }}
+                
+                .negative {{
+                    color: #f44336;
+                }}
+                
+                .positive {{
+                    color: #4caf50;
+                }}
+                
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 1px solid #f8bbd0;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 12px 24px;
+                    background: linear-gradient(135deg, #e91e63, #ad1457);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 25px;
+                    margin: 0 8px;
+                    font-size: 14px;
+                    font-weight: 600;
+                    border: none;
+                    cursor: pointer;
+                    transition: all 0.3s ease;
+                    box-shadow: 0 4px 15px rgba(233, 30, 99, 0.3);
+                }}
+                
+                .btn:hover {{
+                    transform: translateY(-2px);
+                    box-shadow: 0 6px 20px rgba(233, 30, 99, 0.4);
+                }}
+                
+                .btn.print {{
+                    background: linear-gradient(135deg, #4caf50, #66bb6a);
+                    box-shadow: 0 4px 15px rgba(76, 175, 80, 0.3);
+                }}
+                
+                .info-box {{
+                    background: linear-gradient(135deg, #fce4ec, #f8bbd0);
+                    border-radius: 10px;
+                    padding: 20px;
+                    margin: 25px 0;
+                    font-size: 14px;
+                    border-left: 4px solid #e91e63;
+                    color: #ad1457;
+                }}
+                
+                .info-box strong {{
+                    color: #ad1457;
+                }}
+                
+                .stats-grid {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+                    gap: 15px;
+                    margin: 20px 0;
+                    background: #fce4ec;
+                    padding: 20px;
+                    border-radius: 10px;
+                }}
+                
+                .stat-item {{
+                    text-align: center;
+                    padding: 15px;
+                }}
+                
+                .stat-value {{
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #ad1457;
+                    font-family: 'Courier New', monospace;
+                }}
+                
+                .stat-label {{
+                    font-size: 12px;
+                    color: #e91e63;
+                    margin-top: 5px;
+                }}
+                
+                @media print {{
+                    body {{
+                        background: white;
+                        padding: 0;
+                    }}
+                    .container {{
+                        box-shadow: none;
+                        margin: 0;
+                    }}
+                    .back-btn, .action-buttons {{
+                        display: none;
+                    }}
+                    .header {{
+                        background: #ad1457 !important;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>💧 LAPORAN ARUS KAS</h1>
+                    <div class="company-name">RUMAH BIBIT MAS ANGGA</div>
+                    <div class="period">PERIODE {arus_kas_data['periode']}</div>
+                </div>
+                
+                <div class="content">
+                    <div class="summary-cards">
+                        <div class="summary-card {'positive' if arus_kas_data['arus_kas_operasi'] >= 0 else 'negative'}">
+                            <div class="summary-label">Arus Kas Operasi</div>
+                            <div class="summary-number {'positive' if arus_kas_data['arus_kas_operasi'] >= 0 else 'negative'}">{rp(arus_kas_data['arus_kas_operasi'])}</div>
+                        </div>
+                        <div class="summary-card {'positive' if arus_kas_data['arus_kas_investasi'] >= 0 else 'negative'}">
+                            <div class="summary-label">Arus Kas Investasi</div>
+                            <div class="summary-number {'positive' if arus_kas_data['arus_kas_investasi'] >= 0 else 'negative'}">{rp(arus_kas_data['arus_kas_investasi'])}</div>
+                        </div>
+                        <div class="summary-card {'positive' if arus_kas_data['arus_kas_pendanaan'] >= 0 else 'negative'}">
+                            <div class="summary-label">Arus Kas Pendanaan</div>
+                            <div class="summary-number {'positive' if arus_kas_data['arus_kas_pendanaan'] >= 0 else 'negative'}">{rp(arus_kas_data['arus_kas_pendanaan'])}</div>
+                        </div>
+                        <div class="summary-card {'positive' if arus_kas_data['kenaikan_bersih_kas'] >= 0 else 'negative'}">
+                            <div class="summary-label">Kenaikan Bersih Kas</div>
+                            <div class="summary-number {'positive' if arus_kas_data['kenaikan_bersih_kas'] >= 0 else 'negative'}">{rp(arus_kas_data['kenaikan_bersih_kas'])}</div>
+                        </div>
+                    </div>
+
+                    {generate_tabel_arus_kas_otomatis(arus_kas_data, rp)}
+                    
+                    <div class="info-box">
+                        <strong>💡 Informasi:</strong> Laporan arus kas ini dihasilkan otomatis dari semua transaksi yang tercatat dalam sistem. 
+                        Data diperbarui real-time sesuai dengan entri jurnal yang dilakukan. Laporan mengikuti format standar akuntansi dengan metode tidak langsung.
+                    </div>
+                    
+                    <div class="action-buttons">
+                        <a href="/jurnal-umum" class="btn">📝 Lihat Jurnal Umum</a>
+                        <a href="/laba-rugi" class="btn">📈 Lihat Laba Rugi</a>
+                        <a href="/neraca-lajur" class="btn">🏦 Lihat Neraca</a>
+                        <button onclick="window.print()" class="btn print">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+        return html 
+        
+    except Exception as e:
+        logger.error(f"❌ Error di laporan arus kas: {str(e)}")
+        return create_error_page("Arus Kas", str(e))
+
+def hitung_arus_kas_otomatis():
+    """Wrapper untuk kompatibilitas, panggil fungsi fixed yang baru"""
+    return hitung_arus_kas_fixed()
@@ -0,0 +1,879 @@
+"""Laporan laba rugi"""
+from flask import redirect, session
+from pinkilang.core import logger, supabase, create_error_page
+
+# ============================================================
+# 🔹 ROUTE: Laporan Laba Rugi
+# ============================================================
+def laba_rugi():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Ambil data dari neraca lajur untuk perhitungan laba rugi
+        neraca_lajur_data = get_neraca_lajur_simple()
+        
+        if not neraca_lajur_data or 'akun_data' not in neraca_lajur_data:
+            return create_error_page("Laba Rugi", "Tidak dapat mengambil data neraca lajur. Pastikan neraca lajur sudah dibuat terlebih dahulu.")
+        
+        akun_data = neraca_lajur_data['akun_data']
+        neraca_data = hitung_laba_rugi_terintegrasi(akun_data)
+        
+        if not neraca_data:
+            return create_error_page("Laba Rugi", "Tidak dapat menghitung data laba rugi dari data akun yang tersedia.")
+        
+        # Format currency helper
+        def rp(amount):
+            try:
+                return f"Rp {int(amount):,}".replace(",", ".")
+            except:
+                return "Rp 0"
+        
+        # Generate HTML sections
+        pendapatan_section = generate_pendapatan_section(neraca_data, rp)
+        hpp_section = generate_hpp_section(neraca_data, rp)  # ✅ SECTION HPP BARU
+        laba_kotor_section = generate_laba_kotor_section(neraca_data, rp)  # ✅ SECTION LABA KOTOR
+        beban_section = generate_beban_section(neraca_data, rp)
+        perhitungan_section = generate_perhitungan_section(neraca_data, rp)
+        breakdown_section = generate_breakdown_section(neraca_data, rp)
+        
+        html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Laporan Laba Rugi - PINKILANG</title>
+    <meta charset="utf-8">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Arial', sans-serif;
+            background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+            padding: 20px;
+            min-height: 100vh;
+        }}
+        
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }}
+        
+        .header {{
+            background: linear-gradient(135deg, #ff66a3, #ff4d94);
+            color: white;
+            padding: 25px;
+            text-align: center;
+        }}
+        
+        .back-btn {{
+            display: inline-block;
+            padding: 10px 20px;
+            background: rgba(255,255,255,0.2);
+            color: white;
+            text-decoration: none;
+            border-radius: 8px;
+            margin-bottom: 15px;
+            border: 1px solid rgba(255,255,255,0.3);
+        }}
+        
+        .back-btn:hover {{
+            background: rgba(255,255,255,0.3);
+        }}
+        
+        h1 {{
+            font-size: 28px;
+            margin-bottom: 10px;
+        }}
+        
+        .content {{
+            padding: 25px;
+        }}
+        
+        .section {{
+            margin: 25px 0;
+            padding: 20px;
+            background: #fff5f9;
+            border-radius: 12px;
+            border-left: 5px solid #ff66a3;
+        }}
+        
+        .section-title {{
+            color: #ff66a3;
+            font-size: 22px;
+            margin-bottom: 20px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #ffe6f2;
+        }}
+        
+        .calculation-table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin: 15px 0;
+            background: white;
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 4px 15px rgba(255,102,163,0.1);
+        }}
+        
+        .calculation-table th {{
+            background: #ff66a3;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: bold;
+        }}
+        
+        .calculation-table td {{
+            padding: 12px;
+            border-bottom: 1px solid #ffe6f2;
+        }}
+        
+        .calculation-table tr:hover {{
+            background: #fff5f9;
+        }}
+        
+        .number {{
+            text-align: right;
+            font-family: 'Courier New', monospace;
+            font-weight: bold;
+        }}
+        
+        .positive {{
+            color: #00cc66;
+        }}
+        
+        .negative {{
+            color: #ff6666;
+        }}
+        
+        .total-row {{
+            background: #ffe6f2;
+            font-weight: bold;
+            font-size: 16px;
+        }}
+        
+        .subtotal-row {{
+            background: #f8f9fa;
+            font-weight: bold;
+        }}
+        
+        .info-box {{
+            background: #e6f7ff;
+            border: 1px solid #91d5ff;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 15px 0;
+            color: #0066cc;
+        }}
+        
+        .stats-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }}
+        
+        .stat-card {{
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+            box-shadow: 0 4px 15px rgba(255,102,163,0.1);
+            border: 1px solid #ffe6f2;
+        }}
+        
+        .stat-number {{
+            font-size: 24px;
+            font-weight: bold;
+            color: #ff66a3;
+            margin: 10px 0;
+        }}
+        
+        .stat-label {{
+            color: #e83e8c;
+            font-size: 14px;
+            font-weight: bold;
+        }}
+        
+        .breakdown-grid {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin: 20px 0;
+        }}
+        
+        .breakdown-item {{
+            background: white;
+            padding: 15px;
+            border-radius: 8px;
+            border-left: 4px solid #ff66a3;
+        }}
+        
+        .breakdown-header {{
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 10px;
+            font-weight: bold;
+        }}
+        
+        .progress-bar {{
+            background: #e6f2ff;
+            border-radius: 10px;
+            height: 10px;
+            margin: 5px 0;
+        }}
+        
+        .progress-fill {{
+            background: #66b3ff;
+            height: 100%;
+            border-radius: 10px;
+        }}
+        
+        .btn {{
+            display: inline-block;
+            padding: 10px 20px;
+            background: #ff66a3;
+            color: white;
+            text-decoration: none;
+            border-radius: 5px;
+            margin: 5px;
+        }}
+        
+        .btn:hover {{
+            background: #ff4d94;
+        }}
+        
+        .period-selector {{
+            background: white;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 15px 0;
+            text-align: center;
+        }}
+        
+        .empty-state {{
+            text-align: center;
+            padding: 40px;
+            color: #999;
+            font-style: italic;
+        }}
+
+        .hpp-formula {{
+            background: #fff0f0;
+            padding: 10px 15px;
+            border-radius: 5px;
+            margin: 10px 0;
+            border-left: 3px solid #ff6666;
+        }}
+
+        .laba-kotor-box {{
+            background: #f0fff0;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 15px 0;
+            border: 2px solid #00cc66;
+            text-align: center;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <!-- Header -->
+        <div class="header">
+            <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+            <h1>📊 Laporan Laba Rugi</h1>
+            <p>Terintegrasi dengan Neraca Lajur & NSSP - PINKILANG</p>
+        </div>
+        
+        <div class="content">
+            <!-- Section Pendapatan -->
+            {pendapatan_section}
+            
+            <!-- Section HPP Detail -->
+            {hpp_section}
+            
+            <!-- Section Laba Kotor -->
+            {laba_kotor_section}
+            
+            <!-- Section Beban -->
+            {beban_section}
+            
+            <!-- Section Perhitungan Laba Rugi -->
+            {perhitungan_section}
+            
+            <!-- Section Breakdown -->
+            {breakdown_section}
+            
+            <!-- Action Buttons -->
+            <div style="text-align: center; margin-top: 30px;">
+                <a href="/neraca-lajur" class="btn">📊 Lihat Neraca Lajur</a>
+                <a href="/neraca-saldo-setelah-penyesuaian" class="btn">🏦 Lihat NSSP</a>
+                <a href="/laporan-perubahan-modal" class="btn">👨‍💼 Lihat Perubahan Modal</a>
+                <button onclick="window.print()" class="btn">🖨️ Cetak Laporan</button>
+            </div>
+        </div>
+    </div>
+    
+    <script>
+        // Print functionality
+        function printReport() {{
+            window.print();
+        }}
+    </script>
+</body>
+</html>
+"""
+        return html 
+        
+    except Exception as e:
+        logger.error(f"❌ Error di laporan laba rugi: {str(e)}")
+        return create_error_page("Laba Rugi", str(e))
+
+def hitung_laba_rugi_terintegrasi(akun_data):
+    """
+    Menghitung laba rugi berdasarkan list akun yang diberikan
+    DENGAN PERHITUNGAN HPP YANG SESUAI FORMAT CONTOH
+    """
+    try:
+        logger.info("🧮 Memulai perhitungan laba rugi terintegrasi dengan HPP...")
+        
+        # Inisialisasi variabel
+        pendapatan_penjualan = 0
+        pendapatan_lainnya = 0
+        
+        # VARIABEL HPP - sesuai format dari contoh
+        persediaan_awal = 0
+        pembelian = 0
+        persediaan_akhir = 0
+        hpp = 0
+        
+        beban_operasional = {}
+        beban_non_operasional = {}
+        
+        # Identifikasi akun-akun HPP dan lainnya
+        for akun_nama, data in akun_data.items():
+            akun_lower = akun_nama.lower()
+            
+            # Gunakan kolom NSSP untuk laba rugi
+            nssp_debit = data.get('nssp_debit', 0) or 0
+            nssp_kredit = data.get('nssp_kredit', 0) or 0
+            
+            # PENDAPATAN (Akun Nomor 4xxx)
+            if any(keyword in akun_lower for keyword in ['pendapatan', 'penjualan', 'revenue', 'income']) or \
+               str(data.get('kode', '')).startswith('4'):
+                if nssp_kredit > nssp_debit:
+                    if 'penjualan' in akun_lower:
+                        pendapatan_penjualan += (nssp_kredit - nssp_debit)
+                    else:
+                        pendapatan_lainnya += (nssp_kredit - nssp_debit)
+            
+            # KOMPONEN HPP - DETECT OTOMATIS
+            # Persediaan Awal
+            elif any(keyword in akun_lower for keyword in ['persediaan awal', 'barang dagangan awal', 'persediaan dagang awal']):
+                persediaan_awal = nssp_debit
+                logger.info(f"📦 Persediaan Awal terdeteksi: {akun_nama} = {persediaan_awal}")
+            
+            # Pembelian
+            elif any(keyword in akun_lower for keyword in ['pembelian', 'pembelian barang', 'beli barang']):
+                pembelian = nssp_debit
+                logger.info(f"🛒 Pembelian terdeteksi: {akun_nama} = {pembelian}")
+            
+            # Persediaan Akhir
+            elif any(keyword in akun_lower for keyword in ['persediaan akhir', 'persediaan barang dagang akhir', 'persediaan dagang akhir']):
+                persediaan_akhir = nssp_debit
+                logger.info(f"📦 Persediaan Akhir terdeteksi: {akun_nama} = {persediaan_akhir}")
+            
+            # BEBAN (Akun Nomor 6xxx)
+            elif any(keyword in akun_lower for keyword in ['beban', 'biaya']) or \
+                 str(data.get('kode', '')).startswith('6'):
+                if nssp_debit > 0:
+                    # 1. Beban Listrik, Air dan Telepon (hanya yang namanya persis)
+                    if 'beban listrik, air dan telepon' in akun_lower:
+                        beban_operasional['Beban Listrik, Air dan Telepon'] = nssp_debit
+                        logger.info(f"🔌 Beban Listrik, Air dan Telepon: {nssp_debit}")
+                    
+                    # 2. Beban Perlengkapan (hanya yang namanya persis)  
+                    elif 'beban perlengkapan' in akun_lower:
+                        beban_operasional['Beban Perlengkapan'] = nssp_debit
+                        logger.info(f"📝 Beban Perlengkapan: {nssp_debit}")
+                    
+                    # 3. Semua beban lainnya masuk ke non-operasional
+                    else:
+                        beban_non_operasional[akun_nama] = nssp_debit
+                        logger.info(f"📦 Beban Non-Operasional: {akun_nama} = {nssp_debit}")
+        
+        # 🎯 PERHITUNGAN HPP SESUAI FORMAT CONTOH
+        # Rumus: HPP = (Persediaan Awal + Pembelian) - Persediaan Akhir
+        if persediaan_awal > 0 or pembelian > 0:
+            hpp = (persediaan_awal + pembelian) - persediaan_akhir
+            logger.info(f"🧮 Perhitungan HPP: ({persediaan_awal} + {pembelian}) - {persediaan_akhir} = {hpp}")
+        else:
+            # Fallback ke metode lama jika tidak ada komponen HPP terpisah
+            for akun_nama, data in akun_data.items():
+                akun_lower = akun_nama.lower()
+                nssp_debit = data.get('nssp_debit', 0) or 0
+                if any(keyword in akun_lower for keyword in ['hpp', 'harga pokok', 'beban pokok', 'cost of goods']):
+                    hpp += nssp_debit
+            logger.info(f"🧮 HPP Fallback: {hpp}")
+
+        # Hitung total
+        total_pendapatan = pendapatan_penjualan + pendapatan_lainnya
+        total_beban_operasional = sum(beban_operasional.values())
+        total_beban_non_operasional = sum(beban_non_operasional.values())
+        total_beban = hpp + total_beban_operasional + total_beban_non_operasional
+        
+        # Hitung laba kotor dan laba bersih
+        laba_kotor = total_pendapatan - hpp
+        laba_bersih = laba_kotor - total_beban_operasional - total_beban_non_operasional
+        margin_laba = (laba_bersih / total_pendapatan * 100) if total_pendapatan > 0 else 0
+        
+        # Struktur hasil DENGAN KOMPONEN HPP DETAIL
+        result = {
+            'pendapatan': {
+                'Pendapatan Penjualan': pendapatan_penjualan,
+                'Pendapatan Lainnya': pendapatan_lainnya
+            },
+            'total_pendapatan': total_pendapatan,
+            'hpp_detail': {
+                'persediaan_awal': persediaan_awal,
+                'pembelian': pembelian,
+                'persediaan_akhir': persediaan_akhir,
+                'hpp': hpp
+            },
+            'hpp': hpp,
+            'laba_kotor': laba_kotor,
+            'beban_operasional': beban_operasional,
+            'total_beban_operasional': total_beban_operasional,
+            'beban_non_operasional': beban_non_operasional,
+            'total_beban_non_operasional': total_beban_non_operasional,
+            'total_beban': total_beban,
+            'laba_bersih': laba_bersih,
+            'margin_laba': margin_laba
+        }
+        
+        # Log hasil
+        logger.info(f"📊 HASIL LABA RUGI DENGAN HPP:")
+        logger.info(f"   Persediaan Awal: {persediaan_awal}")
+        logger.info(f"   Pembelian: {pembelian}")
+        logger.info(f"   Persediaan Akhir: {persediaan_akhir}")
+        logger.info(f"   HPP: {hpp}")
+        logger.info(f"   Total Pendapatan: {total_pendapatan}")
+        logger.info(f"   Laba Kotor: {laba_kotor}")
+        logger.info(f"   Beban Operasional: {total_beban_operasional}")
+        logger.info(f"   Beban Non-Operasional: {total_beban_non_operasional}")
+        logger.info(f"   Laba Bersih: {laba_bersih}")
+        logger.info(f"   Margin Laba: {margin_laba:.2f}%")
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ Error hitung laba rugi terintegrasi: {str(e)}")
+        import traceback
+        logger.error(f"🔍 Traceback: {traceback.format_exc()}")
+        return None
+
+def generate_pendapatan_section(neraca_data, rp_func):
+    """Generate HTML section untuk pendapatan"""
+    pendapatan_items = ""
+    for nama, jumlah in neraca_data['pendapatan'].items():
+        if jumlah > 0:  # Hanya tampilkan yang memiliki nilai
+            pendapatan_items += f"""
+            <tr>
+                <td>{nama}</td>
+                <td class="number positive">+ {rp_func(jumlah)}</td>
+            </tr>
+            """
+    
+    return f"""
+    <div class="section">
+        <h2 class="section-title">💰 Pendapatan</h2>
+        <table class="calculation-table">
+            <thead>
+                <tr>
+                    <th>Jenis Pendapatan</th>
+                    <th>Jumlah</th>
+                </tr>
+            </thead>
+            <tbody>
+                {pendapatan_items if pendapatan_items else '''
+                <tr>
+                    <td colspan="2" class="empty-state">
+                        📊 Belum ada data pendapatan
+                    </td>
+                </tr>
+                '''}
+                <tr class="total-row">
+                    <td><strong>TOTAL PENDAPATAN</strong></td>
+                    <td class="number positive"><strong>+ {rp_func(neraca_data['total_pendapatan'])}</strong></td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """
+
+def generate_hpp_section(neraca_data, rp_func):
+    """Generate HTML section untuk HPP detail seperti contoh"""
+    
+    hpp_detail = neraca_data.get('hpp_detail', {})
+    persediaan_awal = hpp_detail.get('persediaan_awal', 0)
+    pembelian = hpp_detail.get('pembelian', 0)
+    persediaan_akhir = hpp_detail.get('persediaan_akhir', 0)
+    hpp = hpp_detail.get('hpp', 0)
+    
+    # Hanya tampilkan section HPP jika ada data yang relevan
+    if persediaan_awal > 0 or pembelian > 0:
+        return f"""
+        <div class="section">
+            <h2 class="section-title">📦 Harga Pokok Penjualan (HPP)</h2>
+            
+            <div style="background: #fff; padding: 20px; border-radius: 8px; margin: 15px 0;">
+                <h3 style="color: #ff66a3; margin-bottom: 15px;">Perhitungan HPP</h3>
+                
+                <table class="calculation-table">
+                    <tbody>
+                        <tr>
+                            <td><strong>Persediaan Awal</strong></td>
+                            <td class="number">{rp_func(persediaan_awal)}</td>
+                        </tr>
+                        <tr>
+                            <td><strong>Pembelian</strong></td>
+                            <td class="number">+ {rp_func(pembelian)}</td>
+                        </tr>
+                        <tr style="background: #f8f9fa;">
+                            <td><strong>Barang Tersedia Untuk Dijual</strong></td>
+                            <td class="number"><strong>{rp_func(persediaan_awal + pembelian)}</strong></td>
+                        </tr>
+                        <tr>
+                            <td><strong>Persediaan Barang Dagang Akhir</strong></td>
+                            <td class="number">- {rp_func(persediaan_akhir)}</td>
+                        </tr>
+                        <tr class="total-row">
+                            <td><strong>HARGA POKOK PENJUALAN (HPP)</strong></td>
+                            <td class="number negative"><strong>- {rp_func(hpp)}</strong></td>
+                        </tr>
+                    </tbody>
+                </table>
+                
+                <div class="hpp-formula">
+                    <p style="margin: 0; color: #666; font-size: 14px;">
+                        <strong>📝 Rumus HPP:</strong> HPP = (Persediaan Awal + Pembelian) - Persediaan Akhir
+                    </p>
+                    <p style="margin: 5px 0 0 0; color: #666; font-size: 14px;">
+                        <strong>🔍 Perhitungan:</strong> ({rp_func(persediaan_awal)} + {rp_func(pembelian)}) - {rp_func(persediaan_akhir)} = {rp_func(hpp)}
+                    </p>
+                </div>
+            </div>
+        </div>
+        """
+    else:
+        # Fallback ke tampilan HPP sederhana
+        return f"""
+        <div class="section">
+            <h2 class="section-title">📦 Harga Pokok Penjualan (HPP)</h2>
+            <table class="calculation-table">
+                <tbody>
+                    <tr class="total-row">
+                        <td><strong>HARGA POKOK PENJUALAN (HPP)</strong></td>
+                        <td class="number negative"><strong>- {rp_func(neraca_data['hpp'])}</strong></td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+        """
+
+def generate_laba_kotor_section(neraca_data, rp_func):
+    """Generate HTML section untuk Laba Kotor"""
+    
+    return f"""
+    <div class="section" style="background: #f0fff0; border-left: 5px solid #00cc66;">
+        <h2 class="section-title" style="color: #00cc66;">📈 Laba Kotor</h2>
+        
+        <div class="laba-kotor-box">
+            <h3 style="color: #006600; margin-bottom: 10px;">Laba Kotor</h3>
+            <div style="font-size: 24px; font-weight: bold; color: #00cc66;">
+                {rp_func(neraca_data['laba_kotor'])}
+            </div>
+            <p style="color: #006600; margin-top: 10px;">
+                Total Pendapatan - HPP = {rp_func(neraca_data['total_pendapatan'])} - {rp_func(neraca_data['hpp'])}
+            </p>
+        </div>
+        
+        <table class="calculation-table">
+            <tbody>
+                <tr>
+                    <td><strong>Total Pendapatan</strong></td>
+                    <td class="number positive">+ {rp_func(neraca_data['total_pendapatan'])}</td>
+                </tr>
+                <tr>
+                    <td><strong>Harga Pokok Penjualan (HPP)</strong></td>
+                    <td class="number negative">- {rp_func(neraca_data['hpp'])}</td>
+                </tr>
+                <tr class="total-row" style="background: #e6ffe6;">
+                    <td><strong>LABA KOTOR</strong></td>
+                    <td class="number positive"><strong>{rp_func(neraca_data['laba_kotor'])}</strong></td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """
+
+def generate_beban_section(neraca_data, rp_func):
+    """Generate HTML section untuk beban - TANPA HPP KARENA SUDAH ADA SECTION TERPISAH"""
+    
+    # Beban Operasional
+    beban_operasional_items = ""
+    for nama, jumlah in neraca_data['beban_operasional'].items():
+        beban_operasional_items += f"""
+        <tr>
+            <td style="padding-left: 20px;">{nama}</td>
+            <td class="number negative">- {rp_func(jumlah)}</td>
+        </tr>
+        """
+    
+    beban_operasional_section = ""
+    if beban_operasional_items:
+        beban_operasional_section = f"""
+        <tr class="subtotal-row">
+            <td><strong>Beban Operasional</strong></td>
+            <td></td>
+        </tr>
+        {beban_operasional_items}
+        <tr>
+            <td style="padding-left: 20px;"><em>Total Beban Operasional</em></td>
+            <td class="number negative"><strong>- {rp_func(neraca_data['total_beban_operasional'])}</strong></td>
+        </tr>
+        """
+    
+    # Beban Non-Operasional
+    beban_non_operasional_items = ""
+    for nama, jumlah in neraca_data['beban_non_operasional'].items():
+        beban_non_operasional_items += f"""
+        <tr>
+            <td style="padding-left: 20px;">{nama}</td>
+            <td class="number negative">- {rp_func(jumlah)}</td>
+        </tr>
+        """
+    
+    beban_non_operasional_section = ""
+    if beban_non_operasional_items:
+        beban_non_operasional_section = f"""
+        <tr class="subtotal-row">
+            <td><strong>Beban Lainnya</strong></td>
+            <td></td>
+        </tr>
+        {beban_non_operasional_items}
+        <tr>
+            <td style="padding-left: 20px;"><em>Total Beban Lainnya</em></td>
+            <td class="number negative"><strong>- {rp_func(neraca_data['total_beban_non_operasional'])}</strong></td>
+        </tr>
+        """
+    
+    return f"""
+    <div class="section">
+        <h2 class="section-title">📉 Beban dan Biaya</h2>
+        <table class="calculation-table">
+            <thead>
+                <tr>
+                    <th>Jenis Beban</th>
+                    <th>Jumlah</th>
+                </tr>
+            </thead>
+            <tbody>
+                {beban_operasional_section}
+                {beban_non_operasional_section}
+                {'''
+                <tr>
+                    <td colspan="2" class="empty-state">
+                        📊 Belum ada data beban operasional dan lainnya
+                    </td>
+                </tr>
+                ''' if not any([neraca_data['beban_operasional'], neraca_data['beban_non_operasional']]) else ''}
+                <tr class="total-row">
+                    <td><strong>TOTAL BEBAN OPERASIONAL & LAINNYA</strong></td>
+                    <td class="number negative"><strong>- {rp_func(neraca_data['total_beban_operasional'] + neraca_data['total_beban_non_operasional'])}</strong></td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """
+
+def generate_perhitungan_section(neraca_data, rp_func):
+    """Generate HTML section untuk perhitungan laba rugi"""
+    is_laba = neraca_data['laba_bersih'] >= 0
+    
+    return f"""
+    <div class="section" style="background: {'#f0fff0' if is_laba else '#fff0f0'}; border-left: 5px solid {'#00cc66' if is_laba else '#ff6666'};">
+        <h2 class="section-title" style="color: {'#00cc66' if is_laba else '#ff6666'};">
+            {'💰 Laba Bersih' if is_laba else '📉 Rugi Bersih'}
+        </h2>
+        
+        <table class="calculation-table">
+            <tbody>
+                <tr>
+                    <td><strong>Laba Kotor</strong></td>
+                    <td class="number positive"><strong>+ {rp_func(neraca_data['laba_kotor'])}</strong></td>
+                </tr>
+                <tr>
+                    <td><strong>Total Beban Operasional & Lainnya</strong></td>
+                    <td class="number negative"><strong>- {rp_func(neraca_data['total_beban_operasional'] + neraca_data['total_beban_non_operasional'])}</strong></td>
+                </tr>
+                <tr class="total-row" style="background: {'#e6ffe6' if is_laba else '#ffe6e6'};">
+                    <td><strong>{'LABA BERSIH' if is_laba else 'RUGI BERSIH'}</strong></td>
+                    <td class="number {'positive' if is_laba else 'negative'}">
+                        <strong>{rp_func(abs(neraca_data['laba_bersih']))}</strong>
+                    </td>
+                </tr>
+                <tr>
+                    <td><strong>Margin { 'Laba' if is_laba else 'Rugi' }</strong></td>
+                    <td class="number {'positive' if is_laba else 'negative'}">
+                        <strong>{neraca_data['margin_laba']:.1f}%</strong>
+                    </td>
+                </tr>
+            </tbody>
+        </table>
+        
+        <div style="text-align: center; margin-top: 15px; padding: 15px; background: {'#d4ffd4' if is_laba else '#ffd4d4'}; border-radius: 8px;">
+            <h3 style="color: {'#006600' if is_laba else '#cc0000'};">
+                {'🎉 PERUSAHAAN UNTUNG' if is_laba else '⚠️ PERUSAHAAN RUGI'}
+            </h3>
+            <p style="color: {'#006600' if is_laba else '#cc0000'}; margin: 5px 0;">
+                {f"Setiap Rp 100 pendapatan menghasilkan Rp {neraca_data['margin_laba']:.1f} laba" if is_laba else f"Setiap Rp 100 pendapatan mengalami Rp {abs(neraca_data['margin_laba']):.1f} rugi"}
+            </p>
+        </div>
+    </div>
+    """
+
+def generate_breakdown_section(neraca_data, rp_func):
+    """Generate HTML section untuk breakdown"""
+    
+    # Hitung persentase
+    total_pendapatan = neraca_data['total_pendapatan'] if neraca_data['total_pendapatan'] > 0 else 1
+    hpp_percentage = (neraca_data['hpp'] / total_pendapatan * 100) if neraca_data['hpp'] > 0 else 0
+    beban_operasional_percentage = (neraca_data['total_beban_operasional'] / total_pendapatan * 100) if neraca_data['total_beban_operasional'] > 0 else 0
+    laba_bersih_percentage = (abs(neraca_data['laba_bersih']) / total_pendapatan * 100) if neraca_data['laba_bersih'] != 0 else 0
+    laba_kotor_percentage = (neraca_data['laba_kotor'] / total_pendapatan * 100) if neraca_data['laba_kotor'] > 0 else 0
+    
+    return f"""
+    <div class="section">
+        <h2 class="section-title">📈 Breakdown Laba Rugi</h2>
+        
+        <div class="breakdown-grid">
+            <div class="breakdown-item">
+                <div class="breakdown-header">
+                    <span>💰 Pendapatan</span>
+                    <span>100%</span>
+                </div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: 100%; background: #00cc66;"></div>
+                </div>
+                <div style="text-align: center; margin-top: 10px;">
+                    <strong>{rp_func(neraca_data['total_pendapatan'])}</strong>
+                </div>
+            </div>
+            
+            <div class="breakdown-item">
+                <div class="breakdown-header">
+                    <span>📦 HPP</span>
+                    <span>{hpp_percentage:.1f}%</span>
+                </div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {hpp_percentage}%; background: #ff6666;"></div>
+                </div>
+                <div style="text-align: center; margin-top: 10px;">
+                    <strong>{rp_func(neraca_data['hpp'])}</strong>
+                </div>
+            </div>
+            
+            <div class="breakdown-item">
+                <div class="breakdown-header">
+                    <span>📈 Laba Kotor</span>
+                    <span>{laba_kotor_percentage:.1f}%</span>
+                </div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {laba_kotor_percentage}%; background: #00cc66;"></div>
+                </div>
+                <div style="text-align: center; margin-top: 10px;">
+                    <strong>{rp_func(neraca_data['laba_kotor'])}</strong>
+                </div>
+            </div>
+            
+            <div class="breakdown-item">
+                <div class="breakdown-header">
+                    <span>{'💰 Laba' if neraca_data['laba_bersih'] >= 0 else '📉 Rugi'} Bersih</span>
+                    <span>{laba_bersih_percentage:.1f}%</span>
+                </div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {laba_bersih_percentage}%; background: {'#00cc66' if neraca_data['laba_bersih'] >= 0 else '#ff6666'};"></div>
+                </div>
+                <div style="text-align: center; margin-top: 10px;">
+                    <strong>{rp_func(abs(neraca_data['laba_bersih']))}</strong>
+                </div>
+            </div>
+        </div>
+        
+        <div style="margin-top: 20px; padding: 15px; background: #f8f9fa; border-radius: 8px;">
+            <h4 style="color: #666; margin-bottom: 10px;">📋 Analisis Profitabilitas:</h4>
+            <ul style="color: #666;">
+                <li><strong>Laba Kotor:</strong> {rp_func(neraca_data['laba_kotor'])} ({laba_kotor_percentage:.1f}% dari pendapatan)</li>
+                <li><strong>Beban Operasional:</strong> {rp_func(neraca_data['total_beban_operasional'])} ({beban_operasional_percentage:.1f}% dari pendapatan)</li>
+                <li><strong>Margin { 'Laba' if neraca_data['laba_bersih'] >= 0 else 'Rugi' } Bersih:</strong> {neraca_data['margin_laba']:.1f}%</li>
+            </ul>
+        </div>
+    </div>
+    """
+
+def get_neraca_lajur_simple():
+    """Versi sederhana untuk mengambil data neraca lajur"""
+    try:
+        # Ambil semua data jurnal
+        jurnal_result = supabase.table("jurnal_umum").select("*").order("tanggal").execute()
+        jurnal_data = jurnal_result.data or []
+        
+        # Kelompokkan per akun
+        akun_data = {}
+        
+        for jurnal in jurnal_data:
+            akun_nama = jurnal.get('nama_akun', 'Unknown')
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            if akun_nama not in akun_data:
+                akun_data[akun_nama] = {
+                    'neraca_debit': 0,
+                    'neraca_kredit': 0,
+                    'penyesuaian_debit': 0,
+                    'penyesuaian_kredit': 0
+                }
+            
+            # Pisahkan jurnal biasa dan penyesuaian
+            if jurnal.get('transaksi_type') == 'PENYESUAIAN':
+                akun_data[akun_nama]['penyesuaian_debit'] += debit
+                akun_data[akun_nama]['penyesuaian_kredit'] += kredit
+            else:
+                akun_data[akun_nama]['neraca_debit'] += debit
+                akun_data[akun_nama]['neraca_kredit'] += kredit
+        
+        # Hitung NSSP
+        for akun_nama, data in akun_data.items():
+            data['nssp_debit'] = data['neraca_debit'] + data['penyesuaian_debit']
+            data['nssp_kredit'] = data['neraca_kredit'] + data['penyesuaian_kredit']
+        
+        return {
+            'akun_data': akun_data,
+            'total_jurnal': len(jurnal_data),
+            'total_akun': len(akun_data)
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error di get_neraca_lajur_simple: {str(e)}")
+        return None
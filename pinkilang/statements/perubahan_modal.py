@@ -0,0 +1,273 @@
+"""Laporan perubahan modal"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import hitung_laba_bersih_otomatis
+
+    
+# ============================================================
+# 🔹 FUNGSI: Hitung Modal dari View
+# ============================================================
+def hitung_modal_dari_view():
+    """Hitung modal awal, tambahan modal, dan prive dari view"""
+    modal_awal = 0
+    total_tambahan = 0
+    total_prive = 0
+    
+    try:
+        if supabase:
+            # Ambil data dari view_laporan_modal
+            result = supabase.table("view_laporan_modal").select("*").execute()
+            
+            print(f"🔍 Debug: Found {len(result.data) if result.data else 0} records in view")
+            
+            if result.data:
+                data = result.data[0]  # Ambil record pertama
+                
+                # Pastikan nama kolom sesuai dengan view
+                modal_awal = float(data.get('modal_awal', 0))  # BUKAN 'total_modal_awal'
+                total_tambahan = float(data.get('total_tambahan', 0))
+                total_prive = float(data.get('total_prive', 0))
+                        
+    except Exception as e:
+        logger.error(f"Error hitung modal dari view: {str(e)}")
+        print(f"❌ Error in hitung_modal_dari_view: {str(e)}")
+    
+    return {
+        'modal_awal': modal_awal,
+        'total_tambahan': total_tambahan,
+        'total_prive': total_prive
+    }
+# ============================================================
+# 🔹 ROUTE: Laporan Perubahan Modal - MENGGUNAKAN VIEW
+# ============================================================
+def laporan_perubahan_modal():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    
+    try:
+        # Hitung modal dari view
+        modal_data = hitung_modal_dari_view()
+        
+        modal_awal = modal_data.get('modal_awal', 0)
+        total_tambahan = modal_data.get('total_tambahan', 0)
+        total_prive = modal_data.get('total_prive', 0)
+        
+        # Cek apakah sudah ada modal awal
+        sudah_ada_modal_awal = modal_awal > 0
+        
+        # Hitung laba rugi
+        laba_bersih = hitung_laba_bersih_otomatis()
+        
+        # Hitung modal akhir
+        modal_akhir = modal_awal + total_tambahan - total_prive + laba_bersih
+        
+        # Format currency helper
+        def format_currency(amount):
+            try:
+                return f"Rp {float(amount):,.0f}".replace(",", ".")
+            except:
+                return "Rp 0"
+        
+        # Ambil riwayat transaksi modal dari view
+        riwayat_html = ""
+        try:
+            if supabase:
+                result = supabase.table("view_riwayat_modal").select("*").execute()
+                
+                if result.data:
+                    for transaksi in result.data:
+                        tanggal = transaksi.get('tanggal', '')
+                        keterangan = transaksi.get('keterangan', '')
+                        jumlah = float(transaksi.get('jumlah', 0))
+                        tipe = transaksi.get('tipe', '')
+                        
+                        # Tentukan warna berdasarkan tipe
+                        if tipe == 'MODAL_AWAL':
+                            badge_color = '#00cc66'
+                            amount_color = '#00cc66'
+                            amount_sign = '+'
+                        elif tipe == 'TAMBAHAN_MODAL':
+                            badge_color = '#66b3ff'
+                            amount_color = '#00cc66'
+                            amount_sign = '+'
+                        else:  # PRIVE
+                            badge_color = '#ff6666'
+                            amount_color = '#ff6666'
+                            amount_sign = '-'
+                        
+                        # Format tanggal
+                        try:
+                            tanggal_formatted = datetime.strptime(str(tanggal), '%Y-%m-%d').strftime('%d/%m/%Y')
+                        except:
+                            tanggal_formatted = str(tanggal)
+                        
+                        riwayat_html += f"""
+                        <tr style="border-bottom: 1px solid #eee;">
+                            <td style="padding: 8px;">{tanggal_formatted}</td>
+                            <td style="padding: 8px;">
+                                <span style="padding: 4px 8px; border-radius: 12px; font-size: 12px; font-weight: bold; color: white; background: {badge_color}">
+                                    {tipe.replace('_', ' ').title()}
+                                </span>
+                            </td>
+                            <td style="padding: 8px;">{keterangan}</td>
+                            <td style="padding: 8px; text-align: right; color: {amount_color};">
+                                {amount_sign} {format_currency(abs(jumlah))}
+                            </td>
+                        </tr>
+                        """
+                
+                else:
+                    riwayat_html = """
+                    <tr>
+                        <td colspan="4" style="padding: 20px; text-align: center; color: #999;">
+                            Belum ada transaksi modal.
+                        </td>
+                    </tr>
+                    """
+                    
+        except Exception as e:
+            print(f"Error ambil riwayat: {e}")
+            riwayat_html = """
+            <tr>
+                <td colspan="4" style="padding: 20px; text-align: center; color: #999;">
+                    Error memuat riwayat transaksi.
+                </td>
+            </tr>
+            """
+        
+        # Tombol aksi berdasarkan kondisi
+        if sudah_ada_modal_awal:
+            tombol_modal = '''
+            <div class="action-buttons">
+                <a href="/tambah-modal" class="action-btn" style="background: #00cc66;">➕ Tambah Modal</a>
+                <a href="/prive-modal" class="action-btn" style="background: #66b3ff;">💸 Kelola Prive</a>
+                <button onclick="window.print()" class="action-btn" style="background: #ff66a3;">🖨️ Cetak Laporan</button>
+            </div>
+            '''
+            status_modal = '<div style="background: #e6ffe6; padding: 10px; border-radius: 8px; margin: 10px 0; color: #006600;">✅ Modal awal sudah diinput</div>'
+        else:
+            tombol_modal = '''
+            <div class="action-buttons">
+                <a href="/input-modal-awal" class="action-btn" style="background: #00cc66;">💰 Input Modal Awal</a>
+                <button onclick="window.print()" class="action-btn" style="background: #ff66a3;">🖨️ Cetak Laporan</button>
+            </div>
+            '''
+            status_modal = '<div style="background: #fff0e6; padding: 10px; border-radius: 8px; margin: 10px 0; color: #cc6600;">⚠️ Modal awal belum diinput</div>'
+        
+        # HTML untuk laporan
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Laporan Perubahan Modal - PINKILANG</title>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <style>
+                body {{ font-family: Arial, sans-serif; background: #fafafa; padding: 20px; margin: 0; }}
+                .container {{ background: white; padding: 30px; border-radius: 15px; max-width: 1000px; margin: 0 auto; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
+                .header {{ text-align: center; margin-bottom: 30px; padding-bottom: 20px; border-bottom: 2px solid #ff66a3; }}
+                .calculation-section {{ margin: 25px 0; padding: 20px; background: #fff5f9; border-radius: 10px; border: 1px solid #ffb6d9; }}
+                .calculation-step {{ display: flex; justify-content: space-between; padding: 12px 0; border-bottom: 1px dashed #ffb6d9; }}
+                .calculation-step:last-child {{ border-bottom: none; font-weight: bold; font-size: 18px; color: #ff66a3; margin-top: 10px; padding-top: 15px; border-top: 2px solid #ff66a3; }}
+                .back-btn {{ display: inline-block; padding: 10px 20px; background: #666; color: white; text-decoration: none; border-radius: 8px; margin-bottom: 20px; }}
+                .action-btn {{ display: inline-block; padding: 12px 25px; color: white; text-decoration: none; border-radius: 8px; margin: 5px; font-weight: bold; }}
+                .action-buttons {{ text-align: center; margin: 20px 0; }}
+                table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
+                th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #eee; }}
+                th {{ background: #ff66a3; color: white; }}
+                .debug-info {{ background: #e6f7ff; padding: 10px; border-radius: 8px; margin: 10px 0; font-size: 12px; color: #0066cc; }}
+                @media print {{ .back-btn, .action-buttons, .debug-info {{ display: none; }} .container {{ box-shadow: none; padding: 0; }} }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                
+                <div class="header">
+                    <h1>📊 Laporan Perubahan Modal</h1>
+                    <p>Periode: {datetime.now().strftime('%B %Y')}</p>
+                    <p>User: {user_email}</p>
+                </div>
+
+                {status_modal}
+                
+                <div class="debug-info">
+                    <strong>🔍 Debug Info (From View):</strong><br>
+                    Modal Awal: {format_currency(modal_awal)} | Tambahan: {format_currency(total_tambahan)} | Prive: {format_currency(total_prive)}<br>
+                    Laba Bersih: {format_currency(laba_bersih)} | Modal Akhir: {format_currency(modal_akhir)}
+                </div>
+                
+                {tombol_modal}
+                
+                <div class="calculation-section">
+                    <h2>🧮 Perhitungan Modal Akhir</h2>
+                    
+                    <div class="calculation-step">
+                        <span>Modal Awal</span>
+                        <span>{format_currency(modal_awal)}</span>
+                    </div>
+                    
+                    <div class="calculation-step">
+                        <span>Tambahan Modal</span>
+                        <span>+ {format_currency(total_tambahan)}</span>
+                    </div>
+                    
+                    <div class="calculation-step">
+                        <span>Prive</span>
+                        <span>- {format_currency(total_prive)}</span>
+                    </div>
+                    
+                    <div class="calculation-step">
+                        <span>Subtotal Modal</span>
+                        <span>{format_currency(modal_awal + total_tambahan - total_prive)}</span>
+                    </div>
+                    
+                    <div class="calculation-step">
+                        <span>Laba/Rugi Bersih</span>
+                        <span>{format_currency(laba_bersih)}</span>
+                    </div>
+                    
+                    <div class="calculation-step">
+                        <span><strong>MODAL AKHIR</strong></span>
+                        <span><strong>{format_currency(modal_akhir)}</strong></span>
+                    </div>
+                </div>
+                
+                <div style="margin-top: 30px;">
+                    <h3>📋 Riwayat Transaksi Modal</h3>
+                    <div style="overflow-x: auto;">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>Tanggal</th>
+                                    <th>Tipe</th>
+                                    <th>Keterangan</th>
+                                    <th style="text-align: right;">Jumlah</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {riwayat_html}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        return f"""
+        <html>
+        <head><title>Error</title></head>
+        <body style="font-family: Arial; padding: 20px;">
+            <h1>❌ Error Laporan Perubahan Modal</h1>
+            <p><strong>Error:</strong> {str(e)}</p>
+            <a href="/dashboard" style="color: blue;">Kembali ke Dashboard</a>
+        </body>
+        </html>
+        """
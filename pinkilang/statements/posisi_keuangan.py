@@ -0,0 +1,625 @@
+"""Laporan posisi keuangan (neraca)"""
+from flask import redirect, session
+from datetime import datetime
+from pinkilang.core import logger
+from pinkilang.akuntansi import CHART_OF_ACCOUNTS, filter_akun_tidak_diinginkan, konsolidasi_nsa
+from pinkilang.penyusutan import terapkan_penyusutan
+from pinkilang.async_db import ambil_paralel
+
+# ============================================================
+# 🔹 ROUTE: Laporan Posisi Keuangan (Balance Sheet) - FULL AUTOMATIC
+# ============================================================
+def laporan_posisi_keuangan():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_email = session.get('user_email')
+    current_period = datetime.now().strftime('%Y-%m')
+    
+    try:
+        # FORMAT CURRENCY HELPER
+        def rp(val):
+            try:
+                return f"Rp {int(val):,}".replace(",", ".")
+            except:
+                return "Rp 0"
+
+        # AMBIL SEMUA DATA SEKALIGUS - query independen dijalankan paralel
+        hasil = ambil_paralel({
+            'jurnal': lambda db: db.table("jurnal_umum").select("*").order("tanggal"),
+            'nsa': lambda db: db.table("neraca_saldo_awal").select("*"),
+            'aset_tetap': lambda db: db.table("aset_tetap").select("*").eq("user_email", user_email).order("tanggal_perolehan", desc=True),
+            'pdd': lambda db: db.table("pendapatan_diterima_dimuka").select("*").eq("user_email", user_email).eq("status", "dp_diterima"),
+            'modal_awal': lambda db: db.table("modal").select("jumlah").eq("user_email", user_email).eq("tipe", "MODAL_AWAL"),
+            'tambahan_modal': lambda db: db.table("modal").select("jumlah").eq("user_email", user_email).eq("tipe", "TAMBAHAN_MODAL"),
+            'prive': lambda db: db.table("prive").select("jumlah").eq("user_email", user_email),
+        })
+
+        # 1. AMBIL DATA ASET LANCAR DARI NERACA LAJUR
+        jurnal_data = hasil['jurnal'] or []
+        nsa_consolidated = konsolidasi_nsa(hasil['nsa'] or [])
+        jurnal_data = filter_akun_tidak_diinginkan(jurnal_data)
+        akun_standar = {kode: info['nama'] for kode, info in CHART_OF_ACCOUNTS.items()}
+        
+        # Proses data untuk aset lancar
+        akun_data = {}
+        for akun_nama, nsa_info in nsa_consolidated.items():
+            kode_akun = next((kode for kode, nama in akun_standar.items() if nama.lower() == akun_nama.lower()), akun_nama)
+            akun_data[kode_akun] = {
+                'nama_akun': akun_nama,
+                'kode_akun': kode_akun,
+                'neraca_debit': nsa_info['debit'],
+                'neraca_kredit': nsa_info['kredit'],
+                'penyesuaian_debit': 0,
+                'penyesuaian_kredit': 0
+            }
+
+        # Proses jurnal untuk aset lancar
+        for jurnal in jurnal_data:
+            akun_nama = jurnal.get('nama_akun', 'Unknown')
+            debit = float(jurnal.get('debit', 0) or 0)
+            kredit = float(jurnal.get('kredit', 0) or 0)
+            
+            kode_akun = next((kode for kode, nama in akun_standar.items() if nama.lower() == akun_nama.lower()), akun_nama)
+            
+            if kode_akun not in akun_data:
+                 akun_data[kode_akun] = {
+                    'nama_akun': akun_nama,
+                    'kode_akun': kode_akun,
+                    'neraca_debit': 0, 'neraca_kredit': 0,
+                    'penyesuaian_debit': 0, 'penyesuaian_kredit': 0
+                }
+            
+            if jurnal.get('transaksi_type', '').lower() in ['penyesuaian', 'penyesuaian_manual', 'penyesuaian_aset', 'penyesuaian_otomatis']:
+                akun_data[kode_akun]['penyesuaian_debit'] += debit
+                akun_data[kode_akun]['penyesuaian_kredit'] += kredit
+            else:
+                akun_data[kode_akun]['neraca_debit'] += debit
+                akun_data[kode_akun]['neraca_kredit'] += kredit
+
+        # 2. AMBIL DATA ASET TETAP + PENYUSUTAN
+        aset_tetap_data = terapkan_penyusutan(hasil['aset_tetap'] or [])
+        
+        total_nilai_perolehan_aset = 0
+        total_akumulasi_penyusutan = 0
+        total_nilai_buku_aset = 0
+        
+        aset_tetap_html = ""
+        for aset in aset_tetap_data:
+            nilai_perolehan = float(aset.get('nilai_perolehan', 0) or 0)
+            akumulasi_penyusutan = float(aset.get('akumulasi_penyusutan', 0) or 0)
+            nilai_buku = float(aset.get('nilai_buku', 0) or 0)
+            
+            total_nilai_perolehan_aset += nilai_perolehan
+            total_akumulasi_penyusutan += akumulasi_penyusutan
+            total_nilai_buku_aset += nilai_buku
+            
+            aset_tetap_html += f"""
+            <tr>
+                <td>1210</td>
+                <td>{aset['nama_aset']}</td>
+                <td class="number">{rp(nilai_perolehan)}</td>
+            </tr>
+            <tr>
+                <td>1211</td>
+                <td>Akumulasi Penyusutan {aset['nama_aset']}</td>
+                <td class="number">{rp(akumulasi_penyusutan)}</td>
+            </tr>
+            """
+
+        # 3. AMBIL DATA UTANG DARI BUKU BESAR PEMBANTU UTANG
+        # Cari saldo utang dari jurnal umum
+        saldo_utang_usaha = 0
+        for kode_akun, data in akun_data.items():
+            if 'utang' in data['nama_akun'].lower():
+                saldo_utang = data['neraca_kredit'] + data['penyesuaian_kredit'] - data['neraca_debit'] - data['penyesuaian_debit']
+                if saldo_utang > 0:
+                    saldo_utang_usaha += saldo_utang
+
+        # 4. AMBIL DATA PENDAPATAN DITERIMA DIMUKA
+        pdd_data = hasil['pdd'] or []
+        
+        total_pendapatan_ddm = sum(float(pdd.get('jumlah_dp', 0) or 0) for pdd in pdd_data)
+
+        # 5. AMBIL DATA MODAL DARI LAPORAN PERUBAHAN MODAL
+        # Hitung modal awal
+        total_modal_awal = sum(float(modal.get('jumlah', 0) or 0) for modal in hasil['modal_awal'] or [])
+        
+        # Hitung tambahan modal
+        total_tambahan_modal = sum(float(modal.get('jumlah', 0) or 0) for modal in hasil['tambahan_modal'] or [])
+        
+        # Hitung prive
+        total_prive = sum(float(prive.get('jumlah', 0) or 0) for prive in hasil['prive'] or [])
+        
+        # Hitung laba rugi dari neraca lajur (sederhana)
+        total_pendapatan = 0
+        total_beban = 0
+        for kode_akun, data in akun_data.items():
+            nama_akun = data['nama_akun'].lower()
+            saldo = (data['neraca_debit'] + data['penyesuaian_debit']) - (data['neraca_kredit'] + data['penyesuaian_kredit'])
+            
+            if any(keyword in nama_akun for keyword in ['pendapatan', 'penjualan']):
+                total_pendapatan += abs(saldo) if saldo < 0 else 0
+            elif any(keyword in nama_akun for keyword in ['beban', 'biaya']):
+                total_beban += abs(saldo) if saldo > 0 else 0
+        
+        laba_rugi_bersih = total_pendapatan - total_beban
+        
+        # Hitung modal akhir
+        modal_akhir = total_modal_awal + total_tambahan_modal + laba_rugi_bersih - total_prive
+
+        # 6. HITUNG TOTAL ASET LANCAR
+        total_aset_lancar = 0
+        aset_lancar_html = ""
+        for kode_akun, data in akun_data.items():
+            nama_akun = data['nama_akun'].lower()
+            saldo = (data['neraca_debit'] + data['penyesuaian_debit']) - (data['neraca_kredit'] + data['penyesuaian_kredit'])
+            
+            if any(keyword in nama_akun for keyword in ['kas', 'bank', 'piutang', 'persediaan', 'perlengkapan']) and saldo > 0:
+                total_aset_lancar += saldo
+                aset_lancar_html += f"""
+                <tr>
+                    <td>{data['kode_akun']}</td>
+                    <td>{data['nama_akun']}</td>
+                    <td class="number">{rp(saldo)}</td>
+                </tr>
+                """
+
+        # 7. HITUNG TOTAL KESELURUHAN
+        total_aset = total_aset_lancar + total_nilai_buku_aset
+        total_utang = saldo_utang_usaha + total_pendapatan_ddm
+        total_pasiva = total_utang + modal_akhir
+
+        # 8. GENERATE HTML
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Laporan Posisi Keuangan - PINKILANG</title>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+                
+                body {{
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    background: linear-gradient(135deg, #e6f7ff, #f0f8ff);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+                
+                .container {{
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+                
+                .header {{
+                    background: linear-gradient(135deg, #007bff, #0056b3);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+                
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                }}
+                
+                .back-btn:hover {{
+                    background: rgba(255,255,255,0.3);
+                    transform: translateY(-2px);
+                }}
+                
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                    font-weight: 600;
+                }}
+                
+                .company-info {{
+                    font-size: 18px;
+                    margin-bottom: 5px;
+                    font-weight: 500;
+                }}
+                
+                .period-info {{
+                    font-size: 14px;
+                    opacity: 0.9;
+                }}
+                
+                .content {{
+                    padding: 30px;
+                }}
+                
+                .balance-sheet {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin-bottom: 30px;
+                    font-size: 14px;
+                }}
+                
+                .balance-sheet th {{
+                    background: #f8f9fa;
+                    padding: 12px;
+                    text-align: left;
+                    border: 1px solid #dee2e6;
+                    font-weight: 600;
+                    color: #495057;
+                }}
+                
+                .balance-sheet td {{
+                    padding: 10px 12px;
+                    border: 1px solid #dee2e6;
+                    color: #333;
+                }}
+                
+                .balance-sheet .section-header {{
+                    background: #e3f2fd;
+                    font-weight: bold;
+                    font-size: 15px;
+                }}
+                
+                .balance-sheet .total-row {{
+                    background: #fff3cd;
+                    font-weight: bold;
+                    font-size: 15px;
+                }}
+                
+                .balance-sheet .grand-total {{
+                    background: #d4edda;
+                    font-weight: bold;
+                    font-size: 16px;
+                    color: #155724;
+                }}
+                
+                .number {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                    font-weight: 500;
+                }}
+                
+                .balance-status {{
+                    text-align: center;
+                    padding: 20px;
+                    margin: 20px 0;
+                    border-radius: 10px;
+                    font-weight: 600;
+                    font-size: 18px;
+                }}
+                
+                .balance-correct {{
+                    background: #d4edda;
+                    color: #155724;
+                    border: 2px solid #c3e6cb;
+                }}
+                
+                .balance-incorrect {{
+                    background: #f8d7da;
+                    color: #721c24;
+                    border: 2px solid #f5c6cb;
+                }}
+                
+                .summary-info {{
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                    gap: 15px;
+                    margin: 20px 0;
+                }}
+                
+                .summary-item {{
+                    background: #f8f9fa;
+                    padding: 15px;
+                    border-radius: 8px;
+                    text-align: center;
+                    border-left: 4px solid #007bff;
+                }}
+                
+                .summary-value {{
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #007bff;
+                    margin-bottom: 5px;
+                }}
+                
+                .summary-label {{
+                    font-size: 12px;
+                    color: #666;
+                }}
+                
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 1px solid #eee;
+                    display: flex;
+                    gap: 10px;
+                    justify-content: center;
+                    flex-wrap: wrap;
+                }}
+                
+                .btn {{
+                    display: inline-block;
+                    padding: 12px 24px;
+                    background: #6c757d;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 6px;
+                    transition: all 0.3s ease;
+                    font-weight: 500;
+                    border: none;
+                    cursor: pointer;
+                    font-size: 14px;
+                }}
+                
+                .btn:hover {{
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+                }}
+                
+                .btn-primary {{
+                    background: #007bff;
+                }}
+                
+                .btn-info {{
+                    background: #17a2b8;
+                }}
+                
+                .btn-success {{
+                    background: #28a745;
+                }}
+                
+                .btn-warning {{
+                    background: #ffc107;
+                    color: #000;
+                }}
+                
+                @media print {{
+                    body {{
+                        background: white;
+                        padding: 0;
+                    }}
+                    .container {{
+                        box-shadow: none;
+                        border-radius: 0;
+                    }}
+                    .action-buttons {{
+                        display: none;
+                    }}
+                    .summary-info {{
+                        display: none;
+                    }}
+                }}
+                
+                @media (max-width: 768px) {{
+                    .container {{
+                        margin: 10px;
+                        border-radius: 10px;
+                    }}
+                    
+                    .content {{
+                        padding: 15px;
+                    }}
+                    
+                    .balance-sheet {{
+                        font-size: 12px;
+                    }}
+                    
+                    .balance-sheet td,
+                    .balance-sheet th {{
+                        padding: 8px 10px;
+                    }}
+                    
+                    .action-buttons {{
+                        flex-direction: column;
+                    }}
+                    
+                    .btn {{
+                        width: 100%;
+                        margin: 2px 0;
+                    }}
+                    
+                    .summary-info {{
+                        grid-template-columns: 1fr;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>📋 LAPORAN POSISI KEUANGAN</h1>
+                    <div class="company-info">RUMAH BIBIT MAS ANGGA</div>
+                    <div class="period-info">Periode: {datetime.now().strftime('%B %Y')}</div>
+                    <div class="period-info">Login sebagai: {user_email}</div>
+                </div>
+                
+                <div class="content">
+                    <div class="summary-info">
+                        <div class="summary-item">
+                            <div class="summary-value">{rp(total_aset)}</div>
+                            <div class="summary-label">Total Aset</div>
+                        </div>
+                        <div class="summary-item">
+                            <div class="summary-value">{rp(total_utang)}</div>
+                            <div class="summary-label">Total Utang</div>
+                        </div>
+                        <div class="summary-item">
+                            <div class="summary-value">{rp(modal_akhir)}</div>
+                            <div class="summary-label">Modal Akhir</div>
+                        </div>
+                        <div class="summary-item">
+                            <div class="summary-value">{rp(laba_rugi_bersih)}</div>
+                            <div class="summary-label">Laba/Rugi Bersih</div>
+                        </div>
+                    </div>
+                    
+                    <div class="balance-status {'balance-correct' if abs(total_aset - total_pasiva) < 0.01 else 'balance-incorrect'}">
+                        {'✅ LAPORAN POSISI KEUANGAN SEIMBANG' if abs(total_aset - total_pasiva) < 0.01 else '❌ LAPORAN POSISI KEUANGAN TIDAK SEIMBANG'}
+                        <br>
+                        <small>Total Aktiva: {rp(total_aset)} | Total Pasiva: {rp(total_pasiva)} | Selisih: {rp(abs(total_aset - total_pasiva))}</small>
+                    </div>
+                    
+                    <table class="balance-sheet">
+                        <tr>
+                            <th width="80">NO AKUN</th>
+                            <th>REKENING</th>
+                            <th width="180" class="number">JUMLAH</th>
+                            <th width="80">NO AKUN</th>
+                            <th>REKENING</th>
+                            <th width="180" class="number">JUMLAH</th>
+                        </tr>
+                        
+                        <!-- ASET LANCAR -->
+                        <tr class="section-header">
+                            <td>1100</td>
+                            <td colspan="2">Aset Lancar</td>
+                            <td>2000</td>
+                            <td colspan="2">Utang</td>
+                        </tr>
+                        {aset_lancar_html if aset_lancar_html else """
+                        <tr>
+                            <td colspan="3" style="text-align: center; color: #666; padding: 15px;">
+                                Tidak ada data aset lancar
+                            </td>
+                            <td colspan="3" style="text-align: center; color: #666; padding: 15px;">
+                                Tidak ada data utang
+                            </td>
+                        </tr>
+                        """}
+                        
+                        <!-- Tambahan Kas dari neraca lajur jika ada -->
+                        <tr>
+                            <td>1110</td>
+                            <td>Kas</td>
+                            <td class="number">{rp(total_aset_lancar)}</td>
+                            <td>2100</td>
+                            <td>Utang Usaha</td>
+                            <td class="number">{rp(saldo_utang_usaha)}</td>
+                        </tr>
+                        
+                        <tr class="total-row">
+                            <td colspan="2">Total Aset Lancar</td>
+                            <td class="number">{rp(total_aset_lancar)}</td>
+                            <td>2200</td>
+                            <td>Pendapatan Diterima Dimuka</td>
+                            <td class="number">{rp(total_pendapatan_ddm)}</td>
+                        </tr>
+                        
+                        <!-- ASET TETAP -->
+                        <tr class="section-header">
+                            <td>1200</td>
+                            <td colspan="2">Aset Tetap</td>
+                            <td>3000</td>
+                            <td colspan="2">Modal</td>
+                        </tr>
+                        {aset_tetap_html if aset_tetap_html else """
+                        <tr>
+                            <td colspan="3" style="text-align: center; color: #666; padding: 15px;">
+                                Tidak ada data aset tetap
+                            </td>
+                            <td colspan="3" style="text-align: center; color: #666; padding: 15px;">
+                                Tidak ada data modal
+                            </td>
+                        </tr>
+                        """}
+                        
+                        <tr class="total-row">
+                            <td colspan="2">Total Aset Tetap</td>
+                            <td class="number">{rp(total_nilai_buku_aset)}</td>
+                            <td colspan="2">Total Modal</td>
+                            <td class="number">{rp(modal_akhir)}</td>
+                        </tr>
+                        
+                        <!-- GRAND TOTAL -->
+                        <tr class="grand-total">
+                            <td colspan="2"><strong>Jumlah Aktiva</strong></td>
+                            <td class="number"><strong>{rp(total_aset)}</strong></td>
+                            <td colspan="2"><strong>Jumlah Pasiva</strong></td>
+                            <td class="number"><strong>{rp(total_pasiva)}</strong></td>
+                        </tr>
+                    </table>
+                    
+                    <!-- DETAIL PERHITUNGAN MODAL -->
+                    <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 20px;">
+                        <h4 style="color: #495057; margin-bottom: 10px;">📊 Detail Perhitungan Modal:</h4>
+                        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px; font-size: 14px;">
+                            <div>Modal Awal: <strong>{rp(total_modal_awal)}</strong></div>
+                            <div>Tambahan Modal: <strong>{rp(total_tambahan_modal)}</strong></div>
+                            <div>Laba/Rugi Bersih: <strong>{rp(laba_rugi_bersih)}</strong></div>
+                            <div>Prive: <strong>{rp(total_prive)}</strong></div>
+                            <div style="grid-column: 1 / -1; border-top: 1px solid #ddd; padding-top: 5px;">
+                                Modal Akhir: <strong>{rp(modal_akhir)}</strong>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div class="action-buttons">
+                        <a href="/dashboard" class="btn btn-primary">🏠 Dashboard</a>
+                        <a href="/neraca-lajur" class="btn btn-info">📊 Neraca Lajur</a>
+                        <a href="/laporan-laba-rugi" class="btn btn-success">📈 Laporan Laba Rugi</a>
+                        <a href="/laporan-perubahan-modal" class="btn btn-warning">💰 Laporan Perubahan Modal</a>
+                        <button onclick="window.print()" class="btn" style="background: #17a2b8;">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+            
+            <script>
+                document.addEventListener('DOMContentLoaded', function() {{
+                    // Add animation
+                    const rows = document.querySelectorAll('.balance-sheet tr');
+                    rows.forEach((row, index) => {{
+                        row.style.opacity = '0';
+                        row.style.transform = 'translateY(10px)';
+                        setTimeout(() => {{
+                            row.style.transition = 'all 0.3s ease';
+                            row.style.opacity = '1';
+                            row.style.transform = 'translateY(0)';
+                        }}, index * 50);
+                    }});
+                }});
+            </script>
+        </body>
+        </html>
+        """
+        return html
+        
+    except Exception as e:
+        logger.error(f"❌ Error di Laporan Posisi Keuangan: {str(e)}")
+        import traceback
+        error_details = traceback.format_exc()
+        
+        return f"""
+        <html>
+        <body style="font-family: Arial; padding: 20px; background: #f8f9fa;">
+            <div style="max-width: 600px; margin: 50px auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center;">
+                <h1 style="color: #dc3545; margin-bottom: 20px;">❌ Error Laporan Posisi Keuangan</h1>
+                <p style="color: #666; margin-bottom: 20px;">Terjadi kesalahan saat memproses data:</p>
+                <p style="background: #f8d7da; color: #721c24; padding: 15px; border-radius: 5px; font-family: monospace; font-size: 12px; text-align: left; overflow-x: auto;">
+                    {str(e)}
+                </p>
+                <details style="margin: 15px 0; text-align: left;">
+                    <summary>Detail Error</summary>
+                    <pre style="background: #f8f9fa; padding: 10px; border-radius: 5px; font-size: 10px; overflow-x: auto;">{error_details}</pre>
+                </details>
+                <a href="/dashboard" style="display: inline-block; margin-top: 20px; padding: 10px 20px; background: #007bff; color: white; text-decoration: none; border-radius: 5px;">← Kembali ke Dashboard</a>
+            </div>
+        </body>
+        </html>
+        """
@@ -0,0 +1,233 @@
+"""Laporan umur piutang dan utang"""
+from flask import request, redirect, session, jsonify
+from datetime import datetime, date
+from pinkilang.core import logger
+from pinkilang.piutang_utang import get_aging_data
+
+def generate_aging_table(data, label_pihak, rp_func):
+    """Generate tabel HTML untuk satu laporan aging"""
+    header_bucket = "".join(f"<th>{b['label']}</th>" for b in data['buckets'])
+
+    rows = ""
+    for pihak in data['per_pihak']:
+        cells = "".join(
+            f"<td class='amount'>{rp_func(pihak['buckets'][b['kode']]) if pihak['buckets'][b['kode']] else '-'}</td>"
+            for b in data['buckets']
+        )
+        rows += f"""
+        <tr>
+            <td>{pihak['nama']}</td>
+            <td class='center'>{pihak['jumlah_faktur']}</td>
+            {cells}
+            <td class='amount total'>{rp_func(pihak['total'])}</td>
+        </tr>
+        """
+
+    if not rows:
+        rows = f"<tr><td colspan='{len(data['buckets']) + 3}' class='center'>📊 Tidak ada {data['jenis']} terbuka</td></tr>"
+
+    total_cells = "".join(
+        f"<td class='amount'>{rp_func(data['total_bucket'][b['kode']])}</td>" for b in data['buckets']
+    )
+
+    return f"""
+    <table>
+        <thead>
+            <tr>
+                <th>{label_pihak}</th>
+                <th>Faktur</th>
+                {header_bucket}
+                <th>Total</th>
+            </tr>
+        </thead>
+        <tbody>
+            {rows}
+            <tr class="total-row">
+                <td colspan="2">TOTAL</td>
+                {total_cells}
+                <td class='amount total'>{rp_func(data['total'])}</td>
+            </tr>
+        </tbody>
+    </table>
+    """
+
+def laporan_umur_piutang_utang():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    try:
+        as_of_param = request.args.get('as_of')
+        as_of = datetime.strptime(as_of_param, '%Y-%m-%d').date() if as_of_param else date.today()
+    except ValueError:
+        as_of = date.today()
+
+    try:
+        aging_piutang = get_aging_data("piutang", as_of)
+        aging_utang = get_aging_data("utang", as_of)
+
+        if request.args.get('format') == 'json':
+            return jsonify({'piutang': aging_piutang, 'utang': aging_utang})
+
+        def rp(amount):
+            return f"Rp {amount:,.0f}".replace(",", ".")
+
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Umur Piutang & Utang - PINKILANG</title>
+            <meta charset="utf-8">
+            <style>
+                * {{
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }}
+
+                body {{
+                    font-family: 'Arial', sans-serif;
+                    background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                    padding: 20px;
+                    min-height: 100vh;
+                }}
+
+                .container {{
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background: white;
+                    border-radius: 15px;
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                    overflow: hidden;
+                }}
+
+                .header {{
+                    background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                    color: white;
+                    padding: 25px;
+                    text-align: center;
+                }}
+
+                .back-btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    background: rgba(255,255,255,0.2);
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 8px;
+                    margin-bottom: 15px;
+                    border: 1px solid rgba(255,255,255,0.3);
+                    font-size: 14px;
+                }}
+
+                h1 {{
+                    font-size: 28px;
+                    margin-bottom: 10px;
+                }}
+
+                h2 {{
+                    color: #ff66a3;
+                    margin: 25px 0 15px;
+                }}
+
+                .content {{
+                    padding: 25px;
+                }}
+
+                .filter-form {{
+                    text-align: center;
+                    margin-bottom: 10px;
+                }}
+
+                .filter-form input, .filter-form button {{
+                    padding: 8px 12px;
+                    border: 1px solid #ffb3d1;
+                    border-radius: 5px;
+                }}
+
+                table {{
+                    width: 100%;
+                    border-collapse: collapse;
+                    font-size: 14px;
+                }}
+
+                th {{
+                    background: #ff66a3;
+                    color: white;
+                    padding: 10px;
+                }}
+
+                td {{
+                    padding: 8px 10px;
+                    border-bottom: 1px solid #ffe0ec;
+                }}
+
+                .amount {{
+                    text-align: right;
+                    font-family: 'Courier New', monospace;
+                }}
+
+                .center {{
+                    text-align: center;
+                }}
+
+                .total {{
+                    font-weight: bold;
+                }}
+
+                .total-row {{
+                    background: #fff0f7;
+                    font-weight: bold;
+                }}
+
+                .btn {{
+                    display: inline-block;
+                    padding: 10px 20px;
+                    margin: 0 5px;
+                    background: #ff66a3;
+                    color: white;
+                    text-decoration: none;
+                    border-radius: 5px;
+                    font-size: 14px;
+                }}
+
+                .action-buttons {{
+                    text-align: center;
+                    margin-top: 25px;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                    <h1>⏳ Laporan Umur Piutang & Utang</h1>
+                    <p>Per tanggal {as_of.strftime('%d/%m/%Y')}</p>
+                </div>
+
+                <div class="content">
+                    <form method="GET" class="filter-form">
+                        <input type="date" name="as_of" value="{as_of.isoformat()}">
+                        <button type="submit">🔍 Tampilkan</button>
+                    </form>
+
+                    <h2>📄 Umur Piutang per Pelanggan</h2>
+                    {generate_aging_table(aging_piutang, "Pelanggan", rp)}
+
+                    <h2>📋 Umur Utang per Supplier</h2>
+                    {generate_aging_table(aging_utang, "Supplier", rp)}
+
+                    <div class="action-buttons">
+                        <a href="/buku-besar-pembantu-piutang" class="btn">📄 BB Pembantu Piutang</a>
+                        <a href="/buku-besar-pembantu-utang" class="btn">📋 BB Pembantu Utang</a>
+                        <a href="?as_of={as_of.isoformat()}&format=json" class="btn">🧾 JSON</a>
+                    </div>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+        return html
+
+    except Exception as e:
+        logger.error(f"❌ Error di laporan umur piutang & utang: {str(e)}")
+        return f"Error: {str(e)}"
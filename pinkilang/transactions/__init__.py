@@ -0,0 +1,13 @@
+"""Blueprint transactions: input penjualan, pembelian, operasional, modal dan pelunasan"""
+from flask import Blueprint
+from pinkilang.lazy import lazy_route
+
+bp = Blueprint("transactions", __name__)
+
+lazy_route(bp, "/penjualan", "penjualan.penjualan", methods=["GET", "POST"])
+lazy_route(bp, "/pembelian", "pembelian.pembelian", methods=["GET", "POST"])
+lazy_route(bp, "/operasional", "operasional.operasional", methods=["GET", "POST"])
+lazy_route(bp, "/prive", "modal.prive", methods=["GET", "POST"])
+lazy_route(bp, "/input-modal-awal", "modal.input_modal_awal", methods=["GET", "POST"])
+lazy_route(bp, "/pendapatan-diterima-dimuka", "pendapatan_diterima_dimuka.pendapatan_diterima_dimuka", methods=["GET", "POST"])
+lazy_route(bp, "/pelunasan-massal", "pelunasan_massal.pelunasan_massal", methods=["GET", "POST"])
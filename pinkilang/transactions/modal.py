@@ -0,0 +1,1305 @@
+"""Prive, tambahan modal dan modal awal"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import hitung_laba_bersih_otomatis
+from pinkilang.posting import posting_transaksi, ID_BARU
+
+    
+# ============================================================
+# 🔹 ROUTE: Prive - DIPERBAIKI untuk integrasi dengan modal
+# ============================================================
+def prive():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_id = session.get('user_id')
+    user_email = session.get('user_email')
+    message = ""
+    
+    # Handle form submission untuk prive
+    if request.method == "POST" and 'add_prive' in request.form:
+        message = process_prive_form(user_id, user_email)
+    
+    # Handle form submission untuk tambahan modal
+    if request.method == "POST" and 'add_tambahan_modal' in request.form:
+        message = process_tambahan_modal_form(user_id, user_email)
+    
+    # Ambil data prive dan modal dari database
+    prive_data = get_prive_data()
+    modal_data_all = get_modal_data()
+    
+    # Hitung totals - DIPERBAIKI: hitung dari modal_data saja untuk konsistensi
+    total_prive = sum(item['jumlah'] for item in modal_data_all if item['tipe'] == 'PRIVE')
+    total_tambahan_modal = sum(item['jumlah'] for item in modal_data_all if item['tipe'] == 'TAMBAHAN_MODAL')
+    modal_awal = next((item['jumlah'] for item in modal_data_all if item['tipe'] == 'MODAL_AWAL'), 0)
+    
+    # Hitung modal akhir
+    laba_bersih = hitung_laba_bersih_otomatis()
+    modal_akhir = modal_awal + total_tambahan_modal - total_prive + laba_bersih
+    
+    # Generate HTML
+    return generate_prive_html(
+        user_email, 
+        message, 
+        prive_data, 
+        modal_data_all,
+        total_prive,
+        total_tambahan_modal,
+        modal_awal,
+        laba_bersih,
+        modal_akhir
+    )
+
+def process_prive_form(user_id, user_email):
+    """Process prive form submission dengan jurnal otomatis - DIPERBAIKI"""
+    try:
+        # Collect form data
+        tanggal = request.form["tanggal"]
+        jumlah = int(request.form["jumlah"])
+        keterangan = request.form["keterangan"]
+        metode_pembayaran = request.form["metode_pembayaran"]
+        
+        if jumlah <= 0:
+            return '<div class="message error">❌ Jumlah prive harus lebih dari 0!</div>'
+        
+        # Simpan data prive ke database - DIPERBAIKI: simpan ke tabel modal juga
+        prive_data = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "tanggal": tanggal,
+            "jumlah": jumlah,
+            "keterangan": keterangan,
+            "metode_pembayaran": metode_pembayaran,
+            "created_at": datetime.now().isoformat()
+        }
+        
+        # Data untuk tabel modal (agar terintegrasi dengan laporan)
+        modal_prive_data = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "tanggal": tanggal,
+            "jumlah": jumlah,
+            "keterangan": f"Prive: {keterangan}",
+            "tipe": "PRIVE",  # ✅ Tipe PRIVE untuk integrasi dengan modal
+            "sumber_modal": metode_pembayaran,
+            "created_at": datetime.now().isoformat()
+        }
+        
+        if supabase:
+            # Insert ke tabel prive (untuk backup/data lama)
+            insert_result_prive = supabase.table("prive").insert(prive_data).execute()
+            
+            # Insert ke tabel modal (untuk integrasi dengan laporan)
+            insert_result_modal = supabase.table("modal").insert(modal_prive_data).execute()
+            
+            if insert_result_modal and insert_result_modal.data:
+                prive_id = insert_result_modal.data[0]['id']
+                
+                # ✅ BUAT JURNAL OTOMATIS 
+                jurnal_entries = [
+                    # Debit: Prive (Pengurangan Modal)
+                    {
+                        "tanggal": tanggal,
+                        "nama_akun": "Prive",
+                        "ref": "3120",
+                        "debit": jumlah,
+                        "kredit": 0,
+                        "deskripsi": f"Prive: {keterangan}",
+                        "transaksi_type": "PRIVE",
+                        "transaksi_id": prive_id,
+                        "user_email": user_email,
+                        "created_at": datetime.now().isoformat()
+                    },
+                    # Kredit: Kas/Bank (Pengurangan Kas)
+                    {
+                        "tanggal": tanggal,
+                        "nama_akun": "Kas" if metode_pembayaran == "CASH" else "Bank",
+                        "ref": "1110" if metode_pembayaran == "CASH" else "1120",
+                        "debit": 0,
+                        "kredit": jumlah,
+                        "deskripsi": f"Pembayaran prive: {keterangan}",
+                        "transaksi_type": "PRIVE",
+                        "transaksi_id": prive_id,
+                        "user_email": user_email,
+                        "created_at": datetime.now().isoformat()
+                    }
+                ]
+
+                # Simpan jurnal ke database
+                success_count = 0
+                for entry in jurnal_entries:
+                    try:
+                        result = supabase.table("jurnal_umum").insert(entry).execute()
+                        if result.data:
+                            success_count += 1
+                            logger.info(f"✅ Jurnal prive: {entry['nama_akun']} - {entry['debit']}/{entry['kredit']}")
+                    except Exception as e:
+                        logger.error(f"❌ Error insert jurnal prive: {str(e)}")
+                
+                if success_count == len(jurnal_entries):
+                    logger.info(f"✅ Prive berhasil dicatat: {jumlah} oleh {user_email}")
+                    return f'<div class="message success">✅ Prive berhasil dicatat! Jurnal otomatis dibuat.</div>'
+                else:
+                    logger.warning(f"⚠️ Sebagian jurnal prive gagal: {success_count}/{len(jurnal_entries)}")
+                    return f'<div class="message success">✅ Prive berhasil dicatat! ({success_count}/{len(jurnal_entries)} jurnal berhasil)</div>'
+            else:
+                return '<div class="message error">❌ Gagal menyimpan data prive!</div>'
+                
+    except Exception as e:
+        logger.error(f"❌ Error proses prive: {str(e)}")
+        return f'<div class="message error">❌ Error mencatat prive: {str(e)}</div>'
+
+def process_tambahan_modal_form(user_id, user_email):
+    """Process tambahan modal form submission dengan jurnal otomatis"""
+    try:
+        # Collect form data
+        tanggal = request.form["tanggal_tambahan"]
+        jumlah = int(request.form["jumlah_tambahan"])
+        keterangan = request.form["keterangan_tambahan"]
+        sumber_modal = request.form["sumber_modal"]
+        
+        if jumlah <= 0:
+            return '<div class="message error">❌ Jumlah tambahan modal harus lebih dari 0!</div>'
+        
+        # Simpan data tambahan modal ke database
+        modal_data = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "tanggal": tanggal,
+            "jumlah": jumlah,
+            "keterangan": f"Tambahan Modal: {keterangan}",
+            "sumber_modal": sumber_modal,
+            "tipe": "TAMBAHAN_MODAL",
+            "created_at": datetime.now().isoformat()
+        }
+        
+        if supabase:
+            # ✅ BUAT JURNAL OTOMATIS - disimpan bersama baris modal dalam satu transaksi
+            jurnal_entries = [
+                # Debit: Kas/Bank (Penambahan Kas)
+                {
+                    "tanggal": tanggal,
+                    "nama_akun": "Kas" if sumber_modal == "CASH" else "Bank",
+                    "ref": "1110" if sumber_modal == "CASH" else "1120",
+                    "ref_baris": 1,
+                    "debit": jumlah,
+                    "kredit": 0,
+                    "deskripsi": f"Tambahan modal: {keterangan}",
+                    "transaksi_type": "TAMBAHAN_MODAL",
+                    "transaksi_id": ID_BARU,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                },
+                # Kredit: Modal (Penambahan Modal)
+                {
+                    "tanggal": tanggal,
+                    "nama_akun": "Modal Pemilik",
+                    "ref": "3110",
+                    "ref_baris": 2,
+                    "debit": 0,
+                    "kredit": jumlah,
+                    "deskripsi": f"Tambahan modal: {keterangan}",
+                    "transaksi_type": "TAMBAHAN_MODAL",
+                    "transaksi_id": ID_BARU,
+                    "user_email": user_email,
+                    "created_at": datetime.now().isoformat()
+                }
+            ]
+            posting_transaksi("modal", modal_data, jurnal_entries, "MODAL", updated_by=user_email)
+
+            logger.info(f"✅ Tambahan modal berhasil dicatat: {jumlah} oleh {user_email}")
+            return f'<div class="message success">✅ Tambahan modal berhasil dicatat! Jurnal otomatis dibuat.</div>'
+                
+    except Exception as e:
+        logger.error(f"❌ Error proses tambahan modal: {str(e)}")
+        return f'<div class="message error">❌ Error mencatat tambahan modal: {str(e)}</div>'
+
+def get_prive_data():
+    """Ambil data prive dari database"""
+    try:
+        if supabase:
+            result = supabase.table("prive").select("*").order("tanggal", desc=True).execute()
+            return result.data or []
+    except Exception as e:
+        logger.error(f"Error ambil data prive: {str(e)}")
+    return []
+
+def get_modal_data():
+    """Ambil data modal dari database"""
+    try:
+        if supabase:
+            result = supabase.table("modal").select("*").order("tanggal", desc=True).execute()
+            return result.data or []
+    except Exception as e:
+        logger.error(f"Error ambil data modal: {str(e)}")
+    return []
+
+def generate_prive_rows(prive_data):
+    """Generate HTML rows untuk tabel prive"""
+    if not prive_data:
+        return ""
+    
+    rows = ""
+    for item in prive_data:
+        # Format currency
+        jumlah_formatted = f"Rp {item['jumlah']:,.0f}".replace(",", ".")
+        
+        # Badge user dengan styling berbeda untuk current user
+        user_badge_class = "user-badge current-user" if item.get('user_email') == session.get('user_email') else "user-badge"
+        user_display = item.get('user_email', 'Unknown').split('@')[0]
+        
+        rows += f"""
+        <tr>
+            <td>{item.get('tanggal', '')}</td>
+            <td><span class="{user_badge_class}">👤 {user_display}</span></td>
+            <td style="font-weight: bold; color: #ff6666;">-{jumlah_formatted}</td>
+            <td>{'💰 Cash' if item.get('metode_pembayaran') == 'CASH' else '🏦 Bank'}</td>
+            <td>{item.get('keterangan', '')}</td>
+            <td>
+                <span style="background: #e6f7ff; color: #0066cc; padding: 4px 8px; border-radius: 6px; font-size: 12px;">
+                    ✅ Jurnal Auto
+                </span>
+            </td>
+        </tr>
+        """
+    return rows
+
+def generate_modal_rows(modal_data_all):
+    """Generate HTML rows untuk tabel modal"""
+    if not modal_data_all:
+        return ""
+    
+    rows = ""
+    for item in modal_data_all:
+        # Format currency
+        jumlah_formatted = f"Rp {item['jumlah']:,.0f}".replace(",", ".")
+        
+        # Tentukan styling berdasarkan tipe
+        tipe = item.get('tipe', '')
+        if tipe == 'PRIVE':
+            amount_style = "font-weight: bold; color: #ff6666;"
+            amount_display = f"-{jumlah_formatted}"
+            tipe_badge = "🔴 PRIVE"
+        elif tipe == 'TAMBAHAN_MODAL':
+            amount_style = "font-weight: bold; color: #00cc66;"
+            amount_display = f"+{jumlah_formatted}"
+            tipe_badge = "🟢 TAMBAHAN"
+        else:  # MODAL_AWAL
+            amount_style = "font-weight: bold; color: #ff66a3;"
+            amount_display = jumlah_formatted
+            tipe_badge = "🔵 MODAL AWAL"
+        
+        # Badge user
+        user_display = item.get('user_email', 'Unknown').split('@')[0]
+        user_badge_class = "user-badge current-user" if item.get('user_email') == session.get('user_email') else "user-badge"
+        
+        rows += f"""
+        <tr>
+            <td>{item.get('tanggal', '')}</td>
+            <td><span class="{user_badge_class}">👤 {user_display}</span></td>
+            <td><span style="background: #f0f0f0; padding: 4px 8px; border-radius: 6px; font-size: 12px;">{tipe_badge}</span></td>
+            <td style="{amount_style}">{amount_display}</td>
+            <td>{item.get('keterangan', '')}</td>
+            <td>
+                <span style="background: #e6f7ff; color: #0066cc; padding: 4px 8px; border-radius: 6px; font-size: 12px;">
+                    ✅ Jurnal Auto
+                </span>
+            </td>
+        </tr>
+        """
+    return rows
+
+def generate_prive_html(user_email, message, prive_data, modal_data_all, total_prive, total_tambahan_modal, modal_awal, laba_bersih, modal_akhir):
+    """Generate HTML untuk halaman prive"""
+    
+    # Format currency helper
+    def format_currency(amount):
+        return f"Rp {amount:,.0f}".replace(",", ".")
+    
+    # Generate transaction rows - DIPERBAIKI: ambil prive dari modal_data juga
+    prive_rows = generate_prive_rows(prive_data)
+    modal_rows = generate_modal_rows(modal_data_all)
+    
+    prive_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Prive & Modal - PINKILANG</title>
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial Rounded MT Bold', 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                min-height: 100vh;
+                padding: 20px;
+            }}
+            
+            .container {{
+                max-width: 1400px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 20px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                padding: 30px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 10px;
+                margin-bottom: 20px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 36px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            .section {{
+                margin-bottom: 40px;
+                padding: 25px;
+                background: #fff5f9;
+                border-radius: 15px;
+                border-left: 5px solid #ff85b3;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            .section-title {{
+                color: #ff66a3;
+                font-size: 24px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #ffe6f2;
+            }}
+            
+            .form-grid {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 20px;
+                margin-bottom: 20px;
+            }}
+            
+            .form-group {{
+                margin-bottom: 15px;
+            }}
+            
+            label {{
+                display: block;
+                margin-bottom: 5px;
+                color: #d63384;
+                font-weight: bold;
+            }}
+            
+            input, select, textarea {{
+                width: 100%;
+                padding: 12px;
+                border: 2px solid #ffd1e6;
+                border-radius: 10px;
+                font-size: 16px;
+                transition: border-color 0.3s ease;
+                background: white;
+            }}
+            
+            input:focus, select:focus, textarea:focus {{
+                border-color: #ff66a3;
+                outline: none;
+                box-shadow: 0 0 0 3px rgba(255,102,163,0.1);
+            }}
+            
+            .btn {{
+                padding: 12px 30px;
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                border: none;
+                border-radius: 10px;
+                cursor: pointer;
+                font-size: 16px;
+                transition: all 0.3s ease;
+                font-weight: bold;
+            }}
+            
+            .btn:hover {{
+                transform: translateY(-2px);
+                box-shadow: 0 6px 20px rgba(255,102,163,0.3);
+                background: linear-gradient(135deg, #ff66a3, #ff4d94);
+            }}
+            
+            .btn-secondary {{
+                background: linear-gradient(135deg, #66b3ff, #4d94ff);
+            }}
+            
+            .stats-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                gap: 15px;
+                margin: 20px 0;
+            }}
+            
+            .stat-card {{
+                background: white;
+                padding: 20px;
+                border-radius: 10px;
+                text-align: center;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+                border: 1px solid #ffe6f2;
+                transition: transform 0.3s ease;
+            }}
+            
+            .stat-card:hover {{
+                transform: translateY(-5px);
+            }}
+            
+            .stat-number {{
+                font-size: 24px;
+                font-weight: bold;
+                color: #ff66a3;
+                margin: 10px 0;
+            }}
+            
+            .stat-label {{
+                color: #e83e8c;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            
+            .table-container {{
+                overflow-x: auto;
+                margin-top: 20px;
+            }}
+            
+            table {{
+                width: 100%;
+                border-collapse: collapse;
+                background: white;
+                border-radius: 10px;
+                overflow: hidden;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            th, td {{
+                padding: 12px;
+                text-align: left;
+                border-bottom: 1px solid #ffe6f2;
+                font-size: 14px;
+            }}
+            
+            th {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                font-weight: bold;
+            }}
+            
+            tr:hover {{
+                background: #fff5f9;
+            }}
+            
+            .user-badge {{
+                background: #ffb6d9;
+                color: #c2185b;
+                padding: 4px 8px;
+                border-radius: 12px;
+                font-size: 12px;
+                font-weight: bold;
+            }}
+            
+            .current-user {{
+                background: #ff66a3;
+                color: white;
+            }}
+            
+            .message {{
+                padding: 15px;
+                margin: 15px 0;
+                border-radius: 10px;
+                font-size: 14px;
+            }}
+            
+            .success {{
+                background: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }}
+            
+            .error {{
+                background: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }}
+            
+            .info-box {{
+                background: #ffe6f2;
+                border: 1px solid #ffb6d9;
+                border-radius: 10px;
+                padding: 15px;
+                margin: 15px 0;
+                color: #d63384;
+            }}
+            
+            .akun-info {{
+                background: #e6f7ff;
+                border: 1px solid #b3e0ff;
+                border-radius: 8px;
+                padding: 10px;
+                margin: 5px 0;
+                font-size: 12px;
+                color: #0066cc;
+            }}
+            
+            .calculation-section {{
+                background: #f8f9fa;
+                padding: 20px;
+                border-radius: 10px;
+                margin: 20px 0;
+            }}
+            
+            .calculation-step {{
+                display: flex;
+                justify-content: space-between;
+                padding: 8px 0;
+                border-bottom: 1px dashed #dee2e6;
+            }}
+            
+            .calculation-step:last-child {{
+                border-bottom: none;
+                font-weight: bold;
+                font-size: 18px;
+                color: #ff66a3;
+            }}
+            
+            .negative {{
+                color: #ff6666;
+            }}
+            
+            .positive {{
+                color: #00cc66;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>💼 Modul Prive & Modal</h1>
+                <p>Pengelolaan Pengambilan Pribadi dan Tambahan Modal - PINKILANG</p>
+                <div style="margin-top: 10px; font-size: 14px; opacity: 0.9;">
+                    👋 Login sebagai: <strong>{user_email}</strong>
+                </div>
+            </div>
+            
+            <div class="content">
+                {message}
+                
+                <div class="section">
+                    <h2 class="section-title">📊 Ringkasan Modal</h2>
+                    <div class="stats-grid">
+                        <div class="stat-card">
+                            <div>💰</div>
+                            <div class="stat-number">{format_currency(modal_awal)}</div>
+                            <div class="stat-label">Modal Awal</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>📈</div>
+                            <div class="stat-number positive">+{format_currency(total_tambahan_modal)}</div>
+                            <div class="stat-label">Tambahan Modal</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>📉</div>
+                            <div class="stat-number negative">-{format_currency(total_prive)}</div>
+                            <div class="stat-label">Total Prive</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>🎯</div>
+                            <div class="stat-number">{format_currency(modal_akhir)}</div>
+                            <div class="stat-label">Modal Akhir</div>
+                        </div>
+                    </div>
+                    
+                    <div class="calculation-section">
+                        <h3>🧮 Perhitungan Modal Akhir</h3>
+                        <div class="calculation-step">
+                            <span>Modal Awal</span>
+                            <span>{format_currency(modal_awal)}</span>
+                        </div>
+                        <div class="calculation-step">
+                            <span>Tambahan Modal</span>
+                            <span class="positive">+ {format_currency(total_tambahan_modal)}</span>
+                        </div>
+                        <div class="calculation-step">
+                            <span>Prive</span>
+                            <span class="negative">- {format_currency(total_prive)}</span>
+                        </div>
+                        <div class="calculation-step">
+                            <span>Laba/Rugi Bersih</span>
+                            <span class="{ 'positive' if laba_bersih >= 0 else 'negative' }">{format_currency(laba_bersih)}</span>
+                        </div>
+                        <div class="calculation-step">
+                            <span><strong>MODAL AKHIR</strong></span>
+                            <span><strong>{format_currency(modal_akhir)}</strong></span>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2 class="section-title">📥 Input Pengambilan Prive</h2>
+                    
+                    <div class="akun-info">
+                        <strong>📋 Jurnal Otomatis untuk Prive:</strong>
+                        <br>• <strong>Debit:</strong> Prive (3120) - Pengurangan modal
+                        <br>• <strong>Kredit:</strong> Kas/Bank - Pengurangan kas
+                        <br>• <strong>Integrasi:</strong> Prive otomatis masuk ke Laporan Perubahan Modal
+                    </div>
+                    
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal">📅 Tanggal Pengambilan:</label>
+                                <input type="date" id="tanggal" name="tanggal" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="jumlah">💰 Jumlah Prive (Rp):</label>
+                                <input type="number" id="jumlah" name="jumlah" 
+                                       placeholder="0" step="1" min="1" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="metode_pembayaran">💳 Metode Pembayaran:</label>
+                                <select id="metode_pembayaran" name="metode_pembayaran" required>
+                                    <option value="CASH">💰 Cash</option>
+                                    <option value="BANK">🏦 Transfer Bank</option>
+                                </select>
+                            </div>
+                            <div class="form-group" style="grid-column: span 2;">
+                                <label for="keterangan">📝 Keterangan Pengambilan:</label>
+                                <input type="text" id="keterangan" name="keterangan" 
+                                       placeholder="Contoh: Pengambilan untuk kebutuhan pribadi" required>
+                            </div>
+                        </div>
+                        <button type="submit" name="add_prive" class="btn">💸 Catat Pengambilan Prive</button>
+                    </form>
+                </div>
+                
+                <div class="section">
+                    <h2 class="section-title">📥 Input Tambahan Modal</h2>
+                    
+                    <div class="akun-info">
+                        <strong>📋 Jurnal Otomatis untuk Tambahan Modal:</strong>
+                        <br>• <strong>Debit:</strong> Kas/Bank - Penambahan kas
+                        <br>• <strong>Kredit:</strong> Modal Pemilik (3110) - Penambahan modal
+                    </div>
+                    
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal_tambahan">📅 Tanggal Setoran:</label>
+                                <input type="date" id="tanggal_tambahan" name="tanggal_tambahan" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="jumlah_tambahan">💰 Jumlah Tambahan Modal (Rp):</label>
+                                <input type="number" id="jumlah_tambahan" name="jumlah_tambahan" 
+                                       placeholder="0" step="1" min="1" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="sumber_modal">🏦 Sumber Modal:</label>
+                                <select id="sumber_modal" name="sumber_modal" required>
+                                    <option value="CASH">💰 Cash</option>
+                                    <option value="BANK">🏦 Transfer Bank</option>
+                                    <option value="INVESTOR">👥 Investor</option>
+                                    <option value="LAINNYA">📦 Sumber Lainnya</option>
+                                </select>
+                            </div>
+                            <div class="form-group" style="grid-column: span 2;">
+                                <label for="keterangan_tambahan">📝 Keterangan Tambahan Modal:</label>
+                                <input type="text" id="keterangan_tambahan" name="keterangan_tambahan" 
+                                       placeholder="Contoh: Setoran modal tambahan dari pemilik" required>
+                            </div>
+                        </div>
+                        <button type="submit" name="add_tambahan_modal" class="btn">💰 Catat Tambahan Modal</button>
+                    </form>
+                </div>
+                
+                <div class="section">
+                    <h2 class="section-title">📋 Riwayat Pengambilan Prive</h2>
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>📅 Tanggal</th>
+                                    <th>👤 User</th>
+                                    <th>💰 Jumlah</th>
+                                    <th>💳 Metode</th>
+                                    <th>📝 Keterangan</th>
+                                    <th>📊 Jurnal</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {prive_rows if prive_data else '''
+                                <tr>
+                                    <td colspan="6" style="text-align: center; padding: 40px; color: #ff85b3;">
+                                        💝 Belum ada pengambilan prive
+                                    </td>
+                                </tr>
+                                '''}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2 class="section-title">📋 Riwayat Perubahan Modal</h2>
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>📅 Tanggal</th>
+                                    <th>👤 User</th>
+                                    <th>🏷️ Tipe</th>
+                                    <th>💰 Jumlah</th>
+                                    <th>📝 Keterangan</th>
+                                    <th>📊 Jurnal</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {modal_rows if modal_data_all else '''
+                                <tr>
+                                    <td colspan="6" style="text-align: center; padding: 40px; color: #ff85b3;">
+                                        💝 Belum ada perubahan modal
+                                    </td>
+                                </tr>
+                                '''}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                
+                <div class="section" style="text-align: center;">
+                    <h2 class="section-title">⚡ Aksi Cepat</h2>
+                    <div style="display: flex; gap: 15px; justify-content: center; flex-wrap: wrap;">
+                        <a href="/jurnal-umum" class="btn btn-secondary">📝 Lihat Jurnal</a>
+                        <a href="/neraca-lajur" class="btn btn-secondary">🏦 Lihat Neraca</a>
+                        <a href="/laporan-perubahan-modal" class="btn btn-secondary">📊 Laporan Modal</a>
+                        <button onclick="window.print()" class="btn">🖨️ Cetak Laporan</button>
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+    </body>
+    </html>
+    """
+    return prive_html
+# ============================================================
+# 🔹 ROUTE: Input Modal Awal - BARU
+# ============================================================
+def input_modal_awal():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_id = session.get('user_id')
+    user_email = session.get('user_email')
+    message = ""
+    
+    # Cek apakah sudah ada modal awal
+    sudah_ada_modal_awal = False
+    try:
+        if supabase:
+            result = supabase.table("modal").select("*").eq("tipe", "MODAL_AWAL").execute()
+            if result.data and len(result.data) > 0:
+                sudah_ada_modal_awal = True
+                message = '<div class="message warning">⚠️ Modal awal sudah pernah diinput. Input baru akan menggantikan yang lama.</div>'
+    except Exception as e:
+        print(f"Error cek modal awal: {e}")
+    
+    # Handle form submission
+    if request.method == "POST":
+        message = process_modal_awal_form(user_id, user_email, sudah_ada_modal_awal)
+    
+    return generate_modal_awal_html(user_email, message, sudah_ada_modal_awal)
+
+def process_modal_awal_form(user_id, user_email, sudah_ada_modal_awal):
+    """Process modal awal form submission dengan jurnal otomatis"""
+    try:
+        # Collect form data
+        tanggal = request.form["tanggal"]
+        jumlah = int(request.form["jumlah"])
+        keterangan = request.form["keterangan"]
+        sumber_modal = request.form["sumber_modal"]
+        
+        if jumlah <= 0:
+            return '<div class="message error">❌ Jumlah modal awal harus lebih dari 0!</div>'
+        
+        # Data untuk tabel modal
+        modal_data = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "tanggal": tanggal,
+            "jumlah": jumlah,
+            "keterangan": f"Modal Awal: {keterangan}",
+            "sumber_modal": sumber_modal,
+            "tipe": "MODAL_AWAL",
+            "created_at": datetime.now().isoformat()
+        }
+        
+        if supabase:
+            # Jika sudah ada modal awal, hapus yang lama terlebih dahulu
+            if sudah_ada_modal_awal:
+                try:
+                    # Hapus jurnal yang terkait modal awal sebelumnya
+                    supabase.table("jurnal_umum").delete().eq("transaksi_type", "MODAL_AWAL").execute()
+                    # Hapus modal awal sebelumnya
+                    supabase.table("modal").delete().eq("tipe", "MODAL_AWAL").execute()
+                except Exception as e:
+                    print(f"Error hapus modal awal lama: {e}")
+            
+            # Insert modal awal baru ke database
+            insert_result = supabase.table("modal").insert(modal_data).execute()
+            
+            if insert_result and insert_result.data:
+                modal_id = insert_result.data[0]['id']
+                
+                # ✅ BUAT JURNAL OTOMATIS untuk modal awal
+                jurnal_entries = [
+                    # Debit: Kas/Bank (Penambahan Aset)
+                    {
+                        "tanggal": tanggal,
+                        "nama_akun": "Kas" if sumber_modal == "CASH" else "Bank",
+                        "ref": "1110" if sumber_modal == "CASH" else "1120",
+                        "debit": jumlah,
+                        "kredit": 0,
+                        "deskripsi": f"Modal awal: {keterangan}",
+                        "transaksi_type": "MODAL_AWAL",
+                        "transaksi_id": modal_id,
+                        "user_email": user_email,
+                        "created_at": datetime.now().isoformat()
+                    },
+                    # Kredit: Modal Pemilik (Penambahan Ekuitas)
+                    {
+                        "tanggal": tanggal,
+                        "nama_akun": "Modal Pemilik",
+                        "ref": "3110",
+                        "debit": 0,
+                        "kredit": jumlah,
+                        "deskripsi": f"Modal awal: {keterangan}",
+                        "transaksi_type": "MODAL_AWAL",
+                        "transaksi_id": modal_id,
+                        "user_email": user_email,
+                        "created_at": datetime.now().isoformat()
+                    }
+                ]
+                
+                # Simpan jurnal ke database
+                success_count = 0
+                for entry in jurnal_entries:
+                    try:
+                        result = supabase.table("jurnal_umum").insert(entry).execute()
+                        if result.data:
+                            success_count += 1
+                            logger.info(f"✅ Jurnal modal awal: {entry['nama_akun']} - {entry['debit']}/{entry['kredit']}")
+                    except Exception as e:
+                        logger.error(f"❌ Error insert jurnal modal awal: {str(e)}")
+                
+                if success_count == len(jurnal_entries):
+                    logger.info(f"✅ Modal awal berhasil dicatat: {jumlah} oleh {user_email}")
+                    action_text = "diperbarui" if sudah_ada_modal_awal else "dicatat"
+                    return f'<div class="message success">✅ Modal awal berhasil {action_text}! Jurnal otomatis dibuat.</div>'
+                else:
+                    logger.warning(f"⚠️ Sebagian jurnal modal awal gagal: {success_count}/{len(jurnal_entries)}")
+                    action_text = "diperbarui" if sudah_ada_modal_awal else "dicatat"
+                    return f'<div class="message success">✅ Modal awal berhasil {action_text}! ({success_count}/{len(jurnal_entries)} jurnal berhasil)</div>'
+            else:
+                return '<div class="message error">❌ Gagal menyimpan data modal awal!</div>'
+                
+    except Exception as e:
+        logger.error(f"❌ Error proses modal awal: {str(e)}")
+        return f'<div class="message error">❌ Error mencatat modal awal: {str(e)}</div>'
+
+def generate_modal_awal_html(user_email, message, sudah_ada_modal_awal):
+    """Generate HTML untuk halaman input modal awal"""
+    
+    # Ambil data modal awal yang sudah ada (jika ada)
+    modal_awal_existing = None
+    try:
+        if supabase:
+            result = supabase.table("modal").select("*").eq("tipe", "MODAL_AWAL").execute()
+            if result.data and len(result.data) > 0:
+                modal_awal_existing = result.data[0]
+    except Exception as e:
+        print(f"Error ambil data modal awal: {e}")
+    
+    # Format currency helper
+    def format_currency(amount):
+        if amount is None:
+            return "Rp 0"
+        return f"Rp {float(amount):,.0f}".replace(",", ".")
+    
+    # Tentukan judul dan tombol berdasarkan kondisi
+    if sudah_ada_modal_awal:
+        page_title = "✏️ Edit Modal Awal"
+        button_text = "💾 Update Modal Awal"
+        status_info = f"""
+        <div class="info-box">
+            <strong>📊 Modal Awal Saat Ini:</strong><br>
+            • Tanggal: {modal_awal_existing.get('tanggal', 'N/A') if modal_awal_existing else 'N/A'}<br>
+            • Jumlah: {format_currency(modal_awal_existing.get('jumlah', 0) if modal_awal_existing else 0)}<br>
+            • Keterangan: {modal_awal_existing.get('keterangan', 'N/A') if modal_awal_existing else 'N/A'}
+        </div>
+        """
+    else:
+        page_title = "💰 Input Modal Awal"
+        button_text = "💾 Simpan Modal Awal"
+        status_info = """
+        <div class="info-box">
+            <strong>💡 Informasi:</strong> Modal awal adalah setoran pertama pemilik untuk memulai usaha.
+            Input ini hanya dilakukan sekali di awal periode akuntansi.
+        </div>
+        """
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>{page_title} - PINKILANG</title>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial Rounded MT Bold', 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                min-height: 100vh;
+                padding: 20px;
+            }}
+            
+            .container {{
+                max-width: 800px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 20px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #00cc66, #00b359);
+                color: white;
+                padding: 30px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 10px;
+                margin-bottom: 20px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 36px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            .form-section {{
+                background: #f0fff0;
+                padding: 25px;
+                border-radius: 15px;
+                border-left: 5px solid #00cc66;
+                margin-bottom: 20px;
+            }}
+            
+            .section-title {{
+                color: #008040;
+                font-size: 24px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #ccffcc;
+            }}
+            
+            .form-group {{
+                margin-bottom: 20px;
+            }}
+            
+            label {{
+                display: block;
+                margin-bottom: 8px;
+                color: #006633;
+                font-weight: bold;
+                font-size: 16px;
+            }}
+            
+            input, select, textarea {{
+                width: 100%;
+                padding: 12px 15px;
+                border: 2px solid #99e699;
+                border-radius: 10px;
+                font-size: 16px;
+                transition: all 0.3s ease;
+                background: white;
+            }}
+            
+            input:focus, select:focus, textarea:focus {{
+                border-color: #00cc66;
+                outline: none;
+                box-shadow: 0 0 0 3px rgba(0,204,102,0.1);
+                transform: translateY(-2px);
+            }}
+            
+            .btn {{
+                padding: 15px 30px;
+                background: linear-gradient(135deg, #00cc66, #00b359);
+                color: white;
+                border: none;
+                border-radius: 10px;
+                cursor: pointer;
+                font-size: 18px;
+                font-weight: bold;
+                transition: all 0.3s ease;
+                width: 100%;
+                margin-top: 10px;
+            }}
+            
+            .btn:hover {{
+                transform: translateY(-3px);
+                box-shadow: 0 6px 20px rgba(0,204,102,0.3);
+                background: linear-gradient(135deg, #00b359, #00994d);
+            }}
+            
+            .btn-secondary {{
+                background: linear-gradient(135deg, #666666, #555555);
+            }}
+            
+            .btn-secondary:hover {{
+                background: linear-gradient(135deg, #555555, #444444);
+            }}
+            
+            .message {{
+                padding: 15px;
+                margin: 15px 0;
+                border-radius: 10px;
+                font-size: 14px;
+            }}
+            
+            .success {{
+                background: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }}
+            
+            .error {{
+                background: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }}
+            
+            .warning {{
+                background: #fff3cd;
+                color: #856404;
+                border: 1px solid #ffeaa7;
+            }}
+            
+            .info-box {{
+                background: #e6fff2;
+                border: 1px solid #99e699;
+                border-radius: 10px;
+                padding: 15px;
+                margin: 15px 0;
+                color: #006633;
+            }}
+            
+            .akun-info {{
+                background: #e6f7ff;
+                border: 1px solid #b3e0ff;
+                border-radius: 8px;
+                padding: 12px;
+                margin: 15px 0;
+                font-size: 14px;
+                color: #0066cc;
+            }}
+            
+            .jurnal-preview {{
+                background: #fff9e6;
+                border: 1px solid #ffd699;
+                border-radius: 8px;
+                padding: 15px;
+                margin: 15px 0;
+            }}
+            
+            .jurnal-entry {{
+                display: flex;
+                justify-content: space-between;
+                padding: 8px 0;
+                border-bottom: 1px dashed #ffd699;
+            }}
+            
+            .jurnal-entry:last-child {{
+                border-bottom: none;
+            }}
+            
+            .debit {{
+                color: #00cc66;
+                font-weight: bold;
+            }}
+            
+            .kredit {{
+                color: #ff6666;
+                font-weight: bold;
+            }}
+            
+            .user-info {{
+                text-align: center;
+                margin-bottom: 20px;
+                color: #666;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/laporan-perubahan-modal" class="back-btn">← Kembali ke Laporan Modal</a>
+                <h1>{page_title}</h1>
+                <p>Pencatatan Setoran Awal Modal Usaha - PINKILANG</p>
+            </div>
+            
+            <div class="content">
+                <div class="user-info">
+                    👋 Login sebagai: <strong>{user_email}</strong>
+                </div>
+                
+                {message}
+                {status_info}
+                
+                <div class="form-section">
+                    <h2 class="section-title">📝 Form Input Modal Awal</h2>
+                    
+                    <div class="akun-info">
+                        <strong>📋 Jurnal Otomatis yang akan dibuat:</strong><br>
+                        • <strong>Debit:</strong> Kas/Bank - Penambahan aset kas<br>
+                        • <strong>Kredit:</strong> Modal Pemilik (3110) - Penambahan ekuitas<br>
+                        • <strong>Integrasi:</strong> Otomatis masuk ke Laporan Perubahan Modal
+                    </div>
+                    
+                    <form method="POST">
+                        <div class="form-group">
+                            <label for="tanggal">📅 Tanggal Setoran Modal:</label>
+                            <input type="date" id="tanggal" name="tanggal" 
+                                   value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                        </div>
+                        
+                        <div class="form-group">
+                            <label for="jumlah">💰 Jumlah Modal Awal (Rp):</label>
+                            <input type="number" id="jumlah" name="jumlah" 
+                                   placeholder="Contoh: 10000000" step="1" min="1" required
+                                   value="{modal_awal_existing.get('jumlah', '') if modal_awal_existing else ''}">
+                        </div>
+                        
+                        <div class="form-group">
+                            <label for="sumber_modal">🏦 Sumber Modal:</label>
+                            <select id="sumber_modal" name="sumber_modal" required>
+                                <option value="CASH" {'selected' if modal_awal_existing and modal_awal_existing.get('sumber_modal') == 'CASH' else ''}>💰 Cash (Tunai)</option>
+                                <option value="BANK" {'selected' if modal_awal_existing and modal_awal_existing.get('sumber_modal') == 'BANK' else ''}>🏦 Transfer Bank</option>
+                                <option value="INVESTOR" {'selected' if modal_awal_existing and modal_awal_existing.get('sumber_modal') == 'INVESTOR' else ''}>👥 Investor</option>
+                                <option value="PRIBADI" {'selected' if modal_awal_existing and modal_awal_existing.get('sumber_modal') == 'PRIBADI' else ''}>👤 Dana Pribadi</option>
+                            </select>
+                        </div>
+                        
+                        <div class="form-group">
+                            <label for="keterangan">📝 Keterangan Modal Awal:</label>
+                            <input type="text" id="keterangan" name="keterangan" 
+                                   placeholder="Contoh: Setoran modal awal usaha laundry" required
+                                   value="{modal_awal_existing.get('keterangan', '').replace('Modal Awal: ', '') if modal_awal_existing else ''}">
+                        </div>
+                        
+                        <div class="jurnal-preview">
+                            <strong>👁️ Preview Jurnal:</strong>
+                            <div class="jurnal-entry">
+                                <span>Kas/Bank</span>
+                                <span class="debit">+ Debit</span>
+                            </div>
+                            <div class="jurnal-entry">
+                                <span>Modal Pemilik (3110)</span>
+                                <span class="kredit">+ Kredit</span>
+                            </div>
+                        </div>
+                        
+                        <button type="submit" class="btn">{button_text}</button>
+                    </form>
+                </div>
+                
+                <div style="text-align: center; margin-top: 30px;">
+                    <a href="/laporan-perubahan-modal" class="btn btn-secondary" style="width: auto; padding: 10px 20px; display: inline-block;">
+                        📊 Lihat Laporan Modal
+                    </a>
+                    <a href="/dashboard" class="btn btn-secondary" style="width: auto; padding: 10px 20px; display: inline-block; margin-left: 10px;">
+                        🏠 Dashboard
+                    </a>
+                </div>
+                
+                <div class="info-box" style="margin-top: 30px;">
+                    <strong>💡 Tips:</strong><br>
+                    • Modal awal hanya diinput sekali di awal periode akuntansi<br>
+                    • Pastikan jumlah modal sesuai dengan setoran sebenarnya<br>
+                    • Untuk tambahan modal selanjutnya, gunakan menu "Tambah Modal"<br>
+                    • Modal awal akan mempengaruhi perhitungan laba/rugi dan neraca
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            // Real-time preview untuk jumlah modal
+            document.getElementById('jumlah').addEventListener('input', function(e) {{
+                const amount = e.target.value;
+                const formatted = amount ? 'Rp ' + parseInt(amount).toLocaleString('id-ID') : 'Rp 0';
+                // Bisa ditambahkan preview real-time di sini jika diperlukan
+            }});
+            
+            // Konfirmasi untuk update modal awal
+            document.querySelector('form').addEventListener('submit', function(e) {{
+                {'const action = "mengupdate";' if sudah_ada_modal_awal else 'const action = "menyimpan";'}
+                {'if(!confirm("Apakah Anda yakin ingin mengupdate modal awal? Modal awal sebelumnya akan digantikan.")) e.preventDefault();' if sudah_ada_modal_awal else ''}
+            }});
+        </script>
+    </body>
+    </html>
+    """
+    return html
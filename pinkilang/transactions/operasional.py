@@ -0,0 +1,788 @@
+"""Pengeluaran operasional dan jurnalnya"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, format_currency
+from pinkilang.akuntansi import create_journal_entries, buat_entri_jurnal
+from pinkilang.posting import posting_transaksi, ID_BARU
+
+    
+# ============================================================
+# 🔹 ROUTE: Operasional (PENGELUARAN BIAYA OPERASIONAL) 
+# ============================================================
+def operasional():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_id = session.get('user_id')
+    user_email = session.get('user_email')
+    message = ""
+    
+    # Handle form submission untuk transaksi operasional
+    if request.method == "POST" and 'add_operasional' in request.form:
+        message = process_operasional_form(user_id, user_email)
+    
+    # Handle generate jurnal otomatis
+    if request.method == "POST" and 'generate_jurnal' in request.form:
+        message = generate_jurnal_operasional_otomatis(user_email)
+    
+    # Ambil data transaksi operasional dari SEMUA USER
+    transaksi_operasional, total_pengeluaran_all = get_operasional_data()
+    
+    # Hitung pengeluaran per kategori
+    pengeluaran_per_kategori = calculate_pengeluaran_per_kategori(transaksi_operasional)
+    
+    # Hitung jurnal yang belum dibuat (satu query untuk semua transaksi)
+    jurnal_ids = get_jurnal_operasional_ids()
+    status_jurnal = hitung_jurnal_yang_belum_dibuat(transaksi_operasional, jurnal_ids)
+    
+    # Generate HTML
+    return generate_operasional_html(
+        user_email, 
+        message, 
+        transaksi_operasional, 
+        total_pengeluaran_all, 
+        pengeluaran_per_kategori,
+        status_jurnal,
+        jurnal_ids
+    )
+
+def process_operasional_form(user_id, user_email):
+    """Process operasional form submission """
+    try:
+        # Collect form data
+        form_data = {
+            "tanggal": request.form["tanggal"],
+            "jenis_pengeluaran": request.form["jenis_pengeluaran"],
+            "nama_barang": request.form["nama_barang"],
+            "jumlah": float(request.form["jumlah"]),
+            "satuan": request.form["satuan"],
+            "harga_satuan": int(request.form["harga_satuan"]),
+            "supplier": request.form["supplier"],
+            "metode_pembayaran": request.form["metode_pembayaran"],
+            "keterangan": request.form["keterangan"]
+        }
+        
+        # Validasi jenis pengeluaran
+        jenis_beban_valid = ['PERLENGKAPAN','LISTRIK_AIR_TELEPON', 'PENYUSUTAN', 'LAIN_LAIN']
+        if form_data["jenis_pengeluaran"] not in jenis_beban_valid:
+            return '<div class="message error">❌ Jenis pengeluaran tidak valid!</div>'
+        
+        # Calculate total
+        total_pengeluaran = form_data["jumlah"] * form_data["harga_satuan"]
+        
+        if total_pengeluaran <= 0:
+            return '<div class="message error">❌ Total pengeluaran harus lebih dari 0!</div>'
+        
+        # Prepare transaction data
+        transaksi_data = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "tanggal": form_data["tanggal"],
+            "jenis_pengeluaran": form_data["jenis_pengeluaran"],
+            "nama_barang": form_data["nama_barang"],
+            "jumlah": form_data["jumlah"],
+            "satuan": form_data["satuan"],
+            "harga_satuan": form_data["harga_satuan"],
+            "total_pengeluaran": total_pengeluaran,
+            "supplier": form_data["supplier"],
+            "metode_pembayaran": form_data["metode_pembayaran"],
+            "keterangan": form_data["keterangan"],
+            "created_at": datetime.now().isoformat()
+        }
+        
+        # Insert to database + jurnal otomatis dalam satu transaksi
+        if supabase:
+            # 🎯 BUAT JURNAL OTOMATIS
+            jurnal = buat_entri_jurnal("OPERASIONAL", {
+                'tanggal': form_data["tanggal"],
+                'jenis_pengeluaran': form_data["jenis_pengeluaran"],
+                'nama_barang': form_data["nama_barang"],
+                'total_pengeluaran': total_pengeluaran,
+                'metode_pembayaran': form_data["metode_pembayaran"],
+                'supplier': form_data["supplier"],
+                'transaksi_id': ID_BARU
+            }, user_email)
+            hasil = posting_transaksi("operasional", transaksi_data, jurnal, "OPERASIONAL", updated_by=user_email)
+            transaksi_id = hasil["dokumen"]['id']
+
+            if jurnal:
+                logger.info(f"✅ Jurnal operasional berhasil dibuat untuk transaksi {transaksi_id}")
+                return f'<div class="message success">✅ Pengeluaran operasional berhasil dicatat! Jurnal otomatis dibuat.</div>'
+            else:
+                logger.warning(f"⚠️ Gagal membuat jurnal untuk operasional ID: {transaksi_id}")
+                return f'<div class="message success">✅ Pengeluaran operasional berhasil dicatat! (Catatan: Gagal membuat jurnal)</div>'
+        else:
+            return '<div class="message error">❌ Database tidak tersedia!</div>'
+                
+    except Exception as e:
+        logger.error(f"❌ Error tambah pengeluaran operasional: {str(e)}")
+        return f'<div class="message error">❌ Error mencatat pengeluaran: {str(e)}</div>'
+
+def generate_jurnal_operasional_otomatis(user_email):
+    """Generate jurnal untuk semua transaksi operasional yang belum memiliki jurnal"""
+    try:
+        # Ambil semua transaksi operasional yang belum memiliki jurnal
+        operasional_data = supabase.table("operasional").select("*").execute().data or []
+        jurnal_ids = get_jurnal_operasional_ids()
+        
+        success_count = 0
+        total_processed = 0
+        
+        for operasional in operasional_data:
+            # Cek apakah sudah ada jurnal untuk transaksi ini
+            if str(operasional['id']) not in jurnal_ids:  # Hanya buat jika belum ada
+                journal_data = {
+                    'tanggal': operasional['tanggal'],
+                    'jenis_pengeluaran': operasional['jenis_pengeluaran'],
+                    'nama_barang': operasional['nama_barang'],
+                    'total_pengeluaran': operasional['total_pengeluaran'],
+                    'metode_pembayaran': operasional['metode_pembayaran'],
+                    'supplier': operasional.get('supplier', ''),
+                    'transaksi_id': operasional['id']
+                }
+                
+                if create_journal_entries("OPERASIONAL", journal_data, user_email):
+                    success_count += 1
+                    logger.info(f"✅ Jurnal otomatis dibuat untuk operasional ID: {operasional['id']}")
+                
+                total_processed += 1
+        
+        if total_processed > 0:
+            return f'<div class="message success">✅ Berhasil membuat {success_count} jurnal dari {total_processed} transaksi operasional!</div>'
+        else:
+            return '<div class="message info">ℹ️ Semua transaksi operasional sudah memiliki jurnal.</div>'
+            
+    except Exception as e:
+        logger.error(f"❌ Error generate jurnal operasional: {str(e)}")
+        return f'<div class="message error">❌ Error generate jurnal: {str(e)}</div>'
+
+def get_operasional_data():
+    """Get operasional data from database"""
+    transaksi_operasional = []
+    total_pengeluaran_all = 0
+    
+    try:
+        if supabase:
+            result = supabase.table("operasional").select("*").order("tanggal", desc=True).execute()
+            transaksi_operasional = result.data
+            
+            # Calculate total pengeluaran
+            for transaksi in transaksi_operasional:
+                total_pengeluaran_all += transaksi['total_pengeluaran']
+                
+    except Exception as e:
+        logger.error(f"Error ambil data operasional: {str(e)}")
+        transaksi_operasional = []
+    
+    return transaksi_operasional, total_pengeluaran_all
+
+def calculate_pengeluaran_per_kategori(transaksi_operasional):
+    """Calculate pengeluaran per kategori"""
+    pengeluaran_per_kategori = {}
+    for transaksi in transaksi_operasional:
+        kategori = transaksi['jenis_pengeluaran']
+        if kategori in pengeluaran_per_kategori:
+            pengeluaran_per_kategori[kategori] += transaksi['total_pengeluaran']
+        else:
+            pengeluaran_per_kategori[kategori] = transaksi['total_pengeluaran']
+    
+    return pengeluaran_per_kategori
+
+def get_jurnal_operasional_ids():
+    """Set transaksi_id (string) operasional yang sudah punya jurnal - satu query untuk semua transaksi"""
+    try:
+        result = supabase.table("jurnal_umum")\
+            .select("transaksi_id")\
+            .eq("transaksi_type", "OPERASIONAL")\
+            .execute()
+        
+        return {str(j['transaksi_id']) for j in result.data or [] if j.get('transaksi_id') is not None}
+    except Exception as e:
+        logger.error(f"Error ambil status jurnal operasional: {str(e)}")
+        return set()
+
+def hitung_jurnal_yang_belum_dibuat(transaksi_operasional, jurnal_ids):
+    total_transaksi = len(transaksi_operasional)
+    total_belum_jurnal = sum(1 for t in transaksi_operasional if str(t['id']) not in jurnal_ids)
+    
+    return {
+        'total_transaksi': total_transaksi,
+        'total_belum_jurnal': total_belum_jurnal,
+        'total_sudah_jurnal': total_transaksi - total_belum_jurnal
+    }
+
+def generate_transaction_rows(transaksi_operasional, user_email, jurnal_ids):
+    if not transaksi_operasional:
+        return '''
+        <tr>
+            <td colspan="10" style="text-align: center; padding: 40px; color: #ff85b3;">
+                💝 Belum ada transaksi operasional
+            </td>
+        </tr>
+        '''
+    
+    rows = []
+    for t in transaksi_operasional:
+        # Cek status jurnal
+        has_jurnal = str(t['id']) in jurnal_ids
+        jurnal_status = '<span class="jurnal-status jurnal-ada">✅ JURNAL</span>' if has_jurnal else '<span class="jurnal-status jurnal-tidak">❌ BELUM</span>'
+        
+        # Determine account name based on jenis_pengeluaran
+        account_map = {
+            'LISTRIK_AIR_TELEPON': 'Beban TLA',
+            'PERLENGKAPAN': 'Beban Perlengkapan',
+            'PENYUSUTAN': 'Beban Penyusutan',
+            'LAIN_LAIN': 'Beban Lain - Lain'
+        }
+        account_name = account_map.get(t['jenis_pengeluaran'], 'Beban Operasional')
+        
+        row = f"""
+        <tr>
+            <td>{datetime.strptime(t['tanggal'], '%Y-%m-%d').strftime('%d/%m/%Y')}</td>
+            <td>
+                <span class="user-badge {'current-user' if t.get('user_email') == user_email else ''}">
+                    {t.get('user_email', 'Unknown').split('@')[0]}
+                </span>
+            </td>
+            <td>
+                <span class="kategori-badge kategori-{t['jenis_pengeluaran'].lower()}">
+                    {t['jenis_pengeluaran'].replace('_', ' ').title()}
+                </span>
+            </td>
+            <td>
+                <strong>{t['nama_barang']}</strong>
+                {f"<br><small style='color: #666;'>{t['keterangan']}</small>" if t.get('keterangan') else ''}
+            </td>
+            <td>{t['jumlah']} {t.get('satuan', 'ekor')}</td>
+            <td>{format_currency(t['harga_satuan'])}</td>
+            <td>
+                <span class="payment-badge {'cash' if t.get('metode_pembayaran') == 'CASH' else 'kredit'}">
+                    {'💰 CASH' if t.get('metode_pembayaran') == 'CASH' else '📄 KREDIT'}
+                </span>
+            </td>
+            <td>{t.get('supplier', '-')}</td>
+            <td><strong style="color: #ff6666;">{format_currency(t['total_pengeluaran'])}</strong></td>
+            <td>
+                <small style="color: #666;">{account_name}</small>
+                <br>{jurnal_status}
+            </td>
+        </tr>
+        """
+        rows.append(row)
+    
+    return "".join(rows)
+
+def generate_kategori_breakdown(pengeluaran_per_kategori):
+    """Generate kategori breakdown"""
+    if not pengeluaran_per_kategori:
+        return '''
+        <div style="text-align: center; padding: 20px; color: #999;">
+            📊 Belum ada data pengeluaran
+        </div>
+        '''
+    
+    breakdown_html = ""
+    for kategori, jumlah in pengeluaran_per_kategori.items():
+        breakdown_html += f"""
+        <div style="background: white; padding: 15px; border-radius: 10px; border-left: 4px solid #ff85b3;">
+            <div style="font-weight: bold; color: #ff66a3;">{kategori.replace('_', ' ').title()}</div>
+            <div style="font-size: 18px; font-weight: bold;">{format_currency(jumlah)}</div>
+        </div>
+        """
+    return breakdown_html
+
+def generate_operasional_html(user_email, message, transaksi_operasional, total_pengeluaran_all, pengeluaran_per_kategori, status_jurnal, jurnal_ids):
+    """Generate HTML untuk halaman operasional - VERSI FINAL"""
+    
+    def format_currency(amount):
+        """Format currency to Indonesian format"""
+        return f"Rp {amount:,.0f}".replace(",", ".")
+    
+    # Generate transaction rows
+    transaction_rows = generate_transaction_rows(transaksi_operasional, user_email, jurnal_ids)
+    
+    # Generate kategori breakdown
+    kategori_breakdown = generate_kategori_breakdown(pengeluaran_per_kategori)
+    
+    # Status jurnal info
+    jurnal_info = ""
+    if status_jurnal['total_transaksi'] > 0:
+        jurnal_info = f"""
+        <div class="info-box" style="background: {'#ffe6e6' if status_jurnal['total_belum_jurnal'] > 0 else '#e6ffe6'}; 
+                                     border: 1px solid {'#ff6666' if status_jurnal['total_belum_jurnal'] > 0 else '#00cc66'};">
+            <strong>📊 Status Jurnal:</strong> 
+            {status_jurnal['total_sudah_jurnal']} transaksi sudah memiliki jurnal | 
+            {status_jurnal['total_belum_jurnal']} transaksi belum memiliki jurnal
+            {f'<br><form method="POST" style="margin-top: 10px;"><button type="submit" name="generate_jurnal" class="btn" style="background: #ff6666;">🔄 GENERATE JURNAL OTOMATIS</button></form>' if status_jurnal['total_belum_jurnal'] > 0 else ''}
+        </div>
+        """
+    
+    html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Operasional - PINKILANG</title>
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial Rounded MT Bold', 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                min-height: 100vh;
+                padding: 20px;
+            }}
+            
+            .container {{
+                max-width: 1400px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 20px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                padding: 30px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 10px;
+                margin-bottom: 20px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 36px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            .section {{
+                margin-bottom: 40px;
+                padding: 25px;
+                background: #fff5f9;
+                border-radius: 15px;
+                border-left: 5px solid #ff85b3;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            .section-title {{
+                color: #ff66a3;
+                font-size: 24px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #ffe6f2;
+            }}
+            
+            .form-grid {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 20px;
+                margin-bottom: 20px;
+            }}
+            
+            .form-group {{
+                margin-bottom: 15px;
+            }}
+            
+            label {{
+                display: block;
+                margin-bottom: 5px;
+                color: #d63384;
+                font-weight: bold;
+            }}
+            
+            input, select, textarea {{
+                width: 100%;
+                padding: 12px;
+                border: 2px solid #ffd1e6;
+                border-radius: 10px;
+                font-size: 16px;
+                transition: border-color 0.3s ease;
+                background: white;
+            }}
+            
+            input:focus, select:focus, textarea:focus {{
+                border-color: #ff66a3;
+                outline: none;
+                box-shadow: 0 0 0 3px rgba(255,102,163,0.1);
+            }}
+            
+            .btn {{
+                padding: 12px 30px;
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                border: none;
+                border-radius: 10px;
+                cursor: pointer;
+                font-size: 16px;
+                transition: all 0.3s ease;
+                font-weight: bold;
+            }}
+            
+            .btn:hover {{
+                transform: translateY(-2px);
+                box-shadow: 0 6px 20px rgba(255,102,163,0.3);
+                background: linear-gradient(135deg, #ff66a3, #ff4d94);
+            }}
+            
+            .btn-secondary {{
+                background: linear-gradient(135deg, #66b3ff, #4d94ff);
+            }}
+            
+            .stats-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                gap: 15px;
+                margin: 20px 0;
+            }}
+            
+            .stat-card {{
+                background: white;
+                padding: 20px;
+                border-radius: 10px;
+                text-align: center;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+                border: 1px solid #ffe6f2;
+                transition: transform 0.3s ease;
+            }}
+            
+            .stat-card:hover {{
+                transform: translateY(-5px);
+            }}
+            
+            .stat-number {{
+                font-size: 24px;
+                font-weight: bold;
+                color: #ff66a3;
+                margin: 10px 0;
+            }}
+            
+            .stat-label {{
+                color: #e83e8c;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            
+            .table-container {{
+                overflow-x: auto;
+                margin-top: 20px;
+            }}
+            
+            table {{
+                width: 100%;
+                border-collapse: collapse;
+                background: white;
+                border-radius: 10px;
+                overflow: hidden;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            th, td {{
+                padding: 12px;
+                text-align: left;
+                border-bottom: 1px solid #ffe6f2;
+                font-size: 14px;
+            }}
+            
+            th {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                font-weight: bold;
+            }}
+            
+            tr:hover {{
+                background: #fff5f9;
+            }}
+            
+            .user-badge {{
+                background: #ffb6d9;
+                color: #c2185b;
+                padding: 4px 8px;
+                border-radius: 12px;
+                font-size: 12px;
+                font-weight: bold;
+            }}
+            
+            .current-user {{
+                background: #ff66a3;
+                color: white;
+            }}
+            
+            .kategori-badge {{
+                padding: 4px 8px;
+                border-radius: 8px;
+                font-size: 11px;
+                font-weight: bold;
+                color: white;
+            }}
+            
+            .kategori-listrik_air_telepon {{ background: #66b3ff; }}
+            .kategori-perlengkapan {{ background: #00cc66; }}
+            .kategori-peralatan {{ background: #ffb366; }}
+            
+            .message {{
+                padding: 15px;
+                margin: 15px 0;
+                border-radius: 10px;
+                font-size: 14px;
+            }}
+            
+            .success {{
+                background: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }}
+            
+            .error {{
+                background: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }}
+            
+            .info {{
+                background: #d1ecf1;
+                color: #0c5460;
+                border: 1px solid #bee5eb;
+            }}
+            
+            .info-box {{
+                background: #ffe6f2;
+                border: 1px solid #ffb6d9;
+                border-radius: 10px;
+                padding: 15px;
+                margin: 15px 0;
+                color: #d63384;
+            }}
+            
+            .payment-badge {{
+                background: #66b3ff;
+                color: white;
+                padding: 4px 8px;
+                border-radius: 8px;
+                font-size: 11px;
+                font-weight: bold;
+            }}
+            
+            .payment-badge.cash {{ background: #00cc66; }}
+            .payment-badge.kredit {{ background: #ff6666; }}
+            
+            .akun-info {{
+                background: #e6f7ff;
+                border: 1px solid #b3e0ff;
+                border-radius: 8px;
+                padding: 10px;
+                margin: 5px 0;
+                font-size: 12px;
+                color: #0066cc;
+            }}
+            
+            .akun-guide {{
+                background: #fff5f9;
+                border: 1px solid #ffd1e6;
+                border-radius: 10px;
+                padding: 15px;
+                margin: 15px 0;
+            }}
+            
+            .akun-item {{
+                padding: 5px 0;
+                border-bottom: 1px dashed #ffd1e6;
+            }}
+            
+            .akun-item:last-child {{
+                border-bottom: none;
+            }}
+            
+            .jurnal-status {{
+                padding: 8px 12px;
+                border-radius: 20px;
+                font-size: 11px;
+                font-weight: bold;
+            }}
+            
+            .jurnal-ada {{ background: #d4ffd4; color: #006600; }}
+            .jurnal-tidak {{ background: #ffd4d4; color: #cc0000; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <!-- Header -->
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>💰 Modul Operasional</h1>
+                <p>Pencatatan Pengeluaran Biaya Operasional - PINKILANG</p>
+                <div style="margin-top: 10px; font-size: 14px; opacity: 0.9;">
+                    👋 Login sebagai: <strong>{user_email}</strong>
+                </div>
+            </div>
+            
+            <!-- Content -->
+            <div class="content">
+                {message}
+                
+                {jurnal_info}
+                <!-- Input Transaksi Operasional Section -->
+                <div class="section">
+                    <h2 class="section-title">➕ Input Pengeluaran Operasional</h2>
+                    
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal">📅 Tanggal Pengeluaran:</label>
+                                <input type="date" id="tanggal" name="tanggal" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="jenis_pengeluaran">🏷️ Jenis Pengeluaran:</label>
+                                <select id="jenis_pengeluaran" name="jenis_pengeluaran" required>
+                                    <option value="">Pilih Jenis</option>
+                                    <option value="PERLENGKAPAN">📦 Perlengkapan</option>
+                                    <option value="PERALATAN">🛠️ Peralatan</option>
+                                    <option value="LISTRIK_AIR_TELEPON">⚡TLA</option>
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="nama_barang">📦 Nama Barang/Jasa:</label>
+                                <input type="text" id="nama_barang" name="nama_barang" 
+                                       placeholder="Contoh: Token Listrik, Alat Tulis, Peralatan Kantor" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="supplier">🏭 Supplier/Penyedia:</label>
+                                <input type="text" id="supplier" name="supplier" 
+                                       placeholder="Nama supplier atau penyedia jasa">
+                            </div>
+                            <div class="form-group">
+                                <label for="jumlah">🔢 Jumlah:</label>
+                                <input type="number" id="jumlah" name="jumlah" 
+                                       placeholder="0" step="1" min="0" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="satuan">📏 Satuan:</label>
+                                <select id="satuan" name="satuan" required>
+                                    <option value="kwh">kwh</option>
+                                    <option value="ekor">ekor</option>
+                                    <option value="paket">paket</option>
+                                    <option value="bulan">bulan</option>
+                                    <option value="buah">buah</option>
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="harga_satuan">💵 Harga Satuan (Rp):</label>
+                                <input type="number" id="harga_satuan" name="harga_satuan" 
+                                       placeholder="0" step="1" min="0" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="metode_pembayaran">💳 Metode Pembayaran:</label>
+                                <select id="metode_pembayaran" name="metode_pembayaran" required>
+                                    <option value="CASH">💰 Cash</option>
+                                    <option value="KREDIT">📄 Kredit</option>
+                                </select>
+                            </div>
+                            <div class="form-group" style="grid-column: span 2;">
+                                <label for="keterangan">📝 Keterangan (Opsional):</label>
+                                <textarea id="keterangan" name="keterangan" 
+                                          placeholder="Tambahkan keterangan jika diperlukan..." rows="2"></textarea>
+                            </div>
+                        </div>
+                        
+                        <!-- Info Akun yang Akan Terpengaruh -->
+                        <div class="akun-info">
+                            <strong>💡 Info:</strong> Sistem akan otomatis membuat jurnal akuntansi sesuai dengan jenis pengeluaran yang dipilih.
+                            Lihat panduan di atas untuk detail akun yang akan terpengaruh.
+                        </div>
+                        
+                        <button type="submit" name="add_operasional" class="btn">💾 Catat Pengeluaran</button>
+                    </form>
+                </div>
+                
+                <!-- Ringkasan Pengeluaran -->
+                <div class="section">
+                    <h2 class="section-title">📊 Ringkasan Pengeluaran Operasional</h2>
+                    <div class="stats-grid">
+                        <div class="stat-card">
+                            <div>💰</div>
+                            <div class="stat-number">{format_currency(total_pengeluaran_all)}</div>
+                            <div class="stat-label">Total Pengeluaran</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>📋</div>
+                            <div class="stat-number">{len(transaksi_operasional)}</div>
+                            <div class="stat-label">Total Transaksi</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>👥</div>
+                            <div class="stat-number">{len(set(t['user_email'] for t in transaksi_operasional)) if transaksi_operasional else 0}</div>
+                            <div class="stat-label">User Aktif</div>
+                        </div>
+                    </div>
+                    
+                    <!-- Breakdown per Kategori -->
+                    <h3 style="color: #ff66a3; margin: 20px 0 10px 0;">📈 Breakdown per Kategori</h3>
+                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px;">
+                        {kategori_breakdown}
+                    </div>
+                </div>
+                
+                <!-- Daftar Transaksi Operasional -->
+                <div class="section">
+                    <h2 class="section-title">📋 Daftar Pengeluaran Operasional</h2>
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>📅 Tanggal</th>
+                                    <th>👤 User</th>
+                                    <th>🏷️ Kategori</th>
+                                    <th>📦 Barang/Jasa</th>
+                                    <th>🔢 Jumlah</th>
+                                    <th>💵 Harga</th>
+                                    <th>💳 Bayar</th>
+                                    <th>🏭 Supplier</th>
+                                    <th>💰 Total</th>
+                                    <th>📊 Akun & Status</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {transaction_rows}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                
+                <!-- Action Buttons -->
+                <div class="section" style="text-align: center;">
+                    <h2 class="section-title">⚡ Aksi Cepat</h2>
+                    <div style="display: flex; gap: 15px; justify-content: center; flex-wrap: wrap;">
+                        <a href="/penjualan" class="btn">🛍️ Input Penjualan</a>
+                        <a href="/pembelian" class="btn">🛒 Input Pembelian</a>
+                        <a href="/jurnal-umum" class="btn btn-secondary">📝 Lihat Jurnal</a>
+                        <a href="/laporan-keuangan" class="btn btn-secondary">📊 Laporan Posisi Keuangan</a>
+                    </div>
+                </div>
+            </div>
+        </div>
+    
+    </body>
+    </html>
+    """
+    return html
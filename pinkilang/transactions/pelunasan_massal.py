@@ -0,0 +1,73 @@
+"""Form pelunasan piutang/utang massal"""
+from flask import render_template_string, request, redirect, session, jsonify
+from datetime import date
+from markupsafe import escape
+from pinkilang.core import logger, base_html
+from pinkilang.piutang_utang import AGING_SOURCES, STRATEGI_ALOKASI, proses_pelunasan_massal
+
+def pelunasan_massal():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get('user_email')
+    message = ""
+
+    if request.method == "POST":
+        form = request.get_json(silent=True) or request.form
+        jenis = form.get("jenis", "piutang")
+        pihak = (form.get("pihak") or "").strip()
+        strategi = form.get("strategi", "fifo")
+        metode_pembayaran = (form.get("metode_pembayaran") or "CASH").upper()
+        tanggal_bayar = form.get("tanggal_bayar") or date.today().isoformat()
+
+        faktur_ids = form.get("faktur_ids") or []
+        if isinstance(faktur_ids, str):
+            faktur_ids = [i.strip() for i in faktur_ids.split(",") if i.strip()]
+
+        try:
+            jumlah = int(form.get("jumlah") or 0)
+        except (TypeError, ValueError):
+            jumlah = 0
+
+        if jenis not in AGING_SOURCES or strategi not in STRATEGI_ALOKASI or not pihak:
+            result = {'success': False, 'message': "Jenis, pihak atau strategi tidak valid"}
+        else:
+            try:
+                result = proses_pelunasan_massal(jenis, pihak, jumlah, tanggal_bayar, metode_pembayaran, strategi, faktur_ids, user_email)
+            except Exception as e:
+                logger.error(f"❌ Error pelunasan massal: {str(e)}")
+                result = {'success': False, 'message': f"Error proses pelunasan: {str(e)}"}
+
+        if request.is_json:
+            return jsonify(result), (200 if result['success'] else 400)
+
+        css_class = "success" if result['success'] else "error"
+        icon = "✅" if result['success'] else "❌"
+        # pesan memuat input user (nama pihak, pesan error) - di-escape sebelum masuk HTML
+        message = f'<div class="message {css_class}">{icon} {escape(result["message"])}</div>'
+
+    strategi_options = "".join(f'<option value="{kode}">{label}</option>' for kode, label in STRATEGI_ALOKASI.items())
+
+    html = f"""
+    <h2>💳 Pelunasan Massal</h2>
+    {message}
+    <form method="POST">
+        <select name="jenis">
+            <option value="piutang">Piutang (pelanggan)</option>
+            <option value="utang">Utang (supplier)</option>
+        </select><br>
+        <input type="text" name="pihak" placeholder="Nama pelanggan / supplier" required><br>
+        <input type="number" name="jumlah" placeholder="Jumlah bayar" min="1" required><br>
+        <input type="date" name="tanggal_bayar" value="{date.today().isoformat()}" required><br>
+        <select name="metode_pembayaran">
+            <option value="CASH">CASH</option>
+            <option value="TRANSFER">TRANSFER</option>
+        </select><br>
+        <select name="strategi">{strategi_options}</select><br>
+        <input type="text" name="faktur_ids" placeholder="ID faktur, pisahkan koma (untuk strategi daftar)"><br>
+        <button type="submit">💳 Proses Pelunasan</button>
+    </form>
+    <a href="/laporan-umur-piutang-utang"><button>⏳ Umur Piutang & Utang</button></a>
+    <a href="/dashboard"><button>🏠 Kembali</button></a>
+    """
+    return render_template_string(base_html, content=html)
@@ -0,0 +1,406 @@
+"""Transaksi pembelian dan pelunasan utang"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase
+from pinkilang.akuntansi import buat_entri_jurnal
+from pinkilang.posting import posting_transaksi, ID_BARU
+from pinkilang.piutang_utang import invalidate_aging_cache, get_pelunasan_per_faktur
+from pinkilang.ringkasan import invalidate_ringkasan_cache
+
+# ============================================================
+# 🔹 ROUTE: Pembelian 
+# ============================================================
+def pembelian():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_id = session.get('user_id')
+    user_email = session.get('user_email')
+    message = ""
+
+    # Harga pembelian tetap per ekor
+    HARGA_BELI_1 = 200  # Rp 200 per ekor
+    HARGA_BELI_2 = 500  # Rp 500 per ekor
+
+    # ---- helpers lokal ----
+    def to_int(x):
+        try:
+            return int(x)
+        except Exception:
+            return 0
+
+    def rp(v):
+        try:
+            return f"Rp {int(v):,}".replace(",", ".")
+        except Exception:
+            return "Rp 0"
+
+    # --------------------------------------------------------
+    # POST: Tambah pembelian
+    # --------------------------------------------------------
+    if request.method == "POST" and 'add_pembelian' in request.form:
+        tanggal = request.form.get("tanggal")
+        nama_barang = request.form.get("nama_barang", "").strip()
+        nama_supplier = request.form.get("nama_supplier", "").strip()
+        jumlah = to_int(request.form.get("jumlah"))
+        tipe_harga = request.form.get("tipe_harga")
+        metode_pembayaran = request.form.get("metode_pembayaran", "CASH").upper()
+
+        # Validasi dasar
+        if jumlah <= 0:
+            message = '<div class="message error">❌ Jumlah harus lebih dari 0.</div>'
+        elif not nama_barang or not nama_supplier:
+            message = '<div class="message error">❌ Nama barang & supplier wajib diisi.</div>'
+        else:
+            try:
+                # pilih harga beli
+                harga_beli_per_ekor = HARGA_BELI_1 if tipe_harga == '200' else HARGA_BELI_2
+                total_pembelian = jumlah * harga_beli_per_ekor
+
+                # simpan pembelian
+                transaksi_data = {
+                    "user_id": user_id,
+                    "user_email": user_email,
+                    "tanggal": tanggal,
+                    "nama_barang": nama_barang,
+                    "nama_supplier": nama_supplier,
+                    "jumlah": jumlah,
+                    "harga_beli_per_ekor": harga_beli_per_ekor,
+                    "total_pembelian": total_pembelian,
+                    "metode_pembayaran": metode_pembayaran,
+                    "created_at": datetime.now().isoformat()
+                }
+                # jurnal otomatis (Persediaan & Kas/Utang) ikut disimpan bersama pembelian dan stoknya
+                jurnal = buat_entri_jurnal("PEMBELIAN", {
+                    'transaksi_id': ID_BARU,
+                    'tanggal': tanggal,
+                    'nama_barang': nama_barang,
+                    'nama_supplier': nama_supplier,
+                    'jumlah': jumlah,
+                    'total_pembelian': total_pembelian,
+                    'metode_pembayaran': metode_pembayaran
+                }, user_email)
+                hasil = posting_transaksi("pembelian", transaksi_data, jurnal, "PEMBELIAN",
+                                          delta_persediaan=jumlah, updated_by=user_email)
+                invalidate_aging_cache()
+                invalidate_ringkasan_cache()
+                pembelian_id = hasil["dokumen"]['id']
+                logger.info("Jurnal pembelian dibuat untuk transaksi %s", pembelian_id)
+
+                # jika kredit -> juga masukkan record utang (supaya mudah dilunasi)
+                if metode_pembayaran == "KREDIT":
+                    try:
+                        # utang: kredit sisi Pembelian
+                        utang_payload = {
+                            "user_id": user_id,
+                            "user_email": user_email,
+                            "tanggal": tanggal,
+                            "keterangan": f"Pembelian kredit {nama_barang} dari {nama_supplier}",
+                            "akun_lawan": "Pembelian",
+                            "debit": 0,
+                            "kredit": total_pembelian,
+                            "jenis": "pembelian_kredit",
+                            "ref_id": pembelian_id,
+                            "created_at": datetime.now().isoformat()
+                        }
+                        supabase.table("utang").insert(utang_payload).execute()
+                    except Exception as e:
+                        logger.warning("Gagal insert utang record: %s", str(e))
+
+                message = f'<div class="message success">✅ Pembelian berhasil! Stok bertambah {jumlah} ekor</div>'
+
+            except Exception as e:
+                message = f'<div class="message error">❌ Error menambah pembelian: {str(e)}</div>'
+                logger.error("Error tambah pembelian: %s", str(e))
+
+    # --------------------------------------------------------
+    # POST: Pelunasan utang 
+    # --------------------------------------------------------
+    if request.method == "POST" and 'bayar_utang' in request.form:
+        pembelian_id = request.form.get("pembelian_id")
+        tanggal_bayar = request.form.get("tanggal_bayar")
+        jumlah_bayar = to_int(request.form.get("jumlah_bayar"))
+        metode_bayar = request.form.get("metode_pembayaran_utang", "CASH").upper()
+
+        try:
+            # ambil pembelian untuk cek sisa utang
+            pen_res = supabase.table("pembelian").select("*").eq("id", pembelian_id).execute()
+            if not (pen_res and getattr(pen_res, "data", None) and len(pen_res.data) > 0):
+                message = '<div class="message error">❌ Pembelian tidak ditemukan.</div>'
+            else:
+                pemb = pen_res.data[0]
+                if pemb.get("metode_pembayaran", "").upper() != "KREDIT":
+                    message = '<div class="message error">❌ Transaksi pembelian ini bukan kredit / tidak punya utang.</div>'
+                else:
+                    total_pembelian = int(pemb.get("total_pembelian", 0))
+                    # hitung total pelunasan yang sudah ada
+                    pel_res = supabase.table("pelunasan_utang").select("jumlah_bayar").eq("pembelian_id", pembelian_id).execute()
+                    already_paid = sum([p.get("jumlah_bayar", 0) for p in (pel_res.data or [])])
+                    sisa = total_pembelian - already_paid
+
+                    if jumlah_bayar <= 0:
+                        message = '<div class="message error">❌ Jumlah bayar harus > 0.</div>'
+                    elif jumlah_bayar > sisa:
+                        message = f'<div class="message error">❌ Jumlah bayar melebihi sisa ({rp(sisa)}).</div>'
+                    else:
+                        # ambil nama supplier dari pembelian
+                        nama_supplier = pemb.get("nama_supplier", "")
+
+                        # simpan pelunasan_utang
+                        pelunasan_payload = {
+                            "pembelian_id": pembelian_id,
+                            "tanggal_bayar": tanggal_bayar,
+                            "jumlah_bayar": jumlah_bayar,
+                            "metode_pembayaran": metode_bayar,
+                            "user_email": user_email,
+                            "nama_supplier": nama_supplier,  
+                            "created_at": datetime.now().isoformat()
+                        }
+
+                        ins_p = supabase.table("pelunasan_utang").insert(pelunasan_payload).execute()
+                        invalidate_aging_cache()
+                        if not (ins_p and getattr(ins_p, "data", None)):
+                            message = '<div class="message error">❌ Gagal menyimpan pelunasan (DB).</div>'
+                            logger.error("Insert pelunasan_utang gagal: %s", getattr(ins_p, "error", "no-detail"))
+                        else:
+                            # buat jurnal pelunasan: Utang (D) / Kas/Bank (K)
+                            akun_kredit = "Kas" if metode_bayar == "CASH" else "Bank"
+                            try:
+                                supabase.table("jurnal_umum").insert({
+                                    "tanggal": tanggal_bayar,
+                                    "nama_akun": "Utang Usaha",
+                                    "deskripsi": f"Pelunasan utang pembelian supplier {nama_supplier}",
+                                    "debit": jumlah_bayar,
+                                    "kredit": 0,
+                                    "user_email": user_email,
+                                    "created_at": datetime.now().isoformat()
+                                }).execute()
+                                supabase.table("jurnal_umum").insert({
+                                    "tanggal": tanggal_bayar,
+                                    "nama_akun": akun_kredit,
+                                    "deskripsi": f"Pembayaran pelunasan utang pembelian ID {pembelian_id}",
+                                    "debit": 0,
+                                    "kredit": jumlah_bayar,
+                                    "user_email": user_email,
+                                    "created_at": datetime.now().isoformat()
+                                }).execute()
+                            except Exception as je:
+                                logger.error("Gagal membuat jurnal pelunasan utang: %s", str(je))
+
+                            message = f'<div class="message success">✅ Pelunasan utang berhasil: {rp(jumlah_bayar)}</div>'
+                            logger.info("Pelunasan utang: pembelian %s dibayar %s oleh %s", pembelian_id, jumlah_bayar, user_email)
+
+        except Exception as e:
+            message = f'<div class="message error">❌ Error proses pelunasan: {str(e)}</div>'
+            logger.error("Error pelunasan utang: %s", str(e))
+
+    # --------------------------------------------------------
+    # Ambil data untuk tampilan: persediaan, pembelian, utang (kredit)
+    # --------------------------------------------------------
+    persediaan_sekarang = 0
+    try:
+        pres = supabase.table("persediaan_terintegrasi").select("*").eq("id", 1).execute()
+        if pres and pres.data:
+            persediaan_sekarang = int(pres.data[0].get("jumlah_persediaan", 0))
+    except Exception as e:
+        logger.error("Error ambil persediaan: %s", str(e))
+
+    transaksi_pembelian = []
+    total_pembelian_all = 0
+    total_ekor_dibeli = 0
+    try:
+        res_all = supabase.table("pembelian").select("*").order("tanggal", desc=True).execute()
+        transaksi_pembelian = res_all.data or []
+        for t in transaksi_pembelian:
+            total_pembelian_all += int(t.get('total_pembelian', 0))
+            total_ekor_dibeli += int(t.get('jumlah', 0))
+    except Exception as e:
+        logger.error("Error ambil pembelian: %s", str(e))
+
+    # ambil daftar pembelian kredit (utang) dan hitung sisa utk tiap entri
+    daftar_utang = []
+    total_utang = 0
+    try:
+        kred_res = supabase.table("pembelian").select("*").eq("metode_pembayaran", "KREDIT").execute()
+        pelunasan_per_pembelian = get_pelunasan_per_faktur("utang")
+        for pemb in (kred_res.data or []):
+            sudah_bayar = sum([p.get("jumlah_bayar", 0) for p in pelunasan_per_pembelian.get(pemb['id'], [])])
+            sisa = int(pemb['total_pembelian']) - int(sudah_bayar)
+
+            if sisa > 0:
+                # Tambahkan ke daftar utang yang belum lunas
+                daftar_utang.append({
+                    'id': pemb['id'],
+                    'tanggal': pemb['tanggal'],
+                    'nama_supplier': pemb.get('nama_supplier', ''),
+                    'nama_barang': pemb.get('nama_barang', ''),
+                    'total_pembelian': int(pemb.get('total_pembelian', 0)),
+                    'sudah_bayar': int(sudah_bayar),
+                    'sisa': int(sisa),
+                    'user_email': pemb.get('user_email', '')
+                })
+                total_utang += int(sisa)
+    except Exception as e:
+        logger.error("Error ambil data utang: %s", str(e))
+
+    # ambil data pelunasan utk tabel riwayat
+    data_pelunasan = []
+    try:
+        pel_all = supabase.table("pelunasan_utang").select("*").order("tanggal_bayar", desc=True).execute()
+        data_pelunasan = pel_all.data or []
+    except Exception as e:
+        logger.error("Error ambil pelunasan utang: %s", str(e))
+
+    
+    # --------------------------------------------------------
+    # Tampilan Pembelian
+    # --------------------------------------------------------
+    pembelian_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Pembelian - PINKILANG</title>
+        <meta charset="utf-8" />
+        <style>
+            * {{ margin:0; padding:0; box-sizing:border-box; }}
+            body {{ font-family: 'Arial Rounded MT Bold', Arial, sans-serif; background:linear-gradient(135deg,#ffe6f2,#fff0f7); padding:20px; }}
+            .container {{ max-width:1400px; margin:0 auto; background:white; border-radius:20px; overflow:hidden; }}
+            .header {{ background:linear-gradient(135deg,#ff85b3,#ff66a3); color:white; padding:30px; text-align:center; }}
+            .content {{ padding:30px; }}
+            .section {{ margin-bottom:30px; padding:20px; background:#fff5f9; border-radius:12px; }}
+            .form-grid {{ display:grid; grid-template-columns:1fr 1fr; gap:20px; }}
+            input, select {{ width:100%; padding:10px; border-radius:8px; border:2px solid #ffd1e6; }}
+            button {{ padding:10px 18px; background:linear-gradient(135deg,#ff85b3,#ff66a3); color:white; border:none; border-radius:8px; cursor:pointer; }}
+            table {{ width:100%; border-collapse:collapse; margin-top:10px; }}
+            th, td {{ padding:10px; border-bottom:1px solid #f3d6e3; text-align:left; }}
+            th {{ background:linear-gradient(135deg,#ff85b3,#ff66a3); color:white; }}
+            .message {{ padding:12px; border-radius:8px; margin-bottom:12px; }}
+            .success {{ background:#d4edda; color:#155724; }}
+            .error {{ background:#f8d7da; color:#721c24; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/dashboard" style="color:white; text-decoration:none;">← Kembali ke Dashboard</a>
+                <h1>🛒 Modul Pembelian</h1>
+                <div style="margin-top:8px;">Login sebagai <strong>{user_email}</strong></div>
+            </div>
+
+            <div class="content">
+                {message}
+
+                <div class="section">
+                    <h2>➕ Input Transaksi Pembelian</h2>
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div>
+                                <label>Tanggal</label><br>
+                                <input type="date" name="tanggal" value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div>
+                                <label>Nama Supplier</label><br>
+                                <input type="text" name="nama_supplier" required>
+                            </div>
+                            <div>
+                                <label>Nama Barang</label><br>
+                                <input type="text" name="nama_barang" required>
+                            </div>
+                            <div>
+                                <label>Jumlah (ekor)</label><br>
+                                <input type="number" name="jumlah" min="1" value="1" required>
+                                <div style="margin-top:6px;">Stok saat ini: <strong>{persediaan_sekarang}</strong></div>
+                            </div>
+                            <div>
+                                <label>Tipe Harga</label><br>
+                                <select name="tipe_harga" required>
+                                    <option value="200">Standard - Rp 200/ekor</option>
+                                    <option value="500">Premium - Rp 500/ekor</option>
+                                </select>
+                            </div>
+                            <div>
+                                <label>Metode Pembayaran</label><br>
+                                <select name="metode_pembayaran" required>
+                                    <option value="CASH">CASH</option>
+                                    <option value="KREDIT">KREDIT</option>
+                                </select>
+                            </div>
+                        </div>
+
+                        <div style="margin-top:12px;">
+                            <button type="submit" name="add_pembelian">📥 Proses Pembelian</button>
+                        </div>
+                    </form>
+                </div>
+
+                <div class="section">
+                    <h2>💳 Pelunasan Utang</h2>
+
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div>
+                                <label>Pilih Pembelian Kredit (Utang)</label><br>
+                                <select name="pembelian_id" required>
+                                    <option value="">-- Pilih Pembelian Kredit --</option>
+                                    {"".join([f"<option value='{u['id']}'> - {u['nama_supplier']} - {rp(u['total_pembelian'])} (Sisa: {rp(u['sisa'])})</option>" for u in daftar_utang])}
+                                </select>
+                            </div>
+                            <div>
+                                <label>Tanggal Bayar</label><br>
+                                <input type="date" name="tanggal_bayar" value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div>
+                                <label>Jumlah Bayar (Rp)</label><br>
+                                <input type="number" name="jumlah_bayar" min="1" required>
+                            </div>
+                            <div>
+                                <label>Metode Pembayaran</label><br>
+                                <select name="metode_pembayaran_utang" required>
+                                    <option value="CASH">CASH</option>
+                                    <option value="BANK">BANK</option>
+                                </select>
+                            </div>
+                        </div>
+
+                        <div style="margin-top:12px;">
+                            <button type="submit" name="bayar_utang">💳 Proses Pelunasan</button>
+                        </div>
+                    </form>
+
+                    <br>
+                    <h3>Riwayat Pelunasan</h3>
+                    <table>
+                        <thead>
+                            <tr><th>Tanggal</th><th>Supplier</th><th>Jumlah</th><th>Metode</th></tr>
+                        </thead>
+                        <tbody>
+                            {"".join([f"<tr><td>{p['tanggal_bayar']}</td><td>{p['nama_supplier']}</td><td>{rp(p['jumlah_bayar'])}</td><td>{p['metode_pembayaran']}</td></tr>" for p in data_pelunasan])}
+                        </tbody>
+                    </table>
+                </div>
+
+                <div class="section">
+                    <h2>📋 Daftar Pembelian</h2>
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Tanggal</th><th>Supplier</th><th>Barang</th><th>Jumlah</th><th>Harga/ekor</th><th>Pembayaran</th><th>Total</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            {"".join([f"<tr><td>{datetime.strptime(t['tanggal'],'%Y-%m-%d').strftime('%d/%m/%Y')}</td><td>{t['nama_supplier']}</td><td>{t['nama_barang']}</td><td>+{t['jumlah']}</td><td>Rp {t['harga_beli_per_ekor']}</td><td>{t['metode_pembayaran']}</td><td>{rp(t['total_pembelian'])}</td></tr>" for t in transaksi_pembelian])}
+                        </tbody>
+                    </table>
+                </div>
+
+                <div style="padding:20px;">
+                    <strong>Total Utang (Belum Lunas):</strong> {rp(total_utang)}
+                </div>
+
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+    return pembelian_html
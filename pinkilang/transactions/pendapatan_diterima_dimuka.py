@@ -0,0 +1,386 @@
+"""Pendapatan diterima dimuka"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, format_currency
+
+# ============================================================
+# 🔹 ROUTE: Pendapatan Diterima Dimuka (DP) - Custom dengan Harga Ikan
+# ============================================================
+def pendapatan_diterima_dimuka():
+    if not session.get('logged_in'):
+        return redirect('/login')
+
+    user_email = session.get('user_email')
+    message = ""
+
+    # Handle POST request
+    if request.method == "POST":
+        try:
+            # Data dari form
+            tanggal = request.form["tanggal"]
+            nama_customer = request.form["nama_customer"]
+            jenis_ikan = request.form["jenis_ikan"]
+            harga_jual_per_ekor = int(request.form["harga_jual_per_ekor"])
+            jumlah_ekor = int(request.form["jumlah_ekor"])
+            dp_persen = float(request.form.get("dp_persen", 0))
+            keterangan = request.form["keterangan"]
+            metode_pembayaran = request.form["metode_pembayaran"]
+
+            # Validasi
+            if harga_jual_per_ekor <= 0 or jumlah_ekor <= 0:
+                message = '<div class="message error">❌ Harga per ekor dan jumlah ekor harus lebih dari 0.</div>'
+            else:
+                # 🔹 HITUNG NILAI TRANSAKSI
+                total_harga_jual = harga_jual_per_ekor * jumlah_ekor
+                jumlah_dp = (dp_persen / 100) * total_harga_jual
+
+                # 🔹 SIMPAN KE TABEL PENDAPATAN DITERIMA DIMUKA
+                pdd_data = {
+                    "user_email": user_email,
+                    "tanggal": tanggal,
+                    "nama_customer": nama_customer,
+                    "jenis_ikan": jenis_ikan,
+                    "harga_jual_per_ekor": harga_jual_per_ekor,
+                    "jumlah_ekor": jumlah_ekor,
+                    "total_harga_jual": total_harga_jual,
+                    "dp_persen": dp_persen,
+                    "jumlah_dp": jumlah_dp,
+                    "keterangan": keterangan,
+                    "metode_pembayaran": metode_pembayaran,
+                    "status": "dp_diterima",
+                    "created_at": datetime.now().isoformat()
+                }
+
+                # 🔹 BUAT JURNAL UMUM OTOMATIS
+                jurnal_data = [
+                    {
+                        "user_email": user_email,
+                        "tanggal": tanggal,
+                        "nama_akun": "Kas" if metode_pembayaran == "tunai" else "Bank",
+                        "debit": jumlah_dp,
+                        "kredit": 0,
+                        "keterangan": f"DP {dp_persen}% dari {nama_customer}: {keterangan}",
+                        "transaksi_type": "pendapatan_diterima_dimuka",
+                        "referensi_id": None,
+                        "created_at": datetime.now().isoformat()
+                    },
+                    {
+                        "user_email": user_email,
+                        "tanggal": tanggal,
+                        "nama_akun": "Pendapatan Diterima Dimuka",
+                        "debit": 0,
+                        "kredit": jumlah_dp,
+                        "keterangan": f"DP {dp_persen}% penjualan {jenis_ikan} ke {nama_customer}",
+                        "transaksi_type": "pendapatan_diterima_dimuka", 
+                        "referensi_id": None,
+                        "created_at": datetime.now().isoformat()
+                    }
+                ]
+
+                if supabase:
+                    # Insert ke tabel pendapatan_diterima_dimuka
+                    pdd_result = supabase.table("pendapatan_diterima_dimuka").insert(pdd_data).execute()
+                    
+                    # Insert jurnal umum
+                    for jurnal in jurnal_data:
+                        supabase.table("jurnal_umum").insert(jurnal).execute()
+                    
+                    message = f'''
+                    <div class="message success">
+                        ✅ Pendapatan Diterima Dimuka berhasil dicatat!
+                        <div style="margin-top: 10px; background: #f0f8ff; padding: 10px; border-radius: 5px; border-left: 4px solid #ff66a3;">
+                            <strong>📋 Detail Transaksi:</strong><br>
+                            • 👤 Customer: {nama_customer}<br>
+                            • 🐟 Jenis Ikan: {jenis_ikan}<br> 
+                            • 🔢 Jumlah: {jumlah_ekor} ekor<br>
+                            • 💵 Harga per Ekor: {format_currency(harga_jual_per_ekor)}<br>
+                            • 🏷️ Total Harga Jual: {format_currency(total_harga_jual)}<br>
+                            • 💰 DP {dp_persen}%: {format_currency(jumlah_dp)}<br>
+                            • 💳 Metode: {metode_pembayaran.title()}
+                        </div>
+                    </div>
+                    '''
+                else:
+                    message = '<div class="message error">❌ Database tidak terhubung.</div>'
+
+        except Exception as e:
+            message = f'<div class="message error">❌ Error menyimpan transaksi: {str(e)}</div>'
+            logger.error(f"Error simpan Pendapatan Diterima Dimuka: {str(e)}")
+
+    # Ambil data PDD aktif untuk ditampilkan
+    pdd_aktif = []
+    total_pdd_aktif = 0
+    
+    try:
+        if supabase:
+            pdd_result = supabase.table("pendapatan_diterima_dimuka").select("*").eq("user_email", user_email).eq("status", "dp_diterima").execute()
+            pdd_aktif = pdd_result.data or []
+            total_pdd_aktif = sum(item.get('jumlah_dp', 0) for item in pdd_aktif)
+    except Exception as e:
+        logger.error(f"Error ambil data Pendapatan Diterima Dimuka: {str(e)}")
+
+    # Generate HTML
+    html = f'''
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Pendapatan Diterima Dimuka - PINKILANG</title>
+        <meta charset="utf-8">
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            body {{ font-family: 'Arial', sans-serif; background: linear-gradient(135deg, #ffe6f2, #ffccde); padding: 20px; min-height: 100vh; }}
+            .container {{ max-width: 1000px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.1); overflow: hidden; }}
+            
+            .header {{ background: linear-gradient(135deg, #ff66a3, #cc0066); color: white; padding: 25px; text-align: center; }}
+            .back-btn {{ display: inline-block; padding: 10px 20px; background: rgba(255,255,255,0.2); color: white; text-decoration: none; border-radius: 8px; margin-bottom: 15px; border: 1px solid rgba(255,255,255,0.3); }}
+            h1 {{ font-size: 28px; margin-bottom: 10px; }}
+            
+            .content {{ padding: 25px; }}
+            .section {{ margin: 25px 0; padding: 20px; background: #fff0f5; border-radius: 10px; border-left: 4px solid #ff66a3; }}
+            .section-title {{ color: #cc0066; font-size: 20px; margin-bottom: 15px; padding-bottom: 8px; border-bottom: 1px solid #ffcce0; }}
+            
+            .form-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 15px; }}
+            .form-group {{ margin-bottom: 15px; }}
+            label {{ display: block; margin-bottom: 5px; color: #cc0066; font-weight: bold; }}
+            input, select, textarea {{ width: 100%; padding: 10px; border: 2px solid #ffcce0; border-radius: 6px; font-size: 14px; }}
+            .btn {{ padding: 12px 25px; background: linear-gradient(135deg, #ff66a3, #cc0066); color: white; border: none; border-radius: 6px; cursor: pointer; font-weight: bold; }}
+            
+            .message {{ padding: 12px; margin: 15px 0; border-radius: 6px; }}
+            .success {{ background: #ffe6f2; color: #cc0066; border: 1px solid #ff66a3; }}
+            .error {{ background: #ffebee; color: #d32f2f; border: 1px solid #ffcdd2; }}
+            
+            .table-container {{ overflow-x: auto; margin-top: 15px; }}
+            table {{ width: 100%; border-collapse: collapse; background: white; }}
+            th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ffe6f2; }}
+            th {{ background: #ff66a3; color: white; }}
+            .number {{ text-align: right; font-family: 'Courier New', monospace; }}
+            
+            .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
+            .stat-card {{ background: white; padding: 15px; border-radius: 8px; text-align: center; border: 2px solid #ffcce0; }}
+            .stat-number {{ font-size: 20px; font-weight: bold; color: #cc0066; }}
+            
+            .calculation-box {{ background: #fff0f5; padding: 15px; border-radius: 8px; margin: 15px 0; border: 2px solid #ff66a3; }}
+            .calc-row {{ display: flex; justify-content: space-between; margin: 5px 0; }}
+            .calc-label {{ font-weight: bold; color: #cc0066; }}
+            .calc-value {{ font-family: 'Courier New', monospace; font-weight: bold; color: #cc0066; }}
+            
+            .action-buttons {{ display: flex; gap: 10px; margin-top: 15px; flex-wrap: wrap; }}
+            .btn-secondary {{ background: #ff9966; }}
+            .btn-success {{ background: #ff66a3; }}
+            
+            .harga-option {{ background: #fff0f5; padding: 10px; border-radius: 6px; border: 1px solid #ffcce0; margin-bottom: 10px; }}
+            .harga-option label {{ color: #cc0066; font-weight: normal; }}
+        </style>
+        <script>
+            function updateCalculations() {{
+                // Get form values
+                const hargaJualPerEkor = parseInt(document.getElementById('harga_jual_per_ekor').value) || 0;
+                const jumlahEkor = parseInt(document.getElementById('jumlah_ekor').value) || 0;
+                const dpPersen = parseFloat(document.getElementById('dp_persen').value) || 0;
+                
+                // Calculations
+                const totalHargaJual = hargaJualPerEkor * jumlahEkor;
+                const jumlahDp = (dpPersen / 100) * totalHargaJual;
+                const sisaPembayaran = totalHargaJual - jumlahDp;
+                
+                // Update display
+                document.getElementById('display_total_harga_jual').textContent = formatCurrency(totalHargaJual);
+                document.getElementById('display_jumlah_dp').textContent = formatCurrency(jumlahDp);
+                document.getElementById('display_sisa_pembayaran').textContent = formatCurrency(sisaPembayaran);
+            }}
+            
+            function formatCurrency(amount) {{
+                return 'Rp ' + Math.round(amount).toString().replace(/\\B(?=(\\d{{3}})+(?!\\d))/g, '.');
+            }}
+            
+            function setHargaPerEkor(harga) {{
+                document.getElementById('harga_jual_per_ekor').value = harga;
+                updateCalculations();
+            }}
+            
+            function setHargaCustom() {{
+                const customHarga = document.getElementById('harga_custom').value;
+                if (customHarga) {{
+                    document.getElementById('harga_jual_per_ekor').value = customHarga;
+                    updateCalculations();
+                }}
+            }}
+            
+            // Initialize on page load
+            document.addEventListener('DOMContentLoaded', function() {{
+                updateCalculations();
+            }});
+        </script>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>💰 Pendapatan Diterima Dimuka</h1>
+                <p>Mencatat Uang Muka (DP) Penjualan Ikan</p>
+            </div>
+            
+            <div class="content">
+                {message}
+
+                <!-- Form Input -->
+                <div class="section">
+                    <h2 class="section-title">🐟 Input Pendapatan Diterima Dimuka</h2>
+                    <form method="POST" onsubmit="updateCalculations()">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal">📅 Tanggal:</label>
+                                <input type="date" id="tanggal" name="tanggal" value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="nama_customer">👤 Nama Customer:</label>
+                                <input type="text" id="nama_customer" name="nama_customer" placeholder="Contoh: Tambak Ferdi Jaya" required>
+                            </div>
+                            
+                            <div class="form-group" style="grid-column: span 2;">
+                                <label>💰 Pilih Harga Ikan:</label>
+                                <div class="harga-option">
+                                    <label>
+                                        <input type="radio" name="jenis_ikan" value="Ikan" onclick="setHargaPerEkor(200)" required>
+                                        Ikan - Rp 200/ekor
+                                    </label>
+                                </div>
+                                <div class="harga-option">
+                                    <label>
+                                        <input type="radio" name="jenis_ikan" value="Ikan" onclick="setHargaPerEkor(500)" required>
+                                        Ikan - Rp 500/ekor
+                                    </label>
+                                </div>
+                                <div class="harga-option">
+                                    <label>
+                                        <input type="radio" name="jenis_ikan" value="Custom" id="custom_radio" required>
+                                        Harga Custom:
+                                        <input type="number" id="harga_custom" placeholder="Masukkan harga custom" min="1" style="width: 150px; margin-left: 10px;" onchange="setHargaCustom()">
+                                    </label>
+                                </div>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="harga_jual_per_ekor">💵 Harga Jual per Ekor:</label>
+                                <input type="number" id="harga_jual_per_ekor" name="harga_jual_per_ekor" placeholder="0" min="1" onchange="updateCalculations()" required>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="jumlah_ekor">🔢 Jumlah Ekor:</label>
+                                <input type="number" id="jumlah_ekor" name="jumlah_ekor" placeholder="0" min="1" onchange="updateCalculations()" required>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="dp_persen">💰 DP (%):</label>
+                                <input type="number" id="dp_persen" name="dp_persen" placeholder="20" min="1" max="100" onchange="updateCalculations()" required>
+                            </div>
+                            
+                            <div class="form-group">
+                                <label for="metode_pembayaran">💳 Metode Pembayaran:</label>
+                                <select id="metode_pembayaran" name="metode_pembayaran" required>
+                                    <option value="tunai">Tunai (Kas)</option>
+                                    <option value="transfer">Transfer (Bank)</option>
+                                </select>
+                            </div>
+                            
+                            <div class="form-group" style="grid-column: span 2;">
+                                <label for="keterangan">📝 Keterangan:</label>
+                                <textarea id="keterangan" name="keterangan" placeholder="Contoh: Menerima DP 20% dari Tambak Ferdi Jaya untuk pembelian ikan" rows="2" required></textarea>
+                            </div>
+                        </div>
+
+                        <!-- Calculation Preview -->
+                        <div class="calculation-box">
+                            <h3 style="color: #cc0066; margin-bottom: 10px;">📊 Preview Perhitungan</h3>
+                            <div class="calc-row">
+                                <span class="calc-label">Total Harga Jual:</span>
+                                <span class="calc-value" id="display_total_harga_jual">Rp 0</span>
+                            </div>
+                            <div class="calc-row">
+                                <span class="calc-label">Jumlah DP:</span>
+                                <span class="calc-value" id="display_jumlah_dp">Rp 0</span>
+                            </div>
+                            <div class="calc-row" style="border-top: 1px solid #ff66a3; padding-top: 5px; font-size: 16px;">
+                                <span class="calc-label"><strong>Sisa Pembayaran:</strong></span>
+                                <span class="calc-value" id="display_sisa_pembayaran"><strong>Rp 0</strong></span>
+                            </div>
+                        </div>
+
+                        <button type="submit" class="btn">💾 Catat Pendapatan Diterima Dimuka</button>
+                    </form>
+                </div>
+
+                <!-- Stats -->
+                <div class="stats-grid">
+                    <div class="stat-card">
+                        <div class="stat-number">{format_currency(total_pdd_aktif)}</div>
+                        <div>Total DP Aktif</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="stat-number">{len(pdd_aktif)}</div>
+                        <div>Jumlah Transaksi</div>
+                    </div>
+                </div>
+
+                <!-- Data Aktif -->
+                <div class="section">
+                    <h2 class="section-title">📋 Pendapatan Diterima Dimuka Aktif</h2>
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th>Tanggal</th>
+                                    <th>Customer</th>
+                                    <th>Jenis Ikan</th>
+                                    <th>Harga/Ekor</th>
+                                    <th>Jumlah</th>
+                                    <th>Total</th>
+                                    <th>DP</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {generate_pdd_rows(pdd_aktif) if pdd_aktif else '''
+                                <tr>
+                                    <td colspan="7" style="text-align: center; padding: 20px; color: #666;">
+                                        Belum ada data Pendapatan Diterima Dimuka
+                                    </td>
+                                </tr>
+                                '''}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+
+                <!-- Action Buttons -->
+                <div class="action-buttons">
+                    <a href="/jurnal-umum" class="btn btn-secondary">📝 Lihat Jurnal Umum</a>
+                    <a href="/neraca-lajur" class="btn btn-success">📊 Lihat Neraca Lajur</a>
+                    <a href="/realisasi-pendapatan-dimuka" class="btn" style="background: #ff9966;">🔄 Realisasi Pendapatan</a>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    '''
+    return html
+
+# ============================================================
+# 🔹 FUNGSI BANTU: Pendapatan Diterima Dimuka
+# ============================================================
+
+def generate_pdd_rows(pdd_data):
+    """Generate HTML rows untuk tabel Pendapatan Diterima Dimuka"""
+    rows = ""
+    for item in pdd_data:
+        rows += f"""
+        <tr>
+            <td>{item['tanggal']}</td>
+            <td>{item['nama_customer']}</td>
+            <td>{item['jenis_ikan']}</td>
+            <td class="number">{format_currency(item['harga_jual_per_ekor'])}</td>
+            <td class="number">{item['jumlah_ekor']} ekor</td>
+            <td class="number">{format_currency(item['total_harga_jual'])}</td>
+            <td class="number">{format_currency(item['jumlah_dp'])}</td>
+        </tr>
+        """
+    return rows
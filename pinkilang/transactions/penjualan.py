@@ -0,0 +1,800 @@
+"""Transaksi penjualan dan pelunasan piutang"""
+from flask import request, redirect, session
+from datetime import datetime
+from pinkilang.core import logger, supabase, format_currency
+from pinkilang.akuntansi import buat_entri_jurnal
+from pinkilang.posting import posting_transaksi, ID_BARU, PersediaanBelumDiatur, StokTidakCukup
+from pinkilang.piutang_utang import invalidate_aging_cache, get_pelunasan_per_faktur
+from pinkilang.ringkasan import invalidate_ringkasan_cache
+
+# ============================================================
+# 🔹 ROUTE: Penjualan
+# ============================================================
+def penjualan():
+    if not session.get('logged_in'):
+        return redirect('/login')
+    
+    user_id = session.get('user_id')
+    user_email = session.get('user_email')
+    message = ""
+    
+   # Harga pembelian tetap per ekor
+    HARGA_BELI_1 = 200  # Rp 200 per ekor
+    HARGA_BELI_2 = 500  # Rp 500 per ekor
+
+    # Handle form submission untuk transaksi penjualan
+    if request.method == "POST" and 'add_penjualan' in request.form:
+        tanggal = request.form["tanggal"]
+        nama_barang = request.form["nama_barang"]
+        nama_pegawai = request.form["nama_pegawai"]
+        jumlah = int(request.form["jumlah"])
+        tipe_harga = request.form["tipe_harga"]
+        harga_jual = int(request.form["harga_jual"])
+        metode_pembayaran = request.form["metode_pembayaran"]
+        nama_pelanggan = request.form.get("nama_pelanggan", "")
+        
+        # Validasi untuk penjualan kredit
+        if metode_pembayaran == "KREDIT" and not nama_pelanggan.strip():
+            message = '<div class="message error">X Nama pelanggan wajib diisi untuk penjualan kredit!</div>'
+        else:
+            try:
+                if supabase:  # ← INDOUT KE DALAM
+                    if tipe_harga == '200':
+                        harga_beli = HARGA_BELI_1
+                    else:
+                        harga_beli = HARGA_BELI_2
+                    
+                    # Hitung total penjualan
+                    total_penjualan = jumlah * harga_jual
+                    
+                    # 🎯 HITUNG HPP (Harga Pokok Penjualan)
+                    hpp = jumlah * harga_beli
+                    
+                    # Simpan transaksi penjualan - TAMBAH FIELD HPP
+                    transaksi_data = {
+                        "user_id": user_id,
+                        "user_email": user_email,
+                        "tanggal": tanggal,
+                        "nama_barang": nama_barang,
+                        "nama_pegawai": nama_pegawai,
+                        "jumlah": jumlah,
+                        "harga_beli": harga_beli,
+                        "harga_jual": harga_jual,
+                        "total_penjualan": total_penjualan,
+                        "hpp": hpp,  # 🆕 TAMBAH HPP
+                        "metode_pembayaran": metode_pembayaran,
+                        "nama_pelanggan": nama_pelanggan if metode_pembayaran == "KREDIT" else "",
+                        "created_at": datetime.now().isoformat()
+                    }
+                    jurnal = buat_entri_jurnal("PENJUALAN", {
+                        'transaksi_id': ID_BARU,
+                        'tanggal': tanggal,
+                        'nama_barang': nama_barang,
+                        'jumlah': jumlah,
+                        'total_penjualan': total_penjualan,
+                        'hpp': hpp,
+                        'metode_pembayaran': metode_pembayaran,
+                        'nama_pelanggan': nama_pelanggan
+                    }, user_email)
+
+                    # ✅ Cek stok, kurangi persediaan, simpan penjualan + jurnal dalam satu transaksi
+                    try:
+                        hasil = posting_transaksi("penjualan", transaksi_data, jurnal, "PENJUALAN",
+                                                  delta_persediaan=-jumlah, updated_by=user_email)
+                    except PersediaanBelumDiatur:
+                        message = '<div class="message error">❌ Persediaan belum diatur! Silakan set persediaan awal terlebih dahulu.</div>'
+                    except StokTidakCukup as e:
+                        message = f'<div class="message error">❌ Stok tidak mencukupi! Stok tersedia: {e.tersedia} ekor</div>'
+                    else:
+                        invalidate_aging_cache()
+                        invalidate_ringkasan_cache()
+                        if jurnal:
+                            logger.info(f"✅ Jurnal penjualan berhasil dibuat untuk transaksi {hasil['dokumen']['id']}")
+                            message = f'<div class="message success">✅ Transaksi berhasil! Jurnal akuntansi dibuat (HPP: {format_currency(hpp)})</div>'
+                        else:
+                            logger.warning(f"⚠️ Gagal membuat jurnal penjualan")
+                            message = f'<div class="message success">✅ Transaksi berhasil! (Catatan: Gagal membuat jurnal)</div>'
+                        logger.info(f"✅ Transaksi penjualan oleh {user_email}: {nama_barang} {jumlah} ekor - HPP: {hpp}")
+
+            except Exception as e:
+                message = f'<div class="message error">❌ Error menambah transaksi: {str(e)}</div>'
+                logger.error(f"❌ Error tambah transaksi penjualan: {str(e)}")
+    
+    # Handle pelunasan piutang
+    if request.method == "POST" and 'bayar_piutang' in request.form:
+        penjualan_id = request.form["penjualan_id"]
+        jumlah_bayar = int(request.form["jumlah_bayar"])
+        tanggal_bayar = request.form["tanggal_bayar"]
+        metode_pembayaran = request.form["metode_pembayaran_piutang"]
+        
+        try:
+            if supabase:
+                # Cek data penjualan
+                penjualan_data = supabase.table("penjualan").select("*").eq("id", penjualan_id).execute()
+                if not penjualan_data.data:
+                    message = '<div class="message error">❌ Data penjualan tidak ditemukan!</div>'
+                else:
+                    penjualan = penjualan_data.data[0]
+                    
+                    # Hitung sisa piutang
+                    pelunasan_result = supabase.table("pelunasan_piutang").select("jumlah_bayar").eq("penjualan_id", penjualan_id).execute()
+                    total_dibayar = sum([p['jumlah_bayar'] for p in pelunasan_result.data])
+                    sisa_piutang = penjualan['total_penjualan'] - total_dibayar
+                    
+                    if jumlah_bayar > sisa_piutang:
+                        message = f'<div class="message error">❌ Jumlah bayar melebihi sisa piutang! Sisa: Rp {sisa_piutang:,}</div>'
+                    else:
+                        # Simpan data pelunasan
+                        pelunasan_data = {
+                            "penjualan_id": penjualan_id,
+                            "tanggal_bayar": tanggal_bayar,
+                            "jumlah_bayar": jumlah_bayar,
+                            "metode_pembayaran": metode_pembayaran,
+                            "user_email": user_email,
+                            "created_at": datetime.now().isoformat()
+                        }
+                        
+                        supabase.table("pelunasan_piutang").insert(pelunasan_data).execute()
+                        invalidate_aging_cache()
+                        
+                        # Buat jurnal untuk penerimaan piutang
+                        jurnal_entries = [
+                        {
+                            "tanggal": tanggal_bayar,
+                            "nama_akun": "Kas",
+                            "ref": "1110",
+                            "debit": jumlah_bayar,
+                            "kredit": 0,
+                            "deskripsi": f"Pelunasan piutang dari {penjualan.get('nama_pelanggan', '')} - {penjualan['nama_barang']}",
+                            "transaksi_type": "PELUNASAN_PIUTANG",
+                            "user_email": user_email,  # ✅ GUNAKAN user_email BUKAN created_by
+                            "created_at": datetime.now().isoformat()
+                        },
+                        {
+                            "tanggal": tanggal_bayar,
+                            "nama_akun": "Piutang Usaha",
+                            "ref": "1120",
+                            "debit": 0,
+                            "kredit": jumlah_bayar,
+                            "deskripsi": f"Pelunasan piutang {penjualan.get('nama_pelanggan', '')}",
+                            "transaksi_type": "PELUNASAN_PIUTANG",
+                            "user_email": user_email,  # ✅ GUNAKAN user_email BUKAN created_by
+                            "created_at": datetime.now().isoformat()
+                        }
+                    ]
+                        
+                        for entry in jurnal_entries:
+                            supabase.table("jurnal_umum").insert(entry).execute()
+                        
+                        message = f'<div class="message success">✅ Pelunasan piutang berhasil! Jumlah: Rp {jumlah_bayar:,}</div>'
+                        logger.info(f"✅ Pelunasan piutang oleh {user_email}: {jumlah_bayar} untuk penjualan {penjualan_id}")
+                        
+        except Exception as e:
+            message = f'<div class="message error">❌ Error proses pelunasan: {str(e)}</div>'
+            logger.error(f"❌ Error pelunasan piutang: {str(e)}")
+    
+    # Ambil data persediaan terintegrasi
+    persediaan_sekarang = 0
+    try:
+        if supabase:
+            result = supabase.table("persediaan_terintegrasi").select("*").eq("id", 1).execute()
+            if result.data:
+                persediaan_sekarang = result.data[0]['jumlah_persediaan']
+    except Exception as e:
+        logger.error(f"Error ambil persediaan: {str(e)}")
+    
+    # Ambil data transaksi penjualan dari SEMUA USER
+    transaksi_penjualan = []
+    total_penjualan_all = 0
+    total_ekor_terjual = 0
+    
+    try:
+        if supabase:
+            result = supabase.table("penjualan").select("*").order("tanggal", desc=True).execute()
+            transaksi_penjualan = result.data
+            
+            # Hitung totals
+            for transaksi in transaksi_penjualan:
+                total_penjualan_all += transaksi['total_penjualan']
+                total_ekor_terjual += transaksi['jumlah']
+                
+    except Exception as e:
+        logger.error(f"Error ambil transaksi penjualan: {str(e)}")
+    
+    # Ambil data piutang (penjualan kredit yang belum lunas)
+    data_piutang = []
+    total_piutang = 0
+    try:
+        if supabase:
+            # Ambil penjualan kredit yang belum memiliki pelunasan lengkap
+            result = supabase.table("penjualan").select("*").eq("metode_pembayaran", "KREDIT").execute()
+            pelunasan_per_penjualan = get_pelunasan_per_faktur("piutang")
+            for penjualan in result.data:
+                # Hitung total yang sudah dibayar
+                total_dibayar = sum([p['jumlah_bayar'] for p in pelunasan_per_penjualan.get(penjualan['id'], [])])
+                sisa_piutang = penjualan['total_penjualan'] - total_dibayar
+                
+                if sisa_piutang > 0:
+                    data_piutang.append({
+                        'id': penjualan['id'],
+                        'tanggal': penjualan['tanggal'],
+                        'nama_pelanggan': penjualan.get('nama_pelanggan', ''),
+                        'nama_barang': penjualan['nama_barang'],
+                        'total_penjualan': penjualan['total_penjualan'],
+                        'total_dibayar': total_dibayar,
+                        'sisa_piutang': sisa_piutang,
+                        'user_email': penjualan['user_email']
+                    })
+                    total_piutang += sisa_piutang
+    except Exception as e:
+        logger.error(f"Error ambil data piutang: {str(e)}")
+
+    # HTML untuk halaman penjualan
+    penjualan_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Penjualan - PINKILANG</title>
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Arial Rounded MT Bold', 'Arial', sans-serif;
+                background: linear-gradient(135deg, #ffe6f2, #fff0f7);
+                min-height: 100vh;
+                padding: 20px;
+            }}
+            
+            .container {{
+                max-width: 1400px;
+                margin: 0 auto;
+                background: white;
+                border-radius: 20px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }}
+            
+            .header {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                padding: 30px;
+                text-align: center;
+            }}
+            
+            .back-btn {{
+                display: inline-block;
+                padding: 10px 20px;
+                background: rgba(255,255,255,0.2);
+                color: white;
+                text-decoration: none;
+                border-radius: 10px;
+                margin-bottom: 20px;
+                border: 1px solid rgba(255,255,255,0.3);
+            }}
+            
+            .back-btn:hover {{
+                background: rgba(255,255,255,0.3);
+            }}
+            
+            h1 {{
+                font-size: 36px;
+                margin-bottom: 10px;
+            }}
+            
+            .content {{
+                padding: 30px;
+            }}
+            
+            .section {{
+                margin-bottom: 40px;
+                padding: 25px;
+                background: #fff5f9;
+                border-radius: 15px;
+                border-left: 5px solid #ff85b3;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            .section-title {{
+                color: #ff66a3;
+                font-size: 24px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 2px solid #ffe6f2;
+            }}
+            
+            .form-grid {{
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 20px;
+                margin-bottom: 20px;
+            }}
+            
+            .form-group {{
+                margin-bottom: 15px;
+            }}
+            
+            label {{
+                display: block;
+                margin-bottom: 5px;
+                color: #d63384;
+                font-weight: bold;
+            }}
+            
+            input, select {{
+                width: 100%;
+                padding: 12px;
+                border: 2px solid #ffd1e6;
+                border-radius: 10px;
+                font-size: 16px;
+                transition: border-color 0.3s ease;
+                background: white;
+            }}
+            
+            input:focus, select:focus {{
+                border-color: #ff66a3;
+                outline: none;
+                box-shadow: 0 0 0 3px rgba(255,102,163,0.1);
+            }}
+            
+            .btn {{
+                padding: 12px 30px;
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                border: none;
+                border-radius: 10px;
+                cursor: pointer;
+                font-size: 16px;
+                transition: all 0.3s ease;
+                font-weight: bold;
+            }}
+            
+            .btn:hover {{
+                transform: translateY(-2px);
+                box-shadow: 0 6px 20px rgba(255,102,163,0.3);
+                background: linear-gradient(135deg, #ff66a3, #ff4d94);
+            }}
+            
+            .stats-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+                gap: 15px;
+                margin: 20px 0;
+            }}
+            
+            .stat-card {{
+                background: white;
+                padding: 20px;
+                border-radius: 10px;
+                text-align: center;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+                border: 1px solid #ffe6f2;
+                transition: transform 0.3s ease;
+            }}
+            
+            .stat-card:hover {{
+                transform: translateY(-5px);
+            }}
+            
+            .stat-number {{
+                font-size: 24px;
+                font-weight: bold;
+                color: #ff66a3;
+                margin: 10px 0;
+            }}
+            
+            .stat-label {{
+                color: #e83e8c;
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            
+            .table-container {{
+                overflow-x: auto;
+                margin-top: 20px;
+            }}
+            
+            table {{
+                width: 100%;
+                border-collapse: collapse;
+                background: white;
+                border-radius: 10px;
+                overflow: hidden;
+                box-shadow: 0 4px 15px rgba(255,133,179,0.1);
+            }}
+            
+            th, td {{
+                padding: 12px;
+                text-align: left;
+                border-bottom: 1px solid #ffe6f2;
+                font-size: 14px;
+            }}
+            
+            th {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                font-weight: bold;
+            }}
+            
+            tr:hover {{
+                background: #fff5f9;
+            }}
+            
+            .user-badge {{
+                background: #ffb6d9;
+                color: #c2185b;
+                padding: 4px 8px;
+                border-radius: 12px;
+                font-size: 12px;
+                font-weight: bold;
+            }}
+            
+            .current-user {{
+                background: #ff66a3;
+                color: white;
+            }}
+            
+            .harga-badge {{
+                background: #00cc66;
+                color: white;
+                padding: 4px 8px;
+                border-radius: 8px;
+                font-size: 11px;
+                font-weight: bold;
+            }}
+            
+            .message {{
+                padding: 15px;
+                margin: 15px 0;
+                border-radius: 10px;
+                font-size: 14px;
+            }}
+            
+            .success {{
+                background: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }}
+            
+            .error {{
+                background: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }}
+            
+            .info-box {{
+                background: #ffe6f2;
+                border: 1px solid #ffb6d9;
+                border-radius: 10px;
+                padding: 15px;
+                margin: 15px 0;
+                color: #d63384;
+            }}
+            
+            .stock-indicator {{
+                background: linear-gradient(135deg, #ff85b3, #ff66a3);
+                color: white;
+                padding: 8px 15px;
+                border-radius: 20px;
+                font-weight: bold;
+                display: inline-block;
+                margin: 5px 0;
+            }}
+            
+            .payment-badge {{
+                background: #66b3ff;
+                color: white;
+                padding: 4px 8px;
+                border-radius: 8px;
+                font-size: 11px;
+                font-weight: bold;
+            }}
+            
+            .payment-badge.cash {{
+                background: #00cc66;
+            }}
+            
+            .payment-badge.kredit {{
+                background: #ff6666;
+            }}
+            
+            .piutang-badge {{
+                background: #ffb366;
+                color: white;
+                padding: 4px 8px;
+                border-radius: 8px;
+                font-size: 11px;
+                font-weight: bold;
+            }}
+            
+            .piutang-badge.lunas {{
+                background: #00cc66;
+            }}
+            
+            .piutang-badge.belum {{
+                background: #ff6666;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <!-- Header -->
+            <div class="header">
+                <a href="/dashboard" class="back-btn">← Kembali ke Dashboard</a>
+                <h1>🛍️ Modul Penjualan</h1>
+                <p>Sistem Persediaan Terintegrasi - PINKILANG</p>
+                <div style="margin-top: 10px; font-size: 14px; opacity: 0.9;">
+                    👋 Login sebagai: <strong>{user_email}</strong>
+                </div>
+            </div>
+            
+            <!-- Content -->
+            <div class="content">
+                {message}
+                
+                <!-- Persediaan Awal Section -->
+                <div class="section">
+                    <h2 class="section-title">📦 Kelola Persediaan (Terintegrasi)</h2>
+                    <div class="info-box">
+                        <strong>ℹ️ Info:</strong> Stok persediaan bersifat terpusat untuk semua user.
+                    </div>
+                    <form method="POST">
+                        <div class="form-group">
+                            <label for="persediaan_awal">Jumlah Persediaan (ekor):</label>
+                            <input type="number" id="persediaan_awal" name="persediaan_awal" 
+                                   value="{persediaan_sekarang}" step="1" min="0" required>
+                            <small style="color: #666;">* Stok saat ini: <strong>{persediaan_sekarang} ekor</strong></small>
+                        </div>
+                        <button type="submit" name="set_persediaan" class="btn">💾 Update Stok Persediaan</button>
+                    </form>
+                </div>
+                
+                <!-- Input Transaksi Penjualan Section -->
+                <div class="section">
+                    <h2 class="section-title">➕ Input Transaksi Penjualan</h2>
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="tanggal">📅 Tanggal Transaksi:</label>
+                                <input type="date" id="tanggal" name="tanggal" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="nama_pegawai">👨‍💼 Nama Pegawai:</label>
+                                <input type="text" id="nama_pegawai" name="nama_pegawai" 
+                                       placeholder="Nama pegawai yang menangani" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="nama_barang">📦 Nama Barang:</label>
+                                <input type="text" id="nama_barang" name="nama_barang" 
+                                       placeholder="Nama barang yang dijual" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="jumlah">🔢 Jumlah Barang (ekor):</label>
+                                <input type="number" id="jumlah" name="jumlah" 
+                                       placeholder="0" step="1" min="1" max="{persediaan_sekarang}" required>
+                                <small style="color: #666;">Stok tersedia: {persediaan_sekarang} ekor</small>
+                            </div>
+                            <div class="form-group">
+                                <label for="tipe_harga">💰 Tipe Harga Beli:</label>
+                                <select id="tipe_harga" name="tipe_harga" required>
+                                    <option value="200">Standard - Rp 200/ekor</option>
+                                    <option value="500">Premium - Rp 500/ekor</option>
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="harga_jual">💵 Harga Jual per ekor (Rp):</label>
+                                <input type="number" id="harga_jual" name="harga_jual" 
+                                       placeholder="0" step="1" min="0" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="metode_pembayaran">💳 Metode Pembayaran:</label>
+                                <select id="metode_pembayaran" name="metode_pembayaran" required>
+                                    <option value="CASH">💰 Cash</option>
+                                    <option value="KREDIT">📄 Kredit</option>
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="nama_pelanggan">👤 Nama Pelanggan:</label>
+                                <input type="text" id="nama_pelanggan" name="nama_pelanggan" 
+                                       placeholder="Nama pelanggan (isi jika kredit)">
+                                <small style="color: #666;">*Wajib diisi untuk penjualan kredit</small>
+                            </div>
+                        </div>
+                        <button type="submit" name="add_penjualan" class="btn">💰 Proses Penjualan</button>
+                    </form>
+                </div>
+                
+                <!-- Ringkasan Penjualan -->
+                <div class="section">
+                    <h2 class="section-title">📊 Ringkasan Penjualan (Semua User)</h2>
+                    <div class="stats-grid">
+                        <div class="stat-card">
+                            <div>📦</div>
+                            <div class="stat-number">{persediaan_sekarang}</div>
+                            <div class="stat-label">Stok Tersedia</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>🛍️</div>
+                            <div class="stat-number">{total_ekor_terjual}</div>
+                            <div class="stat-label">Total Ekor Terjual</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>💰</div>
+                            <div class="stat-number">Rp {total_penjualan_all:,.0f}</div>
+                            <div class="stat-label">Total Penjualan</div>
+                        </div>
+                        <div class="stat-card">
+                            <div>👥</div>
+                            <div class="stat-number">{len(set(t['user_email'] for t in transaksi_penjualan)) if transaksi_penjualan else 0}</div>
+                            <div class="stat-label">User Aktif</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <!-- Daftar Transaksi Penjualan -->
+                <div class="section">
+                    <h2 class="section-title">📋 Daftar Transaksi Penjualan (Semua User)</h2>
+                    <div class="table-container">
+                        <table>
+                            <thead>
+                                <tr>
+                                    <th> Tanggal</th>
+                                    <th> Input Oleh</th>
+                                    <th> Pegawai</th>
+                                    <th> Barang</th>
+                                    <th> Jumlah</th>
+                                    <th> Harga Beli</th>
+                                    <th> Harga Jual</th>
+                                    <th> Pembayaran</th>
+                                    <th> Nama Pelanggan</th>
+                                    <th> Total</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                {''.join([f"""
+                                <tr>
+                                    <td>{datetime.strptime(t['tanggal'], '%Y-%m-%d').strftime('%d/%m/%Y')}</td>
+                                    <td>
+                                        <span class="user-badge {'current-user' if t.get('user_email') == user_email else ''}">
+                                            {t.get('user_email', 'Unknown')}
+                                        </span>
+                                    </td>
+                                    <td>{t['nama_pegawai']}</td>
+                                    <td>{t['nama_barang']}</td>
+                                    <td>{t['jumlah']} ekor</td>
+                                    <td>
+                                        <span class="harga-badge">
+                                            Rp {t['harga_beli']}/ekor
+                                        </span>
+                                    </td>
+                                    <td>Rp {t['harga_jual']}/ekor</td>
+                                    <td>
+                                        <span class="payment-badge {'cash' if t.get('metode_pembayaran') == 'CASH' else 'kredit'}">
+                                            {'💰 CASH' if t.get('metode_pembayaran') == 'CASH' else '📄 KREDIT'}
+                                        </span>
+                                    </td>
+                                    <td>{t.get('nama_pelanggan', '-')}</td>
+                                    <td><strong>Rp {t['total_penjualan']:,.0f}</strong></td>
+                                </tr>
+                                """ for t in transaksi_penjualan]) if transaksi_penjualan else '''
+                                <tr>
+                                    <td colspan="10" style="text-align: center; padding: 40px; color: #ff85b3;">
+                                        💝 Belum ada transaksi penjualan
+                                    </td>
+                                </tr>
+                                '''}
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+                
+                <!-- Pelunasan Piutang Section -->
+                <div class="section">
+                    <h2 class="section-title">💳 Pelunasan Piutang</h2>
+                    
+                    <!-- Form Pelunasan Piutang -->
+                    <form method="POST">
+                        <div class="form-grid">
+                            <div class="form-group">
+                                <label for="penjualan_id">📋 Pilih Penjualan Kredit:</label>
+                                <select id="penjualan_id" name="penjualan_id" required>
+                                    <option value="">Pilih Penjualan Kredit</option>
+                                    {"".join([f"""
+                                    <option value="{piutang['id']}" data-sisa="{piutang['sisa_piutang']}">
+                                        {piutang['nama_pelanggan']} - {piutang['nama_barang']} (Sisa: Rp {piutang['sisa_piutang']:,})
+                                    </option>
+                                    """ for piutang in data_piutang])}
+                                </select>
+                            </div>
+                            <div class="form-group">
+                                <label for="jumlah_bayar">💰 Jumlah Bayar (Rp):</label>
+                                <input type="number" id="jumlah_bayar" name="jumlah_bayar" 
+                                       placeholder="0" step="1" min="1" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="tanggal_bayar">📅 Tanggal Bayar:</label>
+                                <input type="date" id="tanggal_bayar" name="tanggal_bayar" 
+                                       value="{datetime.now().strftime('%Y-%m-%d')}" required>
+                            </div>
+                            <div class="form-group">
+                                <label for="metode_pembayaran_piutang">💳 Metode Pembayaran:</label>
+                                <select id="metode_pembayaran_piutang" name="metode_pembayaran_piutang" required>
+                                    <option value="CASH">💰 Cash</option>
+                                    <option value="TRANSFER">🏦 Transfer</option>
+                                    <option value="QRIS">📱 QRIS</option>
+                                </select>
+                            </div>
+                        </div>
+                        <button type="submit" name="bayar_piutang" class="btn">💳 Proses Pelunasan</button>
+                    </form>
+                    
+                    <!-- Ringkasan Piutang -->
+                    <div style="margin-top: 30px;">
+                        <h3 style="color: #ff66a3; margin-bottom: 15px;">📊 Ringkasan Piutang</h3>
+                        <div class="stats-grid">
+                            <div class="stat-card">
+                                <div>📋</div>
+                                <div class="stat-number">{len(data_piutang)}</div>
+                                <div class="stat-label">Total Piutang</div>
+                            </div>
+                            <div class="stat-card">
+                                <div>💰</div>
+                                <div class="stat-number">Rp {total_piutang:,}</div>
+                                <div class="stat-label">Total Belum Lunas</div>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <!-- Daftar Piutang -->
+                    <div style="margin-top: 20px;">
+                        <h3 style="color: #ff66a3; margin-bottom: 15px;">📋 Daftar Piutang</h3>
+                        <div class="table-container">
+                            <table>
+                                <thead>
+                                    <tr>
+                                        <th>Tanggal</th>
+                                        <th>Pelanggan</th>
+                                        <th>Barang</th>
+                                        <th>Total Penjualan</th>
+                                        <th>Terbayar</th>
+                                        <th>Sisa</th>
+                                        <th>Status</th>
+                                    </tr>
+                                </thead>
+                                <tbody>
+                                    {"".join([f"""
+                                    <tr>
+                                        <td>{datetime.strptime(p['tanggal'], '%Y-%m-%d').strftime('%d/%m/%Y')}</td>
+                                        <td><strong>{p['nama_pelanggan']}</strong></td>
+                                        <td>{p['nama_barang']}</td>
+                                        <td>Rp {p['total_penjualan']:,}</td>
+                                        <td>Rp {p['total_dibayar']:,}</td>
+                                        <td>Rp {p['sisa_piutang']:,}</td>
+                                        <td>
+                                            <span class="piutang-badge {'lunas' if p['sisa_piutang'] == 0 else 'belum'}">
+                                                {'✅ LUNAS' if p['sisa_piutang'] == 0 else '⏳ BELUM LUNAS'}
+                                            </span>
+                                        </td>
+                                    </tr>
+                                    """ for p in data_piutang]) if data_piutang else '''
+                                    <tr>
+                                        <td colspan="7" style="text-align: center; padding: 20px; color: #ff85b3;">
+                                            💝 Tidak ada piutang yang belum lunas
+                                        </td>
+                                    </tr>
+                                    '''}
+                                </tbody>
+                            </table>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    return penjualan_html